@@ -0,0 +1,51 @@
+"""
+Measures the cold-import time of ``import ots`` in fresh interpreters,
+against the time of a bare interpreter start, and fails if it exceeds the budget.
+
+.. code-block:: bash
+
+    python benchmarks/cold_import.py --budget 25
+"""
+from argparse import ArgumentParser
+from statistics import median
+from subprocess import run
+from sys import executable, exit
+from time import perf_counter
+
+BUDGET_MS: float = 25.0
+"""Budget in milliseconds for ``import ots`` on top of the interpreter start."""
+
+
+def measure(code: str, runs: int) -> float:
+    """
+    :return: The median wall time in milliseconds of running the code in a fresh interpreter.
+    """
+    times: list[float] = []
+    for _ in range(runs):
+        started: float = perf_counter()
+        run([executable, '-c', code], check=True)
+        times.append((perf_counter() - started) * 1000)
+    return median(times)
+
+
+def main() -> int:
+    parser = ArgumentParser(description='Measure the cold-import time of ots.')
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--budget', type=float, default=BUDGET_MS, help='Budget in milliseconds.')
+    args = parser.parse_args()
+    baseline: float = measure('pass', args.runs)
+    cases: dict[str, float] = {
+        'import ots': measure('import ots', args.runs) - baseline,
+        'from ots import Address': measure('from ots import Address', args.runs) - baseline,
+        'from ots import *': measure('from ots import *', args.runs) - baseline,
+    }
+    for name, elapsed in cases.items():
+        print(f'{name:<26} {elapsed:8.2f} ms')
+    if cases['import ots'] > args.budget:
+        print(f'import ots exceeds the budget of {args.budget:.2f} ms')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,124 @@
+"""
+Measures the memory of the wrapper objects in bytes per object, with :py:mod:`tracemalloc`.
+
+Only the Python side is measured: the native objects are created before, and the
+objects are measured as created, with their lazy fields not fetched yet. The pointer
+cells of cffi (``ffi.new``) are allocated with malloc and not traced.
+
+.. code-block:: bash
+
+    python benchmarks/memory.py --output before.json
+    # ... change something ...
+    python benchmarks/memory.py --output after.json --compare before.json
+"""
+import gc
+import json
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from datetime import datetime
+from sys import exit
+from typing import Callable
+from ots import *
+from ots.raw import lib, ots_handle_t, ots_result_t
+from ots.seed_jar import SeedJarItem
+from ots.transaction import Flow, TransferDescription
+
+FORMAT: int = 1
+"""Version of the JSON format, runs are only compared if it matches."""
+
+Case = tuple[Callable[[int], list], Callable[[object], object]]
+
+
+def measure(case: Case, count: int) -> float:
+    """
+    Creates count objects of a case from their prepared inputs.
+
+    :return: The bytes allocated per object.
+    """
+    make, wrap = case
+    inputs: list = make(count)
+    gc.collect()
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    objects: list = [wrap(value) for value in inputs]
+    allocated: int = tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(objects)
+    tracemalloc.stop()
+    del objects
+    return allocated / count
+
+
+def cases() -> dict[str, Case]:
+    """
+    :return: The cases by name, each with the function preparing the inputs and the one creating an object of an input.
+    """
+    seed: Polyseed = Polyseed.generate()
+    base58: str = seed.address.base58
+    address: Address = seed.address
+    time: datetime = datetime.now()
+
+    def results(count: int) -> list:
+        return [lib.ots_height_from_timestamp(1700000000, int(Network.MAIN)) for _ in range(count)]
+
+    def handles(count: int) -> list:
+        # the results own the handles, they are kept alive with them
+        owners: list = [lib.ots_address_create(base58.encode('utf-8')) for _ in range(count)]
+        return [(owner, lib.ots_result_handle(owner)) for owner in owners]
+
+    def addressHandles(count: int) -> list:
+        return [Address.fromString(base58).handle for _ in range(count)]
+
+    def seedHandles(count: int) -> list:
+        return [Polyseed.generate().handle for _ in range(count)]
+
+    return {
+        'ots_result_t': (results, ots_result_t),
+        'ots_handle_t': (handles, lambda value: ots_handle_t(value[1], True)),
+        'Address': (addressHandles, Address),
+        'Address (base58)': (lambda count: [base58] * count, lambda value: Address(None, value)),
+        'Seed': (seedHandles, Polyseed),
+        'TxDescription': (lambda count: [None] * count, TxDescription),
+        'Flow': (lambda count: list(range(count)), lambda value: Flow(address, value)),
+        'TransferDescription': (lambda count: list(range(count)), lambda value: TransferDescription(value, value)),
+        'SeedJarItem': (
+            lambda count: list(range(count)),
+            lambda value: SeedJarItem(
+                value, 'name', 'ABCDEF', base58, SeedType.POLYSEED, 'Polyseed', False,
+                Network.MAIN, 'Mainnet', 0, 0, time
+            )
+        ),
+    }
+
+
+def main() -> int:
+    parser = ArgumentParser(description='Measure the memory of the ots wrapper objects.')
+    parser.add_argument('--count', type=int, default=10000, help='Objects created per case.')
+    parser.add_argument('--output', help='Write the results as JSON to this file.')
+    parser.add_argument('--compare', help='JSON results of an earlier run to compare against.')
+    args = parser.parse_args()
+
+    baseline: dict = {}
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        if baseline.get('format') != FORMAT:
+            print(f'{args.compare} has another format, not compared')
+            baseline = {}
+    results: dict = {'format': FORMAT, 'ots': Ots.version(), 'python': sys.version.split()[0], 'cases': {}}
+    for name, case in cases().items():
+        size: float = measure(case, args.count)
+        results['cases'][name] = size
+        line: str = f'{name:<22} {size:10.1f} bytes'
+        before: float | None = baseline.get('cases', {}).get(name)
+        if before:
+            line += f'  (before {before:10.1f} bytes, {(size / before - 1) * 100:+6.1f}%)'
+        print(line)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
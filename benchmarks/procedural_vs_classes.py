@@ -0,0 +1,45 @@
+"""
+Compares the lean procedural API with the class API, for address validation,
+subaddress listing and signing.
+
+.. code-block:: bash
+
+    python benchmarks/procedural_vs_classes.py
+"""
+from timeit import timeit
+from ots import Address, Network, Polyseed, Wallet
+from ots import procedural as otsp
+
+
+def main(number: int = 1000) -> None:
+    seed: Polyseed = Polyseed.generate()
+    wallet: Wallet = seed.wallet
+    handle = otsp.seed_wallet(seed.handle)
+    address: str = seed.address.base58
+    data: bytes = b'monero offline transaction signing'
+    cases = {
+        'address validation': (
+            lambda: Address.valid(address, Network.MAIN),
+            lambda: otsp.address_valid(address, Network.MAIN),
+        ),
+        'address fingerprint': (
+            lambda: Address.fromString(address).fingerprint,
+            lambda: otsp.address_fingerprint(address),
+        ),
+        'subaddress listing (100)': (
+            lambda: [a.base58 for a in wallet.subAddresses(0, 100)],
+            lambda: otsp.wallet_subaddresses(handle, 0, 100),
+        ),
+        'sign data': (
+            lambda: wallet.signData(data),
+            lambda: otsp.wallet_sign_data(handle, data),
+        ),
+    }
+    for name, (classes, procedural) in cases.items():
+        classTime: float = timeit(classes, number=number) / number
+        proceduralTime: float = timeit(procedural, number=number) / number
+        print(f'{name:<26} classes {classTime * 1e6:10.2f} us  procedural {proceduralTime * 1e6:10.2f} us  {classTime / proceduralTime:5.2f}x')
+
+
+if __name__ == '__main__':
+    main()
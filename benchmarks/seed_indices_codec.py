@@ -0,0 +1,31 @@
+"""
+Benchmarks the text and binary forms of SeedIndices, encode/decode speed and size.
+
+.. code-block:: bash
+
+    python benchmarks/seed_indices_codec.py
+"""
+from random import randint
+from timeit import timeit
+from ots import SeedIndices
+
+
+def main(number: int = 10000) -> None:
+    for count in (16, 25):
+        seedIndices: SeedIndices = SeedIndices.fromValues([randint(0, 2047) for _ in range(count)])
+        forms = {
+            'numeric': (lambda: seedIndices.numeric(), SeedIndices.fromString),
+            'hex': (lambda: seedIndices.hex(), SeedIndices.fromHexString),
+            'packed': (lambda: seedIndices.packed(), SeedIndices.fromPacked),
+            'qr': (lambda: seedIndices.qr(), SeedIndices.fromQr),
+        }
+        print(f'{count} indices')
+        for name, (encode, decode) in forms.items():
+            encoded = encode()
+            encodeTime: float = timeit(encode, number=number) / number
+            decodeTime: float = timeit(lambda: decode(encoded), number=number) / number
+            print(f'  {name:<8} {len(encoded):>4} {"bytes" if isinstance(encoded, bytes) else "chars"}  encode {encodeTime * 1e6:8.2f} us  decode {decodeTime * 1e6:8.2f} us')
+
+
+if __name__ == '__main__':
+    main()
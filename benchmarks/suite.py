@@ -0,0 +1,178 @@
+"""
+Benchmarks the hot paths of the wrapper and the native library, writes the results
+as JSON and compares them against an earlier run to flag regressions.
+
+.. code-block:: bash
+
+    python benchmarks/suite.py --output before.json
+    # ... change something ...
+    python benchmarks/suite.py --output after.json --compare before.json --threshold 10
+
+Transfers of a tx description are only measured with an unsigned tx set given by ``--tx``,
+or on the fake backend (``OTS_BACKEND=fake``), which builds one of its own.
+Exits with 1 if a case is slower than the threshold (in percent) compared to the baseline.
+"""
+import json
+import platform
+from argparse import ArgumentParser
+from statistics import median
+from sys import exit
+from timeit import Timer
+from typing import Callable
+from ots import *
+from ots._backend import BACKEND
+from ots.seed import LegacySeed
+from ots.raw import ots_address_string_valid, ots_height_from_timestamp, ots_result_number
+
+FORMAT: int = 1
+"""Version of the JSON format, runs are only compared if it matches."""
+
+Case = Callable[[], object]
+
+
+def measure(case: Case, repeat: int, minTime: float) -> dict[str, float | int]:
+    """
+    Times a case. The number of calls per run is chosen so a run takes at least minTime.
+
+    :return: The median and the best time per call in seconds, and the calls per run.
+    """
+    timer: Timer = Timer(case)
+    number, _ = timer.autorange()
+    number = max(1, int(number * minTime / 0.2))
+    times: list[float] = [elapsed / number for elapsed in timer.repeat(repeat, number)]
+    return {'median': median(times), 'best': min(times), 'number': number}
+
+
+def cases(tx: bytes | None) -> dict[str, Case]:
+    """
+    :param tx: An unsigned tx set to describe, or None to skip the transfers case.
+    :return: The cases by name.
+    """
+    english: SeedLanguage = SeedLanguage.fromCode('en')
+    polyseed: Polyseed = Polyseed.generate()
+    moneroSeed: MoneroSeed = MoneroSeed.generate()
+    legacySeed: LegacySeed = LegacySeed.decodeIndices(SeedIndices.fromValues(moneroSeed.indices().values[:12]))
+    phrases: dict[str, str] = {
+        'polyseed': polyseed.phrase(english).insecure(),
+        'monero': moneroSeed.phrase(english).insecure(),
+        'legacy': legacySeed.phrase(english).insecure(),
+    }
+    wallet: Wallet = polyseed.wallet
+    address: str = wallet.address(0, 0).base58
+    deep: str = wallet.address(3, 150).base58
+    data: bytes = b'monero offline transaction signing'
+    signature: str = wallet.signData(data)
+    result = ots_height_from_timestamp(1700000000, Network.MAIN)
+
+    suite: dict[str, Case] = {
+        'raw/ots_result_number': lambda: ots_result_number(result),
+        'raw/ots_address_string_valid': lambda: ots_address_string_valid(address),
+    }
+    for size in (1, 10, 100, 1000):
+        suite[f'wallet/subAddresses/{size}'] = lambda size=size: wallet.subAddresses(0, size)
+    suite['wallet/hasAddress/default'] = lambda: wallet.hasAddress(address)
+    suite['wallet/hasAddress/raised'] = lambda: wallet.hasAddress(deep, 5, 200)
+    suite['wallet/addressIndex/default'] = lambda: wallet.addressIndex(address)
+    suite['wallet/addressIndex/raised'] = lambda: wallet.addressIndex(deep, 5, 200)
+    suite['seed/generate/polyseed'] = Polyseed.generate
+    suite['seed/generate/monero'] = MoneroSeed.generate
+    suite['seed/decode/polyseed'] = lambda: Polyseed.decode(phrases['polyseed'])
+    suite['seed/decode/monero'] = lambda: MoneroSeed.decode(phrases['monero'])
+    suite['seed/decode/legacy'] = lambda: LegacySeed.decode(phrases['legacy'])
+    suite['wallet/signData'] = lambda: wallet.signData(data)
+    suite['wallet/verifyData'] = lambda: wallet.verifyData(data, signature)
+    if tx is None and BACKEND == 'fake':
+        from ots._fake import unsigned_tx_set
+        tx = unsigned_tx_set([{'flows': [(deep, 1000000)], 'change': (address, 5000), 'fee': 300}] * 4)
+    if tx is not None:
+        suite['tx/transfers'] = lambda: wallet.describeTransaction(tx).transfers
+    return suite
+
+
+def jar_cases(sizes: tuple[int, ...] = (10, 100, 1000)) -> dict[str, tuple[Callable[[], None], Case]]:
+    """
+    :return: The SeedJar cases by name, each with the setup filling the jar.
+    """
+    def fill(size: int) -> Callable[[], None]:
+        def setup() -> None:
+            SeedJar.clear()
+            for i in range(size):
+                SeedJar.add(Polyseed.generate(), f'seed {i}')
+        return setup
+    return {f'seed_jar/items/{size}': (fill(size), SeedJar.items) for size in sizes}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Prints the change of every case against the baseline.
+
+    :return: The names of the cases slower than the threshold in percent.
+    """
+    regressions: list[str] = []
+    for name, result in results['cases'].items():
+        before: dict | None = baseline['cases'].get(name)
+        if before is None:
+            print(f'{name:<36} {"new":>12}')
+            continue
+        change: float = (result['median'] / before['median'] - 1) * 100
+        flag: str = ''
+        if change > threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print(f'{name:<36} {change:+11.1f}%{flag}')
+    return regressions
+
+
+def main() -> int:
+    parser = ArgumentParser(description='Benchmark the hot paths of ots.')
+    parser.add_argument('--output', help='Write the results as JSON to this file.')
+    parser.add_argument('--compare', help='JSON results of an earlier run to compare against.')
+    parser.add_argument('--threshold', type=float, default=10.0, help='Slowdown in percent flagged as regression.')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2, help='Minimum seconds per run.')
+    parser.add_argument('--filter', default='', help='Only run cases whose name contains this.')
+    parser.add_argument('--tx', help='File with an unsigned tx set, to measure the transfers of its description.')
+    args = parser.parse_args()
+
+    tx: bytes | None = None
+    if args.tx:
+        with open(args.tx, 'rb') as file:
+            tx = file.read()
+    results: dict = {
+        'format': FORMAT,
+        'ots': Ots.version(),
+        'backend': BACKEND,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'cases': {},
+    }
+    for name, case in cases(tx).items():
+        if args.filter in name:
+            results['cases'][name] = measure(case, args.repeat, args.min_time)
+            print(f'{name:<36} {results["cases"][name]["median"] * 1e6:12.2f} us')
+    for name, (setup, case) in jar_cases().items():
+        if args.filter in name:
+            setup()
+            results['cases'][name] = measure(case, args.repeat, args.min_time)
+            print(f'{name:<36} {results["cases"][name]["median"] * 1e6:12.2f} us')
+    SeedJar.clear()
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            baseline: dict = json.load(file)
+        if baseline.get('format') != FORMAT:
+            print(f'{args.compare} has another format, not compared')
+            return 0
+        print(f'\ncompared to {args.compare} (ots {baseline["ots"]}, python {baseline["python"]})')
+        regressions: list[str] = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f'{len(regressions)} regression(s) above {args.threshold:.1f}%')
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -29,7 +29,8 @@ Or simply import only what is needed:
         print(f"Language: {lang.name}, Code: {lang.code}, default: {'yes' if lang.isDefault(SeedType.POLYSEED) else 'no'}")
 
 
-To use the OTS library procedurally (not yet implemented):
+To use the OTS library procedurally, a lean fast path with plain functions
+on handles and Python values, without the wrapper classes:
 
 .. code-block::
 
@@ -41,7 +42,7 @@ Or better:
 
 .. code-block::
 
-    import procedural from ots as otsp
+    from ots import procedural as otsp
     print(otsp.version())
 
 
@@ -61,7 +62,7 @@ To use the OTS library almost raw like the C ABI:
 And to be completely raw:
 .. code-block::
 
-    from ots._ots import ffi, lib
+    from ots._backend import ffi, lib
     result: _CDataBase = ffi.new('ots_result_t **')
     result[0] = lib.ots_version()
     if lib.ots_is_error(result):
@@ -73,16 +74,72 @@ And to be completely raw:
 """
 from os import environ
 from hashlib import sha256
+from importlib import import_module
 VERSION = '0.1.0'
-environ['PYTHONHASHSEED'] = sha256(f'Monero OTS {VERSION}'.encode('utf-8')).hexdigest()
-from .constants import *
-from .enums import *
-from .exceptions import *
-from .seed_indices import SeedIndices
-from .seed_language import SeedLanguage
-from .address import Address, AddressString
-# from .seed import *
-from .transaction import TxDescription, TxWarning
-from .wallet import Wallet
-from .seed_jar import SeedJar, SeedJarItem, Seed, MoneroSeed, Polyseed
-from .ots import Ots
+# an integer, a new interpreter (e.g. the resource tracker of multiprocessing) refuses to start with anything else
+environ['PYTHONHASHSEED'] = str(int.from_bytes(sha256(f'Monero OTS {VERSION}'.encode('utf-8')).digest()[:4], 'big'))
+
+# The submodules, and with them the native library, are loaded lazily on first
+# use of a name (PEP 562), so `import ots` itself stays cheap.
+_STAR_MODULES: tuple[str, ...] = ('constants', 'enums', 'exceptions')
+"""Submodules of which all public names are exported, like ``from .enums import *``."""
+_NAMES: dict[str, str] = {
+    'SeedIndices': 'seed_indices',
+    'SeedIndicesArray': 'seed_indices',
+    'SecureChannel': 'seed_indices',
+    'SeedLanguage': 'seed_language',
+    'Address': 'address',
+    'AddressString': 'address',
+    'AddressTable': 'address_table',
+    'TxDescription': 'transaction',
+    'TxWarning': 'transaction',
+    'Wallet': 'wallet',
+    'AddressCache': 'address_cache',
+    'SeedJar': 'seed_jar',
+    'SeedJarItem': 'seed_jar',
+    'Seed': 'seed_jar',
+    'MoneroSeed': 'seed_jar',
+    'Polyseed': 'seed_jar',
+    'GeneratedSeed': 'seed',
+    'WordTrie': 'word_trie',
+    'RandomStream': 'random_stream',
+    'TxRing': 'tx_transport',
+    'TxSigningPool': 'tx_transport',
+    'EntropyEstimator': 'entropy',
+    'VerifyCache': 'verify_cache',
+    'Ots': 'ots',
+}
+"""Exported classes and the submodule each is loaded from."""
+
+
+def _public(module) -> list[str]:
+    """
+    Returns the names a star import of the module would import.
+    """
+    return list(getattr(module, '__all__', None) or (n for n in vars(module) if not n.startswith('_')))
+
+
+def __getattr__(name: str):
+    if name in _NAMES:
+        value = getattr(import_module(f'.{_NAMES[name]}', __name__), name)
+        globals()[name] = value
+        return value
+    if name == '__all__':
+        names: list[str] = ['VERSION']
+        for moduleName in _STAR_MODULES:
+            names += _public(import_module(f'.{moduleName}', __name__))
+        names += list(_NAMES)
+        globals()['__all__'] = names
+        return names
+    if not name.startswith('_'):
+        for moduleName in _STAR_MODULES:
+            module = import_module(f'.{moduleName}', __name__)
+            if name in _public(module):
+                value = getattr(module, name)
+                globals()[name] = value
+                return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__getattr__('__all__')))
@@ -0,0 +1,21 @@
+"""
+Selects the ``ffi``/``lib`` pair the wrapper is built on.
+
+By default it is the compiled ``_ots`` extension, linked against libmonero-ots.
+With the environment variable ``OTS_BACKEND=fake`` it is :py:mod:`ots._fake`,
+a pure-Python stand-in without any cryptography, to measure and test the Python
+layers without the native library.
+
+The backend is chosen once, on the first import of :py:mod:`ots.raw`.
+"""
+from os import environ
+
+BACKEND: str = environ.get('OTS_BACKEND', 'native')
+"""The backend in use: ``native`` or ``fake``."""
+
+if BACKEND == 'fake':
+    from ._fake import ffi, lib
+elif BACKEND == 'native':
+    from ._ots import ffi, lib
+else:
+    raise ImportError(f"unknown OTS_BACKEND {BACKEND!r}, must be 'native' or 'fake'")
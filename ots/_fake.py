@@ -0,0 +1,2807 @@
+"""
+A pure-Python stand-in for the compiled ``_ots`` extension, selected with ``OTS_BACKEND=fake``.
+
+It provides an ``ffi`` built from the C headers of libmonero-ots and a ``lib`` implementing
+the ``ots.h`` ABI with deterministic and cheap stub behaviour, so the Python layers
+(:py:mod:`ots.raw` and the classes on top of it) can be profiled and benchmarked alone,
+and the wrapper can be exercised on any machine without the native library.
+
+.. warning::
+
+    There is no cryptography in here. Keys, addresses, signatures and tx sets are
+    made up with hashes and only match each other, never use it with real funds.
+
+What it models:
+
+- Results, handles and the ownership rules of them: owning handles free their object,
+  reference handles do not, seeds added to the jar are owned by the jar.
+- Seeds (Monero, legacy and Polyseed) which round-trip through phrases and indices,
+  with made-up word lists per language and the real checksums of the phrases.
+- Wallets with addresses and subaddresses in the Monero base58 format, which are
+  found by :py:func:`ots_wallet_has_address` and sign and verify data.
+- Tx sets in a JSON format of its own, see :py:func:`unsigned_tx_set`.
+
+The headers are taken from the directories in ``OTS_INCLUDE_PATH`` (like ``ots_build.py``)
+or from the ``include`` directory of the source tree.
+"""
+import json
+import sys
+import time
+from functools import wraps
+from hashlib import sha256, sha3_256, sha512
+from itertools import count
+from math import log2
+from os import environ, path, urandom
+from re import DOTALL, findall, sub
+from zlib import crc32
+from cffi import FFI
+
+HEADER_FILES: tuple[str, ...] = ('ots-errors.h', 'ots.h')
+"""The C header files the ``ffi`` is built from, in this order."""
+
+# Declarations of the batch helpers compiled into the native extension, see HELPER_CDEF in ots_build.py.
+_HELPER_CDEF: str = """
+size_t ots_py_heights_from_timestamps(const uint64_t* timestamps, uint64_t* heights, size_t count, OTS_NETWORK network);
+size_t ots_py_timestamps_from_heights(const uint64_t* heights, uint64_t* timestamps, size_t count, OTS_NETWORK network);
+"""
+
+
+def _header(name: str) -> str:
+    """
+    Finds a header file in ``OTS_INCLUDE_PATH`` or in the ``include`` directory of the source tree.
+    :meta private:
+    """
+    directories: list[str] = [p for p in environ.get('OTS_INCLUDE_PATH', '').split(':') if p]
+    directories.append(path.join(path.dirname(path.dirname(path.abspath(__file__))), 'include'))
+    for directory in directories:
+        candidate: str = path.join(directory, name)
+        if path.isfile(candidate):
+            return candidate
+    raise ImportError(f"{name} not found, set OTS_INCLUDE_PATH to the directory of the OTS headers")
+
+
+def _cdef(text: str) -> str:
+    """
+    Strips a header down to what :py:meth:`cffi.FFI.cdef` parses, like ``cdef_from_header`` in ``ots_build.py``.
+    :meta private:
+    """
+    text = sub(r'/\*.*?\*/', '', text, flags=DOTALL)
+    text = sub(r'//[^\n]*', '', text)
+    text = sub(r'static inline (.*?\))\s*\{.*?\n\s*\}', r'\1;', text, flags=DOTALL)
+    lines: list[str] = []
+    for line in text.splitlines():
+        stripped: str = line.strip()
+        if stripped.startswith('#'):
+            # keep the numeric constants, drop the include guards and the rest of the preprocessor
+            if len(stripped.split()) == 3 and stripped.startswith('#define'):
+                lines.append(stripped)
+            continue
+        if stripped in ('extern "C" {', '}'):
+            continue
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def _load() -> tuple[FFI, object, dict[int, str]]:
+    """
+    Builds the ``ffi`` from the headers, the constants and the error classes by code.
+    :meta private:
+    """
+    ffi: FFI = FFI()
+    texts: list[str] = []
+    for name in HEADER_FILES:
+        with open(_header(name)) as file:
+            texts.append(file.read())
+    ffi.cdef('\n'.join(_cdef(text) for text in texts) + _HELPER_CDEF)
+    classes: dict[int, str] = {
+        int(code): cls for cls, code in findall(r'@see (\S+) in .*?\n\s*\*/\s*\n\s*OTS_ERROR_\w+ = (-?\d+)', texts[0])
+    }
+    return ffi, ffi.dlopen(None), classes
+
+
+ffi, _C, _ERROR_CLASSES = _load()
+lib = sys.modules[__name__]
+"""This module is the ``lib``, the constants of the headers are looked up in the ``ffi``."""
+
+
+def __getattr__(name: str):
+    if name.startswith('OTS_'):
+        return getattr(_C, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+VERSION: tuple[int, int, int] = (0, 1, 0)
+"""The version of libmonero-ots the fake stands in for."""
+GENESIS: int = 1397818193
+"""Timestamp of the first block, the same for all networks here."""
+BLOCK_TIME: int = 120
+"""Seconds per block."""
+POLYSEED_EPOCH: int = 1635768000
+"""Start of the Polyseed birthdays."""
+POLYSEED_TIME_STEP: int = 2629746
+"""Seconds per step of the Polyseed birthday (about a month)."""
+
+UNSIGNED_TX_MAGIC: bytes = b'OTS fake unsigned tx set\n'
+"""Start of the unsigned tx sets of the fake, followed by JSON."""
+SIGNED_TX_MAGIC: bytes = b'OTS fake signed tx set\n'
+"""Start of the signed tx sets of the fake."""
+OUTPUTS_MAGIC: bytes = b'OTS fake outputs\n'
+"""Start of the outputs the fake imports, followed by JSON of the output count."""
+KEY_IMAGES_MAGIC: bytes = b'OTS fake key images\n'
+"""Start of the key images the fake exports."""
+
+_ids = count(1)
+_OBJECTS: dict[int, '_Object'] = {}
+_RESULTS: dict[int, list] = {}
+_HANDLES: dict[int, object] = {}
+_TX_DESCRIPTIONS: dict[int, tuple] = {}
+
+
+class _Error(Exception):
+    """
+    Raised inside the fake functions, returned as error result.
+    :meta private:
+    """
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code: int = code
+        self.message: str = message
+
+
+def _address(pointer) -> int:
+    """
+    :meta private:
+    """
+    return int(ffi.cast('uintptr_t', pointer))
+
+
+def _native(function):
+    """
+    Returns the :py:class:`_Error` raised by a fake function as error result.
+    :meta private:
+    """
+    @wraps(function)
+    def call(*args):
+        try:
+            return function(*args)
+        except _Error as error:
+            return _error(error.code, error.message)
+    return call
+
+
+# --- objects and handles -------------------------------------------------------------------------
+
+
+class _Object:
+    """
+    A native object, a handle points to it by its id.
+    :meta private:
+    """
+    handleType: int = 0
+
+    def __init__(self):
+        self.id: int = next(_ids)
+        self._reference = None
+        _OBJECTS[self.id] = self
+
+    def reference(self):
+        """
+        :return: The reference handle of the object.
+        """
+        if self._reference is None:
+            self._reference = ffi.new('ots_handle_t *', {
+                'type': self.handleType,
+                'ptr': ffi.cast('void *', self.id),
+                'reference': True,
+            })
+        return self._reference
+
+    def release(self) -> None:
+        """
+        Frees the object.
+        """
+        _OBJECTS.pop(self.id, None)
+
+
+def _object(handle, handleType: int | None = None):
+    """
+    Looks up the object of a handle.
+    :meta private:
+    """
+    if handle is None or handle == ffi.NULL:
+        raise _Error(_C.OTS_ERROR_INVALID_ARGUMENT, 'handle is NULL')
+    obj: _Object | None = _OBJECTS.get(_address(handle.ptr))
+    if obj is None or (handleType is not None and obj.handleType != handleType):
+        raise _Error(_C.OTS_ERROR_INVALID_ARGUMENT, 'invalid handle')
+    return obj
+
+
+def _bytes(value, size: int | None = None) -> bytes:
+    """
+    Converts an argument given as bytes or as cdata to bytes.
+    :meta private:
+    """
+    if value is None:
+        return b''
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value if size is None else memoryview(value)[:size])
+    if value == ffi.NULL:
+        return b''
+    if size is None:
+        return ffi.string(ffi.cast('char *', value))
+    return ffi.unpack(ffi.cast('char *', value), size)
+
+
+def _text(value) -> str:
+    """
+    :meta private:
+    """
+    try:
+        return _bytes(value).decode('utf-8')
+    except UnicodeDecodeError:
+        raise _Error(_C.OTS_ERROR_INVALID_ARGUMENT, 'string is not UTF-8')
+
+
+# --- results -------------------------------------------------------------------------------------
+
+
+def _result(resultType: int, keep=None, owned: _Object | None = None):
+    """
+    Creates a result, it is kept alive until :py:func:`ots_free_result`.
+    :meta private:
+    """
+    result = ffi.new('ots_result_t *')
+    result.type = resultType
+    _RESULTS[_address(result)] = [result, keep, owned]
+    return result
+
+
+def _error(code: int, message: str):
+    """
+    :meta private:
+    """
+    result = _result(_C.OTS_RESULT_NONE)
+    result.error.code = code
+    result.error.message = message.encode('utf-8')[:_C.OTS_MAX_ERROR_MESSAGE - 1]
+    result.error.cls = _ERROR_CLASSES.get(code, 'ots::exception::Exception').encode('utf-8')[:_C.OTS_MAX_ERROR_CLASS - 1]
+    return result
+
+
+def _string(value: str | bytes):
+    """
+    :meta private:
+    """
+    data: bytes = value.encode('utf-8') if isinstance(value, str) else value
+    buffer = ffi.new('char[]', data)
+    result = _result(_C.OTS_RESULT_STRING | _C.OTS_RESULT_ARRAY, buffer)
+    result.result.data.ptr = buffer
+    result.result.data.size = len(data)
+    result.result.data.type = _C.OTS_DATA_CHAR
+    return result
+
+
+def _array(cType: str, dataType: int, values: list[int]):
+    """
+    :meta private:
+    """
+    buffer = ffi.new(f'{cType}[]', values or 1)
+    result = _result(_C.OTS_RESULT_ARRAY, buffer)
+    result.result.data.ptr = buffer
+    result.result.data.size = len(values)
+    result.result.data.type = dataType
+    return result
+
+
+def _handles(array, size: int, reference: bool = True):
+    """
+    A result with an array of handles.
+    :meta private:
+    """
+    result = _result(_C.OTS_RESULT_ARRAY, array)
+    result.result.data.ptr = array
+    result.result.data.size = size
+    result.result.data.type = _C.OTS_DATA_HANDLE
+    result.result.data.reference = reference
+    return result
+
+
+def _boolean(value: bool):
+    """
+    :meta private:
+    """
+    result = _result(_C.OTS_RESULT_BOOLEAN)
+    result.result.boolean = bool(value)
+    return result
+
+
+def _number(value: int, resultType: int = 0):
+    """
+    :meta private:
+    """
+    result = _result(_C.OTS_RESULT_NUMBER | resultType)
+    result.result.number = value
+    return result
+
+
+def _handle(obj: _Object, reference: bool = False):
+    """
+    A result with the handle of an object. Owning results free the object if the handle is never taken.
+    :meta private:
+    """
+    result = _result(_C.OTS_RESULT_HANDLE, None, None if reference else obj)
+    result.result.handle.type = obj.handleType
+    result.result.handle.ptr = ffi.cast('void *', obj.id)
+    result.result.handle.reference = reference
+    return result
+
+
+def _reference_array(objects: list[_Object]):
+    """
+    :meta private:
+    """
+    array = ffi.new('ots_handle_t[]', max(len(objects), 1))
+    for i, obj in enumerate(objects):
+        array[i].type = obj.handleType
+        array[i].ptr = ffi.cast('void *', obj.id)
+        array[i].reference = True
+    return array
+
+
+def ots_free_result(result) -> None:
+    if result == ffi.NULL or result[0] == ffi.NULL:
+        return
+    entry: list | None = _RESULTS.pop(_address(result[0]), None)
+    if entry is not None and entry[2] is not None:
+        entry[2].release()
+    result[0] = ffi.NULL
+
+
+def ots_free_handle(handle) -> None:
+    if handle == ffi.NULL or handle[0] == ffi.NULL:
+        return
+    pointer = handle[0]
+    if not pointer.reference:
+        obj: _Object | None = _OBJECTS.get(_address(pointer.ptr))
+        if obj is not None:
+            obj.release()
+    _HANDLES.pop(_address(pointer), None)
+    handle[0] = ffi.NULL
+
+
+def ots_free_handle_object(handle) -> None:
+    if handle != ffi.NULL and not handle.reference:
+        obj: _Object | None = _OBJECTS.get(_address(handle.ptr))
+        if obj is not None:
+            obj.release()
+
+
+def ots_free_string(string) -> None:
+    if string != ffi.NULL:
+        string[0] = ffi.NULL
+
+
+def ots_free_binary_string(string, size: int) -> None:
+    ots_free_string(string)
+
+
+def ots_free_array(array, elementSize: int, count: int) -> None:
+    if array != ffi.NULL:
+        array[0] = ffi.NULL
+
+
+def ots_secure_free(buffer, size: int) -> None:
+    if buffer != ffi.NULL:
+        buffer[0] = ffi.NULL
+
+
+def ots_free_tx_description(description) -> None:
+    if description == ffi.NULL or description[0] == ffi.NULL:
+        return
+    _TX_DESCRIPTIONS.pop(_address(description[0]), None)
+    description[0] = ffi.NULL
+
+
+def ots_handle_valid(handle, handleType: int) -> bool:
+    return handle != ffi.NULL and handle.type == handleType and handle.ptr != ffi.NULL
+
+
+def ots_is_error(result) -> bool:
+    return result == ffi.NULL or result.error.code != 0
+
+
+def ots_is_result(result) -> bool:
+    return not ots_is_error(result)
+
+
+def ots_error_message(result):
+    return result.error.message
+
+
+def ots_error_class(result):
+    return result.error.cls
+
+
+def ots_error_code(result) -> int:
+    return result.error.code
+
+
+def ots_result_is_type(result, resultType: int) -> bool:
+    if resultType == _C.OTS_RESULT_NONE:
+        return result.type == _C.OTS_RESULT_NONE
+    return result.type & resultType == resultType
+
+
+def ots_result_is_handle(result) -> bool:
+    return ots_result_is_type(result, _C.OTS_RESULT_HANDLE)
+
+
+def ots_result_is_string(result) -> bool:
+    return ots_result_is_type(result, _C.OTS_RESULT_STRING)
+
+
+def ots_result_is_boolean(result) -> bool:
+    return ots_result_is_type(result, _C.OTS_RESULT_BOOLEAN)
+
+
+def ots_result_is_number(result) -> bool:
+    return ots_result_is_type(result, _C.OTS_RESULT_NUMBER)
+
+
+def ots_result_is_comparison(result) -> bool:
+    return ots_result_is_type(result, _C.OTS_RESULT_COMPARISON)
+
+
+def ots_result_is_array(result) -> bool:
+    return ots_result_is_type(result, _C.OTS_RESULT_ARRAY)
+
+
+def ots_result_is_address_type(result) -> bool:
+    return ots_result_is_type(result, _C.OTS_RESULT_ADDRESS_TYPE)
+
+
+def ots_result_is_network(result) -> bool:
+    return ots_result_is_type(result, _C.OTS_RESULT_NETWORK)
+
+
+def ots_result_is_seed_type(result) -> bool:
+    return ots_result_is_type(result, _C.OTS_RESULT_SEED_TYPE)
+
+
+def ots_result_is_address_index(result) -> bool:
+    return ots_result_is_type(result, _C.OTS_RESULT_ADDRESS_INDEX)
+
+
+def ots_result_is_equal(result) -> bool:
+    return ots_result_is_comparison(result) and result.result.number == 0
+
+
+def ots_result_handle_is_type(result, handleType: int) -> bool:
+    return ots_result_is_handle(result) and result.result.handle.type == handleType
+
+
+def ots_result_is_wipeable_string(result) -> bool:
+    return ots_result_handle_is_type(result, _C.OTS_HANDLE_WIPEABLE_STRING)
+
+
+def ots_result_is_seed_indices(result) -> bool:
+    return ots_result_handle_is_type(result, _C.OTS_HANDLE_SEED_INDICES)
+
+
+def ots_result_is_seed_language(result) -> bool:
+    return ots_result_handle_is_type(result, _C.OTS_HANDLE_SEED_LANGUAGE)
+
+
+def ots_result_is_address(result) -> bool:
+    return ots_result_handle_is_type(result, _C.OTS_HANDLE_ADDRESS)
+
+
+def ots_result_is_seed(result) -> bool:
+    return ots_result_handle_is_type(result, _C.OTS_HANDLE_SEED)
+
+
+def ots_result_is_wallet(result) -> bool:
+    return ots_result_handle_is_type(result, _C.OTS_HANDLE_WALLET)
+
+
+def ots_result_is_transaction(result) -> bool:
+    return ots_result_handle_is_type(result, _C.OTS_HANDLE_TX)
+
+
+def ots_result_is_transaction_description(result) -> bool:
+    return ots_result_handle_is_type(result, _C.OTS_HANDLE_TX_DESCRIPTION)
+
+
+def ots_result_is_transaction_warning(result) -> bool:
+    return ots_result_handle_is_type(result, _C.OTS_HANDLE_TX_WARNING)
+
+
+def ots_result_handle_is_reference(result) -> bool:
+    return ots_result_is_handle(result) and bool(result.result.handle.reference)
+
+
+def ots_result_data_is_type(result, dataType: int) -> bool:
+    return (ots_result_is_array(result) or ots_result_is_string(result)) and result.result.data.type == dataType
+
+
+def ots_result_data_is_int(result) -> bool:
+    return ots_result_data_is_type(result, _C.OTS_DATA_INT)
+
+
+def ots_result_data_is_char(result) -> bool:
+    return ots_result_data_is_type(result, _C.OTS_DATA_CHAR)
+
+
+def ots_result_data_is_uint8(result) -> bool:
+    return ots_result_data_is_type(result, _C.OTS_DATA_UINT8)
+
+
+def ots_result_data_is_uint16(result) -> bool:
+    return ots_result_data_is_type(result, _C.OTS_DATA_UINT16)
+
+
+def ots_result_data_is_uint32(result) -> bool:
+    return ots_result_data_is_type(result, _C.OTS_DATA_UINT32)
+
+
+def ots_result_data_is_uint64(result) -> bool:
+    return ots_result_data_is_type(result, _C.OTS_DATA_UINT64)
+
+
+def ots_result_data_is_handle(result) -> bool:
+    return ots_result_data_is_type(result, _C.OTS_DATA_HANDLE)
+
+
+def ots_result_data_is_reference(result) -> bool:
+    return ots_result_is_array(result) and bool(result.result.data.reference)
+
+
+def ots_result_data_handle_is_reference(result) -> bool:
+    return ots_result_data_is_handle(result) and bool(result.result.data.reference)
+
+
+def ots_result_data_handle_is_type(result, handleType: int) -> bool:
+    if not ots_result_data_is_handle(result):
+        return False
+    array = ffi.cast('ots_handle_t *', result.result.data.ptr)
+    return all(array[i].type == handleType for i in range(result.result.data.size))
+
+
+def ots_result_data_handle_is_wipeable_string(result) -> bool:
+    return ots_result_data_handle_is_type(result, _C.OTS_HANDLE_WIPEABLE_STRING)
+
+
+def ots_result_data_handle_is_seed_indices(result) -> bool:
+    return ots_result_data_handle_is_type(result, _C.OTS_HANDLE_SEED_INDICES)
+
+
+def ots_result_data_handle_is_seed_language(result) -> bool:
+    return ots_result_data_handle_is_type(result, _C.OTS_HANDLE_SEED_LANGUAGE)
+
+
+def ots_result_data_handle_is_address(result) -> bool:
+    return ots_result_data_handle_is_type(result, _C.OTS_HANDLE_ADDRESS)
+
+
+def ots_result_data_handle_is_seed(result) -> bool:
+    return ots_result_data_handle_is_type(result, _C.OTS_HANDLE_SEED)
+
+
+def ots_result_data_handle_is_wallet(result) -> bool:
+    return ots_result_data_handle_is_type(result, _C.OTS_HANDLE_WALLET)
+
+
+def ots_result_data_handle_is_transaction(result) -> bool:
+    return ots_result_data_handle_is_type(result, _C.OTS_HANDLE_TX)
+
+
+def ots_result_data_handle_is_transaction_description(result) -> bool:
+    return ots_result_data_handle_is_type(result, _C.OTS_HANDLE_TX_DESCRIPTION)
+
+
+def ots_result_data_handle_is_transaction_warning(result) -> bool:
+    return ots_result_data_handle_is_type(result, _C.OTS_HANDLE_TX_WARNING)
+
+
+def ots_result_handle(result):
+    if not ots_result_is_handle(result):
+        return ffi.cast('ots_handle_t *', ffi.NULL)
+    source = result.result.handle
+    obj: _Object | None = _OBJECTS.get(_address(source.ptr))
+    if source.reference and obj is not None:
+        return obj.reference()
+    handle = ffi.new('ots_handle_t *', {'type': source.type, 'ptr': source.ptr, 'reference': source.reference})
+    _HANDLES[_address(handle)] = handle
+    entry: list | None = _RESULTS.get(_address(result))
+    if entry is not None:
+        entry[2] = None  # the handle owns the object now
+    return handle
+
+
+def ots_result_string(result):
+    if not ots_result_is_string(result):
+        return ffi.cast('char *', ffi.NULL)
+    return ffi.cast('char *', result.result.data.ptr)
+
+
+def ots_result_string_copy(result):
+    return ots_result_string(result)
+
+
+def ots_result_boolean(result, default: bool) -> bool:
+    return bool(result.result.boolean) if ots_result_is_boolean(result) else default
+
+
+def ots_result_number(result, default: int) -> int:
+    return result.result.number if ots_result_is_number(result) else default
+
+
+def ots_result_comparison(result) -> int:
+    return result.result.number
+
+
+def ots_result_size(result) -> int:
+    if ots_result_is_array(result) or ots_result_is_string(result):
+        return result.result.data.size
+    return 0
+
+
+def ots_result_address_type(result) -> int:
+    return result.result.number
+
+
+def ots_result_address_type_is_type(result, addressType: int) -> bool:
+    return ots_result_is_address_type(result) and result.result.number == addressType
+
+
+def ots_result_network(result) -> int:
+    return result.result.number
+
+
+def ots_result_network_is_type(result, network: int) -> bool:
+    return ots_result_is_network(result) and result.result.number == network
+
+
+def ots_result_seed_type(result) -> int:
+    return result.result.number
+
+
+def ots_result_seed_type_is_type(result, seedType: int) -> bool:
+    return ots_result_is_seed_type(result) and result.result.number == seedType
+
+
+def ots_result_address_index_account(result) -> int:
+    return (result.result.number >> 32) & 0xFFFFFFFF
+
+
+def ots_result_address_index_index(result) -> int:
+    return result.result.number & 0xFFFFFFFF
+
+
+def ots_result_array(result):
+    return result.result.data.ptr
+
+
+def ots_result_array_reference(result):
+    return result.result.data.ptr
+
+
+def ots_result_array_get(result, index: int):
+    size: int = ffi.sizeof(_DATA_TYPES[result.result.data.type])
+    return ffi.cast('char *', result.result.data.ptr) + index * size
+
+
+def ots_result_array_get_char(result, index: int) -> bytes:
+    return ffi.cast('char *', result.result.data.ptr)[index]
+
+
+def ots_result_array_get_int(result, index: int) -> int:
+    return ffi.cast('int *', result.result.data.ptr)[index]
+
+
+def ots_result_array_get_uint8(result, index: int) -> int:
+    return ffi.cast('uint8_t *', result.result.data.ptr)[index]
+
+
+def ots_result_array_get_uint16(result, index: int) -> int:
+    return ffi.cast('uint16_t *', result.result.data.ptr)[index]
+
+
+def ots_result_array_get_uint32(result, index: int) -> int:
+    return ffi.cast('uint32_t *', result.result.data.ptr)[index]
+
+
+def ots_result_array_get_uint64(result, index: int) -> int:
+    return ffi.cast('uint64_t *', result.result.data.ptr)[index]
+
+
+def ots_result_array_get_handle(result, index: int):
+    return ffi.cast('ots_handle_t *', result.result.data.ptr) + index
+
+
+def ots_result_char_array(result):
+    return ffi.cast('char *', result.result.data.ptr)
+
+
+def ots_result_char_array_reference(result):
+    return ffi.cast('char *', result.result.data.ptr)
+
+
+def ots_result_int_array(result):
+    return ffi.cast('int *', result.result.data.ptr)
+
+
+def ots_result_int_array_reference(result):
+    return ffi.cast('int *', result.result.data.ptr)
+
+
+def ots_result_uint8_array(result):
+    return ffi.cast('uint8_t *', result.result.data.ptr)
+
+
+def ots_result_uint8_array_reference(result):
+    return ffi.cast('uint8_t *', result.result.data.ptr)
+
+
+def ots_result_uint16_array(result):
+    return ffi.cast('uint16_t *', result.result.data.ptr)
+
+
+def ots_result_uint16_array_reference(result):
+    return ffi.cast('uint16_t *', result.result.data.ptr)
+
+
+def ots_result_uint32_array(result):
+    return ffi.cast('uint32_t *', result.result.data.ptr)
+
+
+def ots_result_uint32_array_reference(result):
+    return ffi.cast('uint32_t *', result.result.data.ptr)
+
+
+def ots_result_uint64_array(result):
+    return ffi.cast('uint64_t *', result.result.data.ptr)
+
+
+def ots_result_uint64_array_reference(result):
+    return ffi.cast('uint64_t *', result.result.data.ptr)
+
+
+def ots_result_handle_array(result):
+    return ffi.cast('ots_handle_t *', result.result.data.ptr)
+
+
+def ots_result_handle_array_reference(result):
+    return ffi.cast('ots_handle_t *', result.result.data.ptr)
+
+
+_DATA_TYPES: dict[int, str] = {
+    _C.OTS_DATA_INT: 'int',
+    _C.OTS_DATA_CHAR: 'char',
+    _C.OTS_DATA_UINT8: 'uint8_t',
+    _C.OTS_DATA_UINT16: 'uint16_t',
+    _C.OTS_DATA_UINT32: 'uint32_t',
+    _C.OTS_DATA_UINT64: 'uint64_t',
+    _C.OTS_DATA_HANDLE: 'ots_handle_t',
+}
+
+
+# --- general -------------------------------------------------------------------------------------
+
+
+_enforceEntropy: bool = True
+_entropyLevel: float = 3.5
+_maxAccountDepth: int | None = None
+_maxIndexDepth: int | None = None
+_DEFAULT_ACCOUNT_DEPTH: int = 10
+_DEFAULT_INDEX_DEPTH: int = 100
+
+
+def ots_version():
+    return _string('.'.join(str(i) for i in VERSION))
+
+
+def ots_version_components():
+    return _array('int', _C.OTS_DATA_INT, list(VERSION))
+
+
+def _height(timestamp: int) -> int:
+    """
+    :meta private:
+    """
+    return max(0, (timestamp - GENESIS) // BLOCK_TIME)
+
+
+def _timestamp(height: int) -> int:
+    """
+    :meta private:
+    """
+    return GENESIS + height * BLOCK_TIME
+
+
+def _network(network: int) -> int:
+    """
+    :meta private:
+    """
+    if network not in (_C.OTS_NETWORK_MAIN, _C.OTS_NETWORK_TEST, _C.OTS_NETWORK_STAGE):
+        raise _Error(_C.OTS_ERROR_INVALID_ARGUMENT, f'invalid network {network}')
+    return network
+
+
+@_native
+def ots_height_from_timestamp(timestamp: int, network: int):
+    _network(network)
+    return _number(_height(timestamp))
+
+
+@_native
+def ots_timestamp_from_height(height: int, network: int):
+    _network(network)
+    return _number(_timestamp(height))
+
+
+def ots_py_heights_from_timestamps(timestamps, heights, size: int, network: int) -> int:
+    if network not in (_C.OTS_NETWORK_MAIN, _C.OTS_NETWORK_TEST, _C.OTS_NETWORK_STAGE):
+        return 1 if size else 0
+    for i in range(size):
+        heights[i] = _height(timestamps[i])
+    return 0
+
+
+def ots_py_timestamps_from_heights(heights, timestamps, size: int, network: int) -> int:
+    if network not in (_C.OTS_NETWORK_MAIN, _C.OTS_NETWORK_TEST, _C.OTS_NETWORK_STAGE):
+        return 1 if size else 0
+    for i in range(size):
+        timestamps[i] = _timestamp(heights[i])
+    return 0
+
+
+def _entropy(data: bytes) -> float:
+    """
+    The Shannon entropy in bits per byte.
+    :meta private:
+    """
+    counts: dict[int, int] = {}
+    for byte in data:
+        counts[byte] = counts.get(byte, 0) + 1
+    total: int = len(data)
+    return 0.0 - sum(c / total * log2(c / total) for c in counts.values()) if total else 0.0
+
+
+@_native
+def ots_random_bytes(size: int):
+    data: bytes = urandom(size)
+    if _enforceEntropy and _entropy(data) < _entropyLevel:
+        raise _Error(_C.OTS_ERROR_LOW_ENTROPY, 'random bytes have low entropy')
+    return _array('uint8_t', _C.OTS_DATA_UINT8, list(data))
+
+
+def ots_random_32():
+    return ots_random_bytes(32)
+
+
+@_native
+def ots_check_low_entropy(data, size: int, minEntropy: float):
+    return _boolean(_entropy(_bytes(data, size)) < minEntropy)
+
+
+@_native
+def ots_entropy_level(data, size: int):
+    return _string(repr(_entropy(_bytes(data, size))))
+
+
+def ots_set_enforce_entropy(enforce: bool) -> None:
+    global _enforceEntropy
+    _enforceEntropy = bool(enforce)
+
+
+def ots_set_enforce_entropy_level(level: float) -> None:
+    global _entropyLevel
+    _entropyLevel = float(level)
+
+
+def ots_set_max_account_depth(depth: int) -> None:
+    global _maxAccountDepth
+    _maxAccountDepth = depth
+
+
+def ots_set_max_index_depth(depth: int) -> None:
+    global _maxIndexDepth
+    _maxIndexDepth = depth
+
+
+def ots_set_max_depth(accountDepth: int, indexDepth: int) -> None:
+    ots_set_max_account_depth(accountDepth)
+    ots_set_max_index_depth(indexDepth)
+
+
+def ots_reset_max_depth() -> None:
+    global _maxAccountDepth, _maxIndexDepth
+    _maxAccountDepth = _maxIndexDepth = None
+
+
+def ots_get_max_account_depth(default: int) -> int:
+    if _maxAccountDepth is not None:
+        return _maxAccountDepth
+    return default or _DEFAULT_ACCOUNT_DEPTH
+
+
+def ots_get_max_index_depth(default: int) -> int:
+    if _maxIndexDepth is not None:
+        return _maxIndexDepth
+    return default or _DEFAULT_INDEX_DEPTH
+
+
+# --- wipeable strings ----------------------------------------------------------------------------
+
+
+class _WipeableString(_Object):
+    """
+    :meta private:
+    """
+    handleType: int = _C.OTS_HANDLE_WIPEABLE_STRING
+
+    def __init__(self, data: bytes):
+        super().__init__()
+        self.data: bytes = data
+        self.buffer = ffi.new('char[]', data)
+
+
+@_native
+def ots_wipeable_string_create(string):
+    return _handle(_WipeableString(_bytes(string)))
+
+
+def ots_wipeable_string_c_str(string):
+    return _object(string, _C.OTS_HANDLE_WIPEABLE_STRING).buffer
+
+
+@_native
+def ots_wipeable_string_compare(first, second):
+    a: bytes = _object(first, _C.OTS_HANDLE_WIPEABLE_STRING).data
+    b: bytes = _object(second, _C.OTS_HANDLE_WIPEABLE_STRING).data
+    return _number((a > b) - (a < b), _C.OTS_RESULT_COMPARISON)
+
+
+# --- seed indices --------------------------------------------------------------------------------
+
+
+class _SeedIndices(_Object):
+    """
+    :meta private:
+    """
+    handleType: int = _C.OTS_HANDLE_SEED_INDICES
+
+    def __init__(self, values: list[int]):
+        super().__init__()
+        self.values: list[int] = values
+        self.buffers: dict[str, object] = {}
+
+    def keep(self, kind: str, buffer):
+        """
+        Keeps the last buffer of a kind handed out alive, like the buffers of the library until the next call.
+        """
+        self.buffers[kind] = buffer
+        return buffer
+
+
+def _indices(values: list[int]) -> list[int]:
+    """
+    :meta private:
+    """
+    if any(not 0 <= value <= 0xFFFF for value in values):
+        raise _Error(_C.OTS_ERROR_OUT_OF_RANGE, 'seed index out of range')
+    return values
+
+
+@_native
+def ots_seed_indices_create(values, size: int):
+    return _handle(_SeedIndices(_indices([int(values[i]) for i in range(size)])))
+
+
+def _split(string: str, separator: str, width: int) -> list[str]:
+    """
+    :meta private:
+    """
+    if separator:
+        parts: list[str] = string.split() if separator.isspace() else string.split(separator)
+        return [part.strip() for part in parts if part.strip()]
+    return [string[i:i + width] for i in range(0, len(string), width)]
+
+
+@_native
+def ots_seed_indices_create_from_string(string, separator):
+    try:
+        values: list[int] = [int(part, 10) for part in _split(_text(string), _text(separator), 4)]
+    except ValueError:
+        raise _Error(_C.OTS_ERROR_INVALID_ARGUMENT, 'invalid seed indices')
+    return _handle(_SeedIndices(_indices(values)))
+
+
+@_native
+def ots_seed_indices_create_from_hex(string, separator):
+    try:
+        values: list[int] = [int(part, 16) for part in _split(_text(string), _text(separator), 3)]
+    except ValueError:
+        raise _Error(_C.OTS_ERROR_INVALID_ARGUMENT, 'invalid seed indices')
+    return _handle(_SeedIndices(_indices(values)))
+
+
+def ots_seed_indices_values(handle):
+    indices: _SeedIndices = _object(handle, _C.OTS_HANDLE_SEED_INDICES)
+    return indices.keep('values', ffi.new('uint16_t[]', indices.values or [0]))
+
+
+def ots_seed_indices_count(handle) -> int:
+    return len(_object(handle, _C.OTS_HANDLE_SEED_INDICES).values)
+
+
+def ots_seed_indices_clear(handle) -> None:
+    _object(handle, _C.OTS_HANDLE_SEED_INDICES).values = []
+
+
+def ots_seed_indices_append(handle, value: int) -> None:
+    _object(handle, _C.OTS_HANDLE_SEED_INDICES).values.append(value & 0xFFFF)
+
+
+def ots_seed_indices_numeric(handle, separator):
+    indices: _SeedIndices = _object(handle, _C.OTS_HANDLE_SEED_INDICES)
+    text: str = _text(separator).join(f'{value:04d}' for value in indices.values)
+    return indices.keep('numeric', ffi.new('char[]', text.encode('utf-8')))
+
+
+def ots_seed_indices_hex(handle, separator):
+    indices: _SeedIndices = _object(handle, _C.OTS_HANDLE_SEED_INDICES)
+    text: str = _text(separator).join(f'{value:03X}' for value in indices.values)
+    return indices.keep('hex', ffi.new('char[]', text.encode('utf-8')))
+
+
+def _merge(handles: list, zero: bool):
+    """
+    :meta private:
+    """
+    objects: list[_SeedIndices] = [_object(handle, _C.OTS_HANDLE_SEED_INDICES) for handle in handles]
+    if not objects:
+        raise _Error(_C.OTS_ERROR_INVALID_ARGUMENT, 'nothing to merge')
+    size: int = len(objects[0].values)
+    if any(len(obj.values) != size for obj in objects):
+        raise _Error(_C.OTS_ERROR_SEED_LENGTH_MISMATCH, 'seed indices differ in length')
+    merged: list[int] = [0] * size
+    for obj in objects:
+        merged = [a ^ b for a, b in zip(merged, obj.values)]
+        if zero:
+            obj.values = [0] * size
+    return _handle(_SeedIndices(merged))
+
+
+@_native
+def ots_seed_indices_merge_values(first, second):
+    return _merge([first, second], False)
+
+
+@_native
+def ots_seed_indices_merge_values_and_zero(first, second, zero: bool):
+    return _merge([first, second], zero)
+
+
+@_native
+def ots_seed_indices_merge_multiple_values(handles, elements: int, size: int):
+    return _merge([handles[i] for i in range(size)], False)
+
+
+@_native
+def ots_seed_indices_merge_multiple_values_and_zero(handles, elements: int, size: int, zero: bool):
+    return _merge([handles[i] for i in range(size)], zero)
+
+
+def _password_values(password: bytes, size: int) -> list[int]:
+    """
+    11 bit values derived from a password.
+    :meta private:
+    """
+    return [int.from_bytes(sha256(password + i.to_bytes(4, 'little')).digest()[:2], 'little') & 0x7FF for i in range(size)]
+
+
+@_native
+def ots_seed_indices_merge_with_password(handle, password):
+    indices: _SeedIndices = _object(handle, _C.OTS_HANDLE_SEED_INDICES)
+    mask: list[int] = _password_values(_bytes(password), len(indices.values))
+    return _handle(_SeedIndices([a ^ b for a, b in zip(indices.values, mask)]))
+
+
+@_native
+def ots_seed_indices_merge_with_password_and_zero(handle, password, zero: bool):
+    result = ots_seed_indices_merge_with_password(handle, password)
+    if zero:
+        indices: _SeedIndices = _object(handle, _C.OTS_HANDLE_SEED_INDICES)
+        indices.values = [0] * len(indices.values)
+    return result
+
+
+# --- seed languages ------------------------------------------------------------------------------
+
+
+class _SeedLanguage(_Object):
+    """
+    :meta private:
+    """
+    handleType: int = _C.OTS_HANDLE_SEED_LANGUAGE
+
+    def __init__(self, code: str, name: str, englishName: str, suffix: str, monero: bool, polyseed: bool):
+        super().__init__()
+        self.code: str = code
+        self.name: str = name
+        self.englishName: str = englishName
+        self.suffix: str = suffix
+        self.types: set[int] = {t for t, supported in ((_C.OTS_SEED_TYPE_MONERO, monero), (_C.OTS_SEED_TYPE_POLYSEED, polyseed)) if supported}
+
+    def release(self) -> None:
+        pass  # the languages are static
+
+    def words(self, values: list[int]) -> str:
+        return ' '.join(_STEMS[value] + self.suffix for value in values)
+
+
+# Made up words, a unique 4 letter stem per index with a 2 letter suffix per language.
+_SYLLABLES: list[str] = [c + v for c in 'bdfghjklmnprstvz' for v in 'aeiou']
+_STEMS: tuple[str, ...] = tuple(
+    _SYLLABLES[j // 80] + _SYLLABLES[j % 80] for j in ((i * 2579 + 1234) % 6400 for i in range(2048))
+)
+_STEM_INDEX: dict[str, int] = {stem: i for i, stem in enumerate(_STEMS)}
+_LANGUAGES: list[_SeedLanguage] = [
+    _SeedLanguage(*language) for language in (
+        ('nl', 'Nederlands', 'Dutch', 'ij', True, False),
+        ('en', 'English', 'English', 'ly', True, True),
+        ('es', 'Español', 'Spanish', 'os', True, True),
+        ('ru', 'русский язык', 'Russian', 'ov', True, False),
+        ('de', 'Deutsch', 'German', 'en', True, False),
+        ('lojban', 'Lojban', 'Lojban', 'ai', True, False),
+        ('ko', '한국어', 'Korean', 'im', False, True),
+        ('cs', 'čeština', 'Czech', 'ek', False, True),
+        ('fr', 'Français', 'French', 'ie', True, True),
+        ('pt', 'Português', 'Portuguese', 'ao', True, True),
+        ('zh-Hans', '简体中文 (中国)', 'Chinese (simplified)', 'an', True, True),
+        ('it', 'Italiano', 'Italian', 'io', True, True),
+        ('eo', 'Esperanto', 'Esperanto', 'oj', True, False),
+        ('jp', '日本語', 'Japanese', 'ku', True, True),
+        ('zh-Hant', '中文(繁體)', 'Chinese (Traditional)', 'un', False, True),
+    )
+]
+_defaultLanguages: dict[int, _SeedLanguage] = {}
+_languageArrays: dict[int | None, object] = {}
+
+
+def _language_for_type(language: _SeedLanguage, seedType: int) -> _SeedLanguage:
+    """
+    :meta private:
+    """
+    if seedType not in language.types:
+        raise _Error(_C.OTS_ERROR_SEED_LANGUAGE_NOT_SUPPORTED_BY_SEED_TYPE, f'{language.code} is not supported by the seed type')
+    return language
+
+
+def _find_language(key: str, value: str) -> _SeedLanguage:
+    """
+    :meta private:
+    """
+    for language in _LANGUAGES:
+        if getattr(language, key) == value:
+            return language
+    raise _Error(_C.OTS_ERROR_SEED_LANGUAGE_NOT_FOUND, f'language {value} not found')
+
+
+def _languages(seedType: int | None):
+    """
+    :meta private:
+    """
+    array = _languageArrays.get(seedType)
+    languages: list[_SeedLanguage] = [l for l in _LANGUAGES if seedType is None or seedType in l.types]
+    if array is None:
+        array = _languageArrays[seedType] = _reference_array(languages)
+    return _handles(array, len(languages))
+
+
+def ots_seed_languages():
+    return _languages(None)
+
+
+def ots_seed_languages_for_type(seedType: int):
+    return _languages(seedType)
+
+
+@_native
+def ots_seed_language_default(seedType: int):
+    language: _SeedLanguage | None = _defaultLanguages.get(seedType)
+    if language is None:
+        raise _Error(_C.OTS_ERROR_SEED_NO_DEFAULT_LANGUAGE_SET, 'no default language set')
+    return _handle(language, True)
+
+
+@_native
+def ots_seed_language_set_default(seedType: int, language):
+    _defaultLanguages[seedType] = _language_for_type(_object(language, _C.OTS_HANDLE_SEED_LANGUAGE), seedType)
+    return _boolean(True)
+
+
+@_native
+def ots_seed_language_is_default(language, seedType: int):
+    return _boolean(_defaultLanguages.get(seedType) is _object(language, _C.OTS_HANDLE_SEED_LANGUAGE))
+
+
+@_native
+def ots_seed_language_from_code(code):
+    return _handle(_find_language('code', _text(code)), True)
+
+
+@_native
+def ots_seed_language_from_name(name):
+    return _handle(_find_language('name', _text(name)), True)
+
+
+@_native
+def ots_seed_language_from_english_name(name):
+    return _handle(_find_language('englishName', _text(name)), True)
+
+
+@_native
+def ots_seed_language_code(language):
+    return _string(_object(language, _C.OTS_HANDLE_SEED_LANGUAGE).code)
+
+
+@_native
+def ots_seed_language_name(language):
+    return _string(_object(language, _C.OTS_HANDLE_SEED_LANGUAGE).name)
+
+
+@_native
+def ots_seed_language_english_name(language):
+    return _string(_object(language, _C.OTS_HANDLE_SEED_LANGUAGE).englishName)
+
+
+@_native
+def ots_seed_language_supported(language, seedType: int):
+    return _boolean(seedType in _object(language, _C.OTS_HANDLE_SEED_LANGUAGE).types)
+
+
+@_native
+def ots_seed_language_equals(first, second):
+    return _boolean(_object(first, _C.OTS_HANDLE_SEED_LANGUAGE) is _object(second, _C.OTS_HANDLE_SEED_LANGUAGE))
+
+
+@_native
+def ots_seed_language_equals_code(language, code):
+    return _boolean(_object(language, _C.OTS_HANDLE_SEED_LANGUAGE).code == _text(code))
+
+
+def _words_to_values(phrase: str, seedType: int, language: _SeedLanguage | None = None) -> list[int]:
+    """
+    Maps the words (or their 4 letter prefixes) of a phrase to their indices.
+    :meta private:
+    """
+    suffixes: tuple[str, ...] = tuple(l.suffix for l in ([language] if language else _LANGUAGES) if seedType in l.types)
+    values: list[int] = []
+    for word in phrase.split():
+        value: int | None = _STEM_INDEX.get(word[:4])
+        if value is None or (word[4:] and not any(suffix.startswith(word[4:]) for suffix in suffixes)):
+            raise _Error(_C.OTS_ERROR_SEED_SEED_DECODING_FAILED, f'unknown word {word}')
+        values.append(value)
+    return values
+
+
+# --- Monero base58 and addresses -----------------------------------------------------------------
+
+
+_ALPHABET: str = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+_ALPHABET_INDEX: dict[str, int] = {c: i for i, c in enumerate(_ALPHABET)}
+_ENCODED_SIZES: tuple[int, ...] = (0, 2, 3, 5, 6, 7, 9, 10, 11)
+_PREFIXES: dict[tuple[int, int], int] = {
+    (_C.OTS_NETWORK_MAIN, _C.OTS_ADDRESS_TYPE_STANDARD): 18,
+    (_C.OTS_NETWORK_MAIN, _C.OTS_ADDRESS_TYPE_INTEGRATED): 19,
+    (_C.OTS_NETWORK_MAIN, _C.OTS_ADDRESS_TYPE_SUBADDRESS): 42,
+    (_C.OTS_NETWORK_TEST, _C.OTS_ADDRESS_TYPE_STANDARD): 53,
+    (_C.OTS_NETWORK_TEST, _C.OTS_ADDRESS_TYPE_INTEGRATED): 54,
+    (_C.OTS_NETWORK_TEST, _C.OTS_ADDRESS_TYPE_SUBADDRESS): 63,
+    (_C.OTS_NETWORK_STAGE, _C.OTS_ADDRESS_TYPE_STANDARD): 24,
+    (_C.OTS_NETWORK_STAGE, _C.OTS_ADDRESS_TYPE_INTEGRATED): 25,
+    (_C.OTS_NETWORK_STAGE, _C.OTS_ADDRESS_TYPE_SUBADDRESS): 36,
+}
+_PREFIX_KINDS: dict[int, tuple[int, int]] = {prefix: kind for kind, prefix in _PREFIXES.items()}
+
+
+def _base58_encode(data: bytes) -> str:
+    """
+    Monero base58, in blocks of 8 bytes.
+    :meta private:
+    """
+    out: list[str] = []
+    for offset in range(0, len(data), 8):
+        block: bytes = data[offset:offset + 8]
+        number: int = int.from_bytes(block, 'big')
+        chars: list[str] = []
+        for _ in range(_ENCODED_SIZES[len(block)]):
+            number, digit = divmod(number, 58)
+            chars.append(_ALPHABET[digit])
+        out.append(''.join(reversed(chars)))
+    return ''.join(out)
+
+
+def _base58_decode(text: str) -> bytes | None:
+    """
+    :meta private:
+    """
+    out: bytearray = bytearray()
+    for offset in range(0, len(text), 11):
+        block: str = text[offset:offset + 11]
+        if len(block) not in _ENCODED_SIZES[1:]:
+            return None
+        size: int = _ENCODED_SIZES.index(len(block))
+        number: int = 0
+        for c in block:
+            digit: int | None = _ALPHABET_INDEX.get(c)
+            if digit is None:
+                return None
+            number = number * 58 + digit
+        if number >> (8 * size):
+            return None
+        out += number.to_bytes(size, 'big')
+    return bytes(out)
+
+
+_RC: tuple[int, ...] = (
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000,
+    0x000000000000808B, 0x0000000080000001, 0x8000000080008081, 0x8000000000008009,
+    0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003,
+    0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+    0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+)
+_ROTATIONS: tuple[tuple[int, ...], ...] = (
+    (0, 36, 3, 41, 18), (1, 44, 10, 45, 2), (62, 6, 43, 15, 61), (28, 55, 25, 21, 56), (27, 20, 39, 8, 14),
+)
+_MASK64: int = (1 << 64) - 1
+
+
+def _keccak256(data: bytes) -> bytes:
+    """
+    The original Keccak-256 of Monero (not SHA3), only to accept the checksums of real addresses.
+    :meta private:
+    """
+    rate: int = 136
+    padded: bytearray = bytearray(data) + b'\x01' + bytes((-len(data) - 1) % rate)
+    padded[-1] |= 0x80
+    state: list[list[int]] = [[0] * 5 for _ in range(5)]
+    for offset in range(0, len(padded), rate):
+        for i in range(rate // 8):
+            state[i % 5][i // 5] ^= int.from_bytes(padded[offset + 8 * i:offset + 8 * i + 8], 'little')
+        for rc in _RC:
+            c: list[int] = [state[x][0] ^ state[x][1] ^ state[x][2] ^ state[x][3] ^ state[x][4] for x in range(5)]
+            d: list[int] = [c[(x - 1) % 5] ^ (((c[(x + 1) % 5] << 1) | (c[(x + 1) % 5] >> 63)) & _MASK64) for x in range(5)]
+            b: list[list[int]] = [[0] * 5 for _ in range(5)]
+            for x in range(5):
+                for y in range(5):
+                    value: int = state[x][y] ^ d[x]
+                    r: int = _ROTATIONS[x][y]
+                    b[y][(2 * x + 3 * y) % 5] = ((value << r) | (value >> (64 - r))) & _MASK64 if r else value
+            for x in range(5):
+                for y in range(5):
+                    state[x][y] = b[x][y] ^ ((~b[(x + 1) % 5][y]) & b[(x + 2) % 5][y])
+            state[0][0] ^= rc
+    return b''.join(state[i % 5][i // 5].to_bytes(8, 'little') for i in range(4))
+
+
+class _Address(_Object):
+    """
+    :meta private:
+    """
+    handleType: int = _C.OTS_HANDLE_ADDRESS
+
+    def __init__(self, network: int, addressType: int, spend: bytes, view: bytes, paymentId: bytes = b'', keccak: bool = False):
+        super().__init__()
+        self.network: int = network
+        self.addressType: int = addressType
+        self.spend: bytes = spend
+        self.view: bytes = view
+        self.paymentId: bytes = paymentId
+        self.keccak: bool = keccak
+        self._base58: str | None = None
+
+    @property
+    def base58(self) -> str:
+        if self._base58 is None:
+            data: bytes = bytes([_PREFIXES[(self.network, self.addressType)]]) + self.spend + self.view + self.paymentId
+            checksum: bytes = _keccak256(data) if self.keccak else sha3_256(data).digest()
+            self._base58 = _base58_encode(data + checksum[:4])
+        return self._base58
+
+    @property
+    def fingerprint(self) -> str:
+        return sha256(self.base58.encode('utf-8')).hexdigest()[-6:].upper()
+
+    def copy(self) -> '_Address':
+        """
+        :return: A new address object, for the results which own their address.
+        """
+        address: _Address = _Address(self.network, self.addressType, self.spend, self.view, self.paymentId, self.keccak)
+        address._base58 = self._base58
+        return address
+
+
+def _parse_address(text: str) -> _Address:
+    """
+    Parses an address, the checksum of the fake (SHA3-256) and of Monero (Keccak-256) are accepted.
+    :meta private:
+    """
+    data: bytes | None = _base58_decode(text) if len(text) in (95, 106) else None
+    kind: tuple[int, int] | None = _PREFIX_KINDS.get(data[0]) if data else None
+    if kind is None or len(data) != (77 if kind[1] == _C.OTS_ADDRESS_TYPE_INTEGRATED else 69):
+        raise _Error(_C.OTS_ERROR_ADDRESS_INVALID, 'invalid address')
+    keccak: bool = False
+    if sha3_256(data[:-4]).digest()[:4] != data[-4:]:
+        keccak = True
+        if _keccak256(data[:-4])[:4] != data[-4:]:
+            raise _Error(_C.OTS_ERROR_ADDRESS_INVALID, 'invalid address checksum')
+    address: _Address = _Address(kind[0], kind[1], data[1:33], data[33:65], data[65:-4], keccak)
+    address._base58 = text
+    return address
+
+
+def _string_address(text) -> _Address:
+    """
+    Parses an address given as string argument, the object is not registered.
+    :meta private:
+    """
+    address: _Address = _parse_address(_text(text))
+    address.release()
+    return address
+
+
+@_native
+def ots_address_create(address):
+    return _handle(_parse_address(_text(address)))
+
+
+@_native
+def ots_address_base58_string(address):
+    return _string(_object(address, _C.OTS_HANDLE_ADDRESS).base58)
+
+
+@_native
+def ots_address_fingerprint(address):
+    return _string(_object(address, _C.OTS_HANDLE_ADDRESS).fingerprint)
+
+
+@_native
+def ots_address_network(address):
+    return _number(_object(address, _C.OTS_HANDLE_ADDRESS).network, _C.OTS_RESULT_NETWORK)
+
+
+@_native
+def ots_address_type(address):
+    return _number(_object(address, _C.OTS_HANDLE_ADDRESS).addressType, _C.OTS_RESULT_ADDRESS_TYPE)
+
+
+@_native
+def ots_address_is_integrated(address):
+    return _boolean(_object(address, _C.OTS_HANDLE_ADDRESS).addressType == _C.OTS_ADDRESS_TYPE_INTEGRATED)
+
+
+@_native
+def ots_address_payment_id(address):
+    return _string(_object(address, _C.OTS_HANDLE_ADDRESS).paymentId.hex())
+
+
+@_native
+def ots_address_length(address):
+    return _number(len(_object(address, _C.OTS_HANDLE_ADDRESS).base58))
+
+
+@_native
+def ots_address_equal(first, second):
+    return _boolean(_object(first, _C.OTS_HANDLE_ADDRESS).base58 == _object(second, _C.OTS_HANDLE_ADDRESS).base58)
+
+
+@_native
+def ots_address_equal_string(address, other):
+    return _boolean(_object(address, _C.OTS_HANDLE_ADDRESS).base58 == _text(other))
+
+
+@_native
+def ots_address_from_integrated(address):
+    integrated: _Address = _object(address, _C.OTS_HANDLE_ADDRESS)
+    if integrated.addressType != _C.OTS_ADDRESS_TYPE_INTEGRATED:
+        raise _Error(_C.OTS_ERROR_ADDRESS_NOT_INTEGRATED, 'address is not integrated')
+    return _handle(_Address(integrated.network, _C.OTS_ADDRESS_TYPE_STANDARD, integrated.spend, integrated.view, b'', integrated.keccak))
+
+
+@_native
+def ots_address_string_valid(address, network: int):
+    try:
+        return _boolean(_string_address(address).network == network)
+    except _Error:
+        return _boolean(False)
+
+
+@_native
+def ots_address_string_network(address):
+    return _number(_string_address(address).network, _C.OTS_RESULT_NETWORK)
+
+
+@_native
+def ots_address_string_type(address):
+    return _number(_string_address(address).addressType, _C.OTS_RESULT_ADDRESS_TYPE)
+
+
+@_native
+def ots_address_string_fingerprint(address):
+    return _string(_string_address(address).fingerprint)
+
+
+@_native
+def ots_address_string_is_integrated(address):
+    return _boolean(_string_address(address).addressType == _C.OTS_ADDRESS_TYPE_INTEGRATED)
+
+
+@_native
+def ots_address_string_payment_id(address):
+    parsed: _Address = _string_address(address)
+    if parsed.addressType != _C.OTS_ADDRESS_TYPE_INTEGRATED:
+        raise _Error(_C.OTS_ERROR_ADDRESS_NOT_INTEGRATED, 'address is not integrated')
+    return _string(parsed.paymentId.hex())
+
+
+@_native
+def ots_address_string_integrated(address):
+    parsed: _Address = _string_address(address)
+    if parsed.addressType != _C.OTS_ADDRESS_TYPE_INTEGRATED:
+        raise _Error(_C.OTS_ERROR_ADDRESS_NOT_INTEGRATED, 'address is not integrated')
+    standard: _Address = _Address(parsed.network, _C.OTS_ADDRESS_TYPE_STANDARD, parsed.spend, parsed.view, b'', parsed.keccak)
+    standard.release()
+    return _string(standard.base58)
+
+
+# --- wallets -------------------------------------------------------------------------------------
+
+
+def _public(secret: bytes) -> bytes:
+    """
+    :meta private:
+    """
+    return sha256(b'ots fake public key' + secret).digest()
+
+
+def _signature(spend: bytes, view: bytes, data: bytes) -> str:
+    """
+    :meta private:
+    """
+    return 'SigV2' + _base58_encode(sha512(b'ots fake signature' + spend + view + data).digest())
+
+
+def _wallet_keys(key: bytes) -> tuple[bytes, bytes, bytes]:
+    """
+    :return: The secret view key, the public spend key and the public view key of a secret spend key.
+    :meta private:
+    """
+    view: bytes = sha256(b'ots fake view key' + key).digest()
+    return view, _public(key), _public(view)
+
+
+class _Wallet(_Object):
+    """
+    :meta private:
+    """
+    handleType: int = _C.OTS_HANDLE_WALLET
+
+    def __init__(self, key: bytes, height: int, network: int):
+        super().__init__()
+        self.secretSpend: bytes = key
+        self.secretView, self.publicSpend, self.publicView = _wallet_keys(key)
+        self.height: int = height
+        self.network: int = network
+        self.outputs: int = 0
+        self._keys: dict[tuple[int, int], tuple[bytes, bytes]] = {(0, 0): (self.publicSpend, self.publicView)}
+        self._addresses: dict[tuple[int, int], _Address] = {}
+        self._arrays: dict[tuple, object] = {}
+
+    def release(self) -> None:
+        super().release()
+        for address in self._addresses.values():
+            address.release()
+
+    def keys(self, account: int, index: int) -> tuple[bytes, bytes]:
+        """
+        :return: The public spend and view key of a subaddress.
+        """
+        keys: tuple[bytes, bytes] | None = self._keys.get((account, index))
+        if keys is None:
+            spend: bytes = sha256(
+                b'ots fake subaddress' + self.secretView + account.to_bytes(4, 'little') + index.to_bytes(4, 'little') + self.publicSpend
+            ).digest()
+            keys = self._keys[(account, index)] = (spend, sha256(b'ots fake subaddress view' + spend + self.secretView).digest())
+        return keys
+
+    def address(self, account: int, index: int) -> _Address:
+        """
+        :return: The address of a subaddress, owned by the wallet.
+        """
+        address: _Address | None = self._addresses.get((account, index))
+        if address is None:
+            addressType: int = _C.OTS_ADDRESS_TYPE_STANDARD if (account, index) == (0, 0) else _C.OTS_ADDRESS_TYPE_SUBADDRESS
+            address = self._addresses[(account, index)] = _Address(self.network, addressType, *self.keys(account, index))
+        return address
+
+    def addresses(self, key: tuple, indices: list[tuple[int, int]]):
+        """
+        :return: A result with the reference handles of addresses, the array is cached.
+        """
+        array = self._arrays.get(key)
+        if array is None:
+            array = self._arrays[key] = _reference_array([self.address(a, i) for a, i in indices])
+        return _handles(array, len(indices))
+
+    def index(self, address: _Address, accountDepth: int, indexDepth: int) -> tuple[int, int] | None:
+        """
+        Searches a subaddress within the depths.
+        """
+        if address.network != self.network:
+            return None
+        if address.addressType != _C.OTS_ADDRESS_TYPE_SUBADDRESS:
+            return (0, 0) if address.spend == self.publicSpend and address.view == self.publicView else None
+        for account in range(ots_get_max_account_depth(accountDepth)):
+            for index in range(ots_get_max_index_depth(indexDepth)):
+                if (account, index) != (0, 0) and self.keys(account, index) == (address.spend, address.view):
+                    return (account, index)
+        return None
+
+
+@_native
+def ots_wallet_create(key, height: int, network: int):
+    return _handle(_Wallet(_bytes(key, 32), height, _network(network)))
+
+
+@_native
+def ots_wallet_address(wallet):
+    return _handle(_object(wallet, _C.OTS_HANDLE_WALLET).address(0, 0).copy())
+
+
+@_native
+def ots_wallet_subaddress(wallet, account: int, index: int):
+    return _handle(_object(wallet, _C.OTS_HANDLE_WALLET).address(account, index).copy())
+
+
+@_native
+def ots_wallet_accounts(wallet, size: int, offset: int):
+    return _object(wallet, _C.OTS_HANDLE_WALLET).addresses(
+        ('accounts', size, offset), [(account, 0) for account in range(offset, offset + size)]
+    )
+
+
+@_native
+def ots_wallet_subaddresses(wallet, account: int, size: int, offset: int):
+    return _object(wallet, _C.OTS_HANDLE_WALLET).addresses(
+        ('subaddresses', account, size, offset), [(account, index) for index in range(offset, offset + size)]
+    )
+
+
+def _address_index(wallet, address: _Address, accountDepth: int, indexDepth: int):
+    """
+    :meta private:
+    """
+    index: tuple[int, int] | None = _object(wallet, _C.OTS_HANDLE_WALLET).index(address, accountDepth, indexDepth)
+    if index is None:
+        raise _Error(_C.OTS_ERROR_WALLET_ADDRESS_NOT_FOUND, 'address not found in wallet')
+    return _number(index[0] << 32 | index[1], _C.OTS_RESULT_ADDRESS_INDEX)
+
+
+@_native
+def ots_wallet_address_index(wallet, address, accountDepth: int, indexDepth: int):
+    return _address_index(wallet, _object(address, _C.OTS_HANDLE_ADDRESS), accountDepth, indexDepth)
+
+
+@_native
+def ots_wallet_address_string_index(wallet, address, accountDepth: int, indexDepth: int):
+    return _address_index(wallet, _string_address(address), accountDepth, indexDepth)
+
+
+@_native
+def ots_wallet_has_address(wallet, address, accountDepth: int, indexDepth: int):
+    found = _object(wallet, _C.OTS_HANDLE_WALLET).index(_object(address, _C.OTS_HANDLE_ADDRESS), accountDepth, indexDepth)
+    return _boolean(found is not None)
+
+
+@_native
+def ots_wallet_has_address_string(wallet, address, accountDepth: int, indexDepth: int):
+    found = _object(wallet, _C.OTS_HANDLE_WALLET).index(_string_address(address), accountDepth, indexDepth)
+    return _boolean(found is not None)
+
+
+@_native
+def ots_wallet_height(wallet):
+    return _number(_object(wallet, _C.OTS_HANDLE_WALLET).height)
+
+
+def _key(wallet, attribute: str):
+    """
+    :meta private:
+    """
+    return _handle(_WipeableString(getattr(_object(wallet, _C.OTS_HANDLE_WALLET), attribute).hex().encode('utf-8')))
+
+
+@_native
+def ots_wallet_secret_view_key(wallet):
+    return _key(wallet, 'secretView')
+
+
+@_native
+def ots_wallet_public_view_key(wallet):
+    return _key(wallet, 'publicView')
+
+
+@_native
+def ots_wallet_secret_spend_key(wallet):
+    return _key(wallet, 'secretSpend')
+
+
+@_native
+def ots_wallet_public_spend_key(wallet):
+    return _key(wallet, 'publicSpend')
+
+
+def _sign(wallet, data, size: int, account: int, index: int):
+    """
+    :meta private:
+    """
+    return _string(_signature(*_object(wallet, _C.OTS_HANDLE_WALLET).keys(account, index), _bytes(data, size)))
+
+
+def _signing_index(wallet, address: _Address) -> tuple[int, int]:
+    """
+    :meta private:
+    """
+    index: tuple[int, int] | None = _object(wallet, _C.OTS_HANDLE_WALLET).index(address, 0, 0)
+    if index is None:
+        raise _Error(_C.OTS_ERROR_WALLET_ADDRESS_NOT_FOUND, 'address not found in wallet')
+    return index
+
+
+@_native
+def ots_wallet_sign_data(wallet, data, size: int):
+    return _sign(wallet, data, size, 0, 0)
+
+
+@_native
+def ots_wallet_sign_data_with_index(wallet, data, size: int, account: int, index: int):
+    return _sign(wallet, data, size, account, index)
+
+
+@_native
+def ots_wallet_sign_data_with_address(wallet, data, size: int, address):
+    return _sign(wallet, data, size, *_signing_index(wallet, _object(address, _C.OTS_HANDLE_ADDRESS)))
+
+
+@_native
+def ots_wallet_sign_data_with_address_string(wallet, data, size: int, address):
+    return _sign(wallet, data, size, *_signing_index(wallet, _string_address(address)))
+
+
+def _verify(spend: bytes, view: bytes, data: bytes, signature) -> bool:
+    """
+    :meta private:
+    """
+    text: str = _text(signature)
+    if not text:
+        raise _Error(_C.OTS_ERROR_SIGN_EMPTY_SIGNATURE, 'signature is empty')
+    return text == _signature(spend, view, data)
+
+
+@_native
+def ots_wallet_verify_data(wallet, data, size: int, signature, legacyFallback: bool):
+    return _boolean(_verify(*_object(wallet, _C.OTS_HANDLE_WALLET).keys(0, 0), _bytes(data, size), signature))
+
+
+@_native
+def ots_wallet_verify_data_with_index(wallet, data, size: int, account: int, index: int, signature, legacyFallback: bool):
+    return _boolean(_verify(*_object(wallet, _C.OTS_HANDLE_WALLET).keys(account, index), _bytes(data, size), signature))
+
+
+@_native
+def ots_wallet_verify_data_with_address(wallet, data, size: int, address, signature, legacyFallback: bool):
+    parsed: _Address = _object(address, _C.OTS_HANDLE_ADDRESS)
+    return _boolean(_verify(parsed.spend, parsed.view, _bytes(data, size), signature))
+
+
+@_native
+def ots_wallet_verify_data_with_address_string(wallet, data, size: int, address, signature, legacyFallback: bool):
+    parsed: _Address = _string_address(address)
+    return _boolean(_verify(parsed.spend, parsed.view, _bytes(data, size), signature))
+
+
+@_native
+def ots_verify_data(data, size: int, address, signature):
+    parsed: _Address = _string_address(address)
+    return _boolean(_verify(parsed.spend, parsed.view, _bytes(data, size), signature))
+
+
+@_native
+def ots_wallet_import_outputs(wallet, outputs, size: int):
+    data: bytes = _bytes(outputs, size)
+    if not data.startswith(OUTPUTS_MAGIC):
+        raise _Error(_C.OTS_ERROR_WALLET_IMPORT_OUTPUTS, 'invalid outputs')
+    try:
+        imported: int = int(json.loads(data[len(OUTPUTS_MAGIC):]))
+    except ValueError:
+        raise _Error(_C.OTS_ERROR_WALLET_IMPORT_OUTPUTS, 'invalid outputs')
+    _object(wallet, _C.OTS_HANDLE_WALLET).outputs += imported
+    return _number(imported)
+
+
+@_native
+def ots_wallet_export_key_images(wallet):
+    obj: _Wallet = _object(wallet, _C.OTS_HANDLE_WALLET)
+    if not obj.outputs:
+        raise _Error(_C.OTS_ERROR_WALLET_EXPORT_KEY_IMAGES, 'no outputs imported')
+    return _string(KEY_IMAGES_MAGIC + b''.join(
+        sha256(b'ots fake key image' + obj.secretSpend + i.to_bytes(8, 'little')).digest() for i in range(obj.outputs)
+    ))
+
+
+# --- transactions --------------------------------------------------------------------------------
+
+
+def unsigned_tx_set(transfers: list[dict]) -> bytes:
+    """
+    Builds an unsigned tx set the fake backend can describe and sign.
+
+    .. code-block:: python
+
+        tx: bytes = unsigned_tx_set([{'flows': [(address, 1000000)], 'change': (change, 5000), 'fee': 300}])
+
+    Every transfer is a dict with ``flows`` (list of address and amount), and optional
+    ``change`` (address and amount, or None), ``fee``, ``amount_in`` (defaults to the sum
+    of the outputs and the fee), ``ring_size``, ``unlock_time``, ``payment_id``,
+    ``dummy_outputs`` and ``extra`` (bytes).
+
+    :param transfers: The transfers.
+    :type transfers: list[dict]
+    :return: The unsigned tx set.
+    """
+    normalized: list[dict] = []
+    for transfer in transfers:
+        flows: list[list] = [[str(address), int(amount)] for address, amount in transfer['flows']]
+        change: list | None = [str(transfer['change'][0]), int(transfer['change'][1])] if transfer.get('change') else None
+        fee: int = int(transfer.get('fee', 0))
+        amountOut: int = sum(amount for _, amount in flows) + (change[1] if change else 0)
+        normalized.append({
+            'amount_in': int(transfer.get('amount_in', amountOut + fee)),
+            'amount_out': amountOut,
+            'ring_size': int(transfer.get('ring_size', 16)),
+            'unlock_time': int(transfer.get('unlock_time', 0)),
+            'flows': flows,
+            'change': change,
+            'fee': fee,
+            'payment_id': transfer.get('payment_id'),
+            'dummy_outputs': int(transfer.get('dummy_outputs', 0)),
+            'extra': bytes(transfer.get('extra', b'')).hex(),
+        })
+    return UNSIGNED_TX_MAGIC + json.dumps(normalized).encode('utf-8')
+
+
+class _TxDescription(_Object):
+    """
+    :meta private:
+    """
+    handleType: int = _C.OTS_HANDLE_TX_DESCRIPTION
+
+    def __init__(self, txSet: bytes, transfers: list[dict]):
+        super().__init__()
+        self.txSet: bytes = txSet
+        self.transfers: list[dict] = transfers
+        self.flows: list[list] = [flow for transfer in transfers for flow in transfer['flows']]
+        changes: list[list] = [transfer['change'] for transfer in transfers if transfer['change']]
+        self.change: list | None = [changes[0][0], sum(amount for _, amount in changes)] if changes else None
+        self.strings: dict[object, object] = {}
+
+    def string(self, key, value: str | bytes | None):
+        """
+        :return: A char buffer kept alive as long as the description, NULL for None.
+        """
+        if value is None:
+            return ffi.NULL
+        buffer = self.strings.get(key)
+        if buffer is None:
+            buffer = self.strings[key] = ffi.new('char[]', value.encode('utf-8') if isinstance(value, str) else value)
+        return buffer
+
+
+def _parse_tx(data: bytes) -> list[dict]:
+    """
+    :meta private:
+    """
+    if not data.startswith(UNSIGNED_TX_MAGIC):
+        raise _Error(_C.OTS_ERROR_TX_PARSE, 'not an unsigned tx set')
+    try:
+        transfers: list[dict] = json.loads(data[len(UNSIGNED_TX_MAGIC):])
+        for transfer in transfers:
+            for address, _ in transfer['flows'] + ([transfer['change']] if transfer['change'] else []):
+                _parse_address(address).release()
+            if transfer['amount_in'] < transfer['amount_out'] + transfer['fee']:
+                raise _Error(_C.OTS_ERROR_TX_INVALID, 'inputs do not cover the outputs and the fee')
+    except (ValueError, KeyError, TypeError):
+        raise _Error(_C.OTS_ERROR_TX_PARSE, 'invalid unsigned tx set')
+    return transfers
+
+
+@_native
+def ots_wallet_describe_tx(wallet, tx, size: int):
+    _object(wallet, _C.OTS_HANDLE_WALLET)
+    data: bytes = _bytes(tx, size)
+    return _handle(_TxDescription(data, _parse_tx(data)))
+
+
+@_native
+def ots_wallet_check_tx(wallet, description):
+    _object(wallet, _C.OTS_HANDLE_WALLET)
+    _object(description, _C.OTS_HANDLE_TX_DESCRIPTION)
+    return _handles(ffi.new('ots_handle_t[]', 1), 0, False)
+
+
+@_native
+def ots_wallet_check_tx_string(wallet, tx, size: int):
+    _object(wallet, _C.OTS_HANDLE_WALLET)
+    _parse_tx(_bytes(tx, size))
+    return _handles(ffi.new('ots_handle_t[]', 1), 0, False)
+
+
+@_native
+def ots_wallet_sign_transaction(wallet, tx, size: int):
+    obj: _Wallet = _object(wallet, _C.OTS_HANDLE_WALLET)
+    data: bytes = _bytes(tx, size)
+    _parse_tx(data)
+    return _string(SIGNED_TX_MAGIC + sha512(b'ots fake signed tx' + obj.secretSpend + data).digest() + data[len(UNSIGNED_TX_MAGIC):])
+
+
+def _description(handle) -> _TxDescription:
+    """
+    :meta private:
+    """
+    return _object(handle, _C.OTS_HANDLE_TX_DESCRIPTION)
+
+
+def _transfer(handle, index: int) -> dict:
+    """
+    :meta private:
+    """
+    return _description(handle).transfers[index]
+
+
+def ots_tx_description_tx_set(handle):
+    description: _TxDescription = _description(handle)
+    return description.string('tx_set', description.txSet)
+
+
+def ots_tx_description_tx_set_size(handle) -> int:
+    return len(_description(handle).txSet)
+
+
+def ots_tx_description_amount_in(handle) -> int:
+    return sum(transfer['amount_in'] for transfer in _description(handle).transfers)
+
+
+def ots_tx_description_amount_out(handle) -> int:
+    return sum(transfer['amount_out'] for transfer in _description(handle).transfers)
+
+
+def ots_tx_description_fee(handle) -> int:
+    return sum(transfer['fee'] for transfer in _description(handle).transfers)
+
+
+def ots_tx_description_flows_count(handle) -> int:
+    return len(_description(handle).flows)
+
+
+def ots_tx_description_flow_address(handle, index: int):
+    description: _TxDescription = _description(handle)
+    return description.string(('flow', index), description.flows[index][0])
+
+
+def ots_tx_description_flow_amount(handle, index: int) -> int:
+    return _description(handle).flows[index][1]
+
+
+def ots_tx_description_has_change(handle) -> bool:
+    return _description(handle).change is not None
+
+
+def ots_tx_description_change_address(handle):
+    description: _TxDescription = _description(handle)
+    return description.string('change', description.change[0] if description.change else None)
+
+
+def ots_tx_description_change_amount(handle) -> int:
+    change: list | None = _description(handle).change
+    return change[1] if change else 0
+
+
+def ots_tx_description_transfers_count(handle) -> int:
+    return len(_description(handle).transfers)
+
+
+def ots_tx_description_transfer_amount_in(handle, index: int) -> int:
+    return _transfer(handle, index)['amount_in']
+
+
+def ots_tx_description_transfer_amount_out(handle, index: int) -> int:
+    return _transfer(handle, index)['amount_out']
+
+
+def ots_tx_description_transfer_ring_size(handle, index: int) -> int:
+    return _transfer(handle, index)['ring_size']
+
+
+def ots_tx_description_transfer_unlock_time(handle, index: int) -> int:
+    return _transfer(handle, index)['unlock_time']
+
+
+def ots_tx_description_transfer_flows_count(handle, index: int) -> int:
+    return len(_transfer(handle, index)['flows'])
+
+
+def ots_tx_description_transfer_flow_address(handle, index: int, flow: int):
+    return _description(handle).string(('transfer flow', index, flow), _transfer(handle, index)['flows'][flow][0])
+
+
+def ots_tx_description_transfer_flow_amount(handle, index: int, flow: int) -> int:
+    return _transfer(handle, index)['flows'][flow][1]
+
+
+def ots_tx_description_transfer_has_change(handle, index: int) -> bool:
+    return _transfer(handle, index)['change'] is not None
+
+
+def ots_tx_description_transfer_change_address(handle, index: int):
+    change: list | None = _transfer(handle, index)['change']
+    return _description(handle).string(('transfer change', index), change[0] if change else None)
+
+
+def ots_tx_description_transfer_change_amount(handle, index: int) -> int:
+    change: list | None = _transfer(handle, index)['change']
+    return change[1] if change else 0
+
+
+def ots_tx_description_transfer_fee(handle, index: int) -> int:
+    return _transfer(handle, index)['fee']
+
+
+def ots_tx_description_transfer_payment_id(handle, index: int):
+    return _description(handle).string(('payment id', index), _transfer(handle, index)['payment_id'])
+
+
+def ots_tx_description_transfer_dummy_outputs(handle, index: int) -> int:
+    return _transfer(handle, index)['dummy_outputs']
+
+
+def ots_tx_description_transfer_extra(handle, index: int):
+    return _description(handle).string(('extra', index), bytes.fromhex(_transfer(handle, index)['extra']))
+
+
+def ots_tx_description_transfer_extra_size(handle, index: int) -> int:
+    return len(_transfer(handle, index)['extra']) // 2
+
+
+def ots_tx_description(handle):
+    description: _TxDescription = _description(handle)
+    keep: list = []
+
+    def flows(items: list[list]):
+        if not items:
+            return ffi.NULL
+        array = ffi.new('ots_flow_vector_t[]', len(items))
+        for i, (address, amount) in enumerate(items):
+            keep.append(ffi.new('char[]', address.encode('utf-8')))
+            array[i].address = keep[-1]
+            array[i].amount = amount
+        keep.append(array)
+        return array
+
+    def string(value: str | bytes | None):
+        if value is None:
+            return ffi.NULL
+        keep.append(ffi.new('char[]', value.encode('utf-8') if isinstance(value, str) else value))
+        return keep[-1]
+
+    struct = ffi.new('ots_tx_description_t *')
+    struct.tx_set = string(description.txSet)
+    struct.tx_set_size = len(description.txSet)
+    struct.amount_in = ots_tx_description_amount_in(handle)
+    struct.amount_out = ots_tx_description_amount_out(handle)
+    struct.flows = flows(description.flows)
+    struct.flows_size = len(description.flows)
+    struct.change = flows([description.change]) if description.change else ffi.NULL
+    struct.fee = ots_tx_description_fee(handle)
+    transfers = ffi.new('ots_transfer_description_t[]', max(len(description.transfers), 1))
+    keep.append(transfers)
+    for i, transfer in enumerate(description.transfers):
+        transfers[i].amount_in = transfer['amount_in']
+        transfers[i].amount_out = transfer['amount_out']
+        transfers[i].ring_size = transfer['ring_size']
+        transfers[i].unlock_time = transfer['unlock_time']
+        transfers[i].flows = flows(transfer['flows'])
+        transfers[i].flows_size = len(transfer['flows'])
+        transfers[i].change = flows([transfer['change']]) if transfer['change'] else ffi.NULL
+        transfers[i].fee = transfer['fee']
+        transfers[i].payment_id = string(transfer['payment_id'])
+        transfers[i].dummy_outputs = transfer['dummy_outputs']
+        transfers[i].tx_extra = string(bytes.fromhex(transfer['extra']) if transfer['extra'] else None)
+    struct.transfers = transfers
+    struct.transfers_size = len(description.transfers)
+    _TX_DESCRIPTIONS[_address(struct)] = (struct, keep)
+    return struct
+
+
+# --- seeds ---------------------------------------------------------------------------------------
+
+
+_MONERO_WORDS: int = 1626
+
+
+class _Seed(_Object):
+    """
+    :meta private:
+    """
+    handleType: int = _C.OTS_HANDLE_SEED
+    seedType: int = _C.OTS_SEED_TYPE_MONERO
+    legacy: bool = False
+
+    def __init__(self, network: int, height: int, timestamp: int):
+        super().__init__()
+        self.network: int = _network(network)
+        if not height and not timestamp:
+            timestamp = int(time.time())
+        self.height: int = height or _height(timestamp)
+        self.timestamp: int = timestamp or _timestamp(height)
+        self._address: _Address | None = None
+
+    def release(self) -> None:
+        super().release()
+        if self._address is not None:
+            self._address.release()
+
+    def key(self) -> bytes:
+        raise NotImplementedError
+
+    def values(self, password: bytes) -> list[int]:
+        raise NotImplementedError
+
+    def address(self) -> _Address:
+        if self._address is None:
+            _, spend, view = _wallet_keys(self.key())
+            self._address = _Address(self.network, _C.OTS_ADDRESS_TYPE_STANDARD, spend, view)
+        return self._address
+
+
+def _encode_groups(data: bytes) -> list[int]:
+    """
+    Encodes 4 byte groups with 3 words each, like Monero (and Electrum) seeds.
+    :meta private:
+    """
+    n: int = _MONERO_WORDS
+    values: list[int] = []
+    for offset in range(0, len(data), 4):
+        x: int = int.from_bytes(data[offset:offset + 4], 'little')
+        w1: int = x % n
+        w2: int = (x // n + w1) % n
+        w3: int = (x // n // n + w2) % n
+        values += [w1, w2, w3]
+    return values
+
+
+def _decode_groups(values: list[int]) -> bytes:
+    """
+    :meta private:
+    """
+    n: int = _MONERO_WORDS
+    data: bytearray = bytearray()
+    for i in range(0, len(values), 3):
+        w1, w2, w3 = values[i:i + 3]
+        if max(w1, w2, w3) >= n:
+            raise _Error(_C.OTS_ERROR_SEED_SEED_DECODING_FAILED, 'word index out of range')
+        x: int = w1 + n * ((w2 - w1) % n) + n * n * ((w3 - w2) % n)
+        if x >= 1 << 32:
+            raise _Error(_C.OTS_ERROR_SEED_SEED_DECODING_FAILED, 'invalid word combination')
+        data += x.to_bytes(4, 'little')
+    return bytes(data)
+
+
+def _checksum_value(values: list[int]) -> int:
+    """
+    The checksum word repeats a word chosen by the CRC32 of the unique prefixes of the words.
+    :meta private:
+    """
+    return values[crc32(b''.join(_STEMS[value].encode('utf-8') for value in values)) % len(values)]
+
+
+def _monero_mask(password: bytes) -> bytes:
+    """
+    :meta private:
+    """
+    return sha256(b'ots fake monero passphrase' + password).digest()
+
+
+def _xor(data: bytes, mask: bytes) -> bytes:
+    """
+    :meta private:
+    """
+    return bytes(a ^ b for a, b in zip(data, mask))
+
+
+class _MoneroSeed(_Seed):
+    """
+    :meta private:
+    """
+
+    def __init__(self, secret: bytes, network: int, height: int, timestamp: int):
+        super().__init__(network, height, timestamp)
+        self.secret: bytes = secret
+
+    def key(self) -> bytes:
+        return self.secret
+
+    def values(self, password: bytes) -> list[int]:
+        values: list[int] = _encode_groups(_xor(self.secret, _monero_mask(password)) if password else self.secret)
+        return values + [_checksum_value(values)]
+
+
+class _LegacySeed(_Seed):
+    """
+    :meta private:
+    """
+    legacy: bool = True
+
+    def __init__(self, secret: bytes, network: int, height: int, timestamp: int):
+        super().__init__(network, height, timestamp)
+        self.secret: bytes = secret
+
+    def key(self) -> bytes:
+        return sha256(b'ots fake legacy key' + self.secret).digest()
+
+    def values(self, password: bytes) -> list[int]:
+        if password:
+            raise _Error(_C.OTS_ERROR_SEED_PASSWORD_NOT_SUPPORTED, 'legacy seeds do not support passwords')
+        values: list[int] = _encode_groups(self.secret)
+        return values + [_checksum_value(values)]
+
+
+_GF_MUL2_TABLE: tuple[int, ...] = (5, 7, 1, 3, 13, 15, 9, 11)
+_POLYSEED_SECRET_BITS: int = 150
+_POLYSEED_ENCRYPTED: int = 1
+
+
+def _gf_mul2(x: int) -> int:
+    """
+    :meta private:
+    """
+    return 2 * x if x < 1024 else _GF_MUL2_TABLE[x % 8] + 16 * ((x - 1024) // 8)
+
+
+def _polyseed_mask(password: bytes) -> int:
+    """
+    :meta private:
+    """
+    return int.from_bytes(sha256(b'ots fake polyseed password' + password).digest(), 'little') & ((1 << _POLYSEED_SECRET_BITS) - 1)
+
+
+class _Polyseed(_Seed):
+    """
+    :meta private:
+    """
+    seedType: int = _C.OTS_SEED_TYPE_POLYSEED
+
+    def __init__(self, secret: int, birthday: int, network: int, passphrase: bytes):
+        timestamp: int = POLYSEED_EPOCH + birthday * POLYSEED_TIME_STEP
+        super().__init__(network, _height(timestamp), timestamp)
+        self.secret: int = secret
+        self.birthday: int = birthday
+        self.passphrase: bytes = passphrase
+
+    def key(self) -> bytes:
+        return sha256(b'ots fake polyseed key' + self.secret.to_bytes(19, 'little') + self.passphrase).digest()
+
+    def values(self, password: bytes) -> list[int]:
+        secret: int = self.secret ^ _polyseed_mask(password) if password else self.secret
+        extra: int = (_POLYSEED_ENCRYPTED if password else 0) << 10 | self.birthday
+        data: list[int] = [((secret >> (10 * i)) & 0x3FF) << 1 | ((extra >> i) & 1) for i in range(15)]
+        checksum: int = data[-1]
+        for value in reversed(data[:-1]):
+            checksum = _gf_mul2(checksum) ^ value
+        return [_gf_mul2(checksum)] + data
+
+
+def _polyseed_from_values(values: list[int], network: int, password: bytes, passphrase: bytes) -> _Polyseed:
+    """
+    :meta private:
+    """
+    if len(values) != _C.OTS_POLYSEED_WORDS:
+        raise _Error(_C.OTS_ERROR_POLYSEED_WORD_COUNT, f'a polyseed has {_C.OTS_POLYSEED_WORDS} words')
+    checksum: int = values[-1]
+    for value in reversed(values[:-1]):
+        checksum = _gf_mul2(checksum) ^ value
+    if checksum != 0 or any(value > 0x7FF for value in values):
+        raise _Error(_C.OTS_ERROR_POLYSEED_CHECKSUM_MISMATCH, 'polyseed checksum mismatch')
+    secret: int = 0
+    extra: int = 0
+    for i, value in enumerate(values[1:]):
+        secret |= (value >> 1) << (10 * i)
+        extra |= (value & 1) << i
+    if extra >> 10 & _POLYSEED_ENCRYPTED:
+        if not password:
+            raise _Error(_C.OTS_ERROR_POLYSEED_NO_PASSWORD_PROVIDED, 'the polyseed is encrypted')
+        secret ^= _polyseed_mask(password)
+    return _Polyseed(secret, extra & 0x3FF, network, passphrase)
+
+
+def _polyseed_birthday(timestamp: int) -> int:
+    """
+    :meta private:
+    """
+    return (max(timestamp or int(time.time()), POLYSEED_EPOCH) - POLYSEED_EPOCH) // POLYSEED_TIME_STEP & 0x3FF
+
+
+@_native
+def ots_polyseed_create(random, network: int, timestamp: int, passphrase):
+    secret: int = int.from_bytes(_bytes(random, 19), 'little') & ((1 << _POLYSEED_SECRET_BITS) - 1)
+    return _handle(_Polyseed(secret, _polyseed_birthday(timestamp), network, _bytes(passphrase)))
+
+
+@_native
+def ots_polyseed_generate(network: int, timestamp: int, passphrase):
+    return ots_polyseed_create(urandom(19), network, timestamp, passphrase)
+
+
+@_native
+def ots_polyseed_decode(phrase, network: int, password, passphrase):
+    values: list[int] = _words_to_values(_text(phrase), _C.OTS_SEED_TYPE_POLYSEED)
+    return _handle(_polyseed_from_values(values, network, _bytes(password), _bytes(passphrase)))
+
+
+def _polyseed_with_language(phrase, language: _SeedLanguage, network: int, password, passphrase):
+    """
+    :meta private:
+    """
+    values: list[int] = _words_to_values(_text(phrase), _C.OTS_SEED_TYPE_POLYSEED, _language_for_type(language, _C.OTS_SEED_TYPE_POLYSEED))
+    return _handle(_polyseed_from_values(values, network, _bytes(password), _bytes(passphrase)))
+
+
+@_native
+def ots_polyseed_decode_with_language(phrase, language, network: int, password, passphrase):
+    return _polyseed_with_language(phrase, _object(language, _C.OTS_HANDLE_SEED_LANGUAGE), network, password, passphrase)
+
+
+@_native
+def ots_polyseed_decode_with_language_code(phrase, code, network: int, password, passphrase):
+    return _polyseed_with_language(phrase, _find_language('code', _text(code)), network, password, passphrase)
+
+
+@_native
+def ots_polyseed_decode_indices(indices, network: int, password, passphrase):
+    values: list[int] = _object(indices, _C.OTS_HANDLE_SEED_INDICES).values
+    return _handle(_polyseed_from_values(values, network, _bytes(password), _bytes(passphrase)))
+
+
+@_native
+def ots_polyseed_convert_to_monero_seed(seed):
+    polyseed: _Seed = _object(seed, _C.OTS_HANDLE_SEED)
+    if polyseed.seedType != _C.OTS_SEED_TYPE_POLYSEED:
+        raise _Error(_C.OTS_ERROR_INVALID_ARGUMENT, 'seed is not a polyseed')
+    return _handle(_MoneroSeed(polyseed.key(), polyseed.network, polyseed.height, polyseed.timestamp))
+
+
+def _checked_values(values: list[int], words: int) -> list[int]:
+    """
+    Verifies the checksum word of a Monero (or legacy) phrase, it is optional.
+    :meta private:
+    """
+    if len(values) not in (words - 1, words):
+        raise _Error(_C.OTS_ERROR_SEED_WORD_COUNT, f'a seed has {words - 1} or {words} words')
+    if len(values) == words and values[-1] != _checksum_value(values[:-1]):
+        raise _Error(_C.OTS_ERROR_SEED_SEED_DECODING_FAILED, 'checksum mismatch')
+    return values[:words - 1]
+
+
+def _monero_seed(values: list[int], height: int, timestamp: int, network: int, passphrase: bytes) -> _MoneroSeed:
+    """
+    :meta private:
+    """
+    secret: bytes = _decode_groups(_checked_values(values, _C.OTS_MONERO_SEED_WORDS))
+    if passphrase:
+        secret = _xor(secret, _monero_mask(passphrase))
+    return _MoneroSeed(secret, network, height, timestamp)
+
+
+def _legacy_seed(values: list[int], height: int, timestamp: int, network: int) -> _LegacySeed:
+    """
+    :meta private:
+    """
+    return _LegacySeed(_decode_groups(_checked_values(values, _C.OTS_LEGACY_SEED_WORDS)), network, height, timestamp)
+
+
+@_native
+def ots_monero_seed_create(random, height: int, timestamp: int, network: int):
+    return _handle(_MoneroSeed(_bytes(random, 32), network, height, timestamp))
+
+
+@_native
+def ots_monero_seed_generate(height: int, timestamp: int, network: int):
+    return ots_monero_seed_create(urandom(32), height, timestamp, network)
+
+
+@_native
+def ots_monero_seed_decode(phrase, height: int, timestamp: int, network: int, passphrase):
+    values: list[int] = _words_to_values(_text(phrase), _C.OTS_SEED_TYPE_MONERO)
+    return _handle(_monero_seed(values, height, timestamp, network, _bytes(passphrase)))
+
+
+@_native
+def ots_monero_seed_decode_indices(indices, height: int, timestamp: int, network: int, passphrase):
+    values: list[int] = _object(indices, _C.OTS_HANDLE_SEED_INDICES).values
+    return _handle(_monero_seed(values, height, timestamp, network, _bytes(passphrase)))
+
+
+@_native
+def ots_legacy_seed_decode(phrase, height: int, timestamp: int, network: int):
+    values: list[int] = _words_to_values(_text(phrase), _C.OTS_SEED_TYPE_MONERO)
+    return _handle(_legacy_seed(values, height, timestamp, network))
+
+
+@_native
+def ots_legacy_seed_decode_indices(indices, height: int, timestamp: int, network: int):
+    values: list[int] = _object(indices, _C.OTS_HANDLE_SEED_INDICES).values
+    return _handle(_legacy_seed(values, height, timestamp, network))
+
+
+def _seed(handle) -> _Seed:
+    """
+    :meta private:
+    """
+    return _object(handle, _C.OTS_HANDLE_SEED)
+
+
+def _phrase(seed, language: _SeedLanguage, password):
+    """
+    :meta private:
+    """
+    obj: _Seed = _seed(seed)
+    words: str = _language_for_type(language, obj.seedType).words(obj.values(_bytes(password)))
+    return _handle(_WipeableString(words.encode('utf-8')))
+
+
+@_native
+def ots_seed_phrase(seed, language, password):
+    return _phrase(seed, _object(language, _C.OTS_HANDLE_SEED_LANGUAGE), password)
+
+
+@_native
+def ots_seed_phrase_for_language_code(seed, code, password):
+    return _phrase(seed, _find_language('code', _text(code)), password)
+
+
+@_native
+def ots_seed_indices(seed, password):
+    return _handle(_SeedIndices(_seed(seed).values(_bytes(password))))
+
+
+@_native
+def ots_seed_fingerprint(seed):
+    return _string(_seed(seed).address().fingerprint)
+
+
+@_native
+def ots_seed_address(seed):
+    return _handle(_seed(seed).address().copy())
+
+
+@_native
+def ots_seed_timestamp(seed):
+    return _number(_seed(seed).timestamp)
+
+
+@_native
+def ots_seed_height(seed):
+    return _number(_seed(seed).height)
+
+
+@_native
+def ots_seed_network(seed):
+    return _number(_seed(seed).network, _C.OTS_RESULT_NETWORK)
+
+
+@_native
+def ots_seed_type(seed):
+    return _number(_seed(seed).seedType, _C.OTS_RESULT_SEED_TYPE)
+
+
+@_native
+def ots_seed_is_legacy(seed):
+    return _boolean(_seed(seed).legacy)
+
+
+@_native
+def ots_seed_wallet(seed):
+    obj: _Seed = _seed(seed)
+    return _handle(_Wallet(obj.key(), obj.height, obj.network))
+
+
+# --- seed jar ------------------------------------------------------------------------------------
+
+
+_JAR: list[list] = []
+_jarArray: list = [None]
+_NETWORK_NAMES: dict[int, str] = {
+    _C.OTS_NETWORK_MAIN: 'Mainnet',
+    _C.OTS_NETWORK_TEST: 'Testnet',
+    _C.OTS_NETWORK_STAGE: 'Stagenet',
+}
+
+
+def _jar_changed() -> None:
+    """
+    :meta private:
+    """
+    _jarArray[0] = None
+
+
+def _jar_index(key: str, value) -> int:
+    """
+    :meta private:
+    """
+    for i, (name, seed) in enumerate(_JAR):
+        if (
+            (key == 'name' and name == value)
+            or (key == 'fingerprint' and seed.address().fingerprint == value)
+            or (key == 'address' and seed.address().base58 == value)
+        ):
+            return i
+    raise _Error(_C.OTS_ERROR_SEEDJAR_SEED_NOT_FOUND, f'no seed for {key} {value}')
+
+
+def _jar_item(index: int) -> list:
+    """
+    :meta private:
+    """
+    if not 0 <= index < len(_JAR):
+        raise _Error(_C.OTS_ERROR_SEEDJAR_SEED_NOT_FOUND, f'no seed at index {index}')
+    return _JAR[index]
+
+
+def _jar_seed(handle) -> int:
+    """
+    :meta private:
+    """
+    seed: _Seed = _seed(handle)
+    for i, (_, item) in enumerate(_JAR):
+        if item is seed:
+            return i
+    raise _Error(_C.OTS_ERROR_SEEDJAR_SEED_NOT_FOUND, 'seed not in the jar')
+
+
+def _pointer(handle):
+    """
+    Accepts a handle or a pointer to a handle.
+    :meta private:
+    """
+    return handle[0] if ffi.typeof(handle) == ffi.typeof('ots_handle_t **') else handle
+
+
+def _take(index: int):
+    """
+    Takes a seed out of the jar, the result owns it.
+    :meta private:
+    """
+    _, seed = _JAR.pop(index)
+    _jar_changed()
+    return _handle(seed)
+
+
+def _purge(index: int):
+    """
+    :meta private:
+    """
+    _, seed = _JAR.pop(index)
+    _jar_changed()
+    seed.release()
+    return _boolean(True)
+
+
+@_native
+def ots_seed_jar_add_seed(seed, name):
+    obj: _Seed = _seed(seed)
+    text: str = _text(name)
+    if any(item is obj for _, item in _JAR):
+        raise _Error(_C.OTS_ERROR_INVALID_ARGUMENT, 'seed already in the jar')
+    _JAR.append([text, obj])
+    _jar_changed()
+    seed.reference = True  # the jar owns the seed now
+    return _handle(obj, True)
+
+
+@_native
+def ots_seed_jar_transfer_seed_in(seed, name):
+    handle = _pointer(seed)
+    obj: _Seed = _seed(handle)
+    _JAR.append([_text(name), obj])
+    _jar_changed()
+    if ffi.typeof(seed) == ffi.typeof('ots_handle_t **'):
+        _HANDLES.pop(_address(handle), None)
+        seed[0] = ffi.NULL
+    else:
+        handle.reference = True
+    return _handle(obj, True)
+
+
+@_native
+def ots_seed_jar_remove_seed(seed):
+    handle = _pointer(seed)
+    index: int = _jar_seed(handle)
+    if ffi.typeof(seed) == ffi.typeof('ots_handle_t **'):
+        seed[0] = ffi.NULL
+    return _purge(index)
+
+
+@_native
+def ots_seed_jar_transfer_seed_out(seed):
+    return _take(_jar_seed(_pointer(seed)))
+
+
+@_native
+def ots_seed_jar_transfer_seed_out_for_index(index: int):
+    _jar_item(index)
+    return _take(index)
+
+
+@_native
+def ots_seed_jar_transfer_seed_out_for_name(name):
+    return _take(_jar_index('name', _text(name)))
+
+
+@_native
+def ots_seed_jar_transfer_seed_out_for_fingerprint(fingerprint):
+    return _take(_jar_index('fingerprint', _text(fingerprint)))
+
+
+@_native
+def ots_seed_jar_transfer_seed_out_for_address(address):
+    return _take(_jar_index('address', _text(address)))
+
+
+@_native
+def ots_seed_jar_purge_seed_for_index(index: int):
+    _jar_item(index)
+    return _purge(index)
+
+
+@_native
+def ots_seed_jar_purge_seed_for_name(name):
+    return _purge(_jar_index('name', _text(name)))
+
+
+@_native
+def ots_seed_jar_purge_seed_for_fingerprint(fingerprint):
+    return _purge(_jar_index('fingerprint', _text(fingerprint)))
+
+
+@_native
+def ots_seed_jar_purge_seed_for_address(address):
+    return _purge(_jar_index('address', _text(address)))
+
+
+@_native
+def ots_seed_jar_clear():
+    seeds: list[list] = list(_JAR)
+    _JAR.clear()
+    _jar_changed()
+    for _, seed in seeds:
+        seed.release()
+    return _boolean(True)
+
+
+def ots_seed_jar_seeds():
+    if _jarArray[0] is None:
+        _jarArray[0] = _reference_array([seed for _, seed in _JAR])
+    return _handles(_jarArray[0], len(_JAR))
+
+
+def ots_seed_jar_seed_count():
+    return _number(len(_JAR))
+
+
+@_native
+def ots_seed_jar_seed_for_index(index: int):
+    return _handle(_jar_item(index)[1], True)
+
+
+@_native
+def ots_seed_jar_seed_for_name(name):
+    return _handle(_JAR[_jar_index('name', _text(name))][1], True)
+
+
+@_native
+def ots_seed_jar_seed_for_fingerprint(fingerprint):
+    return _handle(_JAR[_jar_index('fingerprint', _text(fingerprint))][1], True)
+
+
+@_native
+def ots_seed_jar_seed_for_address(address):
+    return _handle(_JAR[_jar_index('address', _text(address))][1], True)
+
+
+@_native
+def ots_seed_jar_seed_name(seed):
+    return _string(_JAR[_jar_seed(seed)][0])
+
+
+@_native
+def ots_seed_jar_seed_rename(seed, name):
+    _JAR[_jar_seed(seed)][0] = _text(name)
+    return _boolean(True)
+
+
+@_native
+def ots_seed_jar_item_name(index: int):
+    return _string(_jar_item(index)[0])
+
+
+@_native
+def ots_seed_jar_item_fingerprint(index: int):
+    return _string(_jar_item(index)[1].address().fingerprint)
+
+
+@_native
+def ots_seed_jar_item_address(index: int):
+    return _handle(_jar_item(index)[1].address().copy())
+
+
+@_native
+def ots_seed_jar_item_address_string(index: int):
+    return _string(_jar_item(index)[1].address().base58)
+
+
+@_native
+def ots_seed_jar_item_height(index: int):
+    return _number(_jar_item(index)[1].height)
+
+
+@_native
+def ots_seed_jar_item_timestamp(index: int):
+    return _number(_jar_item(index)[1].timestamp)
+
+
+@_native
+def ots_seed_jar_item_network(index: int):
+    return _number(_jar_item(index)[1].network, _C.OTS_RESULT_NETWORK)
+
+
+@_native
+def ots_seed_jar_item_network_string(index: int):
+    return _string(_NETWORK_NAMES[_jar_item(index)[1].network])
+
+
+@_native
+def ots_seed_jar_item_seed_type(index: int):
+    return _number(_jar_item(index)[1].seedType, _C.OTS_RESULT_SEED_TYPE)
+
+
+@_native
+def ots_seed_jar_item_seed_type_string(index: int):
+    seed: _Seed = _jar_item(index)[1]
+    if seed.legacy:
+        return _string('Legacy')
+    return _string('Polyseed' if seed.seedType == _C.OTS_SEED_TYPE_POLYSEED else 'Monero')
+
+
+@_native
+def ots_seed_jar_item_is_legacy(index: int):
+    return _boolean(_jar_item(index)[1].legacy)
+
+
+@_native
+def ots_seed_jar_item_wallet(index: int):
+    seed: _Seed = _jar_item(index)[1]
+    return _handle(_Wallet(seed.key(), seed.height, seed.network))
@@ -1,27 +1,110 @@
 from .raw import *
+from .raw import _UNSET
 from .exceptions import *
 
 
 class Address:
     """
     Represents any valid Monero address.
+
+    The properties are fetched from the library on first access and cached.
+    A detached address (see :py:meth:`detach`) holds no native handle, it is rebuilt
+    from the base58 string only if an operation of the library needs it.
     """
+    __slots__ = ('_handle', '_type', '_network', '_fingerprint', '_isIntegrated', '_paymentId', '_length', '_base58', '_detach')
 
-    def __init__(self, handle: ots_handle_t):
+    def __init__(self, handle: ots_handle_t | None, base58: str | None = None, detach: bool = False):
         """
         Initializes the Monero Address object with a handle.
 
-        :param ots_handle_t handle: The handle to the address. It must be of type HandleType.ADDRESS.
+        :param handle: The handle to the address. It must be of type HandleType.ADDRESS. None if created from base58.
+        :type handle: ots_handle_t | None
+        :param base58: The base58 address, the handle is then created on first use.
+        :type base58: str | None
+        :param bool detach: If True, the handle is freed as soon as base58, type, network and
+            fingerprint (and the payment ID of an integrated address) are cached.
+        """
+        assert handle is not None or base58 is not None, "either handle or base58 must be given"
+        assert handle is None or handle.type == HandleType.ADDRESS, "handle must be of type HandleType.ADDRESS"
+        assert isinstance(detach, bool), "detach must be a bool"
+        self._handle: ots_handle_t | None = handle
+        self._type: AddressType = _UNSET
+        self._network: Network = _UNSET
+        self._fingerprint: str = _UNSET
+        self._isIntegrated: bool = _UNSET
+        self._paymentId: str = _UNSET
+        self._length: int = _UNSET
+        self._base58: str = _UNSET if base58 is None else base58
+        self._detach: bool = detach
+
+    def __reduce__(self):
+        """
+        Addresses are pickled as their base58 string, the native side is rebuilt on first use.
+        :meta private:
+        """
+        return (Address, (None, self.base58))
+
+    @property
+    def handle(self) -> ots_handle_t:
+        """
+        :return: The handle of the address, created on first use if the address was unpickled.
+            A detached address with all properties cached does not keep a rebuilt handle,
+            it is freed again with the returned object after the native call.
+        """
+        if self._handle is None:
+            result: ots_result_t = ots_address_create(self._base58)
+            if ots_is_error(result):
+                raise exception_from_result(result)
+            handle: ots_handle_t = ots_result_handle(result)
+            if self._detach and self._complete():
+                return handle
+            self._handle = handle
+        return self._handle
+
+    @property
+    def detached(self) -> bool:
+        """
+        :return: True if the address holds no native handle at the moment.
+        """
+        return self._handle is None
+
+    def detach(self) -> 'Address':
+        """
+        Caches all properties of the address and frees its native handle.
+        The handle is rebuilt from the base58 string for an operation of the library,
+        like :py:meth:`ots.wallet.Wallet.hasAddress`, and freed again after it.
+
+        :return: The address itself.
+        """
+        self.paymentId
+        self.base58
+        self.type
+        self.network
+        self.fingerprint
+        self._detach = True
+        self._handle = None
+        return self
+
+    def _complete(self) -> bool:
+        """
+        :return: True if the properties a detached address keeps are cached.
+        :meta private:
         """
-        assert handle.type == HandleType.ADDRESS, "handle must be of type HandleType.ADDRESS"
-        self.handle: ots_handle_t = handle
-        self._type: AddressType | None = None
-        self._network: Network | None = None
-        self._fingerprint: str | None = None
-        self._isIntegrated: bool | None = None
-        self._paymentId: str | None = None
-        self._length: int | None = None
-        self._base58: str | None = None
+        return (
+            self._base58 is not _UNSET
+            and self._type is not _UNSET
+            and self._network is not _UNSET
+            and self._fingerprint is not _UNSET
+            and (self._type != AddressType.INTEGRATED or self._paymentId is not _UNSET)
+        )
+
+    def _resolved(self) -> None:
+        """
+        Frees the handle of an address created with `detach` once its properties are cached.
+        :meta private:
+        """
+        if self._detach and self._handle is not None and self._complete():
+            self._handle = None
 
     def __str__(self) -> str:
         """
@@ -39,7 +122,7 @@ class Address:
         """
         :meta private:
         """
-        hash(self.handle.ptr)
+        return hash(self.base58)
 
     def __len__(self) -> int:
         """
@@ -56,6 +139,9 @@ class Address:
         :return: True if the addresses are equal, False otherwise.
         """
         assert isinstance(other, (Address, str)), "other must be an Address object or a string"
+        if self._handle is None or (isinstance(other, Address) and other._handle is None):
+            # no need to rebuild a detached handle, the base58 strings are compared
+            return self.base58 == (other if isinstance(other, str) else other.base58)
         if isinstance(other, str):
             result: ots_result_t = ots_address_equal_string(self.handle, other)
             if ots_is_error(result):
@@ -73,12 +159,13 @@ class Address:
         """
         :return: The AddressType of the address.
         """
-        if self._type is not None:
+        if self._type is not _UNSET:
             return self._type
         result: ots_result_t = ots_address_type(self.handle)
         if ots_is_error(result):
             raise exception_from_result(result)
         self._type = ots_result_address_type(result)
+        self._resolved()
         return self._type
 
     @property
@@ -86,12 +173,13 @@ class Address:
         """
         :return: The Network of the address.
         """
-        if self._network is not None:
+        if self._network is not _UNSET:
             return self._network
         result: ots_result_t = ots_address_network(self.handle)
         if ots_is_error(result):
             raise exception_from_result(result)
         self._network = ots_result_network(result)
+        self._resolved()
         return self._network
 
     @property
@@ -99,12 +187,13 @@ class Address:
         """
         :return: The fingerprint of the address.
         """
-        if self._fingerprint is not None:
+        if self._fingerprint is not _UNSET:
             return self._fingerprint
         result: ots_result_t = ots_address_fingerprint(self.handle)
         if ots_is_error(result):
             raise exception_from_result(result)
         self._fingerprint = ots_result_string(result)
+        self._resolved()
         return self._fingerprint
 
     @property
@@ -114,7 +203,10 @@ class Address:
 
         :return: True if the address is integrated, False otherwise.
         """
-        if self._isIntegrated is not None:
+        if self._isIntegrated is not _UNSET:
+            return self._isIntegrated
+        if self._type is not _UNSET:
+            self._isIntegrated = self._type == AddressType.INTEGRATED
             return self._isIntegrated
         result: ots_result_t = ots_address_is_integrated(self.handle)
         if ots_is_error(result):
@@ -129,12 +221,13 @@ class Address:
 
         :return: The payment ID of the address.
         """
-        if self._paymentId is not None:
+        if self._paymentId is not _UNSET:
             return self._paymentId
         result: ots_result_t = ots_address_payment_id(self.handle)
         if ots_is_error(result):
             raise exception_from_result(result)
         self._paymentId = ots_result_string(result)
+        self._resolved()
         return self._paymentId
 
     @property
@@ -144,12 +237,13 @@ class Address:
 
         :return: The base58 string representation of the address.
         """
-        if self._base58 is not None:
+        if self._base58 is not _UNSET:
             return self._base58
         result: ots_result_t = ots_address_base58_string(self.handle)
         if ots_is_error(result):
             raise exception_from_result(result)
         self._base58 = ots_result_string(result)
+        self._resolved()
         return self._base58
 
     @property
@@ -159,7 +253,10 @@ class Address:
 
         :return: The length of the base58 address.
         """
-        if self._length is not None:
+        if self._length is not _UNSET:
+            return self._length
+        if self._base58 is not _UNSET:
+            self._length = len(self._base58)
             return self._length
         result: ots_result_t = ots_address_length(self.handle)
         if ots_is_error(result):
@@ -0,0 +1,319 @@
+"""
+A bounded LRU cache of the addresses of a wallet, by account and index.
+
+Every :py:class:`ots.wallet.Wallet` caches the addresses of :py:meth:`ots.wallet.Wallet.address`
+in an :py:class:`AddressCache`. It is bounded by a number of entries and optionally by
+an estimate of the bytes of its entries, the least recently used addresses are evicted first.
+
+.. code-block:: python
+
+    wallet.addressCache.resize(maxEntries=100000, maxBytes=64 * 1024 * 1024)
+    print(wallet.addressCache.stats())
+
+    # all wallets of the process together
+    address_cache.setGlobalBudget(256 * 1024 * 1024)
+
+The bytes are an estimate: the Python objects with their cached strings as reported
+by :py:func:`sys.getsizeof`, plus :py:data:`NATIVE_ADDRESS_BYTES` while an address holds
+its native handle. It is updated when an entry is added or hit.
+"""
+import sys
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from itertools import count
+from threading import Lock
+from weakref import WeakSet, finalize
+from .address import Address
+
+DEFAULT_MAX_ENTRIES: int = 4096
+"""Maximum number of entries of a new cache."""
+NATIVE_ADDRESS_BYTES: int = 256
+"""Estimate of the native memory of an address handle."""
+_ENTRY_BYTES: int = sys.getsizeof((0, 0)) + 2 * sys.getsizeof(0) + 64
+"""Estimate of the key and the slot in the ordered dict of an entry."""
+
+_globalLock: Lock = Lock()
+_globalBudget: int | None = None
+_globalBytes: int = 0
+_caches: WeakSet = WeakSet()
+_clock: count = count()
+"""The ticks of the uses of entries, to evict the least recently used of all caches first."""
+_collected: deque = deque()
+"""The entry sizes of collected caches, taken from the global bytes with the lock held."""
+
+
+def _size(address: Address) -> int:
+    """
+    Returns the estimated bytes of a cached address.
+    :meta private:
+    """
+    size: int = _ENTRY_BYTES + sys.getsizeof(address)
+    for value in (address._base58, address._fingerprint, address._paymentId):
+        if isinstance(value, str):
+            size += sys.getsizeof(value)
+    if not address.detached:
+        size += NATIVE_ADDRESS_BYTES
+    return size
+
+
+@dataclass(frozen=True, slots=True)
+class AddressCacheStats:
+    """
+    Statistics of an :py:class:`AddressCache`.
+    """
+    hits: int
+    """Lookups answered from the cache."""
+    misses: int
+    """Lookups not in the cache."""
+    evictions: int
+    """Entries evicted for the entry or byte budget, of the cache or the global one."""
+    entries: int
+    """Number of entries."""
+    bytes: int
+    """Estimated bytes of the entries."""
+    maxEntries: int | None
+    """Maximum number of entries, None for no limit."""
+    maxBytes: int | None
+    """Maximum bytes, None for no limit."""
+
+
+class AddressCache:
+    """
+    A thread-safe LRU cache of addresses by (account, index).
+    """
+    __slots__ = ('_maxEntries', '_maxBytes', '_entries', '_sizes', '_ticks', '_bytes', '_hits', '_misses', '_evictions', '_lock', '__weakref__')
+
+    def __init__(self, maxEntries: int | None = DEFAULT_MAX_ENTRIES, maxBytes: int | None = None):
+        """
+        Initializes an empty cache.
+
+        :param maxEntries: Maximum number of entries, None for no limit.
+        :type maxEntries: int | None
+        :param maxBytes: Maximum estimated bytes of the entries, None for no limit.
+        :type maxBytes: int | None
+        """
+        self._entries: OrderedDict[tuple[int, int], Address] = OrderedDict()
+        self._sizes: dict[tuple[int, int], int] = {}
+        self._ticks: dict[tuple[int, int], int] = {}
+        self._bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._lock: Lock = Lock()
+        self._maxEntries: int | None = None
+        self._maxBytes: int | None = None
+        self.resize(maxEntries, maxBytes)
+        with _globalLock:
+            _caches.add(self)
+        # runs on collection, it must not take a lock, the sizes are taken from the global bytes later
+        finalize(self, _collected.append, self._sizes)
+
+    def __len__(self) -> int:
+        """
+        :return: The number of entries.
+        """
+        return len(self._entries)
+
+    def __contains__(self, key: tuple[int, int]) -> bool:
+        """
+        :return: True if the address of (account, index) is cached, it does not count as hit.
+        """
+        return key in self._entries
+
+    def resize(self, maxEntries: int | None = DEFAULT_MAX_ENTRIES, maxBytes: int | None = None) -> None:
+        """
+        Sets the limits of the cache, entries above them are evicted.
+
+        :param maxEntries: Maximum number of entries, None for no limit.
+        :type maxEntries: int | None
+        :param maxBytes: Maximum estimated bytes of the entries, None for no limit.
+        :type maxBytes: int | None
+        """
+        assert maxEntries is None or (isinstance(maxEntries, int) and maxEntries >= 0), "maxEntries must be a non-negative integer or None"
+        assert maxBytes is None or (isinstance(maxBytes, int) and maxBytes >= 0), "maxBytes must be a non-negative integer or None"
+        with self._lock:
+            self._maxEntries = maxEntries
+            self._maxBytes = maxBytes
+            self._shrink()
+
+    def get(self, key: tuple[int, int]) -> Address | None:
+        """
+        Looks up an address and marks it as most recently used.
+
+        :param key: The account and index.
+        :type key: tuple[int, int]
+        :return: The cached address, None if not cached.
+        """
+        with self._lock:
+            address: Address | None = self._entries.get(key)
+            if address is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            self._ticks[key] = next(_clock)
+            self._account(key, _size(address))
+        if _globalBudget is not None:
+            # the address may have grown since it was put, e.g. by a fingerprint computed
+            _enforceGlobalBudget(self, key)
+        return address
+
+    def put(self, key: tuple[int, int], address: Address) -> None:
+        """
+        Adds an address as most recently used, evicting the least recently used ones above the limits.
+
+        :param key: The account and index.
+        :type key: tuple[int, int]
+        :param Address address: The address.
+        """
+        assert isinstance(address, Address), "address must be an Address"
+        with self._lock:
+            self._entries[key] = address
+            self._entries.move_to_end(key)
+            self._ticks[key] = next(_clock)
+            self._account(key, _size(address))
+            self._shrink()
+        if _globalBudget is not None:
+            _enforceGlobalBudget(self, key)
+
+    def clear(self) -> None:
+        """
+        Removes all entries, the statistics are kept.
+        """
+        global _globalBytes
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._ticks.clear()
+            with _globalLock:
+                _globalBytes -= self._bytes
+            self._bytes = 0
+
+    def stats(self) -> AddressCacheStats:
+        """
+        :return: The statistics of the cache.
+        """
+        with self._lock:
+            return AddressCacheStats(
+                self._hits, self._misses, self._evictions, len(self._entries),
+                self._bytes, self._maxEntries, self._maxBytes
+            )
+
+    def _account(self, key: tuple[int, int], size: int) -> None:
+        """
+        Updates the bytes of an entry, with the lock held.
+        :meta private:
+        """
+        global _globalBytes
+        change: int = size - self._sizes.get(key, 0)
+        if change:
+            self._sizes[key] = size
+            self._bytes += change
+            with _globalLock:
+                _globalBytes += change
+
+    def _evictOldest(self) -> None:
+        """
+        Evicts the least recently used entry, with the lock held.
+        :meta private:
+        """
+        global _globalBytes
+        key, _ = self._entries.popitem(last=False)
+        size: int = self._sizes.pop(key)
+        del self._ticks[key]
+        self._bytes -= size
+        self._evictions += 1
+        with _globalLock:
+            _globalBytes -= size
+
+    def _shrink(self) -> None:
+        """
+        Evicts entries until the cache is within its limits, with the lock held.
+        :meta private:
+        """
+        while self._entries and (
+            (self._maxEntries is not None and len(self._entries) > self._maxEntries)
+            or (self._maxBytes is not None and self._bytes > self._maxBytes)
+        ):
+            self._evictOldest()
+
+    def _oldest(self, inserted: tuple[int, int] | None) -> int | None:
+        """
+        :param inserted: The key just inserted, it is not evicted for the global budget.
+        :return: The tick of the least recently used entry, None if there is none to evict.
+        :meta private:
+        """
+        with self._lock:
+            key: tuple[int, int] | None = next(iter(self._entries), None)
+            return None if key is None or key == inserted else self._ticks[key]
+
+    def _evictForGlobal(self, tick: int) -> None:
+        """
+        Evicts the least recently used entry, if it was not used since its tick was taken.
+        :meta private:
+        """
+        with self._lock:
+            key: tuple[int, int] | None = next(iter(self._entries), None)
+            if key is not None and self._ticks[key] == tick:
+                self._evictOldest()
+
+
+def _overBudget() -> bool:
+    """
+    :return: True if the caches together exceed the global budget.
+    :meta private:
+    """
+    global _globalBytes
+    with _globalLock:
+        while _collected:
+            _globalBytes -= sum(_collected.popleft().values())
+        return _globalBudget is not None and _globalBytes > _globalBudget
+
+
+def _enforceGlobalBudget(inserting: AddressCache | None = None, inserted: tuple[int, int] | None = None) -> None:
+    """
+    Evicts the least recently used entries of all caches together until they are within
+    the global budget, never the entry just inserted into the inserting cache.
+    :meta private:
+    """
+    while _overBudget():
+        with _globalLock:
+            caches: list[AddressCache] = list(_caches)
+        oldest: tuple[int, AddressCache] | None = None
+        for cache in caches:
+            tick: int | None = cache._oldest(inserted if cache is inserting else None)
+            if tick is not None and (oldest is None or tick < oldest[0]):
+                oldest = (tick, cache)
+        if oldest is None:
+            return
+        oldest[1]._evictForGlobal(oldest[0])
+
+
+def setGlobalBudget(maxBytes: int | None) -> None:
+    """
+    Sets a budget of estimated bytes shared by the address caches of all wallets in the process.
+    If it is exceeded, the least recently used entries of all caches together are evicted first.
+
+    :param maxBytes: The budget, None for no budget (the default).
+    :type maxBytes: int | None
+    """
+    assert maxBytes is None or (isinstance(maxBytes, int) and maxBytes >= 0), "maxBytes must be a non-negative integer or None"
+    global _globalBudget
+    _globalBudget = maxBytes
+    if maxBytes is not None:
+        _enforceGlobalBudget()
+
+
+def globalBudget() -> int | None:
+    """
+    :return: The budget shared by all address caches, None if there is none.
+    """
+    return _globalBudget
+
+
+def globalBytes() -> int:
+    """
+    :return: The estimated bytes of the address caches of all wallets in the process.
+    """
+    _overBudget()
+    return _globalBytes
@@ -0,0 +1,429 @@
+"""
+A columnar container for large sets of addresses.
+
+An :py:class:`AddressTable` keeps the decoded public keys of the addresses in contiguous
+byte arrays, with a column each for the network, the type and the position (account and
+index) in a wallet. No native handle is held per address, :py:class:`ots.address.Address`
+objects are only created on explicit access.
+
+.. code-block:: python
+
+    table: AddressTable = AddressTable.fromWallet(wallet, accounts=2, indices=50000)
+    if deposit in table:
+        account, index = table.position(table.find(deposit))
+    with open('deposits.csv', 'w', newline='') as file:
+        table.filter(type=AddressType.SUBADDRESS).toCsv(file)
+"""
+import csv
+import json
+from array import array
+from itertools import compress
+from typing import Iterable, Iterator, TextIO
+from .raw import *
+from .address import Address, AddressString
+from .wallet import Wallet
+from .procedural import wallet_subaddresses
+
+_ALPHABET: str = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+_DIGITS: dict[str, int] = {character: value for value, character in enumerate(_ALPHABET)}
+_ENCODED_SIZES: tuple[int, ...] = (0, 2, 3, 5, 6, 7, 9, 10, 11)
+"""Number of base58 characters of a block of 0 to 8 bytes."""
+_DECODED_SIZES: dict[int, int] = {encoded: size for size, encoded in enumerate(_ENCODED_SIZES)}
+
+_PREFIXES: dict[tuple[Network, AddressType], int] = {
+    (Network.MAIN, AddressType.STANDARD): 18,
+    (Network.MAIN, AddressType.INTEGRATED): 19,
+    (Network.MAIN, AddressType.SUBADDRESS): 42,
+    (Network.TEST, AddressType.STANDARD): 53,
+    (Network.TEST, AddressType.INTEGRATED): 54,
+    (Network.TEST, AddressType.SUBADDRESS): 63,
+    (Network.STAGE, AddressType.STANDARD): 24,
+    (Network.STAGE, AddressType.INTEGRATED): 25,
+    (Network.STAGE, AddressType.SUBADDRESS): 36,
+}
+"""The base58 prefix of the addresses of a network and type."""
+_KINDS: dict[int, tuple[Network, AddressType]] = {prefix: kind for kind, prefix in _PREFIXES.items()}
+
+_KEYS: int = 64
+"""Bytes of the public spend and view key of an address."""
+_CHECKSUM: int = 4
+_PAYMENT_ID: int = 8
+_NO_POSITION: int = 0xFFFFFFFF
+"""Account and index of addresses not taken from a wallet."""
+
+
+def _base58_decode(text: str) -> bytes:
+    """
+    Decodes Monero base58, which encodes blocks of 8 bytes into 11 characters.
+    :meta private:
+    """
+    out: bytearray = bytearray()
+    for start in range(0, len(text), 11):
+        block: str = text[start:start + 11]
+        size: int | None = _DECODED_SIZES.get(len(block))
+        if not size:
+            raise ValueError('invalid base58 length')
+        value: int = 0
+        for character in block:
+            digit: int | None = _DIGITS.get(character)
+            if digit is None:
+                raise ValueError(f'invalid base58 character {character!r}')
+            value = value * 58 + digit
+        if value >> (size * 8):
+            raise ValueError('base58 block overflow')
+        out += value.to_bytes(size, 'big')
+    return bytes(out)
+
+
+def _base58_encode(data: bytes | bytearray | memoryview) -> str:
+    """
+    Encodes Monero base58.
+    :meta private:
+    """
+    out: list[str] = []
+    for start in range(0, len(data), 8):
+        block: bytes | bytearray | memoryview = data[start:start + 8]
+        value: int = int.from_bytes(block, 'big')
+        characters: list[str] = ['1'] * _ENCODED_SIZES[len(block)]
+        position: int = len(characters)
+        while value:
+            value, digit = divmod(value, 58)
+            position -= 1
+            characters[position] = _ALPHABET[digit]
+        out.append(''.join(characters))
+    return ''.join(out)
+
+
+def _decode(address: str) -> tuple[int, bytes, bytes, bytes]:
+    """
+    Decodes a base58 address into its prefix, public keys, payment ID (empty if not integrated) and checksum.
+    The checksum is not verified.
+    :meta private:
+    """
+    data: bytes = _base58_decode(address)
+    kind: tuple[Network, AddressType] | None = _KINDS.get(data[0]) if data else None
+    if kind is None:
+        raise ValueError('unknown address prefix')
+    size: int = 1 + _KEYS + (_PAYMENT_ID if kind[1] == AddressType.INTEGRATED else 0) + _CHECKSUM
+    if len(data) != size:
+        raise ValueError('invalid address length')
+    return data[0], data[1:1 + _KEYS], data[1 + _KEYS:-_CHECKSUM], data[-_CHECKSUM:]
+
+
+def _mask(column: bytearray, value: int) -> int:
+    """
+    Returns the rows with the value in the column as bit mask, one byte per row.
+    :meta private:
+    """
+    table: bytearray = bytearray(256)
+    table[value] = 1
+    return int.from_bytes(column.translate(table), 'big')
+
+
+class AddressTable:
+    """
+    A columnar table of addresses, with the public keys in contiguous byte arrays
+    and a hash index over them for O(1) membership tests.
+
+    Addresses added as strings are decoded in Python, their checksum is verified by the
+    library only if `validate` is True. Integrated addresses are found by the keys of their
+    standard address, :py:meth:`find` returns the first row with the keys on the network.
+    """
+    __slots__ = ('_keys', '_checksums', '_paymentIds', '_networks', '_types', '_accounts', '_indices', '_index')
+
+    def __init__(self, addresses: Iterable[Address | str] = (), validate: bool = True):
+        """
+        Initializes the table with addresses.
+
+        :param addresses: The addresses to add.
+        :type addresses: Iterable[Address | str]
+        :param bool validate: If True, the addresses given as string are validated by the library.
+        """
+        self._keys: bytearray = bytearray()
+        self._checksums: bytearray = bytearray()
+        self._paymentIds: bytearray = bytearray()
+        self._networks: bytearray = bytearray()
+        self._types: bytearray = bytearray()
+        self._accounts: array = array('I')
+        self._indices: array = array('I')
+        self._index: dict[bytes, int] = {}
+        self.extend(addresses, validate)
+
+    def __len__(self) -> int:
+        """
+        :return: The number of addresses in the table.
+        """
+        return len(self._networks)
+
+    def __contains__(self, address: Address | str) -> bool:
+        """
+        :return: True if the table has an address with the keys on the network of the address.
+        """
+        return self.find(address) is not None
+
+    def __getitem__(self, row: int) -> Address:
+        """
+        :return: The address of the row, created on access.
+        """
+        return Address(None, self.base58(row))
+
+    def __iter__(self) -> Iterator[Address]:
+        """
+        :return: The addresses of all rows, each created when it is reached.
+        """
+        for row in range(len(self)):
+            yield self[row]
+
+    def __repr__(self) -> str:
+        """
+        :meta private:
+        """
+        return f"AddressTable({len(self)} addresses)"
+
+    def append(self, address: Address | str, account: int | None = None, index: int | None = None, validate: bool = True) -> int:
+        """
+        Adds an address to the table.
+
+        :param address: The address to add.
+        :type address: Address | str
+        :param account: The account of the address in its wallet, None if unknown.
+        :type account: int | None
+        :param index: The index of the address in the account, None if unknown.
+        :type index: int | None
+        :param bool validate: If True and the address is given as string, it is validated by the library.
+        :return: The row of the address.
+        :raises ValueError: If the address can not be decoded or is invalid.
+        """
+        assert isinstance(address, (Address, str)), "address must be an Address or a string"
+        assert (account is None) == (index is None), "account and index must be given both or none"
+        assert account is None or 0 <= account < _NO_POSITION, "account must be a non-negative 32 bit integer"
+        assert index is None or 0 <= index < _NO_POSITION, "index must be a non-negative 32 bit integer"
+        text: str = address.base58 if isinstance(address, Address) else address
+        prefix, keys, paymentId, checksum = _decode(text)
+        network, addressType = _KINDS[prefix]
+        if validate and isinstance(address, str) and not AddressString.valid(address, network):
+            raise ValueError(f'invalid address {address}')
+        row: int = len(self)
+        self._keys += keys
+        self._checksums += checksum
+        self._paymentIds += paymentId or bytes(_PAYMENT_ID)
+        self._networks.append(network.value)
+        self._types.append(addressType.value)
+        self._accounts.append(_NO_POSITION if account is None else account)
+        self._indices.append(_NO_POSITION if index is None else index)
+        self._index.setdefault(bytes((network.value,)) + keys, row)
+        return row
+
+    def extend(self, addresses: Iterable[Address | str], validate: bool = True) -> None:
+        """
+        Adds addresses to the table.
+
+        :param addresses: The addresses to add.
+        :type addresses: Iterable[Address | str]
+        :param bool validate: If True, the addresses given as string are validated by the library.
+        """
+        for address in addresses:
+            self.append(address, validate=validate)
+
+    @classmethod
+    def fromWallet(cls, wallet: Wallet, accounts: int = 1, indices: int = 10, accountOffset: int = 0) -> 'AddressTable':
+        """
+        Creates a table of the subaddresses of a wallet, with their account and index.
+        The addresses are taken from the library as strings, no Address object is created.
+
+        :param Wallet wallet: The wallet.
+        :param int accounts: The number of accounts.
+        :param int indices: The number of subaddresses per account.
+        :param int accountOffset: The first account.
+        :return: The table, account by account.
+        """
+        assert isinstance(wallet, Wallet), "wallet must be a Wallet"
+        assert isinstance(accounts, int) and accounts >= 0, "accounts must be a non-negative integer"
+        assert isinstance(indices, int) and indices >= 0, "indices must be a non-negative integer"
+        table: AddressTable = cls()
+        for account in range(accountOffset, accountOffset + accounts):
+            for index, address in enumerate(wallet_subaddresses(wallet.handle, account, indices, 0)):
+                table.append(address, account, index, False)
+        return table
+
+    def _row(self, row: int) -> int:
+        """
+        :meta private:
+        """
+        assert isinstance(row, int), "row must be an integer"
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError('row out of range')
+        return row
+
+    def find(self, address: Address | str) -> int | None:
+        """
+        Finds an address by its keys and network, a single dictionary access.
+
+        :param address: The address to find.
+        :type address: Address | str
+        :return: The first row with the keys on the network, None if not in the table or not decodable.
+        """
+        assert isinstance(address, (Address, str)), "address must be an Address or a string"
+        try:
+            prefix, keys, _, _ = _decode(address.base58 if isinstance(address, Address) else address)
+        except ValueError:
+            return None
+        return self._index.get(bytes((_KINDS[prefix][0].value,)) + keys)
+
+    def base58(self, row: int) -> str:
+        """
+        :return: The base58 encoded address of the row.
+        """
+        row = self._row(row)
+        addressType: AddressType = AddressType(self._types[row])
+        data: bytearray = bytearray((_PREFIXES[(Network(self._networks[row]), addressType)],))
+        data += self._keys[row * _KEYS:(row + 1) * _KEYS]
+        if addressType == AddressType.INTEGRATED:
+            data += self._paymentIds[row * _PAYMENT_ID:(row + 1) * _PAYMENT_ID]
+        data += self._checksums[row * _CHECKSUM:(row + 1) * _CHECKSUM]
+        return _base58_encode(data)
+
+    def network(self, row: int) -> Network:
+        """
+        :return: The network of the address of the row.
+        """
+        return Network(self._networks[self._row(row)])
+
+    def type(self, row: int) -> AddressType:
+        """
+        :return: The type of the address of the row.
+        """
+        return AddressType(self._types[self._row(row)])
+
+    def position(self, row: int) -> tuple[int, int] | None:
+        """
+        :return: The account and index of the address of the row, None if unknown.
+        """
+        row = self._row(row)
+        if self._accounts[row] == _NO_POSITION:
+            return None
+        return self._accounts[row], self._indices[row]
+
+    def publicSpendKey(self, row: int) -> bytes:
+        """
+        :return: The public spend key of the address of the row.
+        """
+        row = self._row(row)
+        return bytes(self._keys[row * _KEYS:row * _KEYS + 32])
+
+    def publicViewKey(self, row: int) -> bytes:
+        """
+        :return: The public view key of the address of the row.
+        """
+        row = self._row(row)
+        return bytes(self._keys[row * _KEYS + 32:(row + 1) * _KEYS])
+
+    def paymentId(self, row: int) -> str | None:
+        """
+        :return: The payment ID of the address of the row as hex string, None if it is not integrated.
+        """
+        row = self._row(row)
+        if self._types[row] != AddressType.INTEGRATED.value:
+            return None
+        return self._paymentIds[row * _PAYMENT_ID:(row + 1) * _PAYMENT_ID].hex()
+
+    def rows(self, network: Network | None = None, type: AddressType | None = None) -> list[int]:
+        """
+        Returns the rows of the addresses of a network and type. The columns are compared
+        as a whole (bytes.translate and integer masks), not row by row in Python.
+
+        :param network: The network, None for any.
+        :type network: Network | None
+        :param type: The address type, None for any.
+        :type type: AddressType | None
+        :return: The matching rows, in order.
+        """
+        assert network is None or isinstance(network, Network), "network must be a Network or None"
+        assert type is None or isinstance(type, AddressType), "type must be an AddressType or None"
+        size: int = len(self)
+        mask: int = int.from_bytes(b'\x01' * size, 'big')
+        if network is not None:
+            mask &= _mask(self._networks, network.value)
+        if type is not None:
+            mask &= _mask(self._types, type.value)
+        return list(compress(range(size), mask.to_bytes(size, 'big')))
+
+    def select(self, rows: Iterable[int]) -> 'AddressTable':
+        """
+        :param rows: The rows to select.
+        :type rows: Iterable[int]
+        :return: A new table with the rows, in the given order.
+        """
+        table: AddressTable = AddressTable()
+        for row in rows:
+            row = self._row(row)
+            keys: bytearray = self._keys[row * _KEYS:(row + 1) * _KEYS]
+            table._keys += keys
+            table._checksums += self._checksums[row * _CHECKSUM:(row + 1) * _CHECKSUM]
+            table._paymentIds += self._paymentIds[row * _PAYMENT_ID:(row + 1) * _PAYMENT_ID]
+            table._networks.append(self._networks[row])
+            table._types.append(self._types[row])
+            table._accounts.append(self._accounts[row])
+            table._indices.append(self._indices[row])
+            table._index.setdefault(bytes((self._networks[row],)) + keys, len(table) - 1)
+        return table
+
+    def filter(self, network: Network | None = None, type: AddressType | None = None) -> 'AddressTable':
+        """
+        :param network: The network, None for any.
+        :type network: Network | None
+        :param type: The address type, None for any.
+        :type type: AddressType | None
+        :return: A new table with the addresses of the network and type.
+        """
+        return self.select(self.rows(network, type))
+
+    def _records(self) -> Iterator[tuple[str, str, str, int | None, int | None, str | None]]:
+        """
+        :meta private:
+        """
+        for row in range(len(self)):
+            position: tuple[int, int] | None = self.position(row)
+            yield (
+                self.base58(row),
+                Network(self._networks[row]).name,
+                AddressType(self._types[row]).name,
+                position[0] if position else None,
+                position[1] if position else None,
+                self.paymentId(row),
+            )
+
+    def toCsv(self, file: TextIO, header: bool = True) -> int:
+        """
+        Writes the table as CSV, row by row, without creating Address objects.
+        Columns: address, network, type, account, index, payment_id; unknown values are empty.
+
+        :param TextIO file: The file to write to, opened with ``newline=''``.
+        :param bool header: If True, a header row is written first.
+        :return: The number of addresses written.
+        """
+        writer = csv.writer(file)
+        if header:
+            writer.writerow(('address', 'network', 'type', 'account', 'index', 'payment_id'))
+        writer.writerows(self._records())
+        return len(self)
+
+    def toNdjson(self, file: TextIO) -> int:
+        """
+        Writes the table as newline delimited JSON, one object per address, without creating Address objects.
+
+        :param TextIO file: The file to write to.
+        :return: The number of addresses written.
+        """
+        for address, network, addressType, account, index, paymentId in self._records():
+            file.write(json.dumps({
+                'address': address,
+                'network': network,
+                'type': addressType,
+                'account': account,
+                'index': index,
+                'payment_id': paymentId,
+            }) + '\n')
+        return len(self)
@@ -2,7 +2,7 @@
 Constants from the `ots.h` header file.
 """
 
-from ._ots import lib as _lib
+from ._backend import lib as _lib
 
 
 OTS_MAX_ERROR_MESSAGE = _lib.OTS_MAX_ERROR_MESSAGE
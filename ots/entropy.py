@@ -0,0 +1,182 @@
+from math import log2
+from mmap import mmap, ACCESS_READ
+from typing import Iterable
+try:
+    import numpy
+except ImportError:  # NumPy is optional, histograms are counted with bytes.count then
+    numpy = None
+
+
+def byte_histogram(data: bytes | bytearray | memoryview) -> list[int]:
+    """
+    Counts how often every byte value occurs in the data.
+    Vectorised with NumPy if it is installed.
+
+    :param data: The data to count.
+    :type data: bytes | bytearray | memoryview
+    :return: The 256 counts, indexed by byte value.
+    """
+    if numpy is not None:
+        return numpy.bincount(numpy.frombuffer(data, dtype=numpy.uint8), minlength=256).tolist()
+    data = bytes(data)
+    return [data.count(value) for value in range(256)]
+
+
+def shannon_entropy(histogram: list[int]) -> float:
+    """
+    Calculates the Shannon entropy of a byte histogram, in bits per byte.
+
+    :param list[int] histogram: The counts of the byte values.
+    :return: The entropy, between 0 and 8 (and at most log2 of the number of bytes).
+    """
+    total: int = sum(histogram)
+    if total == 0:
+        return 0.0
+    return 0.0 - sum(count / total * log2(count / total) for count in histogram if count)
+
+
+class EntropyEstimator:
+    """
+    Streaming estimator of the Shannon entropy of large data, like exported files
+    or dumps of a random number generator, which would not fit into one
+    call of :py:meth:`ots.ots.Ots.entropyLevel`.
+
+    The data is consumed in chunks, only byte histograms are kept: one for all
+    data and one for the current window, so the entropy is reported in total
+    and for every window of the given size. By default the windows do not overlap,
+    with a step smaller than the window they slide over the data by step bytes,
+    then the bytes of the current window are kept too.
+
+    .. code-block:: python
+
+        estimator: EntropyEstimator = EntropyEstimator.fromFile('/tmp/rng.dump', window=4096, step=512)
+        print(estimator.total, min(estimator.windows))
+    """
+
+    def __init__(self, window: int = 0, step: int | None = None):
+        """
+        Initializes the estimator.
+
+        :param int window: The size of the windows in bytes, 0 to not track windows.
+        :param step: The distance of the starts of two windows in bytes, None for the window size,
+            so the windows do not overlap.
+        :type step: int | None
+        """
+        assert isinstance(window, int) and window >= 0, "window must be a non-negative integer"
+        assert step is None or (isinstance(step, int) and 0 < step <= window), "step must be a positive integer up to the window size"
+        self.window: int = window
+        """The size of the windows in bytes, 0 if windows are not tracked."""
+        self.step: int = window if step is None else step
+        """The distance of the starts of two windows in bytes, the window size if they do not overlap."""
+        self.histogram: list[int] = [0] * 256
+        """The counts of the byte values of all data."""
+        self.count: int = 0
+        """The number of bytes consumed."""
+        self.windows: list[float] = []
+        """The entropy of every complete window, in order."""
+        self._windowHistogram: list[int] = [0] * 256
+        self._windowCount: int = 0
+        self._windowData: bytearray = bytearray()
+
+    def update(self, data: bytes | bytearray | memoryview) -> 'EntropyEstimator':
+        """
+        Consumes the next chunk of data.
+
+        :param data: The chunk.
+        :type data: bytes | bytearray | memoryview
+        :return: The estimator itself.
+        """
+        view: memoryview = memoryview(data).cast('B')
+        if self.window == 0:
+            self._add(self.histogram, byte_histogram(view))
+            self.count += len(view)
+            return self
+        offset: int = 0
+        while offset < len(view):
+            piece: memoryview = view[offset:offset + self.window - self._windowCount]
+            counts: list[int] = byte_histogram(piece)
+            self._add(self.histogram, counts)
+            self._add(self._windowHistogram, counts)
+            self._windowCount += len(piece)
+            offset += len(piece)
+            if self.step < self.window:
+                self._windowData += piece
+            if self._windowCount == self.window:
+                self.windows.append(shannon_entropy(self._windowHistogram))
+                if self.step < self.window:
+                    # slide: the first step bytes leave the window
+                    self._add(self._windowHistogram, [-count for count in byte_histogram(self._windowData[:self.step])])
+                    del self._windowData[:self.step]
+                    self._windowCount -= self.step
+                else:
+                    self._windowHistogram = [0] * 256
+                    self._windowCount = 0
+        self.count += len(view)
+        return self
+
+    @property
+    def total(self) -> float:
+        """
+        :return: The Shannon entropy of all data consumed, in bits per byte.
+        """
+        return shannon_entropy(self.histogram)
+
+    @property
+    def current(self) -> float:
+        """
+        :return: The Shannon entropy of the incomplete current window, in bits per byte.
+        """
+        return shannon_entropy(self._windowHistogram)
+
+    @staticmethod
+    def _add(histogram: list[int], counts: list[int]) -> None:
+        """
+        :meta private:
+        """
+        for value, count in enumerate(counts):
+            if count:
+                histogram[value] += count
+
+    @classmethod
+    def fromIterable(cls, chunks: Iterable[bytes], window: int = 0, step: int | None = None) -> 'EntropyEstimator':
+        """
+        Creates an estimator and consumes all chunks.
+
+        :param chunks: The data, in chunks.
+        :type chunks: Iterable[bytes]
+        :param int window: The size of the windows in bytes, 0 to not track windows.
+        :param step: The distance of the starts of two windows in bytes, None for the window size.
+        :type step: int | None
+        :return: The estimator.
+        """
+        estimator: EntropyEstimator = cls(window, step)
+        for chunk in chunks:
+            estimator.update(chunk)
+        return estimator
+
+    @classmethod
+    def fromFile(cls, path: str, window: int = 0, chunkSize: int = 1 << 20, step: int | None = None) -> 'EntropyEstimator':
+        """
+        Creates an estimator and consumes a file, which is memory mapped.
+
+        :param str path: The path of the file.
+        :param int window: The size of the windows in bytes, 0 to not track windows.
+        :param int chunkSize: The number of bytes counted at once.
+        :param step: The distance of the starts of two windows in bytes, None for the window size.
+        :type step: int | None
+        :return: The estimator.
+        """
+        assert isinstance(chunkSize, int) and chunkSize > 0, "chunkSize must be a positive integer"
+        estimator: EntropyEstimator = cls(window, step)
+        with open(path, 'rb') as f:
+            f.seek(0, 2)
+            if f.tell() == 0:
+                return estimator
+            with mmap(f.fileno(), 0, access=ACCESS_READ) as mapped:
+                view: memoryview = memoryview(mapped)
+                try:
+                    for offset in range(0, len(view), chunkSize):
+                        estimator.update(view[offset:offset + chunkSize])
+                finally:
+                    view.release()
+        return estimator
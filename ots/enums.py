@@ -3,7 +3,7 @@ Enums based on the OTS enums from `ots.h` header file.
 """
 
 from enum import Enum
-from ._ots import lib as _lib
+from ._backend import lib as _lib
 
 
 class Network(Enum):
@@ -0,0 +1,219 @@
+"""
+Opt-in accounting of the native objects of the library: results, handles
+and tx descriptions, which are freed when their Python wrappers are deleted.
+
+While enabled, every wrapper created in :py:mod:`ots.raw` is counted by its kind and type,
+with the number alive, the high-water mark and the number created. Optionally the
+allocation site (like :py:mod:`tracemalloc`) is captured for every object still alive.
+
+.. code-block:: python
+
+    from ots import lifetime
+
+    lifetime.enable(frames=8)
+    signer.run()
+    print(lifetime.snapshot()['handle'])
+    for key, site in lifetime.outstanding():
+        print(key, ''.join(site.format()))
+
+With the environment variable ``OTS_LIFETIME=1`` the accounting is enabled on import,
+with ``OTS_LIFETIME=debug`` allocation sites are captured and the objects still alive
+at interpreter exit are reported to stderr.
+
+Only objects created while enabled are accounted, while disabled it costs a check per object.
+"""
+import atexit
+import sys
+import traceback
+from threading import Lock
+from typing import TextIO
+from . import raw
+from .enums import HandleType, ResultType
+
+_lock: Lock = Lock()
+_live: dict[tuple[str, str], int] = {}
+_peak: dict[tuple[str, str], int] = {}
+_created: dict[tuple[str, str], int] = {}
+_objects: dict[int, tuple[tuple[str, str], traceback.StackSummary | None]] = {}
+_frames: int = 0
+_reportAtExit: bool = False
+
+
+def _handle_key(handle: 'raw.ots_handle_t') -> tuple[str, str]:
+    """
+    :meta private:
+    """
+    try:
+        name: str = HandleType(handle.ptr.type).name
+    except ValueError:
+        name = str(handle.ptr.type)
+    return ('reference' if handle.reference else 'handle', name)
+
+
+def _result_key(result: 'raw.ots_result_t') -> tuple[str, str]:
+    """
+    :meta private:
+    """
+    if result.ptr.error.code != 0:
+        return ('result', 'ERROR')
+    value: int = int(result.ptr.type)
+    names: list[str] = [member.name for member in ResultType if int(member) & value]
+    return ('result', '|'.join(names) or ResultType.NONE.name)
+
+
+def _created_object(wrapper: object, key: tuple[str, str]) -> None:
+    """
+    Accounts a wrapper created in :py:mod:`ots.raw`.
+    :meta private:
+    """
+    site: traceback.StackSummary | None = None
+    if _frames:
+        site = traceback.extract_stack(sys._getframe(3), _frames)
+    with _lock:
+        _objects[id(wrapper)] = (key, site)
+        live: int = _live.get(key, 0) + 1
+        _live[key] = live
+        _created[key] = _created.get(key, 0) + 1
+        if live > _peak.get(key, 0):
+            _peak[key] = live
+
+
+def freed(wrapper: object) -> None:
+    """
+    Called by the wrappers in :py:mod:`ots.raw` before they free their native object.
+    :meta private:
+    """
+    with _lock:
+        entry = _objects.pop(id(wrapper), None)
+        if entry is not None:
+            _live[entry[0]] -= 1
+
+
+def created(wrapper: object) -> None:
+    """
+    Called by the wrappers in :py:mod:`ots.raw` when they take ownership of a native object.
+    :meta private:
+    """
+    if isinstance(wrapper, raw.ots_handle_t):
+        key: tuple[str, str] = _handle_key(wrapper)
+    elif isinstance(wrapper, raw.ots_result_t):
+        key = _result_key(wrapper)
+    else:
+        key = ('tx_description', HandleType.TX_DESCRIPTION.name)
+    _created_object(wrapper, key)
+
+
+def enable(frames: int = 0, reportAtExit: bool = False) -> None:
+    """
+    Enables the accounting.
+
+    :param int frames: Number of stack frames captured as allocation site of every object, 0 to capture none.
+    :param bool reportAtExit: If True, the objects still alive at interpreter exit are reported to stderr.
+    """
+    assert isinstance(frames, int) and frames >= 0, "frames must be a non-negative integer"
+    assert isinstance(reportAtExit, bool), "reportAtExit must be a bool"
+    global _frames, _reportAtExit
+    _frames = frames
+    if reportAtExit and not _reportAtExit:
+        atexit.register(report)
+    _reportAtExit = _reportAtExit or reportAtExit
+    raw._lifetime = raw._lifetimeFreed = sys.modules[__name__]
+
+
+def disable() -> None:
+    """
+    Disables the accounting. Objects accounted before are still counted when they are freed,
+    until :py:func:`reset`.
+    """
+    global _frames
+    _frames = 0
+    raw._lifetime = None
+
+
+def enabled() -> bool:
+    """
+    :return: True if the accounting is enabled.
+    """
+    return raw._lifetime is not None
+
+
+def reset() -> None:
+    """
+    Forgets all accounted objects and counters.
+    """
+    with _lock:
+        _live.clear()
+        _peak.clear()
+        _created.clear()
+        _objects.clear()
+        if raw._lifetime is None:
+            raw._lifetimeFreed = None
+
+
+def live() -> int:
+    """
+    :return: The number of accounted native objects alive, reference handles not included.
+    """
+    with _lock:
+        return sum(count for (kind, _), count in _live.items() if kind != 'reference')
+
+
+def snapshot() -> dict[str, dict[str, dict[str, int]]]:
+    """
+    Returns the counters.
+
+    .. code-block:: python
+
+        {
+            'handle': {'WALLET': {'live': 1, 'peak': 2, 'created': 5}},
+            'reference': {'ADDRESS': {'live': 0, 'peak': 1, 'created': 3}},
+            'result': {'STRING': {'live': 0, 'peak': 1, 'created': 40}, 'ERROR': {...}},
+            'tx_description': {'TX_DESCRIPTION': {...}}
+        }
+
+    Reference handles do not own their native object, they are counted apart from the handles.
+
+    :return: The counters by kind and type.
+    """
+    with _lock:
+        result: dict[str, dict[str, dict[str, int]]] = {}
+        for (kind, name), count in sorted(_created.items()):
+            result.setdefault(kind, {})[name] = {
+                'live': _live.get((kind, name), 0),
+                'peak': _peak.get((kind, name), 0),
+                'created': count,
+            }
+        return result
+
+
+def outstanding() -> list[tuple[tuple[str, str], traceback.StackSummary | None]]:
+    """
+    :return: The kind and type of every accounted object alive, with its allocation site if captured.
+    """
+    with _lock:
+        return list(_objects.values())
+
+
+def report(file: TextIO | None = None) -> int:
+    """
+    Writes the objects still alive, grouped by allocation site, to a file.
+
+    :param file: The file to write to, stderr by default.
+    :type file: TextIO | None
+    :return: The number of objects alive, reference handles not included.
+    """
+    file = file or sys.stderr
+    sites: dict[tuple, int] = {}
+    for (kind, name), site in outstanding():
+        if kind == 'reference':
+            continue
+        where: tuple = tuple(site.format()) if site is not None else ()
+        sites[(kind, name, where)] = sites.get((kind, name, where), 0) + 1
+    total: int = sum(sites.values())
+    if total:
+        print(f'ots: {total} native object(s) still alive', file=file)
+        for (kind, name, where), count in sorted(sites.items(), key=lambda item: -item[1]):
+            print(f'  {count} x {kind} {name}', file=file)
+            for line in where:
+                print('    ' + line.rstrip().replace('\n', '\n    '), file=file)
+    return total
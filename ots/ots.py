@@ -1,7 +1,12 @@
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from os import cpu_count
+from typing import Iterable, Sequence
 from .raw import *
 from .exceptions import *
 from .enums import *
 from .address import Address
+from .verify_cache import VerifyCache, VerifyKey, verifyKey
 from .procedural import (
     version,
     random,
@@ -67,6 +72,59 @@ class Ots:
             raise exception_from_result(result)
         return ots_result_number(result)
 
+    @staticmethod
+    def heightsFromTimestamps(timestamps: Sequence[int], network: Network | int = Network.MAIN) -> Sequence[int]:
+        """
+        Returns the estimated blockchain heights for many timestamps at once.
+
+        The values are converted by the library in one call, a NumPy array
+        is converted in place of its buffer and a NumPy array is returned for it,
+        otherwise an ``array('Q')``.
+
+        .. seealso:: :py:meth:`heightFromTimestamp`
+
+        :param timestamps: The timestamps, e.g. a list, an ``array('Q')`` or a NumPy array.
+        :type timestamps: Sequence[int]
+        :param network: The network to use (default is :py:attr:`Network.MAIN`).
+        :type network: Network | int
+        :return: The blockchain heights, in the order of the timestamps.
+        """
+        return Ots._convertMany(ots_heights_from_timestamps, Ots.heightFromTimestamp, timestamps, network)
+
+    @staticmethod
+    def timestampsFromHeights(heights: Sequence[int], network: Network | int = Network.MAIN) -> Sequence[int]:
+        """
+        Returns the estimated timestamps for many blockchain heights at once.
+
+        .. seealso:: :py:meth:`heightsFromTimestamps` and :py:meth:`timestampFromHeight`
+
+        :param heights: The heights, e.g. a list, an ``array('Q')`` or a NumPy array.
+        :type heights: Sequence[int]
+        :param network: The network to use (default is :py:attr:`Network.MAIN`).
+        :type network: Network | int
+        :return: The timestamps, in the order of the heights.
+        """
+        return Ots._convertMany(ots_timestamps_from_heights, Ots.timestampFromHeight, heights, network)
+
+    @staticmethod
+    def _convertMany(convert, single, values: Sequence[int], network: Network | int) -> Sequence[int]:
+        """
+        :meta private:
+        """
+        assert isinstance(network, (Network, int)), "Network must be an instance of Network or an integer."
+        if type(values).__module__ == 'numpy':
+            import numpy
+            source = numpy.ascontiguousarray(values, dtype=numpy.uint64)
+            out = numpy.empty_like(source)
+        else:
+            source = values if isinstance(values, array) and values.typecode == 'Q' else array('Q', values)
+            out = array('Q', bytes(len(source) * source.itemsize))
+        failed: int = convert(memoryview(source).cast('B'), memoryview(out).cast('B'), network)
+        if failed:
+            single(int(source[failed - 1]), network)  # raises the exception of the library
+            raise RuntimeError(f"Failed to convert value at position {failed - 1}")
+        return out
+
     @staticmethod
     def random(size: int) -> bytes:
         """
@@ -112,6 +170,22 @@ class Ots:
             raise exception_from_result(result)
         return ots_result_boolean(result)
 
+    @staticmethod
+    def entropyLevel(data: bytes) -> float:
+        """
+        Returns the entropy level of the provided data, as calculated by the library.
+
+        .. seealso:: :py:class:`ots.entropy.EntropyEstimator` for data too large to pass at once.
+
+        :param bytes data: The byte string to analyze.
+        :return: The entropy level.
+        """
+        assert isinstance(data, bytes), "Data must be a byte string."
+        result: ots_result_t = ots_entropy_level(data)
+        if ots_is_error(result):
+            raise exception_from_result(result)
+        return float(ots_result_string(result))
+
     @staticmethod
     def setEnforceEntropy(enforce: bool = True) -> None:
         """
@@ -254,3 +328,96 @@ class Ots:
         if ots_is_error(result):
             raise exception_from_result(result)
         return ots_result_boolean(result)
+
+    @staticmethod
+    def verifyDataMany(
+        items: Iterable[tuple[bytes | str, Address | str, str | bytes]],
+        workers: int | None = None,
+        chunkSize: int = 64,
+        cache: VerifyCache | None = None
+    ) -> list[bool]:
+        """
+        Verifies many data signatures, e.g. of an audit of signed messages.
+
+        .. code-block:: python
+
+            cache: VerifyCache = VerifyCache(maxEntries=1000000)
+            valid: list[bool] = Ots.verifyDataMany([(data, address, signature), ...], cache=cache)
+
+        Every message is encoded once and equal items are verified once. The items are
+        grouped by address and every address is checked once, the items of an invalid
+        address are not verified. The verifying is spread over threads, the library is
+        called without the GIL.
+
+        :param items: Tuples of the data, the address and the signature.
+        :type items: Iterable[tuple[bytes | str, Address | str, str | bytes]]
+        :param workers: Number of threads, 1 verifies in this thread. Defaults to the number of CPUs.
+        :type workers: int | None
+        :param int chunkSize: Number of signatures a thread verifies at once.
+        :param cache: Results of earlier verifications, looked up before and updated after verifying.
+        :type cache: VerifyCache | None
+        :return: For each item in order, True if the signature is valid, False otherwise,
+            also if the address is invalid or the library fails to verify the item.
+        """
+        assert workers is None or (isinstance(workers, int) and workers > 0), "workers must be a positive integer"
+        assert isinstance(chunkSize, int) and chunkSize > 0, "chunkSize must be a positive integer"
+        assert cache is None or isinstance(cache, VerifyCache), "cache must be a VerifyCache"
+        messages: dict[bytes | str, bytes] = {}
+        jobs: dict[tuple[bytes, str, str], int] = {}
+        order: list[int] = []
+        for item in items:
+            assert isinstance(item, tuple) and len(item) == 3, "items must be (data, address, signature) tuples"
+            data, address, signature = item
+            assert isinstance(data, (bytes, str)), "Data must be a byte string or a string."
+            assert isinstance(address, (Address, str)), "Address must be an instance of Address or a string."
+            assert isinstance(signature, (bytes, str)), "Signature must be a byte string or a string."
+            message: bytes | None = messages.get(data)
+            if message is None:
+                message = messages[data] = data.encode('utf-8') if isinstance(data, str) else data
+            if isinstance(address, Address):
+                address = str(address)
+            if isinstance(signature, bytes):
+                signature = signature.decode('utf-8')
+            order.append(jobs.setdefault((message, address, signature), len(jobs)))
+        results: list[bool | None] = [None] * len(jobs)
+        keys: list[VerifyKey | None] = [None] * len(jobs)
+        groups: dict[str, list[tuple[int, bytes, str]]] = {}
+        for position, (message, address, signature) in enumerate(jobs):
+            if cache is not None:
+                keys[position] = verifyKey(message, address, signature)
+                results[position] = cache.get(keys[position])
+                if results[position] is not None:
+                    continue
+            groups.setdefault(address, []).append((position, message, signature))
+        for address in list(groups):
+            if ots_is_error(ots_address_create(address)):
+                for position, _, _ in groups.pop(address):
+                    results[position] = False
+        chunks: list[tuple[str, list[tuple[int, bytes, str]]]] = [
+            (address, group[i:i + chunkSize]) for address, group in groups.items() for i in range(0, len(group), chunkSize)
+        ]
+        workers = workers or cpu_count() or 1
+        if workers == 1 or len(chunks) <= 1:
+            verified: list[list[bool]] = [Ots._verifyChunk(address, chunk) for address, chunk in chunks]
+        else:
+            with ThreadPoolExecutor(min(workers, len(chunks))) as executor:
+                verified = list(executor.map(Ots._verifyChunk, *zip(*chunks)))
+        for (_, chunk), valid in zip(chunks, verified):
+            for (position, _, _), result in zip(chunk, valid):
+                results[position] = bool(result)
+                if cache is not None and result is not None:
+                    cache.put(keys[position], result)
+        return [results[i] for i in order]
+
+    @staticmethod
+    def _verifyChunk(address: str, chunk: list[tuple[int, bytes, str]]) -> list[bool | None]:
+        """
+        Verifies the signatures of a chunk of :py:meth:`verifyDataMany`, all against one address.
+        :return: The results, None for an item the library failed to verify.
+        :meta private:
+        """
+        valid: list[bool | None] = []
+        for _, message, signature in chunk:
+            result: ots_result_t = ots_verify_data(message, address, signature)
+            valid.append(None if ots_is_error(result) else ots_result_boolean(result))
+        return valid
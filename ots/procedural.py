@@ -2,15 +2,136 @@
 This modules is intented to provide a procedural interface to the OTS library,
 which is easy to use in comparison to the raw C ABI Wrapper.
 
+It is the lean fast path of the wrapper: functions take and return plain Python
+values (str, bytes, int, bool, tuples), native results are freed right away,
+and no wrapper objects like :py:class:`ots.address.Address` or
+:py:class:`ots.wipeable_string.WipeableString` are created in between.
+Seeds and wallets are passed around as their opaque handles.
+
+.. code-block:: python
+
+    from ots import procedural as otsp
+    seed: ots_handle_t = otsp.polyseed_generate()
+    wallet: ots_handle_t = otsp.seed_wallet(seed)
+    print(otsp.wallet_subaddresses(wallet, 0, 10))
+    signature: str = otsp.wallet_sign_data(wallet, b'data')
+    assert otsp.verify_data(b'data', otsp.wallet_address(wallet), signature)
+
 .. warning::
 
-    This module is not yet implemented, and could be removed in the future.
+    Secrets returned by this module (e.g. :py:func:`seed_phrase`) are plain
+    Python strings, which can not be wiped from memory.
 """
 from .raw import *
 from .raw import _CDataBase
 from .exceptions import *
 
 
+def _check(result: _CDataBase) -> None:
+    """
+    Raises the exception of an error result, the exception keeps the result alive.
+    :meta private:
+    """
+    if lib.ots_is_error(result):
+        raise exception_from_result(ots_result_t(result))
+
+
+def _free(result: _CDataBase) -> None:
+    """
+    :meta private:
+    """
+    lib.ots_free_result(ffi.new('ots_result_t **', result))
+
+
+def _free_handle(handle: _CDataBase) -> None:
+    """
+    :meta private:
+    """
+    lib.ots_free_handle(ffi.new('ots_handle_t **', handle))
+
+
+def _string(result: _CDataBase) -> str:
+    """
+    :meta private:
+    """
+    _check(result)
+    if lib.ots_result_is_array(result):
+        out: str = ffi.unpack(lib.ots_result_char_array(result), lib.ots_result_size(result)).decode('utf-8')
+    else:
+        out = ffi.string(lib.ots_result_string(result)).decode('utf-8')
+    _free(result)
+    return out
+
+
+def _bytes(result: _CDataBase) -> bytes:
+    """
+    :meta private:
+    """
+    _check(result)
+    out: bytes = ffi.unpack(lib.ots_result_string(result), lib.ots_result_size(result))
+    _free(result)
+    return out
+
+
+def _boolean(result: _CDataBase) -> bool:
+    """
+    :meta private:
+    """
+    _check(result)
+    out: bool = lib.ots_result_boolean(result, False)
+    _free(result)
+    return out
+
+
+def _number(result: _CDataBase) -> int:
+    """
+    :meta private:
+    """
+    _check(result)
+    out: int = lib.ots_result_number(result, -1)
+    _free(result)
+    return out
+
+
+def _handle(result: _CDataBase) -> ots_handle_t:
+    """
+    :meta private:
+    """
+    _check(result)
+    out: ots_handle_t = ots_handle_t(lib.ots_result_handle(result), lib.ots_result_handle_is_reference(result))
+    _free(result)
+    return out
+
+
+def _base58(result: _CDataBase) -> str:
+    """
+    Returns the base58 string of the address in the result, freeing the address and the result.
+    :meta private:
+    """
+    _check(result)
+    address: _CDataBase = lib.ots_result_handle(result)
+    reference: bool = lib.ots_result_handle_is_reference(result)
+    _free(result)
+    try:
+        return _string(lib.ots_address_base58_string(address))
+    finally:
+        if not reference:
+            _free_handle(address)
+
+
+def _base58_array(result: _CDataBase) -> list[str]:
+    """
+    Returns the base58 strings of the array of addresses in the result.
+    :meta private:
+    """
+    _check(result)
+    addresses: _CDataBase = lib.ots_result_handle_array_reference(result)
+    try:
+        return [_string(lib.ots_address_base58_string(addresses + i)) for i in range(lib.ots_result_size(result))]
+    finally:
+        _free(result)
+
+
 def free_result(result: ots_result_t | _CDataBase) -> None:
     """
     Frees the result object returned by OTS functions.
@@ -59,3 +180,331 @@ def random32() -> bytes:
     out: bytes = ots_result_char_array_reference(result)
     ots_free_result(result)
     return out
+
+
+def version_components() -> tuple[int, int, int]:
+    """
+    Returns the version components of the OTS library.
+    :return: A tuple of major, minor and patch version.
+    """
+    result: _CDataBase = lib.ots_version_components()
+    _check(result)
+    values = lib.ots_result_int_array(result)
+    out: tuple[int, int, int] = (int(values[0]), int(values[1]), int(values[2]))
+    _free(result)
+    return out
+
+
+def height_from_timestamp(timestamp: int, network: Network | int = Network.MAIN) -> int:
+    """
+    Returns the estimated blockchain height for a timestamp.
+
+    :param int timestamp: The timestamp.
+    :param network: The network.
+    :return: The estimated height.
+    """
+    return _number(lib.ots_height_from_timestamp(timestamp, int(network)))
+
+
+def timestamp_from_height(height: int, network: Network | int = Network.MAIN) -> int:
+    """
+    Returns the estimated timestamp for a blockchain height.
+
+    :param int height: The height.
+    :param network: The network.
+    :return: The estimated timestamp.
+    """
+    return _number(lib.ots_timestamp_from_height(height, int(network)))
+
+
+def address_valid(address: str, network: Network | int = Network.MAIN) -> bool:
+    """
+    Checks if an address is valid for a network.
+
+    :param str address: The base58 address.
+    :param network: The network.
+    :return: True if the address is valid.
+    """
+    return _boolean(lib.ots_address_string_valid(address.encode('utf-8'), int(network)))
+
+
+def address_network(address: str) -> Network:
+    """
+    :param str address: The base58 address.
+    :return: The network of the address.
+    """
+    result: _CDataBase = lib.ots_address_string_network(address.encode('utf-8'))
+    _check(result)
+    out: Network = Network(lib.ots_result_network(result))
+    _free(result)
+    return out
+
+
+def address_type(address: str) -> AddressType:
+    """
+    :param str address: The base58 address.
+    :return: The type of the address.
+    """
+    result: _CDataBase = lib.ots_address_string_type(address.encode('utf-8'))
+    _check(result)
+    out: AddressType = AddressType(lib.ots_result_address_type(result))
+    _free(result)
+    return out
+
+
+def address_fingerprint(address: str) -> str:
+    """
+    :param str address: The base58 address.
+    :return: The fingerprint of the address.
+    """
+    return _string(lib.ots_address_string_fingerprint(address.encode('utf-8')))
+
+
+def address_is_integrated(address: str) -> bool:
+    """
+    :param str address: The base58 address.
+    :return: True if the address is an integrated address.
+    """
+    return _boolean(lib.ots_address_string_is_integrated(address.encode('utf-8')))
+
+
+def address_payment_id(address: str) -> str:
+    """
+    :param str address: The base58 integrated address.
+    :return: The payment id of the integrated address.
+    """
+    return _string(lib.ots_address_string_payment_id(address.encode('utf-8')))
+
+
+def polyseed_generate(network: Network | int = Network.MAIN, time: int = 0, passphrase: str = '') -> ots_handle_t:
+    """
+    Generates a new Polyseed.
+
+    :param network: The network.
+    :param int time: The creation time, 0 for now.
+    :param str passphrase: Optional passphrase.
+    :return: The handle of the seed.
+    """
+    return _handle(lib.ots_polyseed_generate(int(network), time, passphrase.encode('utf-8')))
+
+
+def monero_seed_generate(height: int = 0, time: int = 0, network: Network | int = Network.MAIN) -> ots_handle_t:
+    """
+    Generates a new Monero seed.
+
+    :param int height: The restore height.
+    :param int time: The creation time.
+    :param network: The network.
+    :return: The handle of the seed.
+    """
+    return _handle(lib.ots_monero_seed_generate(height, time, int(network)))
+
+
+def polyseed_decode(phrase: str, network: Network | int = Network.MAIN, password: str = '', passphrase: str = '') -> ots_handle_t:
+    """
+    Decodes a Polyseed phrase.
+
+    :param str phrase: The seed phrase.
+    :param network: The network.
+    :param str password: Optional password the phrase is encrypted with.
+    :param str passphrase: Optional passphrase.
+    :return: The handle of the seed.
+    """
+    return _handle(lib.ots_polyseed_decode(
+        phrase.encode('utf-8'),
+        int(network),
+        password.encode('utf-8'),
+        passphrase.encode('utf-8')
+    ))
+
+
+def monero_seed_decode(phrase: str, height: int = 0, time: int = 0, network: Network | int = Network.MAIN, passphrase: str = '') -> ots_handle_t:
+    """
+    Decodes a Monero seed phrase.
+
+    :param str phrase: The seed phrase.
+    :param int height: The restore height.
+    :param int time: The creation time.
+    :param network: The network.
+    :param str passphrase: Optional offset passphrase.
+    :return: The handle of the seed.
+    """
+    return _handle(lib.ots_monero_seed_decode(phrase.encode('utf-8'), height, time, int(network), passphrase.encode('utf-8')))
+
+
+def seed_phrase(seed: ots_handle_t, languageCode: str = '', password: str = '') -> str:
+    """
+    Returns the phrase of a seed.
+
+    .. warning:: The phrase is returned as a plain string, which can not be wiped.
+
+    :param seed: The handle of the seed.
+    :param str languageCode: The code of the language, empty for the default language.
+    :param str password: Optional password to encrypt the phrase with.
+    :return: The seed phrase.
+    """
+    result: _CDataBase = lib.ots_seed_phrase_for_language_code(
+        seed.ptr,
+        languageCode.encode('utf-8'),
+        password.encode('utf-8')
+    )
+    _check(result)
+    phrase: _CDataBase = lib.ots_result_handle(result)
+    reference: bool = lib.ots_result_handle_is_reference(result)
+    _free(result)
+    out: str = ffi.string(lib.ots_wipeable_string_c_str(phrase)).decode('utf-8')
+    if not reference:
+        _free_handle(phrase)
+    return out
+
+
+def seed_fingerprint(seed: ots_handle_t) -> str:
+    """
+    :param seed: The handle of the seed.
+    :return: The fingerprint of the seed.
+    """
+    return _string(lib.ots_seed_fingerprint(seed.ptr))
+
+
+def seed_address(seed: ots_handle_t) -> str:
+    """
+    :param seed: The handle of the seed.
+    :return: The standard address of the seed, base58 encoded.
+    """
+    return _base58(lib.ots_seed_address(seed.ptr))
+
+
+def seed_wallet(seed: ots_handle_t) -> ots_handle_t:
+    """
+    :param seed: The handle of the seed.
+    :return: The handle of the wallet of the seed.
+    """
+    return _handle(lib.ots_seed_wallet(seed.ptr))
+
+
+def wallet_address(wallet: ots_handle_t, account: int = 0, index: int = 0) -> str:
+    """
+    Returns an address of a wallet, account 0 and index 0 is the standard address.
+
+    :param wallet: The handle of the wallet.
+    :param int account: The account.
+    :param int index: The index in the account.
+    :return: The address, base58 encoded.
+    """
+    return _base58(lib.ots_wallet_subaddress(wallet.ptr, account, index))
+
+
+def wallet_accounts(wallet: ots_handle_t, max: int = 10, offset: int = 0) -> list[str]:
+    """
+    Returns the addresses of accounts of a wallet.
+
+    :param wallet: The handle of the wallet.
+    :param int max: The number of accounts.
+    :param int offset: The first account.
+    :return: The addresses, base58 encoded.
+    """
+    if max <= 0:
+        return []
+    return _base58_array(lib.ots_wallet_accounts(wallet.ptr, max, offset))
+
+
+def wallet_subaddresses(wallet: ots_handle_t, account: int = 0, max: int = 10, offset: int = 0) -> list[str]:
+    """
+    Returns the subaddresses of an account of a wallet.
+
+    :param wallet: The handle of the wallet.
+    :param int account: The account.
+    :param int max: The number of subaddresses.
+    :param int offset: The first index.
+    :return: The addresses, base58 encoded.
+    """
+    if max <= 0:
+        return []
+    return _base58_array(lib.ots_wallet_subaddresses(wallet.ptr, account, max, offset))
+
+
+def wallet_address_index(wallet: ots_handle_t, address: str, maxAccountDepth: int = 0, maxIndexDepth: int = 0) -> tuple[int, int]:
+    """
+    Returns the account and index of an address of a wallet.
+
+    :param wallet: The handle of the wallet.
+    :param str address: The base58 address.
+    :param int maxAccountDepth: The maximum account depth to search, 0 for the default.
+    :param int maxIndexDepth: The maximum index depth to search, 0 for the default.
+    :return: The account and the index.
+    """
+    result: _CDataBase = lib.ots_wallet_address_string_index(wallet.ptr, address.encode('utf-8'), maxAccountDepth, maxIndexDepth)
+    _check(result)
+    out: tuple[int, int] = (lib.ots_result_address_index_account(result), lib.ots_result_address_index_index(result))
+    _free(result)
+    return out
+
+
+def wallet_sign_data(wallet: ots_handle_t, data: bytes, account: int = 0, index: int = 0) -> str:
+    """
+    Signs data with an address of a wallet.
+
+    :param wallet: The handle of the wallet.
+    :param bytes data: The data to sign.
+    :param int account: The account of the address.
+    :param int index: The index of the address.
+    :return: The signature.
+    """
+    if account == 0 and index == 0:
+        return _string(lib.ots_wallet_sign_data(wallet.ptr, data, len(data)))
+    return _string(lib.ots_wallet_sign_data_with_index(wallet.ptr, data, len(data), account, index))
+
+
+def wallet_verify_data(wallet: ots_handle_t, data: bytes, signature: str, legacyFallback: bool = False) -> bool:
+    """
+    Verifies a signature of data against the standard address of a wallet.
+
+    :param wallet: The handle of the wallet.
+    :param bytes data: The signed data.
+    :param str signature: The signature.
+    :param bool legacyFallback: Whether to accept legacy signatures.
+    :return: True if the signature is valid.
+    """
+    return _boolean(lib.ots_wallet_verify_data(wallet.ptr, data, len(data), signature.encode('utf-8'), legacyFallback))
+
+
+def verify_data(data: bytes, address: str, signature: str) -> bool:
+    """
+    Verifies a signature of data against any address.
+
+    :param bytes data: The signed data.
+    :param str address: The base58 address.
+    :param str signature: The signature.
+    :return: True if the signature is valid.
+    """
+    return _boolean(lib.ots_verify_data(data, len(data), address.encode('utf-8'), signature.encode('utf-8')))
+
+
+def wallet_import_outputs(wallet: ots_handle_t, outputs: bytes) -> int:
+    """
+    Imports outputs from the view only wallet.
+
+    :param wallet: The handle of the wallet.
+    :param bytes outputs: The exported outputs.
+    :return: The number of imported outputs.
+    """
+    return _number(lib.ots_wallet_import_outputs(wallet.ptr, outputs, len(outputs)))
+
+
+def wallet_export_key_images(wallet: ots_handle_t) -> bytes:
+    """
+    :param wallet: The handle of the wallet.
+    :return: The key images, to import into the view only wallet.
+    """
+    return _bytes(lib.ots_wallet_export_key_images(wallet.ptr))
+
+
+def wallet_sign_transaction(wallet: ots_handle_t, unsignedTx: bytes) -> bytes:
+    """
+    Signs an unsigned transaction of the view only wallet.
+
+    :param wallet: The handle of the wallet.
+    :param bytes unsignedTx: The unsigned transaction.
+    :return: The signed transaction.
+    """
+    return _bytes(lib.ots_wallet_sign_transaction(wallet.ptr, unsignedTx, len(unsignedTx)))
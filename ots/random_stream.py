@@ -0,0 +1,121 @@
+from io import RawIOBase
+from threading import Lock
+from .raw import *
+from .exceptions import *
+
+
+class RandomStream(RawIOBase):
+    """
+    A buffered, thread-safe, file-like stream of random bytes from the OTS library.
+
+    The buffer is refilled from :py:func:`ots.raw.ots_random_bytes` in large chunks,
+    so many small reads (e.g. nonces) cost one call into the library per chunk,
+    and the entropy of the chunk is checked once per refill instead of per read.
+    Bytes handed out are wiped from the buffer, so they are never returned twice
+    and do not stay in memory longer than needed.
+
+    .. code-block:: python
+
+        with RandomStream() as stream:
+            nonce: bytes = stream.read(12)
+            key = bytearray(32)
+            stream.readinto(key)
+
+    .. note::
+
+        The stream is endless, :py:meth:`readall` and ``read()`` without size raise ValueError.
+    """
+
+    def __init__(self, chunkSize: int = 4096, minEntropy: float | None = None):
+        """
+        Initializes the stream.
+
+        :param int chunkSize: The number of random bytes fetched from the library at once.
+        :param minEntropy: If set, every chunk is checked with :py:func:`ots.raw.ots_check_low_entropy` against this threshold.
+        :type minEntropy: float | None
+        """
+        assert isinstance(chunkSize, int) and chunkSize > 0, "chunkSize must be a positive integer"
+        assert minEntropy is None or isinstance(minEntropy, float), "minEntropy must be a float or None"
+        super().__init__()
+        self.chunkSize: int = chunkSize
+        """The number of random bytes fetched from the library at once."""
+        self.minEntropy: float | None = minEntropy
+        """The minimum entropy of a chunk, or None to rely on the library alone."""
+        self._buffer: bytearray = bytearray(chunkSize)
+        self._offset: int = chunkSize
+        self._lock: Lock = Lock()
+        self.refills: int = 0
+        """The number of chunks fetched from the library so far."""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        """
+        Fills the buffer with random bytes.
+
+        :param buffer: The writable buffer to fill.
+        :type buffer: bytearray | memoryview
+        :return: The number of bytes written, always the size of the buffer.
+        """
+        if self.closed:
+            raise ValueError("I/O operation on closed stream")
+        target: memoryview = memoryview(buffer).cast('B')
+        filled: int = 0
+        with self._lock:
+            while filled < len(target):
+                if self._offset == len(self._buffer):
+                    self._refill()
+                size: int = min(len(target) - filled, len(self._buffer) - self._offset)
+                end: int = self._offset + size
+                target[filled:filled + size] = self._buffer[self._offset:end]
+                self._buffer[self._offset:end] = bytes(size)
+                self._offset = end
+                filled += size
+        return filled
+
+    def readall(self) -> bytes:
+        raise ValueError("RandomStream is endless, read with a size")
+
+    def random(self, size: int) -> bytes:
+        """
+        Returns random bytes, like :py:meth:`ots.ots.Ots.random` but served from the buffer.
+
+        :param int size: The number of random bytes.
+        :return: The random bytes.
+        """
+        assert isinstance(size, int) and size >= 0, "size must be a non-negative integer"
+        out: bytearray = bytearray(size)
+        self.readinto(out)
+        return bytes(out)
+
+    def close(self) -> None:
+        """
+        Wipes the buffer and closes the stream.
+        """
+        with self._lock:
+            self._buffer[:] = bytes(len(self._buffer))
+            self._offset = len(self._buffer)
+        super().close()
+
+    def _refill(self) -> None:
+        """
+        Fetches the next chunk from the library into the buffer.
+        :meta private:
+        """
+        result: ots_result_t = ots_random_bytes(self.chunkSize)
+        if ots_is_error(result):
+            raise exception_from_result(result)
+        if not ots_result_data_is_uint8(result) or ots_result_size(result) != self.chunkSize:
+            raise RuntimeError("Failed to generate random bytes")
+        ots_result_char_array_into(result, self._buffer)
+        ots_free_result(result)
+        if self.minEntropy is not None:
+            result = ots_check_low_entropy(self._buffer, self.minEntropy)
+            if ots_is_error(result):
+                raise exception_from_result(result)
+            if ots_result_boolean(result):
+                self._buffer[:] = bytes(len(self._buffer))
+                raise RuntimeError(f"Random bytes have less entropy than {self.minEntropy}")
+        self._offset = 0
+        self.refills += 1
@@ -1,11 +1,21 @@
 from dataclasses import dataclass, field
+from os import environ
+from typing import Any
 from _cffi_backend import _CDataBase
-from ._ots import ffi, lib
+from ._backend import ffi, lib
 from .enums import *
 
 REQUIRE__OTS_RESULT_T__OR__CDATA_BASE = "result must be a valid ots_result_t or _CDataBase object"
 REQUIRE__OTS_HANDLE_T__OR__CDATA_BASE = "handle must be a valid ots_handle_t or _CDataBase object"
 
+_lifetime = None
+"""The :py:mod:`ots.lifetime` module while the accounting is enabled, None otherwise."""
+_lifetimeFreed = None
+"""The :py:mod:`ots.lifetime` module while objects accounted by it may be alive, None otherwise."""
+
+_UNSET: Any = object()
+"""Marks a lazy field of the classes not fetched from the library yet, None can be a valid value of the field."""
+
 
 class _opaque_handle_t:
     """
@@ -15,7 +25,14 @@ class _opaque_handle_t:
 
         Do not instantiate this class directly!
 
+    .. note::
+
+        The wrappers have ``__slots__``, no ``__dict__``, as there can be many of them.
+        The pointer of a pointer stays, the library sets it to NULL when it frees the
+        object or takes over the ownership, e.g. when a seed is transferred into the jar.
+
     """
+    __slots__ = ()
 
     @property
     def ptr(self) -> _CDataBase:
@@ -44,6 +61,7 @@ class ots_result_t(_opaque_handle_t):
     Internally it wraps the C ABI ots_result_t struct in a pointer of a pointer type,
     so it can be reasonably freed when the object is deleted.
     """
+    __slots__ = ('ptrptr',)
 
     def __init__(self, result: _CDataBase):
         """
@@ -62,11 +80,15 @@ class ots_result_t(_opaque_handle_t):
 
         """
         self.ptrptr[0] = result
+        if _lifetime is not None:
+            _lifetime.created(self)
 
     def __del__(self):
         """
         Frees the underlying C data type before the object is deleted.
         """
+        if _lifetimeFreed is not None:
+            _lifetimeFreed.freed(self)
         if self.ptrptr:
             if lib is not None:
                 lib.ots_free_result(self.ptrptr)
@@ -80,6 +102,7 @@ class ots_handle_t(_opaque_handle_t):
     Internally it wraps the C ABI ots_handle_t struct in a pointer of a pointer type,
     so it can be reasonably freed when the object is deleted.
     """
+    __slots__ = ('ptrptr', 'reference')
 
     def __init__(self, handle: _CDataBase, reference: bool = False):
         """
@@ -104,11 +127,15 @@ class ots_handle_t(_opaque_handle_t):
         C data type when the object is deleted. But no worry, it is taken care of it
         automatically by the wrapper and the library.
         """
+        if _lifetime is not None:
+            _lifetime.created(self)
 
     def __del__(self):
         """
         Frees the underlying C data type when the object is deleted.
         """
+        if _lifetimeFreed is not None:
+            _lifetimeFreed.freed(self)
         if self.ptrptr is not None:
             if not self.reference and lib is not None:
                 lib.ots_free_handle(self.ptrptr)
@@ -123,7 +150,7 @@ class ots_handle_t(_opaque_handle_t):
         return HandleType(self.ptr.type)
 
 
-@dataclass
+@dataclass(slots=True)
 class ots_flow_vector_t:
     """
     Represents a flow vector `ots_flow_vector_t` in OTS, in a pythonic way.
@@ -132,7 +159,7 @@ class ots_flow_vector_t:
     amount: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ots_transfer_description_t:
     """
     Represents a transfer description `ots_transfer_description_t` in OTS, in a pythonic way.
@@ -190,16 +217,21 @@ class ots_tx_description_t(_opaque_handle_t):
 
     If used with random access it would properties of the transfers.
     """
+    __slots__ = ('ptrptr',)
 
     def __init__(self, description: _CDataBase):
         assert ffi.typeof(description) == ffi.typeof('ots_tx_description_t *'), "description must be of type ots_tx_description_t *"
         self.ptrptr = ffi.new('ots_tx_description_t **')
         self.ptrptr[0] = description
+        if _lifetime is not None:
+            _lifetime.created(self)
 
     def __del__(self):
         """
         Frees the underlying C data type when the object is deleted.
         """
+        if _lifetimeFreed is not None:
+            _lifetimeFreed.freed(self)
         if self.ptrptr:
             lib.ots_free_tx_description(self.ptrptr)
             ffi.release(self.ptrptr)
@@ -332,6 +364,21 @@ def _is_handle(handle: ots_handle_t | _CDataBase | None) -> bool:
     return False
 
 
+def _char_buffer(data: bytes | bytearray | memoryview) -> bytes | _CDataBase:
+    """
+    Returns data as it can be passed as `const char *` to the library.
+    Bytes are passed as they are, any other buffer (bytearray, memoryview,
+    e.g. a view into shared memory) is passed without copying it.
+
+    :param data: The data to pass.
+    :type data: bytes | bytearray | memoryview
+    :return: The data, or a `char[]` over the buffer of the data.
+    """
+    if isinstance(data, bytes):
+        return data
+    return ffi.from_buffer('char[]', data)
+
+
 def _is_result(result: ots_result_t | _CDataBase | None) -> bool:
     """
     Checks if the given result is a valid ots_result_t or `ots_result_t *` _CDataBase object. Accepts None to not raise an error and return simply silently False.
@@ -1650,6 +1697,57 @@ def ots_result_char_array_reference(result: _CDataBase|None) -> bytes:
     return ffi.unpack(ffi.cast('char*', lib.ots_result_uint8_array_reference(_unwrap(result))), ots_result_size(result))
 
 
+def ots_result_char_array_into(result: ots_result_t | _CDataBase, buffer: bytearray | memoryview) -> int:
+    """
+    Copies the array of characters from the result into a writable buffer,
+    without creating an intermediate (immutable) bytes object.
+
+    .. code-block:: python
+
+        buffer = bytearray(32)
+        copied: int = ots_result_char_array_into(ots_random_bytes(32), buffer)
+
+    :param result: The result to copy the character array from.
+    :param buffer: The buffer to copy into, at least as large as the array.
+    :type buffer: bytearray | memoryview
+    :return: The number of bytes copied.
+    """
+    assert _is_result(result), REQUIRE__OTS_RESULT_T__OR__CDATA_BASE
+    assert ots_result_is_array(result), "result must be an array"
+    assert ots_result_data_is_char(result) or ots_result_data_is_uint8(result), "result array must be of char or uint8 type"
+    size: int = ots_result_size(result)
+    assert len(buffer) >= size, "buffer is too small for the result"
+    ffi.memmove(buffer, lib.ots_result_uint8_array_reference(_unwrap(result)), size)
+    return size
+
+
+def ots_result_bytes_into(result: ots_result_t | _CDataBase, buffer: bytearray | memoryview) -> int:
+    """
+    Copies the string from the result into a writable buffer, like :py:func:`ots_result_bytes`
+    without creating an intermediate (immutable) bytes object.
+
+    .. code-block:: python
+
+        buffer = bytearray(1 << 20)
+        size: int = ots_result_bytes_into(ots_wallet_sign_transaction(wallet_handle, unsigned_tx), buffer)
+
+    :param result: The result to copy the string from.
+    :param buffer: The buffer to copy into, at least as large as the string.
+    :type buffer: bytearray | memoryview
+    :return: The number of bytes copied.
+    :raises ValueError: If the buffer is too small for the string.
+    """
+    assert _is_result(result), REQUIRE__OTS_RESULT_T__OR__CDATA_BASE
+    out = lib.ots_result_string(_unwrap(result))
+    if out == ffi.NULL:
+        return 0
+    size: int = lib.ots_result_size(_unwrap(result))
+    if len(buffer) < size:
+        raise ValueError(f"buffer of {len(buffer)} bytes is too small for {size} bytes")
+    ffi.memmove(buffer, out, size)
+    return size
+
+
 def ots_result_uint8_array_reference(
     result: ots_result_t | _CDataBase
 ) -> list[int]:
@@ -2480,6 +2578,46 @@ def ots_seed_indices_values(handle: ots_handle_t | _CDataBase) -> list[int]:
     ]
 
 
+def ots_seed_indices_create_from_bytes(data: bytes | bytearray | memoryview) -> ots_result_t:
+    """
+    Creates a seed indices object from a buffer of native-endian unsigned 16-bit integers,
+    without converting the values to Python integers first.
+
+    .. code-block:: python
+
+        indices = array('H', [1, 2, 3, 4])
+        result: ots_result_t = ots_seed_indices_create_from_bytes(indices.tobytes())
+        si: ots_handle_t = ots_result_handle(result)
+        assert ots_seed_indices_bytes(si) == indices.tobytes()
+
+    :param data: The buffer containing the seed indices.
+    :type data: bytes | bytearray | memoryview
+    :return: ots_result_t containing the created seed indices object.
+    """
+    assert isinstance(data, (bytes, bytearray, memoryview)), "data must be a bytes-like object"
+    assert len(data) % ffi.sizeof('uint16_t') == 0, "data must contain whole uint16_t values"
+    c_indices = ffi.from_buffer('uint16_t[]', data)
+    return ots_result_t(lib.ots_seed_indices_create(c_indices, len(data) // ffi.sizeof('uint16_t')))
+
+
+def ots_seed_indices_bytes(handle: ots_handle_t | _CDataBase) -> bytes:
+    """
+    Returns the values of the seed indices as one buffer of native-endian unsigned 16-bit integers.
+
+    .. seealso:: :py:func:`ots_seed_indices_create_from_bytes`
+
+    :param handle: The handle containing the seed indices.
+    :type handle: ots_handle_t | _CDataBase
+    :return: The seed indices as bytes.
+    """
+    assert isinstance(handle, (ots_handle_t, _CDataBase)), "handle must be an instance of ots_handle_t or _CDataBase"
+    assert HandleType(_unwrap(handle).type) == HandleType.SEED_INDICES, "handle must be of type HandleType.SEED_INDICES"
+    return ffi.buffer(
+        lib.ots_seed_indices_values(_unwrap(handle)),
+        ots_seed_indices_count(handle) * ffi.sizeof('uint16_t')
+    )[:]
+
+
 def ots_seed_indices_count(handle: ots_handle_t | _CDataBase) -> int:
     """
     Returns the count of seed indices in the handle.
@@ -3755,7 +3893,7 @@ def ots_polyseed_decode_with_language(
     assert isinstance(network, (Network, int)), "network must be an instance of Network or an integer"
     assert isinstance(password, str), "password must be a string"
     assert isinstance(passphrase, str), "passphrase must be a string"
-    return ots_result_t(lib.ots_polyseed_decode_with_language(_unwrap(phrase), _unwrap(language), int(network), password.encode('utf-8'), passphrase.encode('utf-8')))
+    return ots_result_t(lib.ots_polyseed_decode_with_language(phrase.encode('utf-8'), _unwrap(language), int(network), password.encode('utf-8'), passphrase.encode('utf-8')))
 
 
 def ots_polyseed_decode_with_language_code(
@@ -4600,7 +4738,7 @@ def ots_wallet_export_key_images(wallet: ots_handle_t | _CDataBase) -> ots_resul
 
 def ots_wallet_describe_tx(
     wallet: ots_handle_t | _CDataBase,
-    unsigned_tx: bytes
+    unsigned_tx: bytes | bytearray | memoryview
 ) -> ots_result_t:
     """
     Describes a transaction for the given wallet handle.
@@ -4613,13 +4751,14 @@ def ots_wallet_describe_tx(
 
     :param wallet: The handle of the wallet.
     :type wallet: ots_handle_t | _CDataBase
-    :param bytes unsigned_tx: A bytes object containing the unsigned transaction to describe.
+    :param unsigned_tx: A bytes-like object containing the unsigned transaction to describe.
+    :type unsigned_tx: bytes | bytearray | memoryview
     :return: ots_result_t containing the description of the transaction.
     """
     assert isinstance(wallet, (ots_handle_t, _CDataBase)), "wallet must be an instance of ots_handle_t or _CDataBase"
     assert HandleType(_unwrap(wallet).type) == HandleType.WALLET, "wallet must be of type HandleType.WALLET"
-    assert isinstance(unsigned_tx, bytes), "unsigned_tx must be a bytes object"
-    return ots_result_t(lib.ots_wallet_describe_tx(_unwrap(wallet), unsigned_tx, len(unsigned_tx)))
+    assert isinstance(unsigned_tx, (bytes, bytearray, memoryview)), "unsigned_tx must be a bytes-like object"
+    return ots_result_t(lib.ots_wallet_describe_tx(_unwrap(wallet), _char_buffer(unsigned_tx), len(unsigned_tx)))
 
 
 def ots_wallet_check_tx(
@@ -4649,7 +4788,7 @@ def ots_wallet_check_tx(
 
 def ots_wallet_check_tx_string(
     wallet: ots_handle_t | _CDataBase,
-    unsigned_tx: bytes
+    unsigned_tx: bytes | bytearray | memoryview
 ) -> ots_result_t:
     """
     Checks a transaction for the given wallet handle using a string representation of the unsigned transaction.
@@ -4664,18 +4803,19 @@ def ots_wallet_check_tx_string(
 
     :param wallet: The handle of the wallet.
     :type wallet: ots_handle_t | _CDataBase
-    :param bytes unsigned_tx: A bytes object containing the unsigned transaction to check.
+    :param unsigned_tx: A bytes-like object containing the unsigned transaction to check.
+    :type unsigned_tx: bytes | bytearray | memoryview
     :return: ots_result_t indicating the result of the check operation.
     """
     assert isinstance(wallet, (ots_handle_t, _CDataBase)), "wallet must be an instance of ots_handle_t or _CDataBase"
     assert HandleType(_unwrap(wallet).type) == HandleType.WALLET, "wallet must be of type HandleType.WALLET"
-    assert isinstance(unsigned_tx, bytes), "unsigned_tx must be a bytes object"
-    return ots_result_t(lib.ots_wallet_check_tx_string(_unwrap(wallet), unsigned_tx, len(unsigned_tx)))
+    assert isinstance(unsigned_tx, (bytes, bytearray, memoryview)), "unsigned_tx must be a bytes-like object"
+    return ots_result_t(lib.ots_wallet_check_tx_string(_unwrap(wallet), _char_buffer(unsigned_tx), len(unsigned_tx)))
 
 
 def ots_wallet_sign_transaction(
     wallet: ots_handle_t | _CDataBase,
-    unsigned_tx: bytes
+    unsigned_tx: bytes | bytearray | memoryview
 ) -> ots_result_t:
     """
     Signs a transaction for the given wallet handle.
@@ -4688,13 +4828,14 @@ def ots_wallet_sign_transaction(
 
     :param wallet: The handle of the wallet.
     :type wallet: ots_handle_t | _CDataBase
-    :param bytes unsigned_tx: A bytes object containing the unsigned transaction to sign.
+    :param unsigned_tx: A bytes-like object containing the unsigned transaction to sign.
+    :type unsigned_tx: bytes | bytearray | memoryview
     :return: ots_result_t containing the signed transaction.
     """
     assert isinstance(wallet, (ots_handle_t, _CDataBase)), "wallet must be an instance of ots_handle_t or _CDataBase"
     assert HandleType(_unwrap(wallet).type) == HandleType.WALLET, "wallet must be of type HandleType.WALLET"
-    assert isinstance(unsigned_tx, bytes), "unsigned_tx must be a bytes object"
-    return ots_result_t(lib.ots_wallet_sign_transaction(_unwrap(wallet), unsigned_tx, len(unsigned_tx)))
+    assert isinstance(unsigned_tx, (bytes, bytearray, memoryview)), "unsigned_tx must be a bytes-like object"
+    return ots_result_t(lib.ots_wallet_sign_transaction(_unwrap(wallet), _char_buffer(unsigned_tx), len(unsigned_tx)))
 
 
 def ots_wallet_sign_data(
@@ -6252,6 +6393,66 @@ def ots_timestamp_from_height(
     return ots_result_t(lib.ots_timestamp_from_height(height, int(network)))
 
 
+def ots_heights_from_timestamps(
+    timestamps: bytes | bytearray | memoryview,
+    heights: bytearray | memoryview,
+    network: Network | int = Network.MAIN
+) -> int:
+    """
+    Converts many timestamps to heights in one call, see :py:func:`ots_height_from_timestamp`.
+
+    .. note::
+
+        Not part of the OTS C ABI, the loop is a helper compiled into the CFFI module by ``ots_build.py``.
+
+    .. code-block:: python
+
+        timestamps = array('Q', [1700000000, 1710000000])
+        heights = array('Q', bytes(len(timestamps) * 8))
+        assert ots_heights_from_timestamps(timestamps, heights, Network.MAIN) == 0
+
+    :param timestamps: Buffer of uint64_t timestamps.
+    :type timestamps: bytes | bytearray | memoryview
+    :param heights: Writable buffer of uint64_t for the heights, same length as timestamps.
+    :type heights: bytearray | memoryview
+    :param network: The network for which to calculate the heights.
+    :type network: Network | int
+    :return: 0 on success, otherwise the 1-based position of the first timestamp which failed.
+    """
+    assert isinstance(network, (Network, int)), "network must be an instance of Network or an integer"
+    c_in = ffi.from_buffer('uint64_t[]', timestamps)
+    c_out = ffi.from_buffer('uint64_t[]', heights, require_writable=True)
+    assert len(c_in) == len(c_out), "timestamps and heights must have the same length"
+    return lib.ots_py_heights_from_timestamps(c_in, c_out, len(c_in), int(network))
+
+
+def ots_timestamps_from_heights(
+    heights: bytes | bytearray | memoryview,
+    timestamps: bytearray | memoryview,
+    network: Network | int = Network.MAIN
+) -> int:
+    """
+    Converts many heights to timestamps in one call, see :py:func:`ots_timestamp_from_height`.
+
+    .. note::
+
+        Not part of the OTS C ABI, the loop is a helper compiled into the CFFI module by ``ots_build.py``.
+
+    :param heights: Buffer of uint64_t heights.
+    :type heights: bytes | bytearray | memoryview
+    :param timestamps: Writable buffer of uint64_t for the timestamps, same length as heights.
+    :type timestamps: bytearray | memoryview
+    :param network: The network for which to calculate the timestamps.
+    :type network: Network | int
+    :return: 0 on success, otherwise the 1-based position of the first height which failed.
+    """
+    assert isinstance(network, (Network, int)), "network must be an instance of Network or an integer"
+    c_in = ffi.from_buffer('uint64_t[]', heights)
+    c_out = ffi.from_buffer('uint64_t[]', timestamps, require_writable=True)
+    assert len(c_in) == len(c_out), "heights and timestamps must have the same length"
+    return lib.ots_py_timestamps_from_heights(c_in, c_out, len(c_in), int(network))
+
+
 def ots_random_bytes(size: int) -> ots_result_t:
     """
     Returns a random byte string of the specified size.
@@ -6284,7 +6485,7 @@ def ots_random_32() -> ots_result_t:
 
 
 def ots_check_low_entropy(
-    data: bytes,
+    data: bytes | bytearray | memoryview,
     min_entropy: float
 ) -> ots_result_t:
     """
@@ -6295,13 +6496,14 @@ def ots_check_low_entropy(
         result: ots_result_t = ots_check_low_entropy(data, 3.5)
         low_entropy: bool = ots_result_boolean(result)
 
-    :param bytes data: The data to check.
+    :param data: The data to check, a writable buffer is passed without a copy, so it can be wiped afterwards.
+    :type data: bytes | bytearray | memoryview
     :param float min_entropy: The minimum entropy level to consider.
     :return: ots_result_t indicating whether the data has low entropy.
     """
-    assert isinstance(data, bytes), "data must be a bytes object"
+    assert isinstance(data, (bytes, bytearray, memoryview)), "data must be a bytes-like object"
     assert isinstance(min_entropy, float), "min_entropy must be a float"
-    return ots_result_t(lib.ots_check_low_entropy(data, len(data), min_entropy))
+    return ots_result_t(lib.ots_check_low_entropy(ffi.from_buffer('uint8_t[]', data), memoryview(data).nbytes, min_entropy))
 
 
 def ots_entropy_level(data: bytes) -> ots_result_t:
@@ -6317,7 +6519,7 @@ def ots_entropy_level(data: bytes) -> ots_result_t:
     :return: ots_result_t containing the entropy level.
     """
     assert isinstance(data, bytes), "data must be a bytes object"
-    return ots_result_t(lib.ots_entropy_level(ffi.cast('uint8_t *', data), len(data)))
+    return ots_result_t(lib.ots_entropy_level(ffi.from_buffer('uint8_t[]', data), len(data)))
 
 
 def ots_set_enforce_entropy(enforce: bool) -> None:
@@ -6470,3 +6672,15 @@ def ots_verify_data(
     if isinstance(signature, str):
         signature = signature.encode('utf-8')
     return ots_result_t(lib.ots_verify_data(data, len(data), address.encode('utf-8'), signature))
+
+
+if environ.get('OTS_TRACE', '') not in ('', '0'):
+    from .tracing import enable as _enable_tracing
+    _enable_tracing()
+
+if environ.get('OTS_LIFETIME', '') not in ('', '0'):
+    from .lifetime import enable as _enable_lifetime
+    if environ['OTS_LIFETIME'] == 'debug':
+        _enable_lifetime(16, True)
+    else:
+        _enable_lifetime()
@@ -0,0 +1,812 @@
+import json
+import os
+import string
+from itertools import islice, product
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from difflib import get_close_matches
+from hashlib import sha256
+from time import monotonic
+from typing import Callable, Iterable, Iterator
+from zlib import crc32
+from .raw import *
+from .constants import *
+from .exceptions import *
+from .address import Address
+from .seed_indices import SeedIndices
+from .seed_language import SeedLanguage
+from .seed import Seed, LegacySeed, MoneroSeed, Polyseed
+from .word_trie import WordTrie
+
+UNKNOWN_WORDS: frozenset[str] = frozenset({'?', '*', '_'})
+"""Tokens which mark an unknown word in a phrase to recover."""
+
+_GF_MUL2_TABLE: tuple[int, ...] = (5, 7, 1, 3, 13, 15, 9, 11)
+_GF_POWERS: list[list[int]] = []
+_GF_INVERSES: list[list[int]] = []
+
+
+def gf_mul2(x: int) -> int:
+    """
+    Multiplies an element of GF(2048), the field of the Polyseed checksum, by 2.
+
+    :param int x: The element, an 11 bit word index.
+    :return: The product.
+    """
+    if x < 1024:
+        return 2 * x
+    return _GF_MUL2_TABLE[x % 8] + 16 * ((x - 1024) // 8)
+
+
+def polyseed_checksum(values: list[int] | tuple[int, ...]) -> int:
+    """
+    Evaluates the Polyseed polynomial (the word indices are its coefficients)
+    at x = 2 with Horner's method. A Polyseed phrase is valid if this is 0.
+
+    :param values: The word indices of the phrase.
+    :type values: list[int] | tuple[int, ...]
+    :return: The value of the polynomial.
+    """
+    result: int = values[-1]
+    for value in reversed(values[:-1]):
+        result = gf_mul2(result) ^ value
+    return result
+
+
+def monero_checksum_index(prefixes: list[bytes] | tuple[bytes, ...], values: list[int] | tuple[int, ...], count: int) -> int:
+    """
+    Calculates the position of the word the checksum word of a Monero (or legacy) phrase repeats.
+
+    :param prefixes: The UTF-8 encoded unique prefixes of the words of the language, by index.
+    :type prefixes: list[bytes] | tuple[bytes, ...]
+    :param values: The word indices of the phrase.
+    :type values: list[int] | tuple[int, ...]
+    :param int count: The number of words without the checksum word (24 or 12).
+    :return: The position of the word the checksum word must be equal to.
+    """
+    return crc32(b''.join(prefixes[value] for value in values[:count])) % count
+
+
+def _gf_tables() -> tuple[list[list[int]], list[list[int]]]:
+    """
+    Returns the tables of x * 2^p and their inverses for every word position p.
+    :meta private:
+    """
+    if not _GF_POWERS:
+        powers: list[int] = list(range(2048))
+        for _ in range(OTS_POLYSEED_WORDS):
+            inverse: list[int] = [0] * 2048
+            for x, y in enumerate(powers):
+                inverse[y] = x
+            _GF_POWERS.append(powers)
+            _GF_INVERSES.append(inverse)
+            powers = [gf_mul2(y) for y in powers]
+    return _GF_POWERS, _GF_INVERSES
+
+
+@dataclass(frozen=True)
+class _RecoveryTask:
+    """
+    One arrangement of a phrase to search, shipped once to every worker.
+    :meta private:
+    """
+    seedType: int
+    legacy: bool
+    base: tuple[int, ...]
+    free: tuple[int, ...]
+    candidates: tuple[tuple[int, ...], ...]
+    solve: int
+    solveCandidates: frozenset[int] | None
+    prefixes: tuple[bytes, ...] | None
+    network: int
+    height: int
+    time: int
+    password: str
+    passphrase: str
+    target: str | None
+
+    @property
+    def size(self) -> int:
+        size: int = 1
+        for candidates in self.candidates:
+            size *= len(candidates)
+        return size
+
+
+@dataclass
+class RecoveryProgress:
+    """
+    Progress of a running :py:class:`SeedRecovery`.
+    """
+    checked: int
+    """Number of candidates checked so far."""
+    total: int
+    """Number of candidates in the search space, 0 if it is not known in advance."""
+    matches: int
+    """Number of candidates which decoded (and matched the target, if any) so far."""
+    elapsed: float
+    """Seconds elapsed since the search (or the resumed search) started."""
+    resumed: int = 0
+    """Number of candidates which were already checked in the checkpoint the search resumed from."""
+
+    @property
+    def rate(self) -> float:
+        """
+        :return: Candidates checked per second.
+        """
+        return (self.checked - self.resumed) / self.elapsed if self.elapsed > 0 else 0.0
+
+
+_tasks: list[_RecoveryTask] = []
+
+
+def _init_worker(tasks: list[_RecoveryTask]) -> None:
+    """
+    Initializes a worker process with the arrangements to search.
+    :meta private:
+    """
+    global _tasks
+    _tasks = tasks
+
+
+def _decode(task: _RecoveryTask, values: list[int]) -> Seed | None:
+    """
+    Decodes a candidate, returns None if the library rejects it.
+    :meta private:
+    """
+    try:
+        indices: SeedIndices = SeedIndices.fromValues(values)
+        if SeedType(task.seedType) == SeedType.POLYSEED:
+            return Polyseed.decodeIndices(indices, Network(task.network), task.password, task.passphrase)
+        if task.legacy:
+            return LegacySeed.decodeIndices(indices, task.height, task.time, Network(task.network))
+        return MoneroSeed.decodeIndices(indices, task.height, task.time, Network(task.network), task.passphrase)
+    except OtsException:
+        return None
+
+
+def _search(variant: int, start: int, stop: int) -> tuple[int, int, list[tuple[int, ...]]]:
+    """
+    Searches the candidates `start` up to `stop` of an arrangement.
+    :return: The arrangement, the number of candidates checked, fewer if it stopped at a match, and the matches.
+    :meta private:
+    """
+    task: _RecoveryTask = _tasks[variant]
+    values: list[int] = list(task.base)
+    radices: list[int] = [len(candidates) for candidates in task.candidates]
+    digits: list[int] = [0] * len(radices)
+    rest: int = start
+    for i in reversed(range(len(radices))):
+        rest, digits[i] = divmod(rest, radices[i])
+    for position, candidates, digit in zip(task.free, task.candidates, digits):
+        values[position] = candidates[digit]
+    polyseed: bool = SeedType(task.seedType) == SeedType.POLYSEED
+    if polyseed and task.solve >= 0:
+        powers, inverses = _gf_tables()
+        # the known words contribute a constant to the checksum
+        known: int = 0
+        for position, value in enumerate(task.base):
+            if position != task.solve and position not in task.free:
+                known ^= powers[position][value]
+    count: int = len(values) - 1
+    matches: list[tuple[int, ...]] = []
+    checked: int = 0
+    for _ in range(start, stop):
+        checked += 1
+        # the checksum prunes (or solves the last unknown word) before the expensive decode
+        valid: bool = True
+        if task.prefixes is not None:
+            if polyseed:
+                if task.solve >= 0:
+                    rest = known
+                    for position in task.free:
+                        rest ^= powers[position][values[position]]
+                    values[task.solve] = inverses[task.solve][rest]
+                    valid = task.solveCandidates is None or values[task.solve] in task.solveCandidates
+                else:
+                    valid = polyseed_checksum(values) == 0
+            else:
+                index: int = values[monero_checksum_index(task.prefixes, values, count)]
+                if task.solve == count:
+                    values[count] = index
+                    valid = task.solveCandidates is None or index in task.solveCandidates
+                else:
+                    valid = values[count] == index
+        if valid:
+            seed: Seed | None = _decode(task, values)
+            if seed is not None:
+                if task.target is None or task.target in (seed.address.base58, seed.fingerprint):
+                    matches.append(tuple(values))
+                    if task.target is not None:
+                        break
+        # odometer, the last free word changes fastest
+        for i in reversed(range(len(digits))):
+            digits[i] += 1
+            if digits[i] < radices[i]:
+                values[task.free[i]] = task.candidates[i][digits[i]]
+                break
+            digits[i] = 0
+            values[task.free[i]] = task.candidates[i][0]
+    return variant, checked, matches
+
+
+def _uncovered(size: int, covered: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    Returns the ranges of the candidates 0 up to size not in any of the covered ranges.
+    :meta private:
+    """
+    ranges: list[tuple[int, int]] = []
+    position: int = 0
+    for start, stop in sorted(covered):
+        if start > position:
+            ranges.append((position, min(start, size)))
+        position = max(position, stop)
+    if position < size:
+        ranges.append((position, size))
+    return ranges
+
+
+class SeedRecovery:
+    """
+    Recovers a seed phrase with unknown, unreadable or swapped words.
+
+    Unknown words are marked with ``?`` (or ``*``, ``_``), unreadable words are kept as they
+    were read and replaced by the closest words of the language. The engine enumerates the
+    candidates for these positions, prunes them with the checksum of the phrase in Python
+    before any call into the library (for a Polyseed and a Monero phrase with an unknown
+    checksum word the checksum even solves one unknown word), and only decodes the
+    remaining candidates. The search is spread over a process pool, reports its
+    progress, can be checkpointed and resumed, and stops at a known address.
+
+    .. code-block:: python
+
+        recovery = SeedRecovery('? remain ... abstrct', SeedType.POLYSEED, address='4...')
+        seeds: list[Seed] = recovery.run(progress=print, checkpoint='recovery.json')
+
+    .. caution::
+
+        The checkpoint file contains the indices of the matches found so far,
+        it must be treated as confidential as the seed itself.
+    """
+
+    def __init__(
+        self,
+        phrase: str,
+        seedType: SeedType,
+        language: SeedLanguage | str | None = None,
+        address: Address | str | None = None,
+        network: Network = Network.MAIN,
+        height: int = 0,
+        time: int = 0,
+        password: str = '',
+        passphrase: str = '',
+        swaps: bool = False,
+        cutoff: float = 0.6
+    ):
+        """
+        Prepares the search.
+
+        :param str phrase: The phrase with unknown words marked with ``?``.
+        :param SeedType seedType: The type of the seed, Monero phrases with 12/13 words are decoded as legacy seeds.
+        :param language: The language or its code, detected from the readable words if None.
+        :type language: SeedLanguage | str | None
+        :param address: The standard address or the fingerprint of the seed, the search stops when it is found. If None all valid candidates are returned.
+        :type address: Address | str | None
+        :param Network network: The network type for the seed.
+        :param int height: The block height associated with the seed (Monero seeds only).
+        :param int time: The timestamp associated with the seed (Monero seeds only).
+        :param str password: Optional password to decrypt the seed (Polyseed only).
+        :param str passphrase: Optional passphrase for the seed.
+        :param bool swaps: If True, also tries every arrangement with two neighbouring words swapped.
+        :param float cutoff: Similarity (0-1) a word must have to be a candidate for an unreadable word.
+        """
+        assert isinstance(phrase, str), "phrase must be a string"
+        assert isinstance(seedType, SeedType), "seedType must be an instance of SeedType"
+        assert language is None or isinstance(language, (SeedLanguage, str)), "language must be a SeedLanguage, a string or None"
+        assert address is None or isinstance(address, (Address, str)), "address must be an Address, a string or None"
+        assert isinstance(network, Network), "network must be an instance of Network"
+        assert isinstance(swaps, bool), "swaps must be a bool"
+        assert 0 <= cutoff <= 1, "cutoff must be between 0 and 1"
+        tokens: list[str] = phrase.split()
+        if seedType == SeedType.POLYSEED:
+            assert len(tokens) == OTS_POLYSEED_WORDS, f"a Polyseed phrase has {OTS_POLYSEED_WORDS} words"
+        else:
+            assert len(tokens) in (12, 13, 24, 25), "a Monero phrase has 12, 13, 24 or 25 words"
+        self.seedType: SeedType = seedType
+        self.trie: WordTrie = WordTrie.forType(seedType)
+        self.language: SeedLanguage = self._language(tokens, language)
+        self.words: tuple[str, ...] = self.language.words(seedType)
+        self.target: str | None = address.base58 if isinstance(address, Address) else address
+        self._options: dict = {
+            'network': int(network),
+            'height': height,
+            'time': time,
+            'password': password,
+            'passphrase': passphrase,
+        }
+        self._prefixes: tuple[bytes, ...] | None = self._checksumPrefixes()
+        keys: dict[str, int] = {self.trie.key(word): i for i, word in enumerate(self.words)}
+        candidates: list[tuple[int, ...] | None] = []
+        for token in tokens:
+            if token in UNKNOWN_WORDS:
+                candidates.append(None)
+                continue
+            index: int | None = self.trie.resolve(token).get(self.language.code)
+            if index is not None:
+                candidates.append((index,))
+                continue
+            close: list[str] = get_close_matches(self.trie.key(token), keys.keys(), n=len(keys), cutoff=cutoff)
+            candidates.append(tuple(keys[word] for word in close) if close else None)
+        arrangements: list[list[tuple[int, ...] | None]] = [candidates]
+        if swaps:
+            for i in range(len(candidates) - 1):
+                if candidates[i] != candidates[i + 1]:
+                    swapped = list(candidates)
+                    swapped[i], swapped[i + 1] = swapped[i + 1], swapped[i]
+                    arrangements.append(swapped)
+        self.tasks: list[_RecoveryTask] = [self._task(arrangement) for arrangement in arrangements]
+
+    def _language(self, tokens: list[str], language: SeedLanguage | str | None) -> SeedLanguage:
+        """
+        Resolves the language, or detects it from the readable words.
+        :meta private:
+        """
+        if isinstance(language, SeedLanguage):
+            return language
+        if isinstance(language, str):
+            return SeedLanguage.fromCode(language)
+        counts: dict[str, int] = {}
+        for token in tokens:
+            if token not in UNKNOWN_WORDS:
+                for code in self.trie.resolve(token):
+                    counts[code] = counts.get(code, 0) + 1
+        if not counts:
+            raise ValueError("language can not be detected, no word of the phrase is readable")
+        best: int = max(counts.values())
+        codes: list[str] = [code for code, count in counts.items() if count == best]
+        if len(codes) > 1:
+            raise ValueError(f"language is ambiguous between {', '.join(codes)}, please provide it")
+        return SeedLanguage.fromCode(codes[0])
+
+    def _checksumPrefixes(self) -> tuple[bytes, ...] | None:
+        """
+        Verifies the Python checksum against seeds created by the library, and returns
+        the word prefixes the checksum is calculated over (empty for Polyseed).
+        None disables the pruning, the search then relies on the library alone.
+        :meta private:
+        """
+        seeds: list[Seed] = []
+        for i in range(3):
+            random: bytes = sha256(f'OTS recovery self test {i}'.encode('utf-8')).digest()
+            if self.seedType == SeedType.POLYSEED:
+                seeds.append(Polyseed.create(random[:19]))
+            else:
+                seeds.append(MoneroSeed.create(random))
+        if self.seedType == SeedType.POLYSEED:
+            if all(polyseed_checksum(seed.indices().values) == 0 for seed in seeds):
+                return ()
+            return None
+        samples: list[list[int]] = [seed.indices().values for seed in seeds]
+        for length in (3, 4, 1, 2, 5, 6):
+            prefixes: tuple[bytes, ...] = tuple(word[:length].encode('utf-8') for word in self.words)
+            if all(
+                len(values) == OTS_MONERO_SEED_WORDS
+                and values[24] == values[monero_checksum_index(prefixes, values, 24)]
+                for values in samples
+            ):
+                return prefixes
+        return None
+
+    def _task(self, candidates: list[tuple[int, ...] | None]) -> _RecoveryTask:
+        """
+        Builds the search task of one arrangement of the phrase.
+        :meta private:
+        """
+        everything: tuple[int, ...] = tuple(range(len(self.words)))
+        free: list[int] = [i for i, c in enumerate(candidates) if c is None or len(c) > 1]
+        solve: int = -1
+        if self._prefixes is not None and free:
+            if self.seedType == SeedType.POLYSEED:
+                # the checksum solves the unknown word with the most candidates
+                solve = max(free, key=lambda i: len(candidates[i] or everything))
+            elif len(candidates) in (13, 25) and (len(candidates) - 1) in free:
+                solve = len(candidates) - 1
+        if solve >= 0:
+            free.remove(solve)
+        return _RecoveryTask(
+            seedType=int(self.seedType),
+            legacy=self.seedType == SeedType.MONERO and len(candidates) in (12, 13),
+            base=tuple(-1 if c is None or len(c) > 1 else c[0] for c in candidates),
+            free=tuple(free),
+            candidates=tuple(candidates[i] or everything for i in free),
+            solve=solve,
+            solveCandidates=frozenset(candidates[solve]) if solve >= 0 and candidates[solve] is not None else None,
+            prefixes=self._prefixes if self._prefixes is None or len(candidates) in (13, 16, 25) else None,
+            target=self.target,
+            **self._options
+        )
+
+    @property
+    def total(self) -> int:
+        """
+        :return: The number of candidates in the search space, after solving with the checksum.
+        """
+        return sum(task.size for task in self.tasks)
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        :return: A hash identifying the search, checkpoints are only resumed for the same search.
+        """
+        return sha256(repr(self.tasks).encode('utf-8')).hexdigest()
+
+    def run(
+        self,
+        workers: int | None = None,
+        chunkSize: int = 4096,
+        progress: Callable[[RecoveryProgress], None] | None = None,
+        checkpoint: str | None = None
+    ) -> list[Seed]:
+        """
+        Runs the search.
+
+        :param int workers: Number of worker processes, 1 searches in this process. Defaults to the number of CPUs.
+        :param int chunkSize: Number of candidates a worker searches at once.
+        :param progress: Called after every chunk with the progress of the search.
+        :type progress: Callable[[RecoveryProgress], None] | None
+        :param str checkpoint: Path of a JSON file the progress is saved to after every chunk, and resumed from if it exists.
+            The checkpoint holds the searched ranges, it can be resumed with another chunkSize.
+        :return: The recovered seeds. If an address is given at most one.
+        """
+        assert workers is None or (isinstance(workers, int) and workers > 0), "workers must be a positive integer"
+        assert isinstance(chunkSize, int) and chunkSize > 0, "chunkSize must be a positive integer"
+        done: set[tuple[int, int, int]] = set()
+        found: list[tuple[int, ...]] = []
+        checked: int = 0
+        if checkpoint is not None and os.path.exists(checkpoint):
+            with open(checkpoint, 'r', encoding='utf-8') as f:
+                state: dict = json.load(f)
+            if state.get('fingerprint') == self.fingerprint:
+                # ranges of (variant, start, stop), older checkpoints without the stop are searched again
+                done = {tuple(chunk) for chunk in state['done'] if len(chunk) == 3}
+                found = [tuple(match) for match in state['matches']]
+                checked = state['checked']
+        chunks: list[tuple[int, int, int]] = [
+            (variant, start, min(start + chunkSize, stop))
+            for variant, task in enumerate(self.tasks)
+            for first, stop in _uncovered(task.size, ((start, stop) for v, start, stop in done if v == variant))
+            for start in range(first, stop, chunkSize)
+        ]
+        started: float = monotonic()
+        resumed: int = checked
+
+        def completed(variant: int, start: int, stop: int, count: int, matches: list[tuple[int, ...]]) -> None:
+            nonlocal checked
+            checked += count
+            done.add((variant, start, stop))
+            found.extend(match for match in matches if match not in found)
+            if checkpoint is not None:
+                self._save(checkpoint, done, found, checked)
+            if progress is not None:
+                progress(RecoveryProgress(checked, self.total, len(found), monotonic() - started, resumed))
+
+        if self.target is None or not found:
+            if workers == 1:
+                _init_worker(self.tasks)
+                for variant, start, stop in chunks:
+                    completed(variant, start, stop, *_search(variant, start, stop)[1:])
+                    if self.target is not None and found:
+                        break
+            else:
+                with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(self.tasks,)) as executor:
+                    self._dispatch(executor, chunks, completed, workers or os.cpu_count() or 1)
+        return [_decode(self.tasks[0], list(match)) for match in found]
+
+    def _dispatch(
+        self,
+        executor: Executor,
+        chunks: list[tuple[int, int, int]],
+        completed: Callable[[int, int, int, int, list[tuple[int, ...]]], None],
+        workers: int
+    ) -> None:
+        """
+        Keeps a bounded number of chunks in flight, and stops at the first match if there is a target.
+        :meta private:
+        """
+        pending: dict[Future, tuple[int, int]] = {}
+        queue = iter(chunks)
+        while True:
+            while len(pending) < workers * 2:
+                chunk: tuple[int, int, int] | None = next(queue, None)
+                if chunk is None:
+                    break
+                pending[executor.submit(_search, *chunk)] = chunk[1:]
+            if not pending:
+                return
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                start, stop = pending.pop(future)
+                variant, count, matches = future.result()
+                completed(variant, start, stop, count, matches)
+                if self.target is not None and matches:
+                    for other in pending:
+                        other.cancel()
+                    return
+
+    def _save(self, path: str, done: set[tuple[int, int, int]], found: list[tuple[int, ...]], checked: int) -> None:
+        """
+        Writes the checkpoint atomically, readable only by the owner.
+        :meta private:
+        """
+        tmp: str = f'{path}.tmp'
+        with open(os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w', encoding='utf-8') as f:
+            json.dump({
+                'fingerprint': self.fingerprint,
+                'done': sorted(done),
+                'matches': found,
+                'checked': checked,
+            }, f)
+        os.replace(tmp, path)
+
+
+MASK_CHARSETS: dict[str, str] = {
+    'l': string.ascii_lowercase,
+    'u': string.ascii_uppercase,
+    'd': string.digits,
+    's': ' ' + string.punctuation,
+    'a': string.ascii_lowercase + string.ascii_uppercase + string.digits + ' ' + string.punctuation,
+}
+"""Character sets of the placeholders in a password mask, ``?l``, ``?u``, ``?d``, ``?s`` and ``?a``."""
+
+
+@dataclass(frozen=True)
+class _PasswordTask:
+    """
+    The decoded phrase and the target, shipped once to every worker.
+    :meta private:
+    """
+    seedType: int
+    values: tuple[int, ...]
+    usePassphrase: bool
+    network: int
+    height: int
+    time: int
+    target: str
+
+
+_passwordTask: _PasswordTask | None = None
+
+
+def _init_password_worker(task: _PasswordTask) -> None:
+    """
+    Initializes a worker process with the decoded phrase.
+    :meta private:
+    """
+    global _passwordTask
+    _passwordTask = task
+
+
+def _try_passwords(passwords: list[str]) -> tuple[int, list[str]]:
+    """
+    Decodes the phrase with every password of a batch and compares it with the target.
+    :meta private:
+    """
+    task: _PasswordTask = _passwordTask
+    network: Network = Network(task.network)
+    matches: list[str] = []
+    indices: SeedIndices = SeedIndices.fromValues(list(task.values))
+    for password in passwords:
+        try:
+            if SeedType(task.seedType) == SeedType.POLYSEED:
+                seed: Seed = Polyseed.decodeIndices(
+                    indices,
+                    network,
+                    '' if task.usePassphrase else password,
+                    password if task.usePassphrase else ''
+                )
+            else:
+                seed = MoneroSeed.decodeIndices(indices, task.height, task.time, network, password)
+        except OtsException:
+            continue
+        if task.target == (seed.fingerprint if len(task.target) == 6 else seed.address.base58):
+            matches.append(password)
+    return len(passwords), matches
+
+
+@dataclass
+class PasswordRecoveryResult:
+    """
+    Result of a :py:class:`PasswordRecovery` run.
+    """
+    matches: list[str]
+    """The passwords which decode the phrase to the target."""
+    checked: int
+    """Number of passwords tested."""
+    elapsed: float
+    """Seconds the run took."""
+
+    @property
+    def rate(self) -> float:
+        """
+        :return: Passwords tested per second.
+        """
+        return self.checked / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class PasswordRecovery:
+    """
+    Tests candidate passwords of a Polyseed (or passphrases of a Polyseed or Monero seed)
+    in batches against the expected address or fingerprint.
+
+    The phrase is mapped to its seed indices once (see :py:class:`ots.word_trie.WordTrie`),
+    the indices are reused for every candidate, which is then only decoded with
+    :py:meth:`ots.seed.Polyseed.decodeIndices` or :py:meth:`ots.seed.MoneroSeed.decodeIndices`.
+
+    .. code-block:: python
+
+        recovery = PasswordRecovery(phrase, SeedType.POLYSEED, 'A1B2C3')
+        result = recovery.run(PasswordRecovery.mask('Summer20?d?d'))
+        print(result.matches, f'{result.rate:.0f}/s')
+    """
+
+    def __init__(
+        self,
+        phrase: str,
+        seedType: SeedType,
+        target: Address | str,
+        passphrase: bool = False,
+        network: Network = Network.MAIN,
+        height: int = 0,
+        time: int = 0
+    ):
+        """
+        Decodes the phrase to its seed indices.
+
+        :param str phrase: The phrase, in any language.
+        :param SeedType seedType: The type of the seed.
+        :param target: The expected standard address (or the 6 character fingerprint) of the seed.
+        :type target: Address | str
+        :param bool passphrase: If True, candidates are tested as passphrase instead of as password. Always True for Monero seeds.
+        :param Network network: The network type for the seed.
+        :param int height: The block height associated with the seed (Monero seeds only).
+        :param int time: The timestamp associated with the seed (Monero seeds only).
+        """
+        assert isinstance(phrase, str), "phrase must be a string"
+        assert isinstance(seedType, SeedType), "seedType must be an instance of SeedType"
+        assert isinstance(target, (Address, str)), "target must be an Address or a string"
+        assert isinstance(passphrase, bool), "passphrase must be a bool"
+        assert isinstance(network, Network), "network must be an instance of Network"
+        candidates: dict[tuple[int, ...], list[str]] = WordTrie.phraseIndices(phrase, seedType)
+        if len(candidates) != 1:
+            raise ValueError("phrase does not match the word list of exactly one language")
+        values: tuple[int, ...] = next(iter(candidates))
+        assert seedType == SeedType.POLYSEED or len(values) not in (12, 13), "legacy seeds support no passphrase"
+        self.task: _PasswordTask = _PasswordTask(
+            seedType=int(seedType),
+            values=values,
+            usePassphrase=passphrase or seedType != SeedType.POLYSEED,
+            network=int(network),
+            height=height,
+            time=time,
+            target=target.base58 if isinstance(target, Address) else target
+        )
+
+    def run(
+        self,
+        passwords: Iterable[str],
+        workers: int | None = None,
+        batchSize: int = 64,
+        stopOnMatch: bool = True,
+        total: int = 0,
+        progress: Callable[[RecoveryProgress], None] | None = None
+    ) -> PasswordRecoveryResult:
+        """
+        Tests the candidate passwords.
+
+        :param passwords: The candidate passwords, any iterable, e.g. :py:meth:`wordlist`, :py:meth:`mask` or a generator.
+        :type passwords: Iterable[str]
+        :param int workers: Number of worker processes, 1 tests in this process. Defaults to the number of CPUs.
+        :param int batchSize: Number of passwords a worker tests at once.
+        :param bool stopOnMatch: If True, stops at the first matching password.
+        :param int total: The number of candidates if known, only used for the progress.
+        :param progress: Called after every batch with the progress.
+        :type progress: Callable[[RecoveryProgress], None] | None
+        :return: The matching passwords and the throughput.
+        """
+        assert workers is None or (isinstance(workers, int) and workers > 0), "workers must be a positive integer"
+        assert isinstance(batchSize, int) and batchSize > 0, "batchSize must be a positive integer"
+        iterator: Iterator[str] = iter(passwords)
+        batches: Iterator[list[str]] = iter(lambda: list(islice(iterator, batchSize)), [])
+        matches: list[str] = []
+        checked: int = 0
+        started: float = monotonic()
+
+        def completed(count: int, found: list[str]) -> bool:
+            nonlocal checked
+            checked += count
+            matches.extend(found)
+            if progress is not None:
+                progress(RecoveryProgress(checked, total, len(matches), monotonic() - started))
+            return stopOnMatch and len(matches) > 0
+
+        if workers == 1:
+            _init_password_worker(self.task)
+            for batch in batches:
+                if completed(*_try_passwords(batch)):
+                    break
+        else:
+            with ProcessPoolExecutor(workers, initializer=_init_password_worker, initargs=(self.task,)) as executor:
+                limit: int = (workers or os.cpu_count() or 1) * 2
+                pending: set[Future] = set()
+                stop: bool = False
+                while not stop:
+                    for batch in islice(batches, limit - len(pending)):
+                        pending.add(executor.submit(_try_passwords, batch))
+                    if not pending:
+                        break
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        stop = completed(*future.result()) or stop
+                for future in pending:
+                    future.cancel()
+        return PasswordRecoveryResult(matches, checked, monotonic() - started)
+
+    @staticmethod
+    def wordlist(path: str, encoding: str = 'utf-8') -> Iterator[str]:
+        """
+        Reads candidate passwords from a file, one per line.
+
+        :param str path: The path of the word list.
+        :param str encoding: The encoding of the file.
+        :return: An iterator over the passwords.
+        """
+        with open(path, 'r', encoding=encoding, errors='replace') as f:
+            for line in f:
+                yield line.rstrip('\r\n')
+
+    @staticmethod
+    def _maskParts(mask: str) -> list[str]:
+        """
+        Splits a mask into the characters possible at each position.
+        :meta private:
+        """
+        assert isinstance(mask, str), "mask must be a string"
+        parts: list[str] = []
+        i: int = 0
+        while i < len(mask):
+            if mask[i] == '?' and i + 1 < len(mask):
+                if mask[i + 1] == '?':
+                    parts.append('?')
+                elif mask[i + 1] in MASK_CHARSETS:
+                    parts.append(MASK_CHARSETS[mask[i + 1]])
+                else:
+                    raise ValueError(f"unknown mask placeholder ?{mask[i + 1]}")
+                i += 2
+            else:
+                parts.append(mask[i])
+                i += 1
+        return parts
+
+    @staticmethod
+    def mask(mask: str) -> Iterator[str]:
+        """
+        Generates candidate passwords from a mask, where ``?l`` stands for a lower case letter,
+        ``?u`` for an upper case letter, ``?d`` for a digit, ``?s`` for a special character,
+        ``?a`` for any of them and ``??`` for a question mark. Other characters are kept.
+
+        :param str mask: The mask, e.g. ``Summer?d?d?s``.
+        :return: An iterator over the passwords.
+        """
+        for combination in product(*PasswordRecovery._maskParts(mask)):
+            yield ''.join(combination)
+
+    @staticmethod
+    def maskSize(mask: str) -> int:
+        """
+        :param str mask: The mask, see :py:meth:`mask`.
+        :return: The number of passwords the mask generates.
+        """
+        size: int = 1
+        for part in PasswordRecovery._maskParts(mask):
+            size *= len(part)
+        return size
@@ -1,31 +1,39 @@
 from .raw import *
+from .raw import _UNSET
 from .exceptions import *
 from .wipeable_string import WipeableString
-from .seed_indices import SeedIndices
+from .seed_indices import SeedIndices, SecureChannel
 from .seed_language import SeedLanguage
+from .word_trie import WordTrie
 from .wallet import Wallet
 from .address import Address
+from .procedural import random
+from concurrent.futures import Future, ProcessPoolExecutor, FIRST_COMPLETED, as_completed, wait
+from dataclasses import dataclass
 from datetime import datetime
+from os import cpu_count
+from typing import Callable, Iterator
 
 
 class Seed:
     """
     Seed class to handle the seed data.
     """
+    __slots__ = ('handle', '_type', '_isLegacy', '_fingerprint', '_address', '_timestamp', '_time', '_height', '_network', '_wallet')
 
     def __init__(self, handle: ots_handle_t):
         assert isinstance(handle, ots_handle_t), "handle must be an instance of ots_handle_t"
         assert handle.type == HandleType.SEED, "handle must be of type Seed"
         self.handle: ots_handle_t = handle
-        self._type: SeedType | None = None
-        self._isLegacy: bool | None = None
-        self._fingerprint: str | None = None
-        self._address: Address | None = None
-        self._timestamp: int | None = None
-        self._time: datetime | None = None
-        self._height: int | None = None
-        self._network: Network | None = None
-        self._wallet: Wallet | None = None
+        self._type: SeedType = _UNSET
+        self._isLegacy: bool = _UNSET
+        self._fingerprint: str = _UNSET
+        self._address: Address = _UNSET
+        self._timestamp: int = _UNSET
+        self._time: datetime = _UNSET
+        self._height: int = _UNSET
+        self._network: Network = _UNSET
+        self._wallet: Wallet = _UNSET
 
     def __str__(self):
         """
@@ -46,12 +54,27 @@ class Seed:
         """
         return hash((self.__class__.__name__, self.handle))
 
+    def __reduce__(self):
+        """
+        Seeds can only be pickled through an open :py:class:`ots.seed_indices.SecureChannel`.
+        :meta private:
+        """
+        return (_restore_seed, (
+            self.type,
+            self.isLegacy,
+            SecureChannel.seal(self.indices()),
+            self.network,
+            self.height,
+            self.timestamp,
+            self.fingerprint
+        ))
+
     @property
     def type(self) -> SeedType:
         """
         :return: The type of the seed.
         """
-        if self._type is not None:
+        if self._type is not _UNSET:
             return self._type
         result: ots_result_t = ots_seed_type(self.handle)
         if ots_is_error(result):
@@ -66,7 +89,7 @@ class Seed:
 
         :return: True if the seed is a legacy seed, False otherwise.
         """
-        if self._isLegacy is not None:
+        if self._isLegacy is not _UNSET:
             return self._isLegacy
         result: ots_result_t = ots_seed_is_legacy(self.handle)
         if ots_is_error(result):
@@ -111,7 +134,7 @@ class Seed:
 
         :return: A last 6 digit upper case hex string from sha256(base58 standard addres) representing the fingerprint of the seed.
         """
-        if self._fingerprint is not None:
+        if self._fingerprint is not _UNSET:
             return self._fingerprint
         result: ots_result_t = ots_seed_fingerprint(self.handle)
         if ots_is_error(result):
@@ -126,7 +149,7 @@ class Seed:
 
         :return: An Address object representing the seed's address.
         """
-        if self._address is not None:
+        if self._address is not _UNSET:
             return self._address
         result: ots_result_t = ots_seed_address(self.handle)
         if ots_is_error(result):
@@ -141,7 +164,7 @@ class Seed:
 
         :return: An integer representing the timestamp of the seed.
         """
-        if self._timestamp is not None:
+        if self._timestamp is not _UNSET:
             return self._timestamp
         result: ots_result_t = ots_seed_timestamp(self.handle)
         if ots_is_error(result):
@@ -156,7 +179,7 @@ class Seed:
 
         :return: A datetime object representing the time of the seed.
         """
-        if self._time is not None:
+        if self._time is not _UNSET:
             return self._time
         self._time = datetime.fromtimestamp(self.timestamp)
         return self._time
@@ -168,7 +191,7 @@ class Seed:
 
         :return: An integer representing the height of the seed.
         """
-        if self._height is not None:
+        if self._height is not _UNSET:
             return self._height
         result: ots_result_t = ots_seed_height(self.handle)
         if ots_is_error(result):
@@ -183,7 +206,7 @@ class Seed:
 
         :return: A Network enum representing the network of the seed.
         """
-        if self._network is not None:
+        if self._network is not _UNSET:
             return self._network
         result: ots_result_t = ots_seed_network(self.handle)
         if ots_is_error(result):
@@ -198,7 +221,7 @@ class Seed:
 
         :return: A Wallet object representing the seed's wallet.
         """
-        if self._wallet is not None:
+        if self._wallet is not _UNSET:
             return self._wallet
         result: ots_result_t = ots_seed_wallet(self.handle)
         if ots_is_error(result):
@@ -211,6 +234,7 @@ class LegacySeed(Seed):
     """
     LegacySeed class to handle Monero 12/13 word legacy seeds.
     """
+    __slots__ = ()
 
     @classmethod
     def decode(
@@ -269,6 +293,7 @@ class MoneroSeed(Seed):
     """
     MoneroSeed class to handle Monero 24/25 word seeds.
     """
+    __slots__ = ()
 
     @classmethod
     def create(
@@ -320,6 +345,49 @@ class MoneroSeed(Seed):
             raise exception_from_result(result)
         return cls(ots_result_handle(result))
 
+    @classmethod
+    def generateMany(
+        cls,
+        count: int,
+        password: str,
+        language: SeedLanguage | None = None,
+        height: int = 0,
+        time: int = 0,
+        network: Network = Network.MAIN,
+        workers: int | None = None,
+        batchSize: int = 32
+    ) -> Iterator['GeneratedSeed']:
+        """
+        Generates many MoneroSeeds at once, e.g. to provision wallets.
+        The seeds are generated by a pool of worker processes, each takes the random
+        data of a batch from the library in one block.
+
+        .. code-block:: python
+
+            for generated in MoneroSeed.generateMany(100, 'secret', SeedLanguage.fromCode('en')):
+                print(generated.fingerprint, generated.address)
+
+        :param count: The number of seeds to generate.
+        :param password: The offset passphrase the exported phrases are encrypted with.
+        :param language: The language of the exported phrases, the default language if None.
+        :param height: The block height associated with the seeds.
+        :param time: The timestamp associated with the seeds.
+        :param network: The network type for the seeds.
+        :param workers: Number of worker processes, 1 generates in this process. Defaults to the number of CPUs.
+        :param batchSize: Number of seeds a worker generates at once.
+        :return: The generated seeds, in the order they complete.
+        :raises ValueError: If both height and time are set, one of them must be 0.
+        """
+        assert isinstance(height, int), "height must be an integer"
+        assert isinstance(time, int), "time must be an integer"
+        assert isinstance(network, Network), "network must be an instance of Network"
+        return generate_many(
+            _GenerateTask(int(SeedType.MONERO), int(network), height, time, '', password, _export_language(language, SeedType.MONERO)),
+            count,
+            workers,
+            batchSize
+        )
+
     @classmethod
     def decode(
         cls,
@@ -378,12 +446,42 @@ class MoneroSeed(Seed):
             raise exception_from_result(result)
         return cls(ots_result_handle(result))
 
+    @classmethod
+    def decodeAnyLanguage(
+        cls,
+        phrase: str,
+        height: int = 0,
+        time: int = 0,
+        network: Network = Network.MAIN,
+        passphrase: str = ''
+    ) -> 'MoneroSeed':
+        """
+        Decodes a Monero seed phrase in any language into a MoneroSeed object.
+        The language is identified from the words alone and unique-prefix
+        abbreviations of words are accepted.
+
+        .. seealso:: :py:class:`ots.word_trie.WordTrie`
+
+        :param phrase: The seed phrase to decode.
+        :param height: The block height associated with the seed.
+        :param time: The timestamp associated with the seed.
+        :param network: The network type for the seed.
+        :param passphrase: Optional passphrase for the seed.
+        :return: A MoneroSeed object containing the decoded seed data.
+        """
+        assert isinstance(phrase, str), "phrase must be a string"
+        return decode_candidates(
+            WordTrie.phraseIndices(phrase, SeedType.MONERO),
+            lambda indices: cls.decodeIndices(indices, height, time, network, passphrase)
+        )
+
 
 class Polyseed(Seed):
     """
     Polyseed class to handle Polyseed (16 word) seeds,
     with timestamp and encryption support included.
     """
+    __slots__ = ()
 
     def moneroSeed(self) -> MoneroSeed:
         """
@@ -446,6 +544,45 @@ class Polyseed(Seed):
             raise exception_from_result(result)
         return cls(ots_result_handle(result))
 
+    @classmethod
+    def generateMany(
+        cls,
+        count: int,
+        password: str,
+        language: SeedLanguage | None = None,
+        network: Network = Network.MAIN,
+        time: int = 0,
+        passphrase: str = '',
+        workers: int | None = None,
+        batchSize: int = 32
+    ) -> Iterator['GeneratedSeed']:
+        """
+        Generates many Polyseeds at once, e.g. to provision wallets.
+        The seeds are generated by a pool of worker processes, each takes the random
+        data of a batch from the library in one block.
+
+        .. seealso:: :py:meth:`MoneroSeed.generateMany`
+
+        :param count: The number of seeds to generate.
+        :param password: The password the exported phrases are encrypted with.
+        :param language: The language of the exported phrases, the default language if None.
+        :param network: The network type for the seeds.
+        :param time: The timestamp associated with the seeds.
+        :param passphrase: Optional passphrase for the seeds.
+        :param workers: Number of worker processes, 1 generates in this process. Defaults to the number of CPUs.
+        :param batchSize: Number of seeds a worker generates at once.
+        :return: The generated seeds, in the order they complete.
+        """
+        assert isinstance(network, Network), "network must be an instance of Network"
+        assert isinstance(time, int), "time must be an integer"
+        assert isinstance(passphrase, str), "passphrase must be a string"
+        return generate_many(
+            _GenerateTask(int(SeedType.POLYSEED), int(network), 0, time, passphrase, password, _export_language(language, SeedType.POLYSEED)),
+            count,
+            workers,
+            batchSize
+        )
+
     @classmethod
     def decode(
         cls,
@@ -523,7 +660,7 @@ class Polyseed(Seed):
         assert isinstance(network, Network), "network must be an instance of Network"
         assert isinstance(password, str), "password must be a string"
         assert isinstance(passphrase, str), "passphrase must be a string"
-        result: ots_result_t = ots_polyseed_decode_with_language(phrase, language.result, network, password, passphrase)
+        result: ots_result_t = ots_polyseed_decode_with_language(phrase, language.handle, network, password, passphrase)
         if ots_is_error(result):
             raise exception_from_result(result)
         return cls(ots_result_handle(result))
@@ -557,6 +694,33 @@ class Polyseed(Seed):
             raise exception_from_result(result)
         return cls(ots_result_handle(result))
 
+    @classmethod
+    def decodeAnyLanguage(
+        cls,
+        phrase: str,
+        network: Network = Network.MAIN,
+        password: str = '',
+        passphrase: str = ''
+    ) -> 'Polyseed':
+        """
+        Decodes a Polyseed phrase in any language into a Polyseed object.
+        The language is identified from the words alone and unique-prefix
+        abbreviations of words are accepted.
+
+        .. seealso:: :py:class:`ots.word_trie.WordTrie`
+
+        :param phrase: The seed phrase to decode.
+        :param network: The network type for the seed.
+        :param password: Optional password to decrypt the seed. Not supported for legacy seeds.
+        :param passphrase: Optional passphrase for the seed.
+        :return: A Polyseed object containing the decoded seed data.
+        """
+        assert isinstance(phrase, str), "phrase must be a string"
+        return decode_candidates(
+            WordTrie.phraseIndices(phrase, SeedType.POLYSEED),
+            lambda indices: cls.decodeIndices(indices, network, password, passphrase)
+        )
+
 def handle_to_seed(handle: ots_handle_t) -> Seed:
         assert isinstance(handle, ots_handle_t), "handle must be an instance of ots_handle_t"
         assert handle.type == HandleType.SEED, "handle must be of type Seed"
@@ -572,3 +736,190 @@ def handle_to_seed(handle: ots_handle_t) -> Seed:
         if ots_result_boolean(result):
             return LegacySeed(handle)
         return MoneroSeed(handle)
+
+
+def _restore_seed(
+    seedType: SeedType,
+    legacy: bool,
+    sealed: bytes,
+    network: Network,
+    height: int,
+    time: int,
+    fingerprint: str
+) -> Seed:
+    """
+    Restores a seed pickled through a :py:class:`ots.seed_indices.SecureChannel`.
+    :meta private:
+    """
+    indices: SeedIndices = SecureChannel.unseal(sealed)
+    if seedType == SeedType.POLYSEED:
+        seed: Seed = Polyseed.decodeIndices(indices, network)
+    elif legacy:
+        seed = LegacySeed.decodeIndices(indices, height, time, network)
+    else:
+        seed = MoneroSeed.decodeIndices(indices, height, time, network)
+    if seed.fingerprint != fingerprint:
+        raise ValueError("restored seed does not match, seeds with a passphrase can not be sent through a SecureChannel")
+    return seed
+
+
+def decode_candidates(
+    candidates: dict[tuple[int, ...], list[str]],
+    decode: Callable[[SeedIndices], Seed]
+) -> Seed:
+    """
+    Decodes the seed from the seed indices a phrase was mapped to, see
+    :py:meth:`ots.word_trie.WordTrie.parse`. Only if the words of the phrase
+    resolve to different indices in different languages, every candidate is
+    decoded and the single one passing the checksum is returned.
+
+    :param candidates: The distinct seed indices with the codes of the languages they were resolved in.
+    :type candidates: dict[tuple[int, ...], list[str]]
+    :param decode: Decodes seed indices into a seed.
+    :type decode: Callable[[SeedIndices], Seed]
+    :return: The decoded seed.
+    """
+    if not candidates:
+        raise ValueError("phrase does not match the word list of any language")
+    if len(candidates) == 1:
+        return decode(SeedIndices.fromValues(list(next(iter(candidates)))))
+    seeds: list[Seed] = []
+    error: OtsException | None = None
+    for values in candidates:
+        try:
+            seeds.append(decode(SeedIndices.fromValues(list(values))))
+        except OtsException as e:
+            error = e
+    if len(seeds) == 0:
+        raise error
+    if len(seeds) > 1:
+        raise ValueError(f"phrase is ambiguous between the languages {', '.join(c for codes in candidates.values() for c in codes)}")
+    return seeds[0]
+
+
+@dataclass(frozen=True)
+class GeneratedSeed:
+    """
+    A seed generated by :py:meth:`MoneroSeed.generateMany` or :py:meth:`Polyseed.generateMany`.
+    """
+    fingerprint: str
+    """The fingerprint of the seed."""
+    address: str
+    """The standard address of the seed, base58 encoded."""
+    export: str
+    """The seed phrase, encrypted with the password."""
+
+
+@dataclass(frozen=True)
+class _GenerateTask:
+    """
+    The parameters of a batch generation, shipped once to every worker.
+    :meta private:
+    """
+    seedType: int
+    network: int
+    height: int
+    time: int
+    passphrase: str
+    password: str
+    language: str
+
+    @property
+    def randomSize(self) -> int:
+        return 19 if SeedType(self.seedType) == SeedType.POLYSEED else 32
+
+
+_generateTask: _GenerateTask | None = None
+
+
+def _export_language(language: SeedLanguage | None, seedType: SeedType) -> str:
+    """
+    Returns the code of the language phrases are exported in.
+    :meta private:
+    """
+    if language is None:
+        language = SeedLanguage.defaultLanguage(seedType)
+    assert isinstance(language, SeedLanguage), "language must be an instance of SeedLanguage"
+    assert language.supported(seedType), "language must be supported by the seed type"
+    return language.code
+
+
+def _init_generate_worker(task: _GenerateTask) -> None:
+    """
+    Initializes a worker process with the generation parameters.
+    :meta private:
+    """
+    global _generateTask
+    _generateTask = task
+
+
+def _generate(count: int) -> list[GeneratedSeed]:
+    """
+    Takes the random data of count seeds from the library at once and creates the seeds.
+    The random data does not leave the process.
+    :meta private:
+    """
+    task: _GenerateTask = _generateTask
+    block: bytes = random(count * task.randomSize)
+    network: Network = Network(task.network)
+    language: SeedLanguage = SeedLanguage.fromCode(task.language)
+    generated: list[GeneratedSeed] = []
+    for offset in range(0, len(block), task.randomSize):
+        data: bytes = block[offset:offset + task.randomSize]
+        if SeedType(task.seedType) == SeedType.POLYSEED:
+            seed: Seed = Polyseed.create(data, network, task.time, task.passphrase)
+        else:
+            seed = MoneroSeed.create(data, task.height, task.time, network)
+        generated.append(GeneratedSeed(
+            seed.fingerprint,
+            seed.address.base58,
+            seed.phrase(language, task.password).insecure()
+        ))
+    return generated
+
+
+def generate_many(task: _GenerateTask, count: int, workers: int | None = None, batchSize: int = 32) -> Iterator[GeneratedSeed]:
+    """
+    Generates seeds in batches. For every batch the random data is taken from
+    the library at once, in the process creating the seeds, so the entropy is
+    checked once per batch, not per seed.
+    The arguments are checked on call, not on the first seed taken.
+
+    :param task: The generation parameters.
+    :param int count: The number of seeds to generate.
+    :param int workers: Number of worker processes, 1 generates in this process. Defaults to the number of CPUs.
+    :param int batchSize: Number of seeds a worker generates at once.
+    :raises ValueError: If both height and time are set.
+    :meta private:
+    """
+    assert isinstance(count, int) and count >= 0, "count must be a non-negative integer"
+    assert isinstance(task.password, str) and len(task.password) > 0, "password must be a non-empty string"
+    assert workers is None or (isinstance(workers, int) and workers > 0), "workers must be a positive integer"
+    assert isinstance(batchSize, int) and batchSize > 0, "batchSize must be a positive integer"
+    if task.height and task.time:
+        raise ValueError("either height or time must be 0")
+    return _generate_batches(task, count, workers, batchSize)
+
+
+def _generate_batches(task: _GenerateTask, count: int, workers: int | None, batchSize: int) -> Iterator[GeneratedSeed]:
+    """
+    The generator of :py:func:`generate_many`.
+    :meta private:
+    """
+    batches: Iterator[int] = (min(batchSize, count - start) for start in range(0, count, batchSize))
+    if workers == 1:
+        _init_generate_worker(task)
+        for size in batches:
+            yield from _generate(size)
+        return
+    workers = workers or cpu_count() or 1
+    with ProcessPoolExecutor(workers, initializer=_init_generate_worker, initargs=(task,)) as executor:
+        pending: set[Future] = set()
+        for size in batches:
+            pending.add(executor.submit(_generate, size))
+            if len(pending) >= workers * 2:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    yield from future.result()
+        for future in as_completed(pending):
+            yield from future.result()
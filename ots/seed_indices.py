@@ -1,6 +1,131 @@
+from array import array
+from threading import Lock
+from typing import Iterable, Iterator
 from .raw import *
 from .enums import HandleType
 from .exceptions import *
+from .procedural import random
+
+SEED_INDEX_MASK: int = 0x07FF
+"""Seed indices are 11 bit values, the mask is used for the random shares."""
+SEED_INDEX_BITS: int = 11
+"""The number of bits of a seed index."""
+BASE45_ALPHABET: str = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:'
+"""The alphabet of the QR code alphanumeric mode, used by base45 (RFC 9285)."""
+
+
+def _xor(first: bytes, *others: bytes) -> bytes:
+    """
+    XORs equally sized buffers at once, as one big integer each.
+
+    :meta private:
+    """
+    value: int = int.from_bytes(first, 'little')
+    for other in others:
+        assert len(other) == len(first), "all buffers must have the same size"
+        value ^= int.from_bytes(other, 'little')
+    return value.to_bytes(len(first), 'little')
+
+
+def pack_indices(values: Iterable[int], bits: int = SEED_INDEX_BITS) -> bytes:
+    """
+    Packs seed indices into a bit stream. The first byte holds the number of bits
+    per value, the second the number of values, followed by the values big-endian,
+    padded with zero bits to the next byte.
+
+    .. code-block:: python
+
+        assert pack_indices([1, 2, 3]) == bytes.fromhex('0b030020080180')
+
+    :param values: The seed indices.
+    :type values: Iterable[int]
+    :param int bits: The number of bits per value, 1 to 16.
+    :return: The packed seed indices.
+    """
+    assert isinstance(bits, int) and 1 <= bits <= 16, "bits must be an integer between 1 and 16"
+    packed: int = 0
+    count: int = 0
+    for value in values:
+        assert 0 <= value < (1 << bits), f"value {value} does not fit in {bits} bits"
+        packed = (packed << bits) | value
+        count += 1
+    assert count <= 0xFF, "at most 255 values can be packed"
+    size: int = (count * bits + 7) // 8
+    return bytes((bits, count)) + (packed << (size * 8 - count * bits)).to_bytes(size, 'big')
+
+
+def unpack_indices(data: bytes) -> list[int]:
+    """
+    Unpacks seed indices packed with :py:func:`pack_indices`.
+
+    :param bytes data: The packed seed indices.
+    :return: The seed indices.
+    :raises ValueError: If the data is not valid packed seed indices.
+    """
+    assert isinstance(data, (bytes, bytearray, memoryview)), "data must be a bytes-like object"
+    if len(data) < 2 or not 1 <= data[0] <= 16:
+        raise ValueError("Invalid packed seed indices header")
+    bits, count = data[0], data[1]
+    size: int = (count * bits + 7) // 8
+    if len(data) != 2 + size:
+        raise ValueError(f"Packed seed indices must be {2 + size} bytes, got {len(data)}")
+    packed: int = int.from_bytes(data[2:], 'big')
+    padding: int = size * 8 - count * bits
+    if packed & ((1 << padding) - 1):
+        raise ValueError("Invalid padding of packed seed indices")
+    packed >>= padding
+    mask: int = (1 << bits) - 1
+    return [(packed >> (bits * (count - 1 - i))) & mask for i in range(count)]
+
+
+def base45_encode(data: bytes) -> str:
+    """
+    Encodes bytes with base45 (RFC 9285), the result only uses characters
+    of the QR code alphanumeric mode, which stores 5.5 bits per character.
+
+    :param bytes data: The data to encode.
+    :return: The encoded string.
+    """
+    encoded: list[str] = []
+    for i in range(0, len(data) - 1, 2):
+        value: int = data[i] * 256 + data[i + 1]
+        value, c = divmod(value, 45)
+        e, d = divmod(value, 45)
+        encoded += (BASE45_ALPHABET[c], BASE45_ALPHABET[d], BASE45_ALPHABET[e])
+    if len(data) % 2:
+        d, c = divmod(data[-1], 45)
+        encoded += (BASE45_ALPHABET[c], BASE45_ALPHABET[d])
+    return ''.join(encoded)
+
+
+def base45_decode(text: str) -> bytes:
+    """
+    Decodes a base45 (RFC 9285) string.
+
+    :param str text: The encoded string.
+    :return: The decoded bytes.
+    :raises ValueError: If the string is not valid base45.
+    """
+    assert isinstance(text, str), "text must be a string"
+    if len(text) % 3 == 1:
+        raise ValueError("Invalid base45 length")
+    try:
+        digits: list[int] = [BASE45_ALPHABET.index(c) for c in text]
+    except ValueError:
+        raise ValueError("Invalid base45 character") from None
+    decoded: bytearray = bytearray()
+    for i in range(0, len(digits), 3):
+        chunk: list[int] = digits[i:i + 3]
+        value: int = sum(digit * 45 ** n for n, digit in enumerate(chunk))
+        if len(chunk) == 3:
+            if value > 0xFFFF:
+                raise ValueError("Invalid base45 triplet")
+            decoded += value.to_bytes(2, 'big')
+        else:
+            if value > 0xFF:
+                raise ValueError("Invalid base45 pair")
+            decoded.append(value)
+    return bytes(decoded)
 
 
 class SeedIndices:
@@ -46,6 +171,13 @@ class SeedIndices:
             raise exception_from_result(result)
         return SeedIndices(ots_result_handle(result))
 
+    def __reduce__(self):
+        """
+        Seed indices are secrets, they can only be pickled through an open :py:class:`SecureChannel`.
+        :meta private:
+        """
+        return (SecureChannel.unseal, (SecureChannel.seal(self),))
+
     def __sub__(self, other: 'SeedIndices | str') -> 'SeedIndices':
         """
         How the operation is essentially XOR it's the same as addition.
@@ -56,6 +188,64 @@ class SeedIndices:
         """
         return self.__add__(other)
 
+    def packed(self, bits: int = SEED_INDEX_BITS) -> bytes:
+        """
+        Get the seed indices bit-packed, the most compact binary form.
+
+        .. seealso:: :py:func:`pack_indices`
+
+        :param int bits: The number of bits per index. (default: 11)
+        :return: The packed seed indices.
+        """
+        return self.array.packed(bits)
+
+    def qr(self, bits: int = SEED_INDEX_BITS) -> str:
+        """
+        Get the seed indices bit-packed and base45 encoded, to be stored
+        in the alphanumeric mode of a QR code, which is denser than the byte mode.
+
+        :param int bits: The number of bits per index. (default: 11)
+        :return: The encoded seed indices.
+        """
+        return self.array.qr(bits)
+
+    @property
+    def array(self) -> 'SeedIndicesArray':
+        """
+        :return: A compact copy of the seed indices, see :py:class:`SeedIndicesArray`.
+        """
+        return SeedIndicesArray.fromSeedIndices(self)
+
+    def split(self, shares: int) -> list['SeedIndices']:
+        """
+        Splits the seed indices into k-of-k shares, all of them are needed
+        to recombine the seed indices with :py:meth:`combine`.
+
+        .. seealso:: :py:meth:`SeedIndicesArray.split`
+
+        :param int shares: The number of shares, at least 2.
+        :return: The shares.
+        """
+        return [share.toSeedIndices() for share in self.array.split(shares)]
+
+    @classmethod
+    def combine(cls, shares: list['SeedIndices']) -> 'SeedIndices':
+        """
+        Recombines k-of-k shares into the seed indices, in one call into the library.
+
+        :param list[SeedIndices] shares: The shares, all of the same length.
+        :return: The recombined seed indices.
+        """
+        assert isinstance(shares, list) and len(shares) > 0, "shares must be a non-empty list"
+        assert all(isinstance(share, SeedIndices) for share in shares), "all shares must be SeedIndices"
+        result: ots_result_t = ots_seed_indices_merge_multiple_values(
+            [share.handle for share in shares],
+            shares[0].count
+        )
+        if ots_is_error(result):
+            raise exception_from_result(result)
+        return cls(ots_result_handle(result))
+
     @property
     def values(self) -> list[int]:
         """
@@ -120,6 +310,28 @@ class SeedIndices:
             raise exception_from_result(result)
         return cls(ots_result_handle(result))
 
+    @classmethod
+    def fromPacked(cls, data: bytes) -> 'SeedIndices':
+        """
+        Create a SeedIndices object from bit-packed seed indices, see :py:meth:`packed`.
+
+        :param bytes data: The packed seed indices.
+        :return: A SeedIndices object containing the unpacked values.
+        :raises ValueError: If the data is not valid packed seed indices.
+        """
+        return SeedIndicesArray.fromPacked(data).toSeedIndices()
+
+    @classmethod
+    def fromQr(cls, text: str) -> 'SeedIndices':
+        """
+        Create a SeedIndices object from the QR code form, see :py:meth:`qr`.
+
+        :param str text: The encoded seed indices.
+        :return: A SeedIndices object containing the decoded values.
+        :raises ValueError: If the text is not valid encoded seed indices.
+        """
+        return SeedIndicesArray.fromQr(text).toSeedIndices()
+
     @classmethod
     def fromString(cls, string: str, separator: str = '') -> 'SeedIndices':
         """
@@ -151,3 +363,336 @@ class SeedIndices:
         if ots_is_error(result):
             raise exception_from_result(result)
         return cls(ots_result_handle(result))
+
+
+
+class SecureChannel:
+    """
+    An explicit opt-in to pickle secrets, like :py:class:`SeedIndices` and seeds,
+    e.g. to send them to worker processes. Without an open channel pickling them
+    raises TypeError.
+
+    Secrets are pickled as their seed indices merged with the password of the channel,
+    bit-packed. The receiving process must open a channel with the same password to
+    unpickle them.
+
+    .. code-block:: python
+
+        with SecureChannel(password):
+            sealed: bytes = pickle.dumps(seed)
+        # in the other process, with the password not sent along with the sealed seed
+        with SecureChannel(password):
+            seed: Seed = pickle.loads(sealed)
+
+    .. warning::
+
+        The merge with the password protects the seed no better than the password,
+        it must reach the other process another way than the sealed secrets.
+        For the same reason a channel itself can not be pickled.
+        Seeds created with a passphrase can not be restored from their indices alone.
+    """
+    _password: str | None = None
+    _depth: int = 0
+    _lock: Lock = Lock()
+
+    def __init__(self, password: str):
+        """
+        :param str password: The password secrets are merged with.
+        """
+        assert isinstance(password, str) and len(password) > 0, "password must be a non-empty string"
+        self.password: str = password
+
+    def __reduce__(self):
+        """
+        :meta private:
+        """
+        raise TypeError("SecureChannel holds its password and can not be pickled, open a channel in the other process")
+
+    def __enter__(self) -> 'SecureChannel':
+        self.open()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """
+        Opens the channel for this process. Opening an open channel again
+        nests, it stays open until it is closed as often as it was opened.
+
+        :raises RuntimeError: If a channel with another password is open.
+        """
+        with SecureChannel._lock:
+            if SecureChannel._password not in (None, self.password):
+                raise RuntimeError("another SecureChannel is already open")
+            SecureChannel._password = self.password
+            SecureChannel._depth += 1
+
+    def close(self) -> None:
+        """
+        Closes the channel for this process.
+        """
+        with SecureChannel._lock:
+            SecureChannel._depth = max(0, SecureChannel._depth - 1)
+            if SecureChannel._depth == 0:
+                SecureChannel._password = None
+
+    @classmethod
+    def activePassword(cls) -> str:
+        """
+        :return: The password of the open channel.
+        :raises TypeError: If no channel is open.
+        :meta private:
+        """
+        if cls._password is None:
+            raise TypeError("secrets can only be pickled through an open SecureChannel")
+        return cls._password
+
+    @classmethod
+    def seal(cls, indices: SeedIndices) -> bytes:
+        """
+        Merges seed indices with the password of the open channel and packs them.
+
+        :param SeedIndices indices: The seed indices.
+        :return: The sealed seed indices.
+        """
+        merged: SeedIndicesArray = (indices + cls.activePassword()).array
+        return merged.packed(max(SEED_INDEX_BITS, max(merged, default=0).bit_length()))
+
+    @classmethod
+    def unseal(cls, sealed: bytes) -> SeedIndices:
+        """
+        Reverses :py:meth:`seal`.
+
+        :param bytes sealed: The sealed seed indices.
+        :return: The seed indices.
+        """
+        return SeedIndices.fromPacked(sealed) + cls.activePassword()
+
+
+class SeedIndicesArray:
+    """
+    A compact, pure Python form of seed indices, backed by an ``array('H')``.
+
+    Merges (XOR), comparisons and conversions run over the whole buffer at once,
+    without a call into the library and without converting each value,
+    which makes it the better fit to work on many seeds, e.g. to generate backup
+    shares for hundreds of seeds at once with :py:meth:`splitMany`.
+
+    .. code-block:: python
+
+        shares: list[SeedIndicesArray] = seed.indices().array.split(3)
+        assert SeedIndicesArray.combine(shares) == seed.indices().array
+
+    .. note::
+
+        Shares are random 11 bit values, they are not valid seed phrases themselves.
+    """
+
+    def __init__(self, values: Iterable[int] | array = ()):
+        """
+        Initializes the array with values.
+
+        :param values: The seed indices.
+        :type values: Iterable[int] | array
+        """
+        self.data: array = array('H', values)
+        """The seed indices."""
+
+    def __len__(self) -> int:
+        """
+        :return: The number of seed indices.
+        """
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.data)
+
+    def __getitem__(self, index: int) -> int:
+        return self.data[index]
+
+    def __repr__(self) -> str:
+        return f'SeedIndicesArray({self.data.tolist()})'
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compares with another array, with SeedIndices or with a list of integers.
+        """
+        if isinstance(other, SeedIndicesArray):
+            return self.data == other.data
+        if isinstance(other, SeedIndices):
+            return self.tobytes() == ots_seed_indices_bytes(other.handle)
+        if isinstance(other, list):
+            return self.data.tolist() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __xor__(self, other: 'SeedIndicesArray | SeedIndices') -> 'SeedIndicesArray':
+        """
+        Merges (XOR) with another array or SeedIndices of the same length.
+
+        :param other: The values to merge with.
+        :type other: SeedIndicesArray | SeedIndices
+        :return: A new array containing the merged values.
+        """
+        if isinstance(other, SeedIndices):
+            other = SeedIndicesArray.fromSeedIndices(other)
+        if not isinstance(other, SeedIndicesArray):
+            raise NotImplementedError("Can only merge another SeedIndicesArray or SeedIndices object.")
+        assert len(other) == len(self), "both seed indices must have the same length"
+        return SeedIndicesArray.fromBytes(_xor(self.tobytes(), other.tobytes()))
+
+    __add__ = __xor__
+    __sub__ = __xor__
+
+    @property
+    def values(self) -> list[int]:
+        """
+        :return: A list of integers representing the seed indices.
+        """
+        return self.data.tolist()
+
+    def tobytes(self) -> bytes:
+        """
+        :return: The seed indices as native-endian unsigned 16-bit integers.
+        """
+        return self.data.tobytes()
+
+    def packed(self, bits: int = SEED_INDEX_BITS) -> bytes:
+        """
+        :param int bits: The number of bits per index. (default: 11)
+        :return: The seed indices bit-packed, see :py:func:`pack_indices`.
+        """
+        return pack_indices(self.data, bits)
+
+    def qr(self, bits: int = SEED_INDEX_BITS) -> str:
+        """
+        :param int bits: The number of bits per index. (default: 11)
+        :return: The seed indices bit-packed and base45 encoded for the QR code alphanumeric mode.
+        """
+        return base45_encode(self.packed(bits))
+
+    def numpy(self):
+        """
+        Returns the seed indices as a NumPy array, it shares the memory with this array.
+
+        .. note::
+
+            NumPy is not a dependency of OTS, this method raises ImportError if it is not installed.
+
+        :return: A ``numpy.ndarray`` of ``uint16``.
+        """
+        import numpy
+        return numpy.frombuffer(self.data, dtype=numpy.uint16)
+
+    def toSeedIndices(self) -> SeedIndices:
+        """
+        :return: The seed indices as a :py:class:`SeedIndices` object, in one call into the library.
+        """
+        result: ots_result_t = ots_seed_indices_create_from_bytes(self.tobytes())
+        if ots_is_error(result):
+            raise exception_from_result(result)
+        return SeedIndices(ots_result_handle(result))
+
+    def split(self, shares: int) -> list['SeedIndicesArray']:
+        """
+        Splits the seed indices into k-of-k shares, all of them are needed
+        to recombine the seed indices with :py:meth:`combine`.
+
+        :param int shares: The number of shares, at least 2.
+        :return: The shares.
+        """
+        return SeedIndicesArray.splitMany([self], shares)[0]
+
+    @classmethod
+    def splitMany(cls, seeds: list['SeedIndicesArray | SeedIndices'], shares: int) -> list[list['SeedIndicesArray']]:
+        """
+        Splits many seed indices into k-of-k shares, with the random data
+        for all of them taken from the library at once.
+
+        :param seeds: The seed indices to split.
+        :type seeds: list[SeedIndicesArray | SeedIndices]
+        :param int shares: The number of shares per seed, at least 2.
+        :return: The shares, per seed.
+        """
+        assert isinstance(seeds, list), "seeds must be a list"
+        assert isinstance(shares, int) and shares >= 2, "shares must be an integer of at least 2"
+        arrays: list[SeedIndicesArray] = [
+            seed if isinstance(seed, SeedIndicesArray) else cls.fromSeedIndices(seed)
+            for seed in seeds
+        ]
+        total: int = sum(len(seed) for seed in arrays)
+        if total == 0:
+            return [[cls() for _ in range(shares)] for _ in arrays]
+        size: int = total * (shares - 1) * array('H').itemsize
+        mask: bytes = array('H', [SEED_INDEX_MASK]).tobytes() * (size // array('H').itemsize)
+        noise: bytes = (int.from_bytes(random(size), 'little') & int.from_bytes(mask, 'little')).to_bytes(size, 'little')
+        split: list[list[SeedIndicesArray]] = []
+        offset: int = 0
+        for seed in arrays:
+            length: int = len(seed) * array('H').itemsize
+            parts: list[bytes] = []
+            for _ in range(shares - 1):
+                parts.append(noise[offset:offset + length])
+                offset += length
+            parts.append(_xor(seed.tobytes(), *parts))
+            split.append([cls.fromBytes(part) for part in parts])
+        return split
+
+    @classmethod
+    def combine(cls, shares: list['SeedIndicesArray']) -> 'SeedIndicesArray':
+        """
+        Recombines k-of-k shares into the seed indices.
+
+        :param list[SeedIndicesArray] shares: The shares, all of the same length.
+        :return: The recombined seed indices.
+        """
+        assert isinstance(shares, list) and len(shares) > 0, "shares must be a non-empty list"
+        assert all(isinstance(share, SeedIndicesArray) for share in shares), "all shares must be SeedIndicesArray"
+        return cls.fromBytes(_xor(*(share.tobytes() for share in shares)))
+
+    @classmethod
+    def fromPacked(cls, data: bytes) -> 'SeedIndicesArray':
+        """
+        Creates an array from bit-packed seed indices.
+
+        :param bytes data: The packed seed indices.
+        :return: The array.
+        :raises ValueError: If the data is not valid packed seed indices.
+        """
+        return cls(unpack_indices(data))
+
+    @classmethod
+    def fromQr(cls, text: str) -> 'SeedIndicesArray':
+        """
+        Creates an array from the QR code form, see :py:meth:`qr`.
+
+        :param str text: The encoded seed indices.
+        :return: The array.
+        :raises ValueError: If the text is not valid encoded seed indices.
+        """
+        return cls.fromPacked(base45_decode(text))
+
+    @classmethod
+    def fromBytes(cls, data: bytes) -> 'SeedIndicesArray':
+        """
+        Creates an array from native-endian unsigned 16-bit integers.
+
+        :param bytes data: The seed indices as bytes.
+        :return: The array.
+        """
+        indices: SeedIndicesArray = cls()
+        indices.data.frombytes(data)
+        return indices
+
+    @classmethod
+    def fromSeedIndices(cls, indices: SeedIndices) -> 'SeedIndicesArray':
+        """
+        Creates an array from a :py:class:`SeedIndices` object, reading its buffer at once.
+
+        :param SeedIndices indices: The seed indices.
+        :return: The array.
+        """
+        assert isinstance(indices, SeedIndices), "indices must be an instance of SeedIndices"
+        return cls.fromBytes(ots_seed_indices_bytes(indices.handle))
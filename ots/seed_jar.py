@@ -1,14 +1,16 @@
 from dataclasses import dataclass
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from threading import RLock
 from .raw import *
 from .exceptions import *
 from .enums import *
 from .seed import Seed, MoneroSeed, Polyseed, handle_to_seed
-from .address import Address
+from .address import Address, AddressString
 from .wallet import Wallet
 
 
-@dataclass
+@dataclass(slots=True)
 class SeedJarItem:
     """
     A data class representing an item in the seed jar.
@@ -65,6 +67,13 @@ class SeedJar:
     transfer, and query seeds in the jar. All methods are static.
     """
 
+    _ownerLock: RLock = RLock()
+    _ownerIndex: dict[str, tuple[str, int, int]] = {}
+    _ownerIndexKeys: dict[str, list[str]] = {}
+    _ownerIndexDepths: dict[str, tuple[int, int]] = {}
+    _ownerIndexCoverage: tuple[int, int] = (0, 0)
+    _ownerIndexStale: bool = True
+
     @staticmethod
     def add(seed: Seed, name: str | None = None) -> Seed:
         """
@@ -81,6 +90,7 @@ class SeedJar:
         result: ots_result_t = ots_seed_jar_add_seed(seed.handle, name)
         if ots_is_error(result):
             raise exception_from_result(result)
+        SeedJar._invalidateOwnerIndex()
         return handle_to_seed(ots_result_handle(result))
 
     @staticmethod
@@ -95,6 +105,7 @@ class SeedJar:
         result: ots_result_t = ots_seed_jar_remove_seed(seed.handle)
         if ots_is_error(result):
             raise exception_from_result(result)
+        SeedJar._invalidateOwnerIndex()
         return ots_result_boolean(result)
 
     @staticmethod
@@ -109,6 +120,7 @@ class SeedJar:
         result: ots_result_t = ots_seed_jar_purge_seed_for_index(index)
         if ots_is_error(result):
             raise exception_from_result(result)
+        SeedJar._invalidateOwnerIndex()
         return ots_result_boolean(result)
 
     @staticmethod
@@ -123,6 +135,7 @@ class SeedJar:
         result: ots_result_t = ots_seed_jar_purge_seed_for_name(name)
         if ots_is_error(result):
             raise exception_from_result(result)
+        SeedJar._invalidateOwnerIndex()
         return ots_result_boolean(result)
 
     @staticmethod
@@ -137,6 +150,7 @@ class SeedJar:
         result: ots_result_t = ots_seed_jar_purge_seed_for_fingerprint(fingerprint)
         if ots_is_error(result):
             raise exception_from_result(result)
+        SeedJar._invalidateOwnerIndex()
         return ots_result_boolean(result)
 
     @staticmethod
@@ -151,6 +165,7 @@ class SeedJar:
         result: ots_result_t = ots_seed_jar_purge_seed_for_address(address)
         if ots_is_error(result):
             raise exception_from_result(result)
+        SeedJar._invalidateOwnerIndex()
         return ots_result_boolean(result)
 
     @staticmethod
@@ -185,6 +200,7 @@ class SeedJar:
         )
         if ots_is_error(result):
             raise exception_from_result(result)
+        SeedJar._invalidateOwnerIndex()
         return handle_to_seed(ots_result_handle(result))
 
     @staticmethod
@@ -200,6 +216,7 @@ class SeedJar:
         result: ots_result_t = ots_seed_jar_transfer_seed_out(seed.handle if isinstance(seed, Seed) else seed)
         if ots_is_error(result):
             raise exception_from_result(result)
+        SeedJar._invalidateOwnerIndex()
         return handle_to_seed(ots_result_handle(result))
 
     @staticmethod
@@ -214,6 +231,7 @@ class SeedJar:
         result: ots_result_t = ots_seed_jar_transfer_seed_out_for_index(index)
         if ots_is_error(result):
             raise exception_from_result(result)
+        SeedJar._invalidateOwnerIndex()
         return handle_to_seed(ots_result_handle(result))
 
     @staticmethod
@@ -228,6 +246,7 @@ class SeedJar:
         result: ots_result_t = ots_seed_jar_transfer_seed_out_for_name(name)
         if ots_is_error(result):
             raise exception_from_result(result)
+        SeedJar._invalidateOwnerIndex()
         return handle_to_seed(ots_result_handle(result))
 
     @staticmethod
@@ -242,6 +261,7 @@ class SeedJar:
         result: ots_result_t = ots_seed_jar_transfer_seed_out_for_fingerprint(fingerprint)
         if ots_is_error(result):
             raise exception_from_result(result)
+        SeedJar._invalidateOwnerIndex()
         return handle_to_seed(ots_result_handle(result))
 
     @staticmethod
@@ -256,6 +276,7 @@ class SeedJar:
         result: ots_result_t = ots_seed_jar_transfer_seed_out_for_address(address)
         if ots_is_error(result):
             raise exception_from_result(result)
+        SeedJar._invalidateOwnerIndex()
         return handle_to_seed(ots_result_handle(result))
 
     @staticmethod
@@ -274,6 +295,7 @@ class SeedJar:
         result: ots_result_t = ots_seed_jar_clear()
         if ots_is_error(result):
             raise exception_from_result(result)
+        SeedJar._invalidateOwnerIndex()
         return ots_result_boolean(result)
 
     @staticmethod
@@ -640,3 +662,161 @@ class SeedJar:
         if ots_is_error(result):
             raise exception_from_result(result)
         return Wallet(ots_result_handle(result))
+
+    @staticmethod
+    def _invalidateOwnerIndex() -> None:
+        """
+        Marks the subaddress ownership index as stale, so the next lookup
+        synchronizes it with the seeds in the jar.
+
+        :meta private:
+        """
+        SeedJar._ownerIndexStale = True
+
+    @staticmethod
+    def _indexSeed(
+        seed: Seed,
+        fingerprint: str,
+        depths: tuple[int, int],
+        indexed: tuple[int, int]
+    ) -> dict[str, tuple[str, int, int]]:
+        """
+        Derives the subaddresses of a seed which are in `depths` but not
+        yet in the already `indexed` depths.
+
+        :meta private:
+        """
+        maxAccountDepth, maxIndexDepth = depths
+        indexedAccounts, indexedIndices = indexed
+        wallet: Wallet = seed.wallet
+        entries: dict[str, tuple[str, int, int]] = {}
+        for account in range(maxAccountDepth):
+            offset: int = indexedIndices if account < indexedAccounts else 0
+            for i, address in enumerate(wallet.subAddresses(account, maxIndexDepth - offset, offset)):
+                entries[address.base58] = (fingerprint, account, offset + i)
+        return entries
+
+    @staticmethod
+    def buildOwnerIndex(
+        maxAccountDepth: int = 0,
+        maxIndexDepth: int = 0,
+        workers: int | None = None
+    ) -> int:
+        """
+        Builds or extends the merged subaddress index over all seeds in the jar,
+        which is used by :py:meth:`ownerOf`.
+
+        The index is built incrementally: seeds which are already indexed up to the
+        requested depths are skipped, seeds which were removed from the jar are dropped,
+        and only the missing subaddresses of new seeds (or of seeds indexed with lower
+        depths) are derived. The derivation runs per seed in a thread pool, the OTS
+        library is called without holding the GIL.
+
+        .. note::
+
+            Seeds added or removed via the methods of this class are picked up
+            automatically on the next lookup. Call this method explicitly to
+            pre-build the index, for example after start up.
+
+        .. seealso:: :py:meth:`ots.wallet.Wallet.hasAddress` for the meaning of the depths.
+
+        :param int maxAccountDepth: Maximum account depth to index (default is 0, which uses :py:meth:`ots.ots.Ots.maxAccountDepth`).
+        :param int maxIndexDepth: Maximum index depth to index (default is 0, which uses :py:meth:`ots.ots.Ots.maxIndexDepth`).
+        :param int workers: Number of threads to derive subaddresses with (default is None, which lets the executor decide).
+        :return: The number of addresses in the index.
+        """
+        assert isinstance(maxAccountDepth, int), "maxAccountDepth must be an integer"
+        assert isinstance(maxIndexDepth, int), "maxIndexDepth must be an integer"
+        assert maxAccountDepth >= 0, "maxAccountDepth must be non-negative"
+        assert maxIndexDepth >= 0, "maxIndexDepth must be non-negative"
+        assert workers is None or (isinstance(workers, int) and workers > 0), "workers must be a positive integer"
+        depths: tuple[int, int] = (
+            maxAccountDepth if maxAccountDepth > 0 else ots_get_max_account_depth(0),
+            maxIndexDepth if maxIndexDepth > 0 else ots_get_max_index_depth(0)
+        )
+        with SeedJar._ownerLock:
+            seeds: dict[str, Seed] = {seed.fingerprint: seed for seed in SeedJar.seeds()}
+            for fingerprint in list(SeedJar._ownerIndexDepths):
+                if fingerprint not in seeds:
+                    for key in SeedJar._ownerIndexKeys.pop(fingerprint, []):
+                        SeedJar._ownerIndex.pop(key, None)
+                    del SeedJar._ownerIndexDepths[fingerprint]
+            pending: dict[str, tuple[int, int]] = {}
+            for fingerprint in seeds:
+                indexed: tuple[int, int] = SeedJar._ownerIndexDepths.get(fingerprint, (0, 0))
+                if indexed[0] < depths[0] or indexed[1] < depths[1]:
+                    pending[fingerprint] = indexed
+            if pending:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        fingerprint: executor.submit(
+                            SeedJar._indexSeed,
+                            seeds[fingerprint],
+                            fingerprint,
+                            (max(depths[0], indexed[0]), max(depths[1], indexed[1])),
+                            indexed
+                        )
+                        for fingerprint, indexed in pending.items()
+                    }
+                    for fingerprint, future in futures.items():
+                        entries: dict[str, tuple[str, int, int]] = future.result()
+                        SeedJar._ownerIndex.update(entries)
+                        SeedJar._ownerIndexKeys.setdefault(fingerprint, []).extend(entries)
+                        indexed = pending[fingerprint]
+                        SeedJar._ownerIndexDepths[fingerprint] = (
+                            max(depths[0], indexed[0]),
+                            max(depths[1], indexed[1])
+                        )
+            SeedJar._ownerIndexCoverage = (
+                min((indexed[0] for indexed in SeedJar._ownerIndexDepths.values()), default=depths[0]),
+                min((indexed[1] for indexed in SeedJar._ownerIndexDepths.values()), default=depths[1])
+            )
+            SeedJar._ownerIndexStale = False
+            return len(SeedJar._ownerIndex)
+
+    @staticmethod
+    def ownerOf(
+        address: Address | str,
+        maxAccountDepth: int = 0,
+        maxIndexDepth: int = 0
+    ) -> tuple[Seed, int, int] | None:
+        """
+        Find the seed in the jar which owns an address, including subaddresses
+        and integrated addresses.
+
+        Unlike :py:meth:`forAddress`, which only matches the standard address
+        of a seed, this consults the merged subaddress index of all seeds in
+        the jar (see :py:meth:`buildOwnerIndex`), so a lookup is a single
+        dictionary access instead of calling :py:meth:`ots.wallet.Wallet.addressIndex`
+        on every seed in turn.
+
+        .. seealso:: :py:meth:`ots.wallet.Wallet.hasAddress` for the meaning of the depths.
+
+        :param address: The address to look up, can be an Address instance or a string.
+        :type address: Address | str
+        :param int maxAccountDepth: Maximum account depth to search (default is 0, which uses :py:meth:`ots.ots.Ots.maxAccountDepth`).
+        :param int maxIndexDepth: Maximum index depth to search (default is 0, which uses :py:meth:`ots.ots.Ots.maxIndexDepth`).
+        :return: A tuple of the Seed (reference to the seed in the jar), the account and the index, or None if no seed in the jar owns the address.
+        """
+        assert isinstance(address, (Address, str)), "address must be an Address instance or a string"
+        if isinstance(address, str):
+            if AddressString.isIntegrated(address):
+                address = Address.fromIntegrated(Address.fromString(address))
+        elif address.isIntegrated:
+            address = Address.fromIntegrated(address)
+        key: str = address if isinstance(address, str) else address.base58
+        depths: tuple[int, int] = (
+            maxAccountDepth if maxAccountDepth > 0 else ots_get_max_account_depth(0),
+            maxIndexDepth if maxIndexDepth > 0 else ots_get_max_index_depth(0)
+        )
+        with SeedJar._ownerLock:
+            coverage: tuple[int, int] = SeedJar._ownerIndexCoverage
+            if SeedJar._ownerIndexStale or coverage[0] < depths[0] or coverage[1] < depths[1]:
+                SeedJar.buildOwnerIndex(*depths)
+            entry: tuple[str, int, int] | None = SeedJar._ownerIndex.get(key)
+        if entry is None:
+            return None
+        fingerprint, account, index = entry
+        if account >= depths[0] or index >= depths[1]:
+            return None
+        return SeedJar.forFingerprint(fingerprint), account, index
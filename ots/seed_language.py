@@ -1,16 +1,38 @@
+from hashlib import sha256
+from threading import Lock, RLock
 from .raw import *
 from .exceptions import *
+from .seed_indices import SeedIndices
+from .wipeable_string import WipeableString
+
+WORD_LIST_SIZES: dict[SeedType, int] = {
+    SeedType.MONERO: 1626,
+    SeedType.POLYSEED: 2048,
+}
+"""Number of words in the word list of every language, per seed type."""
 
 
 class SeedLanguage:
     """
     SeedLanguage class to handle the languages for seed phrase handling.
+
+    .. note::
+
+        There is only one instance per language: all lookups return the same
+        instance from a registry, which is built lazily (a language is only
+        wrapped once it is first requested) and is thread safe. Properties and
+        the default languages are cached in Python, so once a language is known
+        its use does not cross the C ABI anymore.
     """
-    _all: set['SeedLanguage'] = set()
+    _lock: RLock = RLock()
+    _all: frozenset['SeedLanguage'] | None = None
     _byCode: dict[str, 'SeedLanguage'] = {}
     _byName: dict[str, 'SeedLanguage'] = {}
     _byEnglishName: dict[str, 'SeedLanguage'] = {}
-    _byType: dict[SeedType, set['SeedLanguage']] = {}
+    _byType: dict[SeedType, frozenset['SeedLanguage']] = {}
+    _defaults: dict[SeedType, 'SeedLanguage | None'] = {}
+    _words: dict[SeedType, dict[str, tuple[str, ...]]] = {}
+    _wordsLock: Lock = Lock()
 
     def __init__(self, handle: ots_handle_t):
         """
@@ -93,6 +115,26 @@ class SeedLanguage:
         self._supported[seedType] = ots_result_boolean(result)
         return self._supported[seedType]
 
+    def words(self, seedType: SeedType) -> tuple[str, ...]:
+        """
+        Returns the word list of the seed language for the given seed type,
+        the position of a word in the list is its seed index.
+
+        .. note::
+
+            The C ABI has no accessor for the word lists, so they are derived
+            through it once per seed type (for all languages at the same time)
+            by rendering deterministically created seeds and pairing the
+            words of their phrases with their seed indices. The lists are cached
+            afterwards.
+
+        :param SeedType seedType: The type of seed to get the word list for.
+        :return: A tuple with all words of the language, indexed by seed index.
+        """
+        assert isinstance(seedType, SeedType), "seedType must be an instance of SeedType"
+        assert self.supported(seedType), "language must be supported by the seed type"
+        return SeedLanguage._load_words(seedType)[self.code]
+
     def isDefault(self, seedType: SeedType) -> bool:
         """
         Checks if the seed language is the default for the given seed type.
@@ -100,11 +142,8 @@ class SeedLanguage:
         :param SeedType seedType: The type of seed to check if the language is default for.
         :return: True if the seed language is the default for the given seed type, False otherwise.
         """
-        # we check every time from the C library to ensure we have the latest state
-        result: ots_result_t = ots_seed_language_is_default(self.handle, seedType)
-        if ots_is_error(result):
-            raise exception_from_result(result)
-        return ots_result_boolean(result)
+        default: SeedLanguage | None = SeedLanguage._default(seedType)
+        return default is not None and default == self
 
     def __eq__(self, other: object) -> bool:
         """
@@ -118,95 +157,186 @@ class SeedLanguage:
             return self.code.lower() == other.lower()
         if not isinstance(other, SeedLanguage):
             raise NotImplementedError("other must be an instance of SeedLanguage or str")
-        assert isinstance(other, SeedLanguage), "other must be an instance of SeedLanguage"
-        print(HandleType(other.handle.ptr.type).name)
-        assert HandleType(other.handle.ptr.type) == HandleType.SEED_LANGUAGE, "self must be a SeedLanguage instance"
-        result: ots_result_t = ots_seed_language_equals(self.handle, other.handle)
+        return self is other or self.code == other.code
+
+    @classmethod
+    def _register(cls, handle: ots_handle_t) -> 'SeedLanguage':
+        """
+        Returns the registered instance for the language of the handle,
+        registers a new instance if the language is not known yet.
+        :meta private:
+        """
+        result: ots_result_t = ots_seed_language_code(handle)
         if ots_is_error(result):
             raise exception_from_result(result)
-        return ots_result_is_equal(result)
+        code: str = ots_result_string(result)
+        with cls._lock:
+            language: SeedLanguage | None = cls._byCode.get(code)
+            if language is None:
+                language = cls(handle)
+                language._code = code
+                cls._byCode[code] = language
+            return language
 
     @classmethod
     def fromName(cls, name: str) -> 'SeedLanguage':
         """
-        Creates a SeedLanguage instance from the given name.
+        Returns the SeedLanguage instance for the given name.
 
         :param str name: The name of the seed language.
         :return: A SeedLanguage instance corresponding to the given name.
         """
+        language: SeedLanguage | None = cls._byName.get(name)
+        if language is not None:
+            return language
         result: ots_result_t = ots_seed_language_from_name(name)
         if ots_is_error(result):
             raise exception_from_result(result)
-        return cls(ots_result_handle(result))
+        language = cls._register(ots_result_handle(result))
+        cls._byName[name] = language
+        return language
 
     @classmethod
     def fromEnglishName(cls, englishName: str) -> 'SeedLanguage':
         """
-        Creates a SeedLanguage instance from the given English name.
+        Returns the SeedLanguage instance for the given English name.
 
         :param str englishName: The English name of the seed language.
         :return: A SeedLanguage instance corresponding to the given English name.
         """
+        language: SeedLanguage | None = cls._byEnglishName.get(englishName)
+        if language is not None:
+            return language
         result: ots_result_t = ots_seed_language_from_english_name(englishName)
         if ots_is_error(result):
             raise exception_from_result(result)
-        return cls(ots_result_handle(result))
+        language = cls._register(ots_result_handle(result))
+        cls._byEnglishName[englishName] = language
+        return language
 
     @classmethod
     def fromCode(cls, code: str) -> 'SeedLanguage':
         """
-        Creates a SeedLanguage instance from the given code.
+        Returns the SeedLanguage instance for the given code.
 
         :param str code: The code of the seed language (mostly ISO 639-1).
         :return: A SeedLanguage instance corresponding to the given code.
         """
+        language: SeedLanguage | None = cls._byCode.get(code)
+        if language is not None:
+            return language
         result: ots_result_t = ots_seed_language_from_code(code)
         if ots_is_error(result):
             raise exception_from_result(result)
-        return cls(ots_result_handle(result))
+        return cls._register(ots_result_handle(result))
 
     @classmethod
-    def _load_all(cls) -> None:
+    def _load_all(cls) -> frozenset['SeedLanguage']:
         """
-        Loads all SeedLanguage instances and populates the class attributes.
+        Registers all languages of the library.
         :meta private:
         """
-        if len(cls._all) > 0:
-            return
-        result: ots_result_t = ots_seed_languages()
-        if ots_is_error(result):
-            raise exception_from_result(result)
-        languages = ots_result_handle_array_reference(result)
-        for seedType in SeedType:
-            cls._byType[seedType] = set()
-        for language in languages:
-            seed_language = cls(language)
-            cls._all.add(seed_language)
-            cls._byCode[seed_language.code] = seed_language
-            cls._byName[seed_language.name] = seed_language
-            cls._byEnglishName[seed_language.englishName] = seed_language
-            for seedType in SeedType:
-                if seed_language.supported(seedType):
-                    cls._byType[seedType].add(seed_language)
+        if cls._all is not None:
+            return cls._all
+        with cls._lock:
+            if cls._all is None:
+                result: ots_result_t = ots_seed_languages()
+                if ots_is_error(result):
+                    raise exception_from_result(result)
+                cls._all = frozenset(cls._register(handle) for handle in ots_result_handle_array_reference(result))
+            return cls._all
+
+    @classmethod
+    def _load_words(cls, seedType: SeedType) -> dict[str, tuple[str, ...]]:
+        """
+        Derives the word lists of all languages supported by the seed type.
+        :meta private:
+        """
+        with cls._wordsLock:
+            if seedType in cls._words:
+                return cls._words[seedType]
+            size: int = WORD_LIST_SIZES[seedType]
+            seeds: list[tuple[ots_handle_t, list[int]]] = []
+            covered: set[int] = set()
+            counter: int = 0
+            while len(covered) < size:
+                assert counter < size * 64, "could not derive the complete word list"
+                random: bytes = sha256(f'OTS word list {counter}'.encode('utf-8')).digest()
+                counter += 1
+                if seedType == SeedType.POLYSEED:
+                    result: ots_result_t = ots_polyseed_create(random[:19], Network.MAIN, 0, '')
+                else:
+                    result: ots_result_t = ots_monero_seed_create(random, 0, 0, Network.MAIN)
+                if ots_is_error(result):
+                    continue
+                seed: ots_handle_t = ots_result_handle(result)
+                result = ots_seed_indices(seed, '')
+                if ots_is_error(result):
+                    raise exception_from_result(result)
+                values: list[int] = SeedIndices(ots_result_handle(result)).values
+                # only seeds which add new words need to be rendered in every language
+                if covered.issuperset(values):
+                    continue
+                covered.update(values)
+                seeds.append((seed, values))
+            words: dict[str, tuple[str, ...]] = {}
+            for language in cls.listForType(seedType):
+                wordList: list[str] = [''] * size
+                for seed, values in seeds:
+                    result = ots_seed_phrase(seed, language.handle, '')
+                    if ots_is_error(result):
+                        raise exception_from_result(result)
+                    phrase: list[str] = WipeableString(ots_result_handle(result)).insecure().split()
+                    for index, word in zip(values, phrase):
+                        wordList[index] = word
+                words[language.code] = tuple(wordList)
+            cls._words[seedType] = words
+            return words
 
     @classmethod
-    def list(cls) -> set['SeedLanguage']:
+    def list(cls) -> frozenset['SeedLanguage']:
         """
         :return: A set of all SeedLanguage instances.
         """
-        cls._load_all()
-        return cls._all
+        return cls._load_all()
 
     @classmethod
-    def listForType(cls, seedType: SeedType) -> set['SeedLanguage']:
+    def listForType(cls, seedType: SeedType) -> frozenset['SeedLanguage']:
         """
         Returns a set of SeedLanguage instances only for the given seed type.
 
         :param SeedType seedType: The type of seed to get the languages for.
         :return: A set of SeedLanguage instances for the given seed type.
         """
-        cls._load_all()
-        return cls._byType.get(seedType, set())
+        languages: frozenset[SeedLanguage] | None = cls._byType.get(seedType)
+        if languages is not None:
+            return languages
+        with cls._lock:
+            if seedType not in cls._byType:
+                result: ots_result_t = ots_seed_languages_for_type(seedType)
+                if ots_is_error(result):
+                    raise exception_from_result(result)
+                languages = frozenset(cls._register(handle) for handle in ots_result_handle_array_reference(result))
+                for language in cls._load_all():
+                    language._supported.setdefault(seedType, language in languages)
+                cls._byType[seedType] = languages
+            return cls._byType[seedType]
+
+    @classmethod
+    def _default(cls, seedType: SeedType) -> 'SeedLanguage | None':
+        """
+        Returns the default language for the seed type, None if there is none.
+        The library is only asked once, afterwards the default is kept in
+        sync by :py:meth:`setDefaultLanguage`.
+        :meta private:
+        """
+        if seedType in cls._defaults:
+            return cls._defaults[seedType]
+        with cls._lock:
+            if seedType not in cls._defaults:
+                result: ots_result_t = ots_seed_language_default(seedType)
+                cls._defaults[seedType] = None if ots_is_error(result) else cls._register(ots_result_handle(result))
+            return cls._defaults[seedType]
 
     @classmethod
     def defaultLanguage(cls, seedType: SeedType) -> 'SeedLanguage':
@@ -220,12 +350,16 @@ class SeedLanguage:
         :param SeedType seedType: The type of seed to get the default language for.
         :return: The default SeedLanguage instance for the given seed type.
         """
-        cls._load_all()
+        language: SeedLanguage | None = cls._default(seedType)
+        if language is not None:
+            return language
+        # no default set, let the library raise the error
         result: ots_result_t = ots_seed_language_default(seedType)
         if ots_is_error(result):
             raise exception_from_result(result)
-        tmp: 'SeedLanguage' = cls(ots_result_handle(result))
-        return cls.fromCode(tmp.code)
+        with cls._lock:
+            cls._defaults[seedType] = cls._register(ots_result_handle(result))
+            return cls._defaults[seedType]
 
     @classmethod
     def setDefaultLanguage(cls, seedType: SeedType, language: 'SeedLanguage') -> None:
@@ -240,6 +374,8 @@ class SeedLanguage:
         """
         if not isinstance(language, SeedLanguage):
             raise TypeError("language must be an instance of SeedLanguage")
-        result: ots_result_t = ots_seed_language_set_default(seedType, language.handle)
-        if ots_is_error(result):
-            raise exception_from_result(result)
+        with cls._lock:
+            result: ots_result_t = ots_seed_language_set_default(seedType, language.handle)
+            if ots_is_error(result):
+                raise exception_from_result(result)
+            cls._defaults[seedType] = cls.fromCode(language.code)
@@ -0,0 +1,312 @@
+"""
+Opt-in tracing of the calls into the native library and of the high-level methods.
+
+Every call of a ``lib.ots_*`` function and of a public method of the ``ots`` classes
+is counted and its latency recorded in a histogram. For the methods the time is split
+into the time spent in the native library and the time spent in Python (the wrapper
+asserts, conversions and the methods themselves).
+
+.. code-block:: python
+
+    from ots import tracing
+
+    tracing.enable()
+    wallet.signTransaction(tx)
+    tracing.disable()
+    print(tracing.snapshot()['methods']['Wallet.signTransaction'])
+    print(tracing.prometheus())
+
+Tracing is also enabled on import with the environment variable ``OTS_TRACE=1``.
+
+It is built on :py:func:`sys.setprofile`, while it is disabled no hook is installed
+and it costs nothing. It can not be enabled while another profiler is installed. While it is enabled every call in the process pays for the hook,
+so the Python time of traced methods is an upper bound.
+
+With the pure-Python backend (``OTS_BACKEND=fake``) its ``ots_*`` functions are timed as native calls.
+"""
+import sys
+import threading
+from bisect import bisect_left
+from os import path
+from time import perf_counter_ns
+
+BUCKETS: tuple[float, ...] = (
+    1e-6, 2.5e-6, 5e-6,
+    1e-5, 2.5e-5, 5e-5,
+    1e-4, 2.5e-4, 5e-4,
+    1e-3, 2.5e-3, 5e-3,
+    1e-2, 2.5e-2, 5e-2,
+    1e-1, 2.5e-1, 5e-1,
+    1.0, 2.5, 5.0,
+)
+"""Upper bounds of the latency histogram buckets in seconds, the last bucket is unbounded."""
+
+_PACKAGE: str = path.dirname(path.abspath(__file__))
+_UNTRACED: frozenset[str] = frozenset({'raw.py', 'tracing.py', '_fake.py'})
+_GENERATOR: int = 0x20 | 0x200  # CO_GENERATOR | CO_ASYNC_GENERATOR
+
+
+class _Histogram:
+    """
+    A latency histogram, with the sum of the latencies and the native part of them.
+    :meta private:
+    """
+    __slots__ = ('counts', 'count', 'total', 'native')
+
+    def __init__(self):
+        self.counts: list[int] = [0] * (len(BUCKETS) + 1)
+        self.count: int = 0
+        self.total: int = 0
+        self.native: int = 0
+
+    def add(self, elapsed: int, native: int = 0) -> None:
+        self.counts[bisect_left(BUCKETS, elapsed / 1e9)] += 1
+        self.count += 1
+        self.total += elapsed
+        self.native += native
+
+    def toDict(self, withNative: bool) -> dict:
+        cumulative: list[int] = []
+        running: int = 0
+        for count in self.counts:
+            running += count
+            cumulative.append(running)
+        result: dict = {
+            'count': self.count,
+            'seconds': self.total / 1e9,
+            'buckets': dict(zip([*BUCKETS, float('inf')], cumulative)),
+        }
+        if withNative:
+            result['native_seconds'] = self.native / 1e9
+            result['python_seconds'] = (self.total - self.native) / 1e9
+        return result
+
+
+_lock: threading.Lock = threading.Lock()
+_local: threading.local = threading.local()
+_native: dict[str, _Histogram] = {}
+_methods: dict[str, _Histogram] = {}
+_traced: dict[object, str | None] = {}
+_fakeNatives: dict[object, str | None] = {}
+_enabled: bool = False
+
+
+def _method(code) -> str | None:
+    """
+    Returns the name a code object is traced under, None if it is not traced.
+    :meta private:
+    """
+    name: str | None = _traced.get(code, False)
+    if name is False:
+        name = None
+        filename: str = path.abspath(code.co_filename)
+        qualname: str = code.co_qualname
+        if (
+            path.dirname(filename) == _PACKAGE
+            and path.basename(filename) not in _UNTRACED
+            and not code.co_flags & _GENERATOR
+            and not any(part.startswith(('_', '<')) for part in qualname.split('.'))
+        ):
+            name = qualname
+        _traced[code] = name
+    return name
+
+
+def _fake_native(code) -> str | None:
+    """
+    Returns the name of a function of the pure-Python backend (:py:mod:`ots._fake`)
+    timed as native call, None for the other code objects.
+    :meta private:
+    """
+    name: str | None = _fakeNatives.get(code, False)
+    if name is False:
+        name = None
+        if code.co_name.startswith('ots_') and path.basename(code.co_filename) == '_fake.py':
+            name = code.co_name
+        _fakeNatives[code] = name
+    return name
+
+
+def _state() -> tuple[list, list]:
+    """
+    Returns the per-thread stack of traced methods and the native clock:
+    [native nanoseconds, start of the native call, frame of the pure-Python native call].
+    :meta private:
+    """
+    try:
+        return _local.stack, _local.clock
+    except AttributeError:
+        _local.stack = []
+        _local.clock = [0, 0, 0]
+        return _local.stack, _local.clock
+
+
+def _native_returned(name: str, clock: list) -> None:
+    """
+    Records the native call started on the clock.
+    :meta private:
+    """
+    elapsed: int = perf_counter_ns() - clock[1]
+    clock[0] += elapsed
+    clock[1] = 0
+    clock[2] = 0
+    with _lock:
+        histogram: _Histogram | None = _native.get(name)
+        if histogram is None:
+            histogram = _native[name] = _Histogram()
+        histogram.add(elapsed)
+
+
+def _profile(frame, event: str, arg) -> None:
+    """
+    The profile hook.
+    :meta private:
+    """
+    if event == 'c_call':
+        if getattr(arg, '__name__', '').startswith('ots_'):
+            _state()[1][1] = perf_counter_ns()
+    elif event == 'c_return' or event == 'c_exception':
+        name: str = getattr(arg, '__name__', '')
+        if name.startswith('ots_'):
+            stack, clock = _state()
+            if clock[1]:
+                _native_returned(name, clock)
+    elif event == 'call':
+        name: str | None = _method(frame.f_code)
+        if name is not None:
+            stack, clock = _state()
+            stack.append((id(frame), name, perf_counter_ns(), clock[0]))
+        elif _fake_native(frame.f_code) is not None:
+            stack, clock = _state()
+            # only the outermost call, the fake functions call each other
+            if not clock[1]:
+                clock[1] = perf_counter_ns()
+                clock[2] = id(frame)
+    elif event == 'return':
+        stack, clock = _state()
+        if clock[2] == id(frame):
+            _native_returned(frame.f_code.co_name, clock)
+        elif stack and stack[-1][0] == id(frame):
+            _, name, started, native = stack.pop()
+            with _lock:
+                histogram = _methods.get(name)
+                if histogram is None:
+                    histogram = _methods[name] = _Histogram()
+                histogram.add(perf_counter_ns() - started, clock[0] - native)
+
+
+def _setprofile(function) -> None:
+    """
+    Installs the profile hook in all threads, before Python 3.12 only in this and in new threads.
+    :meta private:
+    """
+    if hasattr(threading, 'setprofile_all_threads'):
+        threading.setprofile_all_threads(function)
+    else:
+        threading.setprofile(function)
+        sys.setprofile(function)
+
+
+def _foreign(function) -> bool:
+    """
+    :return: True if function is a profile hook other than the one of the tracing.
+    :meta private:
+    """
+    return function is not None and function is not _profile
+
+
+def enable() -> None:
+    """
+    Enables tracing, in all threads.
+
+    :raises RuntimeError: If another profiler, like :py:mod:`cProfile` or a debugger, is installed.
+    """
+    global _enabled
+    if _foreign(sys.getprofile()) or _foreign(getattr(threading, 'getprofile', lambda: None)()):
+        raise RuntimeError("another profiler is installed, tracing can not be enabled")
+    _enabled = True
+    _setprofile(_profile)
+
+
+def disable() -> None:
+    """
+    Disables tracing, in all threads. The recorded calls are kept until :py:func:`reset`.
+    A profiler installed after :py:func:`enable` is left in place.
+    """
+    global _enabled
+    _enabled = False
+    if not _foreign(sys.getprofile()):
+        _setprofile(None)
+
+
+def enabled() -> bool:
+    """
+    :return: True if tracing is enabled.
+    """
+    return _enabled
+
+
+def reset() -> None:
+    """
+    Forgets all recorded calls.
+    """
+    with _lock:
+        _native.clear()
+        _methods.clear()
+
+
+def snapshot() -> dict:
+    """
+    Returns the recorded calls.
+
+    .. code-block:: python
+
+        {
+            'native': {'ots_wallet_sign_data': {'count': 2, 'seconds': 0.0021, 'buckets': {1e-06: 0, ...}}},
+            'methods': {'Wallet.signData': {'count': 2, 'seconds': 0.0023, 'buckets': {...},
+                                            'native_seconds': 0.0021, 'python_seconds': 0.0002}}
+        }
+
+    The buckets are cumulative, by their upper bound in seconds, like in Prometheus.
+
+    :return: The calls per native function and per method.
+    """
+    with _lock:
+        return {
+            'native': {name: histogram.toDict(False) for name, histogram in sorted(_native.items())},
+            'methods': {name: histogram.toDict(True) for name, histogram in sorted(_methods.items())},
+        }
+
+
+def _bound(bound: float) -> str:
+    """
+    :meta private:
+    """
+    return '+Inf' if bound == float('inf') else repr(bound)
+
+
+def prometheus(prefix: str = 'ots') -> str:
+    """
+    Returns the recorded calls in the Prometheus text exposition format.
+
+    :param str prefix: The prefix of the metric names.
+    :return: The metrics, ``<prefix>_native_call_seconds`` and ``<prefix>_method_call_seconds``
+        histograms and the ``<prefix>_method_native_seconds_total`` counter.
+    """
+    recorded: dict = snapshot()
+    lines: list[str] = []
+    for kind, label in (('native', 'function'), ('method', 'method')):
+        metric: str = f'{prefix}_{kind}_call_seconds'
+        lines.append(f'# HELP {metric} Latency of the calls per {label}.')
+        lines.append(f'# TYPE {metric} histogram')
+        for name, histogram in recorded['native' if kind == 'native' else 'methods'].items():
+            for bound, count in histogram['buckets'].items():
+                lines.append(f'{metric}_bucket{{{label}="{name}",le="{_bound(bound)}"}} {count}')
+            lines.append(f'{metric}_sum{{{label}="{name}"}} {histogram["seconds"]!r}')
+            lines.append(f'{metric}_count{{{label}="{name}"}} {histogram["count"]}')
+    metric = f'{prefix}_method_native_seconds_total'
+    lines.append(f'# HELP {metric} Time of the methods spent in the native library.')
+    lines.append(f'# TYPE {metric} counter')
+    for name, histogram in recorded['methods'].items():
+        lines.append(f'{metric}{{method="{name}"}} {histogram["native_seconds"]!r}')
+    return '\n'.join(lines) + '\n'
@@ -1,4 +1,5 @@
 from .raw import *
+from .raw import _UNSET
 from .exceptions import *
 from .address import Address, AddressString
 from dataclasses import dataclass, field
@@ -12,6 +13,7 @@ class Flow:
 
         In the original Monero codebase and cryptonote it is refered to splitted_dsts and change_dts.
     """
+    __slots__ = ('address', 'amount')
 
     def __init__(self, address: Address | str, amount: int):
         """
@@ -34,7 +36,7 @@ class Flow:
         """
 
 
-@dataclass
+@dataclass(slots=True)
 class TransferDescription:
     """
     Represents a transfer description in a Monero transaction description.
@@ -74,26 +76,52 @@ class TransferDescription:
 class TxDescription:
     """
     Represents a Monero transaction description.
-    """
 
-    def __init__(self, handle: ots_handle_t):
-        self.handle: ots_handle_t = handle
-        self._txSet: bytes | None = None
-        self._txSetSize: int | None = None
-        self._amountIn: int | None = None
-        self._amountOut: int | None = None
-        self._flows: list[ots_flow_t] | None = None
-        self._change: Flow | None = None
-        self._hasChange: bool | None = None
-        self._fee: int | None = None
-        self._transfers: list[TransferDescription] | None = None
+    The fields are fetched from the library on first access and cached.
+    """
+    __slots__ = ('handle', '_txSet', '_txSetSize', '_amountIn', '_amountOut', '_flows', '_change', '_fee', '_transfers')
+
+    def __init__(self, handle: ots_handle_t | None):
+        self.handle: ots_handle_t | None = handle
+        self._txSet: bytes = _UNSET
+        self._txSetSize: int = _UNSET
+        self._amountIn: int = _UNSET
+        self._amountOut: int = _UNSET
+        self._flows: list[Flow] = _UNSET
+        self._change: Flow | None = _UNSET
+        self._fee: int = _UNSET
+        self._transfers: list[TransferDescription] = _UNSET
+
+    def __reduce__(self):
+        """
+        A tx description is pickled as its tx set and all its fields,
+        the unpickled description has no native handle and only serves the fields.
+        :meta private:
+        """
+        state: dict = {'_txSet': self.txSet, **self._fields()}
+        return (TxDescription, (None,), (None, state))
+
+    def _fields(self) -> dict:
+        """
+        :return: All fields of the description but the tx set, by slot name.
+        :meta private:
+        """
+        return {
+            '_txSetSize': self.txSetSize,
+            '_amountIn': self.amountIn,
+            '_amountOut': self.amountOut,
+            '_flows': self.flows,
+            '_change': self.change,
+            '_fee': self.fee,
+            '_transfers': self.transfers,
+        }
 
     @property
     def txSet(self) -> bytes:
         """
         Returns the transaction set as a byte string.
         """
-        if self._txSet is None:
+        if self._txSet is _UNSET:
             self._txSet = ots_tx_description_tx_set(self.handle)
         return self._txSet
 
@@ -102,7 +130,7 @@ class TxDescription:
         """
         Returns the size of the transaction set.
         """
-        if self._txSetSize is None:
+        if self._txSetSize is _UNSET:
             self._txSetSize = ots_tx_description_tx_set_size(self.handle)
         return self._txSetSize
 
@@ -111,7 +139,7 @@ class TxDescription:
         """
         Returns the total input amount for the transaction.
         """
-        if self._amountIn is None:
+        if self._amountIn is _UNSET:
             self._amountIn = ots_tx_description_amount_in(self.handle)
         return self._amountIn
 
@@ -120,7 +148,7 @@ class TxDescription:
         """
         Returns the total output amount for the transaction.
         """
-        if self._amountOut is None:
+        if self._amountOut is _UNSET:
             self._amountOut = ots_tx_description_amount_out(self.handle)
         return self._amountOut
 
@@ -129,7 +157,7 @@ class TxDescription:
         """
         Returns the list of flows in the transaction.
         """
-        if self._flows is not None:
+        if self._flows is not _UNSET:
             return self._flows
         flow_count: int = ots_tx_description_flows_count(self.handle)
         self._flows = [
@@ -145,10 +173,10 @@ class TxDescription:
         """
         Returns the change flow if it exists, otherwise None.
         """
-        if self._change is not None or self._hasChange is False:
+        if self._change is not _UNSET:
             return self._change
-        self._hasChange = ots_tx_description_has_change(self.handle)
-        if not self._hasChange:
+        if not ots_tx_description_has_change(self.handle):
+            self._change = None
             return None
         self._change = Flow(
             Address.fromString(ots_tx_description_change_address(self.handle)),
@@ -161,7 +189,7 @@ class TxDescription:
         """
         Returns the transaction fee.
         """
-        if self._fee is None:
+        if self._fee is _UNSET:
             self._fee = ots_tx_description_fee(self.handle)
         return self._fee
 
@@ -170,7 +198,7 @@ class TxDescription:
         """
         Returns the list of transfer descriptions for the transaction.
         """
-        if self._transfers is not None:
+        if self._transfers is not _UNSET:
             return self._transfers
         transfer_count: int = ots_tx_description_transfers_count(self.handle)
         self._transfers = []
@@ -0,0 +1,407 @@
+from concurrent.futures import Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from multiprocessing import Value
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.sharedctypes import Synchronized
+from os import cpu_count
+from typing import Callable, Iterable, Iterator
+from .raw import *
+from .exceptions import *
+from .seed import Seed, _restore_seed
+from .seed_indices import SecureChannel
+from .transaction import TxDescription
+from .wallet import Wallet
+
+
+class TxRing:
+    """
+    A ring of fixed size slots in shared memory (:py:class:`multiprocessing.shared_memory.SharedMemory`),
+    to hand tx sets and signed transactions between processes without pickling and piping them.
+
+    The process which creates the ring owns it, hands out the slots with :py:meth:`acquire`
+    and :py:meth:`release` and unlinks the shared memory on :py:meth:`close`.
+    A ring pickles as its name only, the unpickled ring attaches to the same shared memory.
+
+    .. code-block:: python
+
+        with TxRing(8, 1 << 22) as ring:
+            slot: int = ring.acquire()
+            size: int = ring.write(slot, unsignedTx)
+            wallet.describeTransaction(ring.view(slot, size))
+            ring.release(slot)
+    """
+
+    def __init__(self, slots: int, slotSize: int, name: str | None = None):
+        """
+        Creates a new ring, or attaches to an existing one.
+
+        :param int slots: The number of slots.
+        :param int slotSize: The size of every slot in bytes.
+        :param name: The name of the shared memory to attach to, None creates a new ring.
+        :type name: str | None
+        """
+        assert isinstance(slots, int) and slots > 0, "slots must be a positive integer"
+        assert isinstance(slotSize, int) and slotSize > 0, "slotSize must be a positive integer"
+        assert name is None or isinstance(name, str), "name must be a string or None"
+        self.slots: int = slots
+        """The number of slots."""
+        self.slotSize: int = slotSize
+        """The size of every slot in bytes."""
+        self.owner: bool = name is None
+        """If this ring created the shared memory, and unlinks it on close."""
+        self.memory: SharedMemory = SharedMemory(name, create=self.owner, size=slots * slotSize if self.owner else 0)
+        """The shared memory of the ring."""
+        self._used: list[bool] = [False] * slots
+        self._next: int = 0
+
+    def __reduce__(self):
+        """
+        :meta private:
+        """
+        return (TxRing, (self.slots, self.slotSize, self.name))
+
+    def __enter__(self) -> 'TxRing':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.slots
+
+    @property
+    def name(self) -> str:
+        """
+        :return: The name of the shared memory, to attach to it from another process.
+        """
+        return self.memory.name
+
+    def acquire(self) -> int | None:
+        """
+        Takes the next free slot, in ring order.
+
+        :return: The slot, or None if all slots are in use.
+        """
+        for _ in range(self.slots):
+            slot: int = self._next
+            self._next = (slot + 1) % self.slots
+            if not self._used[slot]:
+                self._used[slot] = True
+                return slot
+        return None
+
+    def release(self, slot: int) -> None:
+        """
+        Gives a slot taken with :py:meth:`acquire` back.
+
+        :param int slot: The slot.
+        """
+        assert self._used[slot], "slot is not in use"
+        self._used[slot] = False
+
+    def view(self, slot: int, size: int | None = None) -> memoryview:
+        """
+        Returns a view into a slot, without copying it.
+
+        .. warning::
+
+            Views must be released (or dropped) before the ring is closed,
+            copy them with ``bytes(view)`` if the data must outlive the ring.
+
+        :param int slot: The slot.
+        :param size: The number of bytes from the start of the slot, None for the whole slot.
+        :type size: int | None
+        :return: The view into the slot.
+        """
+        assert isinstance(slot, int) and 0 <= slot < self.slots, "slot must be an index of the ring"
+        size = self.slotSize if size is None else size
+        assert isinstance(size, int) and 0 <= size <= self.slotSize, "size must fit into the slot"
+        offset: int = slot * self.slotSize
+        return self.memory.buf[offset:offset + size]
+
+    def write(self, slot: int, data: bytes | bytearray | memoryview) -> int:
+        """
+        Copies data into a slot.
+
+        :param int slot: The slot.
+        :param data: The data.
+        :type data: bytes | bytearray | memoryview
+        :return: The size of the data in bytes.
+        :raises ValueError: If the data does not fit into a slot.
+        """
+        assert isinstance(data, (bytes, bytearray, memoryview)), "data must be a bytes-like object"
+        size: int = memoryview(data).nbytes
+        if size > self.slotSize:
+            raise ValueError(f"{size} bytes do not fit into a slot of {self.slotSize} bytes")
+        with self.view(slot, size) as view:
+            view[:] = memoryview(data).cast('B')
+        return size
+
+    def close(self) -> None:
+        """
+        Detaches from the shared memory, the owner also unlinks it.
+        """
+        self.memory.close()
+        if self.owner:
+            self.owner = False
+            self.memory.unlink()
+
+
+@dataclass(frozen=True)
+class _TxTask:
+    """
+    The sealed seed and the rings of a pool, shipped once to every worker.
+    The password of the channel is not part of it, the worker reads it from
+    the shared memory named by passwordMemory, the last of the workers to read it
+    wipes and unlinks it.
+    :meta private:
+    """
+    seed: tuple
+    passwordMemory: str
+    passwordSize: int
+    readers: Synchronized
+    workers: int
+    requests: TxRing
+    responses: TxRing
+
+
+_txWallet: Wallet | None = None
+_txRequests: TxRing | None = None
+_txResponses: TxRing | None = None
+
+
+def _init_tx_worker(task: _TxTask) -> None:
+    """
+    Initializes a worker process, restores the wallet and attaches to the rings.
+    :meta private:
+    """
+    global _txWallet, _txRequests, _txResponses
+    memory: SharedMemory = SharedMemory(task.passwordMemory)
+    try:
+        password: str = bytes(memory.buf[:task.passwordSize]).decode('utf-8')
+        with task.readers.get_lock():
+            task.readers.value += 1
+            if task.readers.value == task.workers:
+                memory.buf[:] = bytes(len(memory.buf))
+                memory.unlink()
+    finally:
+        memory.close()
+    with SecureChannel(password):
+        _txWallet = _restore_seed(*task.seed).wallet
+    _txRequests = task.requests
+    _txResponses = task.responses
+
+
+def _sign_slot(slot: int, size: int) -> int:
+    """
+    Signs the tx set in a request slot into the response slot.
+    :meta private:
+    """
+    with _txRequests.view(slot, size) as request, _txResponses.view(slot) as response:
+        return _txWallet.signTransactionInto(request, response)
+
+
+def _describe_slot(slot: int, size: int) -> dict:
+    """
+    Describes the tx set in a request slot.
+
+    :return: The fields of the description, the tx set is not sent back, it is still in the slot.
+    :meta private:
+    """
+    with _txRequests.view(slot, size) as request:
+        return _txWallet.describeTransaction(request)._fields()
+
+
+class TxSigningPool:
+    """
+    Signs (or describes) many tx sets in worker processes. The tx sets and the signed
+    transactions are handed through two :py:class:`TxRing` in shared memory, only the slot
+    and the size go through the pipe, so large tx sets are not pickled and copied twice.
+
+    The workers restore the wallet from the seed through a :py:class:`ots.seed_indices.SecureChannel`.
+    The sealed seed goes through the pipe to the workers, the password of the channel
+    does not: it is handed over in shared memory, which is wiped and unlinked as soon as
+    all workers have read it, or on :py:meth:`close` at the latest.
+
+    .. code-block:: python
+
+        with TxSigningPool(seed, SecureChannel(password)) as pool:
+            for index, signed in pool.signMany(unsignedTxs):
+                save(index, bytes(signed))
+
+    .. note::
+
+        Seeds created with a passphrase can not be restored in the workers.
+    """
+
+    def __init__(
+        self,
+        seed: Seed,
+        channel: SecureChannel,
+        workers: int | None = None,
+        slots: int | None = None,
+        slotSize: int = 1 << 22
+    ):
+        """
+        :param Seed seed: The seed of the wallet which signs.
+        :param SecureChannel channel: The channel the seed is sent to the workers through.
+        :param workers: Number of worker processes, 1 signs in this process. Defaults to the number of CPUs.
+        :type workers: int | None
+        :param slots: Number of tx sets in flight. Defaults to twice the number of workers.
+        :type slots: int | None
+        :param int slotSize: The maximum size of a tx set and of a signed transaction in bytes.
+        """
+        assert isinstance(seed, Seed), "seed must be an instance of Seed"
+        assert isinstance(channel, SecureChannel), "channel must be an instance of SecureChannel"
+        assert workers is None or (isinstance(workers, int) and workers > 0), "workers must be a positive integer"
+        assert slots is None or (isinstance(slots, int) and slots > 0), "slots must be a positive integer"
+        assert isinstance(slotSize, int) and slotSize > 0, "slotSize must be a positive integer"
+        self.seed: Seed = seed
+        self.channel: SecureChannel = channel
+        self.workers: int = workers or cpu_count() or 1
+        self.slots: int = slots or self.workers * 2
+        self.slotSize: int = slotSize
+        self._requests: TxRing | None = None
+        self._responses: TxRing | None = None
+        self._password: SharedMemory | None = None
+        self._readers: Synchronized | None = None
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> 'TxSigningPool':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _start(self) -> ProcessPoolExecutor:
+        """
+        Creates the rings and the workers on first use.
+        :meta private:
+        """
+        if self._executor is None:
+            with self.channel:
+                _, seed = self.seed.__reduce__()
+            password: bytes = self.channel.password.encode('utf-8')
+            self._password = SharedMemory(create=True, size=len(password))
+            self._password.buf[:len(password)] = password
+            self._readers = Value('i', 0)
+            self._requests = TxRing(self.slots, self.slotSize)
+            self._responses = TxRing(self.slots, self.slotSize)
+            task: _TxTask = _TxTask(
+                seed, self._password.name, len(password), self._readers, self.workers, self._requests, self._responses
+            )
+            self._executor = ProcessPoolExecutor(self.workers, initializer=_init_tx_worker, initargs=(task,))
+        return self._executor
+
+    def _map(
+        self,
+        txs: Iterable[bytes | bytearray | memoryview],
+        function: Callable[[int, int], object],
+        collect: Callable[[int, object], object]
+    ) -> Iterator[tuple[int, object]]:
+        """
+        Writes the tx sets into free slots, as long as there are, and yields the results as they complete.
+        If it stops early, on an error or when the caller stops iterating, the pending tx sets
+        are cancelled or waited for, and their slots released.
+        :meta private:
+        """
+        executor: ProcessPoolExecutor = self._start()
+        pending: dict[Future, tuple[int, int]] = {}
+
+        def completed() -> Iterator[tuple[int, object]]:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index, slot = pending.pop(future)
+                try:
+                    yield index, collect(slot, future.result())
+                finally:
+                    self._requests.release(slot)
+
+        try:
+            for index, tx in enumerate(txs):
+                slot: int | None = self._requests.acquire()
+                while slot is None:
+                    yield from completed()
+                    slot = self._requests.acquire()
+                try:
+                    size: int = self._requests.write(slot, tx)
+                except ValueError:
+                    self._requests.release(slot)
+                    raise
+                pending[executor.submit(function, slot, size)] = (index, slot)
+            while pending:
+                yield from completed()
+        finally:
+            for future in pending:
+                future.cancel()
+            # a running worker still uses its slots
+            wait(pending)
+            for _, slot in pending.values():
+                self._requests.release(slot)
+
+    def signMany(self, txs: Iterable[bytes | bytearray | memoryview]) -> Iterator[tuple[int, memoryview]]:
+        """
+        Signs tx sets.
+
+        :param txs: The unsigned tx sets.
+        :type txs: Iterable[bytes | bytearray | memoryview]
+        :return: The position of the tx set in txs and the signed transaction, in the order they complete.
+            The signed transaction is a view into shared memory, valid until the next one is taken,
+            copy it with ``bytes(signed)`` to keep it.
+        :raises ValueError: If a tx set or a signed transaction does not fit into a slot.
+        """
+        if self.workers == 1:
+            wallet: Wallet = self.seed.wallet
+            for index, tx in enumerate(txs):
+                yield index, memoryview(wallet.signTransaction(tx))
+            return
+
+        def collect(slot: int, size: int) -> memoryview:
+            return self._responses.view(slot, size)
+
+        for index, signed in self._map(txs, _sign_slot, collect):
+            with signed:
+                yield index, signed
+
+    def describeMany(self, txs: Iterable[bytes | bytearray | memoryview]) -> Iterator[tuple[int, TxDescription]]:
+        """
+        Describes tx sets.
+
+        :param txs: The unsigned tx sets.
+        :type txs: Iterable[bytes | bytearray | memoryview]
+        :return: The position of the tx set in txs and its description, in the order they complete.
+        :raises ValueError: If a tx set does not fit into a slot.
+        """
+        if self.workers == 1:
+            wallet: Wallet = self.seed.wallet
+            for index, tx in enumerate(txs):
+                yield index, wallet.describeTransaction(tx)
+            return
+
+        def collect(slot: int, fields: dict) -> TxDescription:
+            description: TxDescription = TxDescription(None)
+            for name, value in fields.items():
+                setattr(description, name, value)
+            with self._requests.view(slot, description.txSetSize) as request:
+                description._txSet = bytes(request)
+            return description
+
+        yield from self._map(txs, _describe_slot, collect)
+
+    def close(self) -> None:
+        """
+        Stops the workers and frees the shared memory.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+            self._requests.close()
+            self._responses.close()
+            self._requests = self._responses = None
+            self._password.buf[:] = bytes(len(self._password.buf))
+            self._password.close()
+            with self._readers.get_lock():
+                # it is still linked if not all workers have been started and read it
+                if self._readers.value < self.workers:
+                    self._password.unlink()
+            self._password = self._readers = None
@@ -0,0 +1,161 @@
+"""
+A bounded LRU cache of signature verification results.
+
+:py:meth:`ots.ots.Ots.verifyDataMany` looks up every (data, address, signature) it
+verifies in an optional :py:class:`VerifyCache`, so messages verified again, e.g. by
+repeated audit runs, are not verified natively again.
+
+.. code-block:: python
+
+    cache: VerifyCache = VerifyCache(maxEntries=1000000)
+    valid: list[bool] = Ots.verifyDataMany(items, cache=cache)
+    print(cache.stats())
+
+The data is kept as its SHA-256 digest only, an entry is about 250 bytes.
+Only results are cached, a verification raising an exception is not.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import sha256
+from threading import Lock
+
+DEFAULT_MAX_ENTRIES: int = 65536
+"""Maximum number of entries of a new cache."""
+
+VerifyKey = tuple[bytes, str, str]
+"""The key of an entry: the SHA-256 digest of the data, the address and the signature."""
+
+
+def verifyKey(data: bytes | str, address: str, signature: str | bytes) -> VerifyKey:
+    """
+    Returns the key of a verification in a :py:class:`VerifyCache`.
+
+    :param data: The signed data.
+    :type data: bytes | str
+    :param str address: The address the data is verified against.
+    :param signature: The signature.
+    :type signature: str | bytes
+    :return: The digest of the data, the address and the signature.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    if isinstance(signature, bytes):
+        signature = signature.decode('utf-8')
+    return sha256(data).digest(), address, signature
+
+
+@dataclass(frozen=True, slots=True)
+class VerifyCacheStats:
+    """
+    Statistics of a :py:class:`VerifyCache`.
+    """
+    hits: int
+    """Lookups answered from the cache."""
+    misses: int
+    """Lookups not in the cache."""
+    evictions: int
+    """Entries evicted for the entry limit."""
+    entries: int
+    """Number of entries."""
+    maxEntries: int | None
+    """Maximum number of entries, None for no limit."""
+
+
+class VerifyCache:
+    """
+    A thread-safe LRU cache of verification results by (data digest, address, signature).
+    """
+    __slots__ = ('_maxEntries', '_entries', '_hits', '_misses', '_evictions', '_lock')
+
+    def __init__(self, maxEntries: int | None = DEFAULT_MAX_ENTRIES):
+        """
+        Initializes an empty cache.
+
+        :param maxEntries: Maximum number of entries, None for no limit.
+        :type maxEntries: int | None
+        """
+        self._entries: OrderedDict[VerifyKey, bool] = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._lock: Lock = Lock()
+        self._maxEntries: int | None = None
+        self.resize(maxEntries)
+
+    def __len__(self) -> int:
+        """
+        :return: The number of entries.
+        """
+        return len(self._entries)
+
+    def __contains__(self, key: VerifyKey) -> bool:
+        """
+        :return: True if the result of the key is cached, it does not count as hit.
+        """
+        return key in self._entries
+
+    def resize(self, maxEntries: int | None = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Sets the limit of the cache, entries above it are evicted.
+
+        :param maxEntries: Maximum number of entries, None for no limit.
+        :type maxEntries: int | None
+        """
+        assert maxEntries is None or (isinstance(maxEntries, int) and maxEntries >= 0), "maxEntries must be a non-negative integer or None"
+        with self._lock:
+            self._maxEntries = maxEntries
+            self._shrink()
+
+    def get(self, key: VerifyKey) -> bool | None:
+        """
+        Looks up a result and marks it as most recently used.
+
+        :param key: The key, see :py:func:`verifyKey`.
+        :type key: VerifyKey
+        :return: The cached result, None if not cached.
+        """
+        with self._lock:
+            valid: bool | None = self._entries.get(key)
+            if valid is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return valid
+
+    def put(self, key: VerifyKey, valid: bool) -> None:
+        """
+        Adds a result as most recently used, evicting the least recently used ones above the limit.
+
+        :param key: The key, see :py:func:`verifyKey`.
+        :type key: VerifyKey
+        :param bool valid: The result of the verification.
+        """
+        assert isinstance(valid, bool), "valid must be a boolean"
+        with self._lock:
+            self._entries[key] = valid
+            self._entries.move_to_end(key)
+            self._shrink()
+
+    def clear(self) -> None:
+        """
+        Removes all entries, the statistics are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> VerifyCacheStats:
+        """
+        :return: The statistics of the cache.
+        """
+        with self._lock:
+            return VerifyCacheStats(self._hits, self._misses, self._evictions, len(self._entries), self._maxEntries)
+
+    def _shrink(self) -> None:
+        """
+        Evicts entries until the cache is within its limit, with the lock held.
+        :meta private:
+        """
+        while self._entries and self._maxEntries is not None and len(self._entries) > self._maxEntries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
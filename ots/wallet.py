@@ -1,8 +1,12 @@
 from .raw import *
 from .enums import HandleType
+from concurrent.futures import ThreadPoolExecutor
+from os import cpu_count
+from typing import Iterable
 from .exceptions import *
 from .transaction import TxDescription, TxWarning
 from .address import Address
+from .address_cache import AddressCache
 from .wipeable_string import WipeableString
 
 
@@ -11,17 +15,23 @@ class Wallet:
     Represents a monero wallet.
     """
 
-    def __init__(self, handle: ots_handle_t):
+    def __init__(self, handle: ots_handle_t, addressCache: AddressCache | None = None):
         """
         Initializes the Wallet with a handle.
 
         :param ots_handle_t handle: The handle to the wallet. Must be of type ots_handle_t.
+        :param addressCache: The cache of :py:meth:`address`, a new one with the default limits if None.
+        :type addressCache: AddressCache | None
         """
         assert isinstance(handle, ots_handle_t), "handle must be of type ots_handle_t"
         assert handle.type == HandleType.WALLET, "handle must be of type HandleType.WALLET"
+        assert addressCache is None or isinstance(addressCache, AddressCache), "addressCache must be an AddressCache or None"
         self.handle: ots_handle_t = handle
         self._height: int | None = None
-        self._addresses: dict[tuple[int, int], Address] = {}
+        self.addressCache: AddressCache = addressCache if addressCache is not None else AddressCache()
+        """
+        The bounded LRU cache of :py:meth:`address`, see :py:mod:`ots.address_cache`.
+        """
 
     def __str__(self):
         """
@@ -36,6 +46,12 @@ class Wallet:
         """
         return f"Wallet({str(self)})"
 
+    def __reduce__(self):
+        """
+        :meta private:
+        """
+        raise TypeError("Wallet holds secret keys and can not be pickled, send its seed through a SecureChannel")
+
     @property
     def height(self) -> int:
         """
@@ -52,17 +68,23 @@ class Wallet:
         Get the address at the specified account and index.
         Account 0 and index 0 are the standard address of the wallet.
 
+        The addresses are cached in :py:attr:`addressCache`, in detach mode: their native
+        handle is freed once their properties are cached, see :py:meth:`ots.address.Address.detach`.
+
         :param int account: The account number (default is 0).
         :param int index: The index of the address in the account (default is 0).
         """
-        key = (account, index)
-        if key not in self._addresses:
-            self._addresses[key] = Address(
+        key: tuple[int, int] = (account, index)
+        address: Address | None = self.addressCache.get(key)
+        if address is None:
+            address = Address(
                 ots_result_handle(
                     ots_wallet_subaddress(self.handle, account, index)
-                )
+                ),
+                detach=True
             )
-        return self._addresses[key]
+            self.addressCache.put(key, address)
+        return address
 
     def accounts(self, max: int = 10, offset: int = 0) -> list[Address]:
         """
@@ -277,13 +299,14 @@ class Wallet:
             raise exception_from_result(result)
         return ots_result_bytes(result)
 
-    def describeTransaction(self, tx: bytes) -> TxDescription:
+    def describeTransaction(self, tx: bytes | bytearray | memoryview) -> TxDescription:
         """
         Describe an unsigned transaction.
 
-        :param bytes tx: The unsigned transaction to describe.
+        :param tx: The unsigned transaction to describe, any buffer is read without copying it.
+        :type tx: bytes | bytearray | memoryview
         """
-        assert isinstance(tx, bytes), "tx must be bytes"
+        assert isinstance(tx, (bytes, bytearray, memoryview)), "tx must be a bytes-like object"
         result: ots_result_t = ots_wallet_describe_tx(self.handle, tx)
         if ots_is_error(result):
             raise exception_from_result(result)
@@ -317,19 +340,38 @@ class Wallet:
         handles: list[ots_handle_t] = ots_result_handle_array(result)
         return [TxWarning(handle) for handle in handles]
 
-    def signTransaction(self, tx: bytes) -> bytes:
+    def signTransaction(self, tx: bytes | bytearray | memoryview) -> bytes:
         """
         Sign an unsigned transaction from the hot wallet (view only).
 
-        :param bytes tx: The unsigned transaction to sign.
+        :param tx: The unsigned transaction to sign, any buffer is read without copying it.
+        :type tx: bytes | bytearray | memoryview
         :return: The signed transaction as bytes.
         """
-        assert isinstance(tx, bytes), "tx must be bytes"
+        assert isinstance(tx, (bytes, bytearray, memoryview)), "tx must be a bytes-like object"
         result: ots_result_t = ots_wallet_sign_transaction(self.handle, tx)
         if ots_is_error(result):
             raise exception_from_result(result)
         return ots_result_bytes(result)
 
+    def signTransactionInto(self, tx: bytes | bytearray | memoryview, buffer: bytearray | memoryview) -> int:
+        """
+        Sign an unsigned transaction like :py:meth:`signTransaction`, but write the signed
+        transaction straight into a writable buffer, e.g. a slot in shared memory.
+
+        :param tx: The unsigned transaction to sign.
+        :type tx: bytes | bytearray | memoryview
+        :param buffer: The buffer the signed transaction is written to.
+        :type buffer: bytearray | memoryview
+        :return: The size of the signed transaction in bytes.
+        :raises ValueError: If the buffer is too small for the signed transaction.
+        """
+        assert isinstance(tx, (bytes, bytearray, memoryview)), "tx must be a bytes-like object"
+        result: ots_result_t = ots_wallet_sign_transaction(self.handle, tx)
+        if ots_is_error(result):
+            raise exception_from_result(result)
+        return ots_result_bytes_into(result, buffer)
+
     def signData(self, data: bytes | str) -> str:
         """
         Sign arbitrary data, with the standard address of the wallet.
@@ -411,6 +453,83 @@ class Wallet:
             raise exception_from_result(result)
         return ots_result_char_array(result)
 
+    def signDataMany(
+        self,
+        items: Iterable[tuple[bytes | str, int, int] | tuple[bytes | str, Address | str]],
+        workers: int | None = None,
+        chunkSize: int = 64
+    ) -> list[str]:
+        """
+        Sign many messages, e.g. the same challenge with thousands of subaddresses,
+        or many challenges with one address.
+
+        .. code-block:: python
+
+            signatures: list[str] = wallet.signDataMany(
+                [(challenge, 0, index) for index in range(1000)] + [(challenge, address)]
+            )
+
+        Every message is encoded once and every address is resolved to its account
+        and index once (within the max depths, see :py:meth:`addressIndex`), equal items
+        are signed once. The signing is spread over threads, the library is called
+        without the GIL.
+
+        :param items: Tuples of the data and the account and index, or of the data and the address to sign with.
+        :type items: Iterable[tuple[bytes | str, int, int] | tuple[bytes | str, Address | str]]
+        :param workers: Number of threads, 1 signs in this thread. Defaults to the number of CPUs.
+        :type workers: int | None
+        :param int chunkSize: Number of signatures a thread creates at once.
+        :return: The signatures, in the order of the items.
+        """
+        assert workers is None or (isinstance(workers, int) and workers > 0), "workers must be a positive integer"
+        assert isinstance(chunkSize, int) and chunkSize > 0, "chunkSize must be a positive integer"
+        messages: dict[bytes | str, bytes] = {}
+        positions: dict[str, tuple[int, int]] = {}
+        jobs: dict[tuple[bytes, int, int], int] = {}
+        order: list[int] = []
+        for item in items:
+            assert isinstance(item, tuple) and len(item) in (2, 3), "items must be (data, account, index) or (data, address) tuples"
+            data: bytes | str = item[0]
+            assert isinstance(data, (bytes, str)), "data must be bytes or a string"
+            message: bytes | None = messages.get(data)
+            if message is None:
+                message = messages[data] = data.encode('utf-8') if isinstance(data, str) else data
+            if len(item) == 3:
+                account, index = item[1], item[2]
+                assert isinstance(account, int) and isinstance(index, int), "account and index must be integers"
+            else:
+                address: Address | str = item[1]
+                assert isinstance(address, (Address, str)), "address must be an Address instance or a string"
+                key: str = address if isinstance(address, str) else address.base58
+                position: tuple[int, int] | None = positions.get(key)
+                if position is None:
+                    position = positions[key] = self.addressIndex(address)
+                account, index = position
+            order.append(jobs.setdefault((message, account, index), len(jobs)))
+        unique: list[tuple[bytes, int, int]] = list(jobs)
+        chunks: list[list[tuple[bytes, int, int]]] = [unique[i:i + chunkSize] for i in range(0, len(unique), chunkSize)]
+        workers = workers or cpu_count() or 1
+        if workers == 1 or len(chunks) <= 1:
+            signed: list[list[str]] = [self._signChunk(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(min(workers, len(chunks))) as executor:
+                signed = list(executor.map(self._signChunk, chunks))
+        signatures: list[str] = [signature for chunk in signed for signature in chunk]
+        return [signatures[i] for i in order]
+
+    def _signChunk(self, chunk: list[tuple[bytes, int, int]]) -> list[str]:
+        """
+        Signs the messages of a chunk of :py:meth:`signDataMany`.
+        :meta private:
+        """
+        signatures: list[str] = []
+        for message, account, index in chunk:
+            result: ots_result_t = ots_wallet_sign_data_with_index(self.handle, message, account, index)
+            if ots_is_error(result):
+                raise exception_from_result(result)
+            signatures.append(ots_result_char_array(result))
+        return signatures
+
     def verifyData(
         self,
         data: bytes | str,
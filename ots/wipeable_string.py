@@ -35,6 +35,12 @@ class WipeableString:
         """
         return f"<WipeableString {self.__hash__()}>"
 
+    def __reduce__(self):
+        """
+        :meta private:
+        """
+        raise TypeError("WipeableString can not be pickled, it would leave the secret in memory and on the wire")
+
     def __hash__(self):
         """
         :meta private:
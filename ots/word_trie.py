@@ -0,0 +1,224 @@
+from threading import Lock
+from unicodedata import normalize, combining
+from .raw import *
+from .seed_language import SeedLanguage
+
+
+class _WordTrieNode:
+    """
+    A node of the :py:class:`WordTrie`.
+
+    :meta private:
+    """
+    __slots__ = ('edges', 'words', 'counts', 'first')
+
+    def __init__(self):
+        self.edges: dict[str, tuple[str, '_WordTrieNode']] = {}
+        """Outgoing edges by their first character, each with its (compressed) label."""
+        self.words: dict[str, list[int]] = {}
+        """Indices of the words ending at this node, per language code."""
+        self.counts: dict[str, int] = {}
+        """Number of words below (and including) this node, per language code."""
+        self.first: dict[str, int] = {}
+        """Index of one word below this node, per language code."""
+
+    def add(self, code: str, index: int) -> None:
+        self.counts[code] = self.counts.get(code, 0) + 1
+        self.first.setdefault(code, index)
+
+
+class WordTrie:
+    """
+    A compressed prefix trie (radix tree) over the word lists of all languages
+    of a seed type.
+
+    From the words of a phrase alone it identifies the language, resolves
+    unique-prefix abbreviations and maps the phrase straight to the seed indices,
+    so a phrase can be decoded in a single pass, without trying every language.
+
+    .. code-block:: python
+
+        trie: WordTrie = WordTrie.forType(SeedType.POLYSEED)
+        for values, codes in trie.parse(phrase).items():
+            print(codes, SeedIndices.fromValues(list(values)))
+
+    .. seealso:: :py:meth:`ots.seed.MoneroSeed.decodeAnyLanguage` and
+        :py:meth:`ots.seed.Polyseed.decodeAnyLanguage`
+    """
+    _byType: dict[tuple[SeedType, bool], 'WordTrie'] = {}
+    _lock: Lock = Lock()
+
+    def __init__(self, wordLists: dict[str, tuple[str, ...]], foldAccents: bool = False):
+        """
+        Initializes the trie with word lists.
+
+        :param wordLists: The word lists by language code, the position of a word in the list is its index.
+        :type wordLists: dict[str, tuple[str, ...]]
+        :param bool foldAccents: If True, words are matched without their accents (diacritics).
+        """
+        assert isinstance(wordLists, dict), "wordLists must be a dict"
+        assert isinstance(foldAccents, bool), "foldAccents must be a bool"
+        self.foldAccents: bool = foldAccents
+        self._root: _WordTrieNode = _WordTrieNode()
+        for code, words in wordLists.items():
+            for index, word in enumerate(words):
+                self.insert(word, code, index)
+
+    def key(self, word: str) -> str:
+        """
+        Normalizes a word the way it is stored in the trie.
+
+        :param str word: The word to normalize.
+        :return: The normalized word.
+        """
+        if self.foldAccents:
+            return ''.join(c for c in normalize('NFKD', word) if not combining(c)).casefold()
+        return normalize('NFKC', word).casefold()
+
+    def insert(self, word: str, code: str, index: int) -> None:
+        """
+        Inserts a word into the trie.
+
+        :param str word: The word to insert.
+        :param str code: The code of the language the word belongs to.
+        :param int index: The index of the word in the word list of the language.
+        """
+        assert isinstance(word, str) and len(word) > 0, "word must be a non-empty string"
+        node: _WordTrieNode = self._root
+        node.add(code, index)
+        rest: str = self.key(word)
+        while rest:
+            edge: tuple[str, _WordTrieNode] | None = node.edges.get(rest[0])
+            if edge is None:
+                child: _WordTrieNode = _WordTrieNode()
+                node.edges[rest[0]] = (rest, child)
+                child.add(code, index)
+                node = child
+                break
+            label, child = edge
+            common: int = 1
+            while common < len(label) and common < len(rest) and label[common] == rest[common]:
+                common += 1
+            if common < len(label):
+                # split the edge, the new node inherits the words below the old child
+                middle: _WordTrieNode = _WordTrieNode()
+                middle.counts = dict(child.counts)
+                middle.first = dict(child.first)
+                middle.edges[label[common]] = (label[common:], child)
+                node.edges[rest[0]] = (label[:common], middle)
+                child = middle
+            child.add(code, index)
+            node = child
+            rest = rest[common:]
+        node.words.setdefault(code, []).append(index)
+
+    def _find(self, key: str) -> tuple[_WordTrieNode | None, bool]:
+        """
+        Returns the node below which all words start with the key,
+        and if the key ends exactly at that node.
+        :meta private:
+        """
+        node: _WordTrieNode = self._root
+        rest: str = key
+        while rest:
+            edge: tuple[str, _WordTrieNode] | None = node.edges.get(rest[0])
+            if edge is None:
+                return None, False
+            label, child = edge
+            if rest.startswith(label):
+                rest = rest[len(label):]
+                node = child
+            elif label.startswith(rest):
+                return child, False
+            else:
+                return None, False
+        return node, True
+
+    def resolve(self, token: str) -> dict[str, int]:
+        """
+        Resolves a single word or a unique-prefix abbreviation of a word.
+
+        :param str token: The word or the abbreviation.
+        :return: The index of the word per language code, for every language in which the token is unambiguous.
+        """
+        node, atNode = self._find(self.key(token))
+        if node is None:
+            return {}
+        resolved: dict[str, int] = {}
+        for code, count in node.counts.items():
+            exact: list[int] | None = node.words.get(code) if atNode else None
+            if exact is not None:
+                if len(exact) == 1:
+                    resolved[code] = exact[0]
+            elif count == 1:
+                resolved[code] = node.first[code]
+        return resolved
+
+    def parse(self, phrase: str) -> dict[tuple[int, ...], list[str]]:
+        """
+        Maps a phrase to seed indices, in every language in which all of its words resolve.
+
+        :param str phrase: The phrase, words separated by whitespace.
+        :return: The distinct seed indices, each with the codes of the languages they were resolved in. Empty if no language matches.
+        """
+        assert isinstance(phrase, str), "phrase must be a string"
+        candidates: dict[str, list[int]] | None = None
+        for token in phrase.split():
+            resolved: dict[str, int] = self.resolve(token)
+            if candidates is None:
+                candidates = {code: [index] for code, index in resolved.items()}
+            else:
+                candidates = {
+                    code: values + [resolved[code]]
+                    for code, values in candidates.items()
+                    if code in resolved
+                }
+            if not candidates:
+                return {}
+        parsed: dict[tuple[int, ...], list[str]] = {}
+        for code, values in (candidates or {}).items():
+            parsed.setdefault(tuple(values), []).append(code)
+        return parsed
+
+    def detect(self, phrase: str) -> list[str]:
+        """
+        Identifies the languages of a phrase.
+
+        :param str phrase: The phrase, words separated by whitespace.
+        :return: The codes of all languages in which every word of the phrase resolves.
+        """
+        return [code for codes in self.parse(phrase).values() for code in codes]
+
+    @classmethod
+    def forType(cls, seedType: SeedType, foldAccents: bool = False) -> 'WordTrie':
+        """
+        Returns the trie over the word lists of all languages of the seed type.
+        It is built once on first use.
+
+        :param SeedType seedType: The type of seed.
+        :param bool foldAccents: If True, words are matched without their accents (diacritics).
+        :return: The trie for the seed type.
+        """
+        assert isinstance(seedType, SeedType), "seedType must be an instance of SeedType"
+        with cls._lock:
+            key: tuple[SeedType, bool] = (seedType, foldAccents)
+            if key not in cls._byType:
+                cls._byType[key] = cls(
+                    {language.code: language.words(seedType) for language in SeedLanguage.listForType(seedType)},
+                    foldAccents
+                )
+            return cls._byType[key]
+
+    @classmethod
+    def phraseIndices(cls, phrase: str, seedType: SeedType) -> dict[tuple[int, ...], list[str]]:
+        """
+        Maps a phrase to seed indices. Words are matched exactly first,
+        and only if that fails without their accents.
+
+        .. seealso:: :py:meth:`parse`
+
+        :param str phrase: The phrase, words separated by whitespace.
+        :param SeedType seedType: The type of seed.
+        :return: The distinct seed indices, each with the codes of the languages they were resolved in.
+        """
+        return cls.forType(seedType).parse(phrase) or cls.forType(seedType, True).parse(phrase)
@@ -13,6 +13,42 @@ CDEF_HEADER_FILES = [
     'include/ots-errors.h'
 ]  # C header files to generate CFFI cdef from (e.g., ots.h, ots-errors.h)
 
+# Batch helpers compiled into the CFFI module, they loop in C over the single value
+# functions of the library, so converting many values is one call from Python.
+# They return 0 on success, or the 1-based position of the first value that failed.
+HELPER_CDEF = """
+size_t ots_py_heights_from_timestamps(const uint64_t* timestamps, uint64_t* heights, size_t count, OTS_NETWORK network);
+size_t ots_py_timestamps_from_heights(const uint64_t* heights, uint64_t* timestamps, size_t count, OTS_NETWORK network);
+"""
+HELPER_SOURCE = """
+static size_t ots_py_convert(
+    ots_result_t* (*convert)(uint64_t, OTS_NETWORK),
+    const uint64_t* in,
+    uint64_t* out,
+    size_t count,
+    OTS_NETWORK network
+) {
+    for (size_t i = 0; i < count; i++) {
+        ots_result_t* result = convert(in[i], network);
+        if (ots_is_error(result)) {
+            ots_free_result(&result);
+            return i + 1;
+        }
+        out[i] = (uint64_t)ots_result_number(result, 0);
+        ots_free_result(&result);
+    }
+    return 0;
+}
+
+size_t ots_py_heights_from_timestamps(const uint64_t* timestamps, uint64_t* heights, size_t count, OTS_NETWORK network) {
+    return ots_py_convert(ots_height_from_timestamp, timestamps, heights, count, network);
+}
+
+size_t ots_py_timestamps_from_heights(const uint64_t* heights, uint64_t* timestamps, size_t count, OTS_NETWORK network) {
+    return ots_py_convert(ots_timestamp_from_height, heights, timestamps, count, network);
+}
+"""
+
 
 class FfiBuilderController(FFI):
     """
@@ -126,6 +162,7 @@ class FfiBuilderController(FFI):
         cdef_content = ''
         for header in self.cdef_header_file:
             cdef_content += self.cdef_from_header(header) + '\n'
+        cdef_content += HELPER_CDEF
         if self.debug:
             with open('ots_cdef.h', 'w') as f:
                 f.write(cdef_content)
@@ -137,6 +174,7 @@ class FfiBuilderController(FFI):
         for inlude in self.cdef_header_file:
             include_path = PurePath(inlude).name
             source_content += f'#include <{include_path}>\n'
+        source_content += HELPER_SOURCE
         if self.debug:
             with open('source.c', 'w') as f:
                 f.write(source_content)
@@ -4,7 +4,8 @@ from setuptools import setup, find_packages
 
 
 VERSION = '0.5.12'
-environ['PYTHONHASHSEED'] = sha256(f'Monero OTS {VERSION}'.encode('utf-8')).hexdigest()
+# an integer, a new interpreter (e.g. the resource tracker of multiprocessing) refuses to start with anything else
+environ['PYTHONHASHSEED'] = str(int.from_bytes(sha256(f'Monero OTS {VERSION}'.encode('utf-8')).digest()[:4], 'big'))
 
 
 with open('README.md', 'r') as f:
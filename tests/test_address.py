@@ -144,3 +144,31 @@ def test_address_string():
                 AddressString.type(case.address)
             with pytest.raises(OtsException):
                 AddressString.isIntegrated(case.address)
+
+def test_address_slots():
+    case: AddressTestCase = next(case for case in test_cases if case.valid)
+    address: Address = Address(None, case.address)
+    assert not hasattr(address, '__dict__')
+    assert not hasattr(Polyseed.generate(), '__dict__')
+    assert not hasattr(address.handle, '__dict__')
+    assert address.fingerprint == case.fingerprint
+    assert address.paymentId == case.payment_id
+
+def test_address_detach():
+    case: AddressTestCase = next(case for case in test_cases if case.valid and case.type == AddressType.INTEGRATED)
+    address: Address = Address.fromString(case.address)
+    assert not address.detached
+    assert address.detach() is address and address.detached
+    assert address.paymentId == case.payment_id and address.isIntegrated and len(address) == 106
+    assert address == case.address and address.detached
+    assert hash(address) == hash(Address(None, case.address))
+    # an operation of the library rebuilds the handle, only for the call
+    assert address.handle is not None and address.detached
+    standard: AddressTestCase = next(case for case in test_cases if case.valid and case.type != AddressType.INTEGRATED)
+    assert Address.fromString(standard.address).detach().paymentId == Address.fromString(standard.address).paymentId
+    wallet: Wallet = Polyseed.generate().wallet
+    cached: Address = wallet.address(0, 2)
+    assert not cached.detached
+    cached.base58, cached.type, cached.network, cached.fingerprint
+    assert cached.detached and wallet.address(0, 2) is cached
+    assert wallet.hasAddress(cached) and cached.detached
@@ -0,0 +1,65 @@
+from ots import *
+from ots import address_cache
+from ots.address_cache import AddressCacheStats
+import gc
+
+
+def test_address_cache_lru():
+    wallet: Wallet = Wallet(Polyseed.generate().wallet.handle, AddressCache(maxEntries=3))
+    first: Address = wallet.address(0, 1)
+    for index in range(2, 5):
+        wallet.address(0, index)
+    stats: AddressCacheStats = wallet.addressCache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.entries) == (0, 4, 1, 3)
+    assert (0, 1) not in wallet.addressCache
+    assert wallet.address(0, 1) is not first and wallet.address(0, 1).base58 == first.base58
+    wallet.address(0, 3)
+    wallet.address(0, 5)
+    # (0, 3) was used more recently than (0, 4)
+    assert (0, 3) in wallet.addressCache and (0, 4) not in wallet.addressCache
+    assert wallet.addressCache.stats().hits == 2
+    wallet.addressCache.resize(maxEntries=None, maxBytes=0)
+    assert len(wallet.addressCache) == 0
+
+
+def test_address_cache_global_budget():
+    wallets: list[Wallet] = [Polyseed.generate().wallet for _ in range(2)]
+    before: int = address_cache.globalBytes()
+    try:
+        for index in range(10):
+            for wallet in wallets:
+                wallet.address(0, index).fingerprint
+        used: int = address_cache.globalBytes() - before
+        assert used > 0
+        address_cache.setGlobalBudget(before + used // 2)
+        assert address_cache.globalBytes() <= before + used // 2
+        wallets[0].address(1, 1)
+        assert address_cache.globalBytes() <= before + used // 2
+        assert sum(wallet.addressCache.stats().evictions for wallet in wallets) > 0
+    finally:
+        address_cache.setGlobalBudget(None)
+    del wallet, wallets
+    gc.collect()
+    assert address_cache.globalBytes() <= before
+
+
+def test_address_cache_global_lru():
+    first: Wallet = Polyseed.generate().wallet
+    second: Wallet = Polyseed.generate().wallet
+    before: int = address_cache.globalBytes()
+    try:
+        for index in range(200):
+            first.address(0, index).fingerprint
+        address_cache.setGlobalBudget(address_cache.globalBytes())
+        for _ in range(10):
+            second.address(0, 1).fingerprint
+        stats: AddressCacheStats = second.addressCache.stats()
+        # the entries of the first wallet are older, they are evicted instead of the new one
+        assert (stats.hits, stats.misses, stats.evictions, stats.entries) == (9, 1, 0, 1)
+        assert first.addressCache.stats().evictions > 0 and (0, 0) not in first.addressCache
+        assert address_cache.globalBytes() <= address_cache.globalBudget()
+    finally:
+        address_cache.setGlobalBudget(None)
+    del first, second
+    gc.collect()
+    assert address_cache.globalBytes() <= before
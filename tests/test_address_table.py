@@ -0,0 +1,57 @@
+from io import StringIO
+from ots import *
+import json
+import pytest
+
+
+def test_address_table():
+    wallet: Wallet = Polyseed.generate().wallet
+    table: AddressTable = AddressTable.fromWallet(wallet, accounts=2, indices=20)
+    assert len(table) == 40
+    address: Address = wallet.address(1, 7)
+    row: int | None = table.find(address)
+    assert row is not None and address.base58 in table
+    assert table.position(row) == (1, 7)
+    assert table.base58(row) == address.base58
+    assert table[row].fingerprint == address.fingerprint
+    assert table.network(row) == Network.MAIN and table.type(row) == AddressType.SUBADDRESS
+    assert len(table.publicSpendKey(row)) == 32 and len(table.publicViewKey(row)) == 32
+    assert table.paymentId(row) is None
+    assert Polyseed.generate().address not in table
+    assert 'not an address' not in table
+    assert table.rows(type=AddressType.STANDARD) == [0]
+    assert len(table.filter(Network.MAIN, AddressType.SUBADDRESS)) == 39
+    assert len(table.filter(Network.TEST)) == 0
+    with pytest.raises(ValueError):
+        table.append('not an address')
+    with pytest.raises(IndexError):
+        table.base58(40)
+
+
+def test_address_table_export():
+    wallet: Wallet = Polyseed.generate().wallet
+    table: AddressTable = AddressTable([wallet.address().base58])
+    table.append(wallet.address(0, 3), 0, 3)
+    assert table.position(0) is None
+    csvFile: StringIO = StringIO()
+    assert table.toCsv(csvFile) == 2
+    lines: list[str] = csvFile.getvalue().splitlines()
+    assert lines[0] == 'address,network,type,account,index,payment_id'
+    assert lines[1] == f'{wallet.address().base58},MAIN,STANDARD,,,'
+    assert lines[2] == f'{wallet.address(0, 3).base58},MAIN,SUBADDRESS,0,3,'
+    jsonFile: StringIO = StringIO()
+    assert table.toNdjson(jsonFile) == 2
+    records: list[dict] = [json.loads(line) for line in jsonFile.getvalue().splitlines()]
+    assert records[1] == {'address': wallet.address(0, 3).base58, 'network': 'MAIN', 'type': 'SUBADDRESS', 'account': 0, 'index': 3, 'payment_id': None}
+    assert [address.base58 for address in table] == [record['address'] for record in records]
+
+
+def test_address_table_integrated():
+    integrated: str = '4Jmnw8aLmCzAA4a2rRjLmbT4uJadSZxzrW1nJh3NJYDr87hEdiFhaCcGyK87kb8u1i1DWtwKTUnoZ6uobbotLGqX5QeCPeUbcLb1iqv4E7'
+    subaddress: str = 'BaswxFneurncD8EanZiasqLYdB2wLBPKUEpGvfTyoymEH933uibnpuWTjQA2ThJiirVSMgbYVWuGVUePddR2v9WmNHDwdPJ'
+    table: AddressTable = AddressTable([integrated, subaddress])
+    assert [table.base58(row) for row in range(len(table))] == [integrated, subaddress]
+    assert table.type(0) == AddressType.INTEGRATED
+    assert table.paymentId(0) == Address.fromString(integrated).paymentId
+    assert table.network(1) == Network.TEST
+    assert table.rows(Network.TEST, AddressType.SUBADDRESS) == [1]
@@ -0,0 +1,40 @@
+from ots import *
+from ots.entropy import shannon_entropy, byte_histogram
+import pytest
+
+
+def test_entropy_estimator_native():
+    for data in (b'aaaaaaaa', b'abcdabcdabcdabcd', Ots.random(32), bytes(range(32)), b'monero offline signing'):
+        estimator: EntropyEstimator = EntropyEstimator().update(data)
+        assert estimator.total == pytest.approx(Ots.entropyLevel(data), abs=0.01)
+
+
+def test_entropy_estimator_stream(tmp_path):
+    data: bytes = Ots.random(100000) + bytes(50000)
+    estimator: EntropyEstimator = EntropyEstimator(4096).update(data)
+    assert estimator.count == len(data)
+    assert len(estimator.windows) == len(data) // 4096
+    assert estimator.windows[0] > 7.9
+    assert estimator.windows[-1] == 0.0
+    assert estimator.total == pytest.approx(shannon_entropy(byte_histogram(data)))
+    chunked: EntropyEstimator = EntropyEstimator.fromIterable((data[i:i + 777] for i in range(0, len(data), 777)), 4096)
+    assert chunked.windows == estimator.windows
+    assert chunked.histogram == estimator.histogram
+    path = tmp_path / 'dump.bin'
+    path.write_bytes(data)
+    mapped: EntropyEstimator = EntropyEstimator.fromFile(str(path), 4096, 1000)
+    assert mapped.windows == estimator.windows
+    assert mapped.total == estimator.total
+
+
+def test_entropy_estimator_sliding():
+    data: bytes = Ots.random(20000) + bytes(10000)
+    estimator: EntropyEstimator = EntropyEstimator(4096, 1000).update(data)
+    assert len(estimator.windows) == (len(data) - 4096) // 1000 + 1
+    assert estimator.windows == [
+        pytest.approx(shannon_entropy(byte_histogram(data[start:start + 4096])))
+        for start in range(0, len(data) - 4096 + 1, 1000)
+    ]
+    chunked: EntropyEstimator = EntropyEstimator.fromIterable((data[i:i + 777] for i in range(0, len(data), 777)), 4096, 1000)
+    assert chunked.windows == pytest.approx(estimator.windows)
+    assert EntropyEstimator(4096, 4096).update(data).windows == EntropyEstimator(4096).update(data).windows
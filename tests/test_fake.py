@@ -0,0 +1,46 @@
+from os import environ
+from ots import *
+import pytest
+
+pytestmark = pytest.mark.skipif(environ.get('OTS_BACKEND') != 'fake', reason='only with OTS_BACKEND=fake')
+
+
+def test_fake_backend():
+    from ots._backend import BACKEND
+    assert BACKEND == 'fake'
+
+
+def test_fake_phrase_round_trip():
+    en: SeedLanguage = SeedLanguage.fromCode('en')
+    for seed in (Polyseed.generate(), MoneroSeed.generate()):
+        phrase: str = seed.phrase(en).insecure()
+        decoded: Seed = type(seed).decode(phrase)
+        assert decoded.fingerprint == seed.fingerprint
+        assert decoded.address.base58 == seed.address.base58
+
+
+def test_fake_transaction():
+    from ots._fake import unsigned_tx_set
+    wallet: Wallet = Polyseed.generate().wallet
+    destination: str = Polyseed.generate().address.base58
+    change: str = wallet.address(0, 1).base58
+    tx: bytes = unsigned_tx_set([{'flows': [(destination, 1000000)], 'change': (change, 5000), 'fee': 300}])
+    description: TxDescription = wallet.describeTransaction(tx)
+    assert description.amountOut == 1005000
+    assert description.fee == 300
+    assert [flow.amount for flow in description.flows] == [1000000]
+    assert str(description.flows[0].address) == destination
+    assert len(description.transfers) == 1
+    assert len(wallet.signTransaction(tx)) > 0
+
+
+def test_fake_seed_jar_ownership():
+    seed: Polyseed = Polyseed.generate()
+    fingerprint: str = seed.fingerprint
+    SeedJar.clear()
+    try:
+        SeedJar.add(seed, 'owned by the jar')
+        del seed
+        assert [item.fingerprint for item in SeedJar.items()] == [fingerprint]
+    finally:
+        SeedJar.clear()
@@ -0,0 +1,68 @@
+from ots import *
+from ots import lifetime
+import gc
+import io
+
+
+def test_lifetime_counters():
+    lifetime.reset()
+    lifetime.enable(frames=4)
+    try:
+        assert lifetime.enabled()
+        address: Address = Address.fromString(Polyseed.generate().address.base58)
+        assert address.network == Network.MAIN
+        handles: dict = lifetime.snapshot()['handle']
+        assert handles['ADDRESS']['live'] >= 1
+        assert handles['ADDRESS']['peak'] >= handles['ADDRESS']['live']
+        sites = [site for key, site in lifetime.outstanding() if key == ('handle', 'ADDRESS')]
+        assert any(__file__ in ''.join(site.format()) for site in sites)
+        output = io.StringIO()
+        assert lifetime.report(output) == lifetime.live() > 0
+        assert 'handle ADDRESS' in output.getvalue()
+        del address, sites
+        gc.collect()
+        assert lifetime.snapshot()['handle']['ADDRESS']['live'] == 0
+    finally:
+        lifetime.disable()
+    assert not lifetime.enabled()
+    lifetime.reset()
+    assert lifetime.snapshot() == {}
+
+
+def test_lifetime_freed_after_disable():
+    lifetime.reset()
+    lifetime.enable()
+    try:
+        address: Address = Address.fromString(Polyseed.generate().address.base58)
+        gc.collect()
+        assert lifetime.live() >= 1
+    finally:
+        lifetime.disable()
+    del address
+    gc.collect()
+    assert lifetime.live() == 0
+    lifetime.reset()
+
+
+def test_lifetime_soak():
+    wallet: Wallet = Polyseed.generate().wallet
+    data: bytes = b'soak'
+    lifetime.reset()
+    lifetime.enable()
+    try:
+        def sign(rounds: int) -> None:
+            for i in range(rounds):
+                signature: str = wallet.signData(data + bytes([i % 256]))
+                assert wallet.verifyData(data + bytes([i % 256]), signature)
+                wallet.address(0, i % 20).base58
+        sign(50)
+        gc.collect()
+        before: int = lifetime.live()
+        sign(1000)
+        gc.collect()
+        assert lifetime.live() == before
+        results: dict = lifetime.snapshot()['result']
+        assert all(counters['live'] == 0 for counters in results.values())
+    finally:
+        lifetime.disable()
+        lifetime.reset()
@@ -1,9 +1,17 @@
 from dataclasses import dataclass
 from random import randint
 from ots import *
+import ots
+import subprocess
+import sys
 import pytest
 
 
+def test_lazy_import():
+    code: str = "import sys, ots; assert not any(m.startswith('ots.') for m in sys.modules); ots.Address; assert 'ots._backend' in sys.modules"
+    subprocess.run([sys.executable, '-c', code], check=True)
+    assert 'Network' in ots.__all__ and 'OtsException' in ots.__all__ and 'Ots' in ots.__all__
+
 def test_ots_version():
     assert Ots.version() == '0.1.0'
     assert Ots.versionComponets() == tuple(int(i) for i in Ots.version().split('.'))
@@ -12,6 +20,18 @@ def test_height_timestamp():
     assert Ots.timestampFromHeight(0) == 1397818193
     assert Ots.heightFromTimestamp(1397818193) == 0
 
+def test_heights_timestamps_many():
+    timestamps: list[int] = [1397818193 + randint(0, 400_000_000) for _ in range(1000)]
+    for network in Network:
+        heights = Ots.heightsFromTimestamps(timestamps, network)
+        assert list(heights) == [Ots.heightFromTimestamp(t, network) for t in timestamps]
+        assert list(Ots.timestampsFromHeights(heights, network)) == [Ots.timestampFromHeight(h, network) for h in heights]
+    assert len(Ots.heightsFromTimestamps([])) == 0
+    numpy = pytest.importorskip('numpy')
+    heights = Ots.heightsFromTimestamps(numpy.array(timestamps, dtype=numpy.uint64))
+    assert isinstance(heights, numpy.ndarray)
+    assert heights.tolist() == [Ots.heightFromTimestamp(t) for t in timestamps]
+
 def test_random():
     data: bytes = Ots.random(1024)
     assert isinstance(data, bytes)
@@ -53,3 +73,30 @@ def test_ots_verif_data():
     assert Ots.verifyData(data, addr, sig)
     data = data[512:] + data[:512]
     assert not Ots.verifyData(data, addr, sig)
+
+def test_ots_verify_data_many():
+    wallet: Wallet = MoneroSeed.generate().wallet
+    addresses: list[str] = [wallet.address(0, index).base58 for index in range(3)]
+    items: list[tuple] = []
+    expected: list[bool] = []
+    for i in range(20):
+        data: bytes = f'message {i % 7}'.encode('utf-8')
+        index: int = i % 3
+        signature: str = wallet.signDataWithIndex(data, 0, index)
+        items.append((data, addresses[index], signature))
+        expected.append(True)
+        items.append((data, addresses[(index + 1) % 3], signature))
+        expected.append(False)
+    assert Ots.verifyDataMany(items, workers=1) == expected
+    assert Ots.verifyDataMany(items, workers=4, chunkSize=2) == expected
+    assert Ots.verifyDataMany([]) == []
+    # an invalid address or signature fails its item only
+    broken: list[tuple] = [(b'message', 'not an address', items[0][2]), (items[0][0], addresses[0], '')]
+    assert Ots.verifyDataMany(broken + items[:2], workers=1) == [False, False] + expected[:2]
+    cache: VerifyCache = VerifyCache()
+    assert Ots.verifyDataMany(items, cache=cache) == expected
+    assert (cache.stats().hits, cache.stats().misses, cache.stats().entries) == (0, 40, 40)
+    assert Ots.verifyDataMany(items, cache=cache) == expected
+    assert (cache.stats().hits, cache.stats().misses) == (40, 40)
+    cache.resize(maxEntries=8)
+    assert len(cache) == 8 and cache.stats().evictions == 32
@@ -0,0 +1,45 @@
+from ots import *
+import pickle
+import pytest
+
+
+def test_pickle_address():
+    address: Address = Polyseed.generate().address
+    restored: Address = pickle.loads(pickle.dumps(address))
+    assert restored.base58 == address.base58
+    assert restored.network == address.network
+    assert restored.type == address.type
+
+
+def test_pickle_secrets_need_channel():
+    seed: Seed = Polyseed.generate()
+    with pytest.raises(TypeError):
+        pickle.dumps(seed)
+    with pytest.raises(TypeError):
+        pickle.dumps(seed.indices())
+    with pytest.raises(TypeError):
+        pickle.dumps(seed.wallet)
+    with SecureChannel('password'):
+        sealed: bytes = pickle.dumps(seed)
+        indices: bytes = pickle.dumps(seed.indices())
+    with pytest.raises(TypeError):
+        pickle.loads(sealed)
+    with SecureChannel('password'):
+        restored: Seed = pickle.loads(sealed)
+        assert pickle.loads(indices).values == seed.indices().values
+        with pytest.raises(RuntimeError):
+            SecureChannel('other').open()
+    with pytest.raises(TypeError):
+        pickle.dumps(SecureChannel('password'))
+    assert isinstance(restored, Polyseed)
+    assert restored.fingerprint == seed.fingerprint
+    assert restored.indices().values == seed.indices().values
+
+
+def test_pickle_monero_seed():
+    seed: Seed = MoneroSeed.generate()
+    with SecureChannel('password'):
+        restored: Seed = pickle.loads(pickle.dumps(seed))
+    assert isinstance(restored, MoneroSeed)
+    assert restored.fingerprint == seed.fingerprint
+    assert restored.height == seed.height
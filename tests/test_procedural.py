@@ -0,0 +1,40 @@
+from ots import *
+from ots import procedural as otsp
+import pytest
+
+
+def test_procedural_address():
+    seed: Polyseed = Polyseed.generate()
+    address: str = seed.address.base58
+    assert otsp.address_valid(address, Network.MAIN)
+    assert not otsp.address_valid(address, Network.TEST)
+    assert otsp.address_network(address) == Network.MAIN
+    assert otsp.address_type(address) == seed.address.type
+    assert otsp.address_fingerprint(address) == seed.fingerprint
+    assert not otsp.address_is_integrated(address)
+    with pytest.raises(OtsException):
+        otsp.address_fingerprint('invalid')
+
+
+def test_procedural_seed_wallet():
+    seed = otsp.polyseed_generate()
+    phrase: str = otsp.seed_phrase(seed, 'en')
+    decoded = otsp.polyseed_decode(phrase)
+    assert otsp.seed_fingerprint(decoded) == otsp.seed_fingerprint(seed)
+    assert otsp.seed_address(decoded) == otsp.seed_address(seed)
+    wallet = otsp.seed_wallet(seed)
+    classes: Wallet = Polyseed.decode(phrase).wallet
+    assert otsp.wallet_address(wallet) == otsp.seed_address(seed)
+    assert otsp.wallet_address(wallet, 1, 2) == classes.address(1, 2).base58
+    subaddresses: list[str] = otsp.wallet_subaddresses(wallet, 0, 20)
+    assert subaddresses == [a.base58 for a in classes.subAddresses(0, 20)]
+    assert otsp.wallet_accounts(wallet, 3) == [a.base58 for a in classes.accounts(3)]
+    assert otsp.wallet_address_index(wallet, subaddresses[7]) == (0, 7)
+    for account, index in ((0, 0), (1, 2)):
+        signature: str = otsp.wallet_sign_data(wallet, b'data', account, index)
+        assert otsp.verify_data(b'data', otsp.wallet_address(wallet, account, index), signature)
+        assert not otsp.verify_data(b'other', otsp.wallet_address(wallet, account, index), signature)
+    assert otsp.wallet_verify_data(wallet, b'data', otsp.wallet_sign_data(wallet, b'data'))
+    monero = otsp.monero_seed_generate()
+    assert otsp.seed_fingerprint(otsp.monero_seed_decode(otsp.seed_phrase(monero, 'en'))) == otsp.seed_fingerprint(monero)
+    assert otsp.version_components() == Ots.versionComponets()
@@ -0,0 +1,29 @@
+from concurrent.futures import ThreadPoolExecutor
+from ots import *
+import pytest
+
+
+def test_random_stream():
+    stream: RandomStream = RandomStream(256)
+    first: bytes = stream.read(32)
+    assert len(first) == 32
+    assert stream.read(32) != first
+    assert stream._buffer[:stream._offset] == bytes(stream._offset), "consumed bytes must be wiped"
+    buffer: bytearray = bytearray(1000)
+    assert stream.readinto(buffer) == 1000
+    assert buffer != bytearray(1000)
+    assert stream.refills == 5
+    with pytest.raises(ValueError):
+        stream.read()
+    stream.close()
+    assert stream._buffer == bytearray(256)
+    with pytest.raises(ValueError):
+        stream.read(1)
+
+
+def test_random_stream_threads():
+    with RandomStream(1024, 3.5) as stream:
+        with ThreadPoolExecutor(8) as executor:
+            nonces: list[bytes] = list(executor.map(lambda _: stream.random(16), range(1000)))
+    assert len(set(nonces)) == len(nonces)
+    assert all(len(nonce) == 16 for nonce in nonces)
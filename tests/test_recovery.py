@@ -0,0 +1,83 @@
+from ots import *
+from ots.recovery import SeedRecovery, RecoveryProgress, PasswordRecovery, PasswordRecoveryResult, polyseed_checksum
+from ots.recovery import _init_worker, _search
+import json
+import pytest
+
+
+def test_polyseed_checksum():
+    seed: Polyseed = Polyseed.generate()
+    assert polyseed_checksum(seed.indices().values) == 0
+
+
+def test_recover_unknown_words():
+    en: SeedLanguage = SeedLanguage.fromCode('en')
+    seed: Polyseed = Polyseed.generate()
+    words: list[str] = seed.phrase(en).insecure().split()
+    words[3] = '?'
+    recovery = SeedRecovery(' '.join(words), SeedType.POLYSEED, 'en', address=seed.address)
+    # the checksum solves the only unknown word
+    assert recovery.total == 1
+    seeds: list[Seed] = recovery.run(workers=1)
+    assert [s.fingerprint for s in seeds] == [seed.fingerprint]
+
+
+def test_recover_garbled_and_swapped_words(tmp_path):
+    en: SeedLanguage = SeedLanguage.fromCode('en')
+    seed: MoneroSeed = MoneroSeed.generate()
+    words: list[str] = seed.phrase(en).insecure().split()
+    words[24] = '?'
+    words[5] = words[5][:-1] + ('x' if words[5][-1] != 'x' else 'y')
+    words[10], words[11] = words[11], words[10]
+    reports: list[RecoveryProgress] = []
+    checkpoint: str = str(tmp_path / 'recovery.json')
+    recovery = SeedRecovery(' '.join(words), SeedType.MONERO, address=seed.fingerprint, swaps=True)
+    seeds: list[Seed] = recovery.run(workers=2, chunkSize=16, progress=reports.append, checkpoint=checkpoint)
+    assert [s.fingerprint for s in seeds] == [seed.fingerprint]
+    assert len(reports) > 0 and reports[-1].matches == 1
+    # a search stopped at the match counts only the candidates it checked
+    _init_worker(recovery.tasks)
+    for variant, task in enumerate(recovery.tasks):
+        _, checked, matches = _search(variant, 0, task.size)
+        if matches:
+            assert _search(variant, 0, checked - 1)[2] == []
+        else:
+            assert checked == task.size
+    # resuming a finished search returns the match from the checkpoint
+    assert [s.fingerprint for s in recovery.run(workers=1, checkpoint=checkpoint)] == [seed.fingerprint]
+
+
+def test_password_recovery(tmp_path):
+    en: SeedLanguage = SeedLanguage.fromCode('en')
+    seed: Polyseed = Polyseed.generate()
+    encrypted: str = seed.phrase(en, 'ab7').insecure()
+    recovery = PasswordRecovery(encrypted, SeedType.POLYSEED, seed.fingerprint)
+    assert PasswordRecovery.maskSize('ab?d') == 10
+    result: PasswordRecoveryResult = recovery.run(PasswordRecovery.mask('ab?d'), workers=1, batchSize=4)
+    assert result.matches == ['ab7']
+    assert 0 < result.checked <= 10
+    wordlist = tmp_path / 'passwords.txt'
+    wordlist.write_text('secret\nab7\nother\n')
+    result = recovery.run(PasswordRecovery.wordlist(str(wordlist)), workers=2, batchSize=1, stopOnMatch=False)
+    assert result.matches == ['ab7']
+    assert result.checked == 3
+
+
+def test_recover_resume_with_other_chunk_size(tmp_path):
+    en: SeedLanguage = SeedLanguage.fromCode('en')
+    seed: MoneroSeed = MoneroSeed.generate()
+    words: list[str] = seed.phrase(en).insecure().split()
+    words[3] = words[3][:-1] + ('x' if words[3][-1] != 'x' else 'y')
+    # an address which never matches, the whole space is searched
+    recovery = SeedRecovery(' '.join(words), SeedType.MONERO, address=MoneroSeed.generate().address)
+    assert recovery.total > 2
+    checkpoint = tmp_path / 'recovery.json'
+    recovery.run(workers=1, chunkSize=2, checkpoint=str(checkpoint))
+    state: dict = json.loads(checkpoint.read_text())
+    # interrupted after the first chunk of 2
+    state['done'], state['checked'] = [[0, 0, 2]], 2
+    checkpoint.write_text(json.dumps(state))
+    reports: list[RecoveryProgress] = []
+    recovery.run(workers=1, chunkSize=4, progress=reports.append, checkpoint=str(checkpoint))
+    assert reports[-1].resumed == 2
+    assert reports[-1].checked == recovery.total
@@ -21,3 +21,52 @@ def test_seed():
         assert seed.network == network
 
 # TODO: continue with more tests
+
+
+def test_decode_any_language():
+    for language in SeedLanguage.listForType(SeedType.POLYSEED):
+        seed: Polyseed = Polyseed.generate()
+        phrase: str = seed.phrase(language).insecure()
+        words: tuple[str, ...] = language.words(SeedType.POLYSEED)
+        assert len(words) == 2048
+        assert [words[i] for i in seed.indices().values] == phrase.split()
+        assert tuple(seed.indices().values) in WordTrie.forType(SeedType.POLYSEED).parse(phrase)
+        assert Polyseed.decodeAnyLanguage(phrase).fingerprint == seed.fingerprint
+    for language in SeedLanguage.listForType(SeedType.MONERO):
+        seed: MoneroSeed = MoneroSeed.generate()
+        phrase: str = seed.phrase(language).insecure()
+        assert len(language.words(SeedType.MONERO)) == 1626
+        assert MoneroSeed.decodeAnyLanguage(phrase).fingerprint == seed.fingerprint
+    seed = MoneroSeed.generate()
+    abbreviated: str = ' '.join(word[:4] for word in seed.phrase(SeedLanguage.fromCode('en')).insecure().split())
+    assert MoneroSeed.decodeAnyLanguage(abbreviated).fingerprint == seed.fingerprint
+    with pytest.raises(ValueError):
+        Polyseed.decodeAnyLanguage('this is not a seed phrase at all')
+
+
+def test_decode_with_language():
+    for language in SeedLanguage.listForType(SeedType.POLYSEED):
+        seed: Polyseed = Polyseed.generate()
+        phrase: str = seed.phrase(language).insecure()
+        assert Polyseed.decodeWithLanguage(phrase, language).fingerprint == seed.fingerprint
+
+
+def test_generate_many():
+    language: SeedLanguage = SeedLanguage.fromCode('en')
+    for workers in (1, 2):
+        generated: list[GeneratedSeed] = list(Polyseed.generateMany(10, 'secret', language, workers=workers, batchSize=4))
+        assert len(generated) == 10
+        assert len({g.fingerprint for g in generated}) == 10
+        for g in generated[:3]:
+            seed: Polyseed = Polyseed.decodeWithLanguage(g.export, language, password='secret')
+            assert seed.fingerprint == g.fingerprint
+            assert seed.address.base58 == g.address
+    generated = list(MoneroSeed.generateMany(5, 'secret', language, workers=1))
+    assert len({g.address for g in generated}) == 5
+    seed: MoneroSeed = MoneroSeed.decode(generated[0].export, passphrase='secret')
+    assert seed.fingerprint == generated[0].fingerprint
+    # checked on call, before the first seed is taken
+    with pytest.raises(ValueError):
+        MoneroSeed.generateMany(5, 'secret', language, height=100, time=1700000000)
+    with pytest.raises(AssertionError):
+        Polyseed.generateMany(5, '', language)
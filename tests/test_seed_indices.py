@@ -58,3 +58,46 @@ def test_seed_indices_add_sub():
     assert (si2 - si3).values == si1.values, "SeedIndices values do not match after subtraction"
     assert (si1 + si1).values == null, "SeedIndices values do not match after adding itself"
     assert (si1 - si1).values == null, "SeedIndices values do not match after subtracting itself"
+
+def test_seed_indices_array():
+    indices1: list[int] = [randint(0, 2047) for _ in range(16)]
+    indices2: list[int] = [randint(0, 2047) for _ in range(16)]
+    si1: SeedIndices = SeedIndices.fromValues(indices1)
+    a1: SeedIndicesArray = si1.array
+    a2: SeedIndicesArray = SeedIndicesArray(indices2)
+    assert a1 == si1 and a1 == indices1, "SeedIndicesArray does not match SeedIndices values"
+    assert a1.toSeedIndices().values == indices1, "SeedIndicesArray does not convert back to SeedIndices"
+    assert (a1 + a2) == (si1 + SeedIndices.fromValues(indices2)).values, "SeedIndicesArray XOR does not match native merge"
+    assert (a1 ^ a2 ^ a2) == a1, "SeedIndicesArray XOR is not reversible"
+
+def test_seed_indices_split_combine():
+    indices: list[int] = [randint(0, 2047) for _ in range(16)]
+    si: SeedIndices = SeedIndices.fromValues(indices)
+    for count in (2, 3, 5):
+        shares: list[SeedIndices] = si.split(count)
+        assert len(shares) == count, "Unexpected number of shares"
+        assert all(max(share.values) <= 0x07FF for share in shares), "Shares must be 11 bit values"
+        assert SeedIndices.combine(shares).values == indices, "Shares do not recombine to the seed indices"
+        assert SeedIndicesArray.combine([share.array for share in shares]) == indices, "Shares do not recombine vectorised"
+    seeds: list[SeedIndicesArray] = [SeedIndicesArray([randint(0, 2047) for _ in range(16)]) for _ in range(50)]
+    for seed, shares in zip(seeds, SeedIndicesArray.splitMany(seeds, 3)):
+        assert SeedIndicesArray.combine(shares) == seed, "Batch shares do not recombine to the seed indices"
+        assert SeedIndicesArray.combine(shares[1:]) != seed, "Seed indices recovered without all shares"
+
+def test_seed_indices_packed_qr():
+    for count in (0, 1, 12, 13, 16, 25):
+        indices: list[int] = [randint(0, 2047) for _ in range(count)]
+        seedIndices = SeedIndices.fromValues(indices)
+        packed: bytes = seedIndices.packed()
+        assert len(packed) == 2 + (count * 11 + 7) // 8, "Unexpected packed size"
+        assert SeedIndices.fromPacked(packed).values == indices, "SeedIndices values do not match after packing"
+        qr: str = seedIndices.qr()
+        assert all(c in '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:' for c in qr), "QR form must be alphanumeric"
+        assert SeedIndices.fromQr(qr).values == indices, "SeedIndices values do not match after QR encoding"
+        if count >= 12:
+            assert len(qr) < len(seedIndices.hex()), "QR form should be smaller than the hex form"
+    assert SeedIndices.fromValues([2048, 4095]).packed(12) == bytes.fromhex('0c02800fff')
+    with pytest.raises(ValueError):
+        SeedIndices.fromPacked(b'\x0b\x02\x00')
+    with pytest.raises(ValueError):
+        SeedIndices.fromQr('a')
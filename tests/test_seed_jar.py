@@ -0,0 +1,25 @@
+from ots import *
+import pytest
+
+
+def test_owner_of():
+    SeedJar.clear()
+    first: Seed = SeedJar.add(Polyseed.generate(), 'first')
+    second: Seed = SeedJar.add(MoneroSeed.generate(), 'second')
+    assert SeedJar.buildOwnerIndex(2, 5) == 2 * 2 * 5
+    for seed in (first, second):
+        for account, index in ((0, 0), (0, 4), (1, 3)):
+            owner = SeedJar.ownerOf(seed.wallet.address(account, index).base58, 2, 5)
+            assert owner is not None
+            assert owner[0].fingerprint == seed.fingerprint
+            assert owner[1:] == (account, index)
+    assert SeedJar.ownerOf(first.wallet.address(2, 0), 2, 5) is None
+    owner = SeedJar.ownerOf(first.wallet.address(2, 0), 3, 5)
+    assert owner is not None and owner[1:] == (2, 0)
+    assert SeedJar.ownerOf(Polyseed.generate().address) is None
+    address: str = second.address.base58
+    SeedJar.purgeForName('second')
+    assert SeedJar.ownerOf(address) is None
+    address = first.address.base58
+    SeedJar.clear()
+    assert SeedJar.ownerOf(address) is None
@@ -195,4 +195,19 @@ def test_seed_language_default_language():
     assert 'en' == SeedLanguage.defaultLanguage(SeedType.POLYSEED), "Default language for POLYSEED should be set to English"
     assert en.isDefault(SeedType.MONERO), "English should be default for MONERO after setting it"
     assert en.isDefault(SeedType.POLYSEED), "English should be default for POLYSEED after setting it"
+    from ots.raw import ots_result_handle, ots_seed_language_from_code
+    unregistered: SeedLanguage = SeedLanguage(ots_result_handle(ots_seed_language_from_code('en')))
+    assert unregistered.isDefault(SeedType.MONERO), "An equal instance outside the registry should be default too"
 
+
+def test_seed_language_registry():
+    en: SeedLanguage = SeedLanguage.fromCode('en')
+    assert SeedLanguage.fromCode('en') is en
+    assert SeedLanguage.fromName('English') is en
+    assert SeedLanguage.fromEnglishName('English') is en
+    assert en in SeedLanguage.list()
+    for st in (SeedType.MONERO, SeedType.POLYSEED):
+        for lang in SeedLanguage.listForType(st):
+            assert SeedLanguage.fromCode(lang.code) is lang
+    assert SeedLanguage.list() is SeedLanguage.list()
+    assert en == SeedLanguage.fromCode('en') and en != SeedLanguage.fromCode('de')
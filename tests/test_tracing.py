@@ -0,0 +1,44 @@
+from ots import *
+from ots import tracing
+import sys
+import pytest
+
+
+def test_tracing():
+    wallet: Wallet = Polyseed.generate().wallet
+    tracing.reset()
+    wallet.signData(b'untraced')
+    assert tracing.snapshot() == {'native': {}, 'methods': {}}
+    tracing.enable()
+    try:
+        assert tracing.enabled()
+        signature: str = wallet.signData(b'traced')
+        wallet.verifyData(b'traced', signature)
+    finally:
+        tracing.disable()
+    assert not tracing.enabled()
+    recorded: dict = tracing.snapshot()
+    signData: dict = recorded['methods']['Wallet.signData']
+    assert signData['count'] == 1
+    assert signData['buckets'][float('inf')] == 1
+    assert 0 < signData['native_seconds'] <= signData['seconds']
+    assert recorded['native']['ots_wallet_sign_data']['count'] == 1
+    text: str = tracing.prometheus()
+    assert 'ots_method_call_seconds_count{method="Wallet.signData"} 1' in text
+    assert 'ots_native_call_seconds_bucket{function="ots_wallet_sign_data",le="+Inf"} 1' in text
+    tracing.reset()
+    assert tracing.snapshot() == {'native': {}, 'methods': {}}
+
+
+def test_tracing_other_profiler():
+    def profiler(frame, event, arg):
+        pass
+
+    previous = sys.getprofile()
+    sys.setprofile(profiler)
+    try:
+        with pytest.raises(RuntimeError):
+            tracing.enable()
+        assert sys.getprofile() is profiler and not tracing.enabled()
+    finally:
+        sys.setprofile(previous)
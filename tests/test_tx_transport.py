@@ -0,0 +1,65 @@
+from multiprocessing.shared_memory import SharedMemory
+from os import environ
+from ots import *
+import pickle
+import pytest
+
+
+def test_tx_ring():
+    with TxRing(2, 16) as ring:
+        assert len(ring) == 2
+        first: int = ring.acquire()
+        second: int = ring.acquire()
+        assert {first, second} == {0, 1}
+        assert ring.acquire() is None
+        assert ring.write(first, b'unsigned') == 8
+        with ring.view(first, 8) as view:
+            assert bytes(view) == b'unsigned'
+        with pytest.raises(ValueError):
+            ring.write(second, bytes(17))
+        attached: TxRing = pickle.loads(pickle.dumps(ring))
+        assert attached.name == ring.name and not attached.owner
+        with attached.view(first, 8) as view:
+            assert bytes(view) == b'unsigned'
+        attached.close()
+        ring.release(first)
+        assert ring.acquire() == first
+
+
+def test_tx_signing_pool_invalid():
+    seed: Seed = Polyseed.generate()
+    for workers in (1, 2):
+        with TxSigningPool(seed, SecureChannel('password'), workers, slotSize=64) as pool:
+            assert list(pool.signMany([])) == []
+            with pytest.raises(Exception):
+                list(pool.signMany([b'not a tx set'] * 4))
+            if workers > 1:
+                with pytest.raises(ValueError):
+                    list(pool.describeMany([bytes(65)]))
+                # the failed tx sets give their slots back
+                assert not any(pool._requests._used)
+
+
+@pytest.mark.skipif(environ.get('OTS_BACKEND') != 'fake', reason='tx sets are built with the fake backend')
+def test_tx_signing_pool():
+    from ots._fake import unsigned_tx_set
+    seed: Seed = Polyseed.generate()
+    wallet: Wallet = seed.wallet
+    txs: list[bytes] = [
+        unsigned_tx_set([{'flows': [(Polyseed.generate().address.base58, 1000 * (i + 1))], 'fee': 10}])
+        for i in range(5)
+    ]
+    with TxSigningPool(seed, SecureChannel('password'), 2, slots=2) as pool:
+        signed: dict[int, bytes] = {index: bytes(tx) for index, tx in pool.signMany(txs)}
+        assert signed == {index: wallet.signTransaction(tx) for index, tx in enumerate(txs)}
+        described: dict[int, TxDescription] = dict(pool.describeMany(txs))
+        assert [(described[i].amountOut, described[i].fee) for i in range(5)] == [(1000 * (i + 1), 10) for i in range(5)]
+        assert [described[i].txSet for i in range(5)] == txs
+        # both workers have read the password, it is no longer in shared memory
+        assert pool._readers.value == 2
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(pool._password.name)
+        for _ in pool.signMany(txs):
+            break
+        assert not any(pool._requests._used)
+        assert len(dict(pool.signMany(txs))) == 5
@@ -0,0 +1,22 @@
+from ots import *
+import pytest
+
+
+def test_sign_data_many():
+    seed: Polyseed = Polyseed.generate()
+    wallet: Wallet = seed.wallet
+    challenge: str = 'proof of ownership'
+    address: Address = wallet.address(0, 3)
+    items: list[tuple] = [(challenge, 0, index) for index in range(10)]
+    items += [(challenge.encode('utf-8'), address), (b'other', address.base58), (challenge, 0, 1)]
+    for workers in (1, 4):
+        signatures: list[str] = wallet.signDataMany(items, workers=workers, chunkSize=3)
+        assert len(signatures) == len(items)
+        for (data, *where), signature in zip(items, signatures):
+            if len(where) == 2:
+                assert wallet.verifyDataWithIndex(data, where[0], where[1], signature)
+            else:
+                assert Ots.verifyData(data if isinstance(data, bytes) else data.encode('utf-8'), str(where[0]), signature)
+    assert wallet.signDataMany([]) == []
+    with pytest.raises(OtsException):
+        wallet.signDataMany([(challenge, Polyseed.generate().address)])